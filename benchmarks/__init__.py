@@ -0,0 +1,7 @@
+"""
+Chunking benchmark suite.
+
+corpus generates deterministic documents of several kinds and sizes;
+run times every pipeline stage on them and compares against a baseline.
+See docs/performance.md.
+"""
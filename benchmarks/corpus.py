@@ -0,0 +1,225 @@
+"""
+Deterministic benchmark corpus.
+
+generate(kind, size) returns the same Markdown document for the same
+arguments on every run and platform, so timings can be compared across
+commits. Documents are built from blocks typical of their kind until the
+requested size (in UTF-8 bytes, approximately) is reached.
+"""
+
+import random
+import zlib
+from collections.abc import Callable
+
+WORDS = (
+    "chunk",
+    "parser",
+    "section",
+    "header",
+    "table",
+    "list",
+    "code",
+    "block",
+    "render",
+    "stream",
+    "window",
+    "offset",
+    "token",
+    "index",
+    "vector",
+    "query",
+    "context",
+    "metadata",
+    "overlap",
+    "strategy",
+    "document",
+    "analysis",
+    "boundary",
+    "fence",
+    "formula",
+    "paragraph",
+    "sentence",
+)
+
+
+def _sentence(rng: random.Random, words: int = 12) -> str:
+    text = " ".join(rng.choice(WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+
+def _paragraph(rng: random.Random, sentences: int = 4) -> str:
+    return " ".join(_sentence(rng, rng.randint(6, 18)) for _ in range(sentences))
+
+
+def _header(rng: random.Random, level: int) -> str:
+    return "#" * level + " " + " ".join(rng.choice(WORDS) for _ in range(3)).title()
+
+
+def _code_block(rng: random.Random) -> str:
+    language = rng.choice(["python", "javascript", "bash", ""])
+    lines = [
+        f"{rng.choice(WORDS)}_{i} = {rng.choice(WORDS)}({rng.randint(0, 99)})"
+        for i in range(rng.randint(3, 30))
+    ]
+    return f"```{language}\n" + "\n".join(lines) + "\n```"
+
+
+def _list(rng: random.Random) -> str:
+    lines = []
+    for i in range(rng.randint(3, 15)):
+        marker = rng.choice(["-", "*", f"{i + 1}.", "- [ ]", "- [x]"])
+        lines.append(f"{marker} {_sentence(rng, rng.randint(3, 10))}")
+        for _ in range(rng.choice([0, 0, 1, 2])):
+            lines.append(f"  - {_sentence(rng, rng.randint(3, 8))}")
+    return "\n".join(lines)
+
+
+def _table(rng: random.Random) -> str:
+    columns = rng.randint(3, 8)
+    header = "| " + " | ".join(rng.choice(WORDS).title() for _ in range(columns)) + " |"
+    rule = "|" + "---|" * columns
+    rows = [
+        "| " + " | ".join(str(rng.randint(0, 9999)) for _ in range(columns)) + " |"
+        for _ in range(rng.randint(5, 30))
+    ]
+    return "\n".join([header, rule, *rows])
+
+
+def _latex(rng: random.Random) -> str:
+    a, b = rng.randint(1, 9), rng.randint(1, 9)
+    if rng.random() < 0.5:
+        return f"$$\nE_{a} = \\sum_{{i=1}}^{{{b}}} x_i^{a} + \\frac{{{a}}}{{{b}}}\n$$"
+    return f"\\begin{{equation}}\n\\int_0^{a} f(x)\\,dx = {b} \\cdot \\alpha_{a}\n\\end{{equation}}"
+
+
+def _code_heavy(rng: random.Random) -> list[str]:
+    return [
+        _header(rng, 2),
+        _paragraph(rng, 2),
+        _code_block(rng),
+        "Output:",
+        "```\n" + _sentence(rng) + "\n```",
+    ]
+
+
+def _list_heavy(rng: random.Random) -> list[str]:
+    return [_header(rng, 2), _list(rng), _list(rng)]
+
+
+def _table_heavy(rng: random.Random) -> list[str]:
+    return [_header(rng, 2), _paragraph(rng, 1), _table(rng), _table(rng)]
+
+
+def _latex_heavy(rng: random.Random) -> list[str]:
+    return [
+        _header(rng, 2),
+        _paragraph(rng, 2) + f" Inline math $x^{rng.randint(2, 9)}$ here.",
+        _latex(rng),
+        _paragraph(rng, 1),
+        _latex(rng),
+    ]
+
+
+def _deep_headers(rng: random.Random) -> list[str]:
+    blocks = []
+    for level in range(1, 7):
+        blocks.append(_header(rng, level))
+        if rng.random() < 0.5:
+            blocks.append(_sentence(rng))
+    return blocks
+
+
+def _mixed(rng: random.Random) -> list[str]:
+    return rng.choice([_code_heavy, _list_heavy, _table_heavy, _latex_heavy, _deep_headers])(rng)
+
+
+def _pathological(rng: random.Random) -> list[str]:
+    return rng.choice(
+        [
+            # One huge line without newlines
+            lambda: [" ".join(rng.choice(WORDS) for _ in range(2000))],
+            # A very long paragraph with no blank lines
+            lambda: ["\n".join(_sentence(rng) for _ in range(200))],
+            # Runs of headers without content
+            lambda: [_header(rng, rng.randint(1, 6)) for _ in range(50)],
+            # A very large table
+            lambda: [_table(rng) + "\n" + "\n".join(_table(rng).split("\n")[2:])],
+            # A list with a single very long item
+            lambda: ["- " + _paragraph(rng, 60)],
+            # Fence markers inside a longer fence, stray dollar signs
+            lambda: [
+                "````python\n```\n" + _paragraph(rng, 3) + "\n~~~\n````",
+                "$$ " + _sentence(rng) + " $ 5 and $$",
+            ],
+        ]
+    )()
+
+
+KINDS: dict[str, Callable[[random.Random], list[str]]] = {
+    "code_heavy": _code_heavy,
+    "list_heavy": _list_heavy,
+    "table_heavy": _table_heavy,
+    "latex": _latex_heavy,
+    "deep_headers": _deep_headers,
+    "mixed": _mixed,
+    "pathological": _pathological,
+}
+
+
+def generate(kind: str, size: int, seed: int = 0) -> str:
+    """
+    Generate a document of a given kind and size.
+
+    Args:
+        kind: One of KINDS
+        size: Target size in UTF-8 bytes (the document is at least this long,
+            cut at the end of a block)
+        seed: Variation of the corpus; the same arguments give the same text
+
+    Returns:
+        Markdown document
+
+    Raises:
+        ValueError: If kind is unknown or size is not positive
+    """
+    if kind not in KINDS:
+        raise ValueError(f"kind must be one of {sorted(KINDS)}, got {kind}")
+    if size <= 0:
+        raise ValueError(f"size must be positive, got {size}")
+
+    rng = random.Random(zlib.crc32(kind.encode()) + seed)
+    make_blocks = KINDS[kind]
+    blocks = [f"# {kind.replace('_', ' ').title()} Benchmark"]
+    total = len(blocks[0])
+    while total < size:
+        for block in make_blocks(rng):
+            blocks.append(block)
+            total += len(block.encode("utf-8")) + 2
+    return "\n\n".join(blocks) + "\n"
+
+
+def parse_size(text: str) -> int:
+    """
+    Parse a size such as "1KB", "10MB" or "512" into bytes.
+
+    Raises:
+        ValueError: If the size cannot be parsed
+    """
+    value = text.strip().upper()
+    factor = 1
+    for unit, unit_factor in (("GB", 1024**3), ("MB", 1024**2), ("KB", 1024), ("B", 1)):
+        if value.endswith(unit):
+            value, factor = value[: -len(unit)], unit_factor
+            break
+    try:
+        return int(float(value) * factor)
+    except ValueError:
+        raise ValueError(f"Invalid size: {text}") from None
+
+
+def format_size(size: int) -> str:
+    """Format a byte count as in parse_size() ("1KB", "100MB")."""
+    for unit, factor in (("GB", 1024**3), ("MB", 1024**2), ("KB", 1024)):
+        if size >= factor and size % factor == 0:
+            return f"{size // factor}{unit}"
+    return f"{size}B"
@@ -0,0 +1,251 @@
+"""
+Run the chunking benchmark and compare against a stored baseline.
+
+    python -m benchmarks.run                          # default sizes, print table
+    python -m benchmarks.run --sizes 1KB,100MB --kinds latex
+    python -m benchmarks.run --output results.json --baseline benchmarks/baseline.json
+
+Every (kind, size) document from benchmarks.corpus is chunked --repeat
+times; the fastest run is kept for each pipeline stage. Results are
+written as JSON. With --baseline, every stage is compared against the
+baseline and the run fails (exit status 1) if a stage got slower than
+the tolerance allows.
+"""
+
+import argparse
+import json
+import logging
+import platform
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from chunkana import ChunkConfig, MarkdownChunker, __version__
+from chunkana.profiling import STAGES
+from chunkana.types import Chunk
+
+from .corpus import KINDS, format_size, generate, parse_size
+
+DEFAULT_SIZES = "1KB,10KB,100KB,1MB"
+
+# Stages faster than this are too noisy to compare
+MIN_COMPARED_SECONDS = 0.005
+
+
+def time_stages(chunker: MarkdownChunker, text: str) -> tuple[list[Chunk], dict[str, float]]:
+    """
+    Chunk a document, timing each pipeline stage separately.
+
+    Returns:
+        Tuple of (chunks, seconds per stage)
+    """
+    chunks, stats = chunker.chunk_with_stats(text)
+    return chunks, {name: stage.seconds for name, stage in stats.stages.items()}
+
+
+def benchmark_document(
+    chunker: MarkdownChunker, kind: str, size: int, repeat: int = 5
+) -> dict[str, Any]:
+    """
+    Benchmark one corpus document, keeping the fastest run of each stage.
+
+    Returns:
+        Result entry as written to the JSON output
+    """
+    text = generate(kind, size)
+    best: dict[str, float] = {}
+    chunks: list[Chunk] = []
+    for _ in range(repeat):
+        chunks, timings = time_stages(chunker, text)
+        for stage, seconds in timings.items():
+            best[stage] = min(best.get(stage, seconds), seconds)
+    return {
+        "kind": kind,
+        "size": format_size(size),
+        "bytes": len(text.encode("utf-8")),
+        "chunks": len(chunks),
+        "strategy": chunks[0].strategy if chunks else None,
+        "total": round(sum(best.values()), 6),
+        "stages": {stage: round(best.get(stage, 0.0), 6) for stage in STAGES},
+    }
+
+
+def run_benchmark(
+    kinds: list[str],
+    sizes: list[int],
+    repeat: int = 5,
+    config: ChunkConfig | None = None,
+) -> dict[str, Any]:
+    """
+    Benchmark every (kind, size) document.
+
+    Returns:
+        Results as written to the JSON output
+    """
+    chunker = MarkdownChunker(config or ChunkConfig())
+    return {
+        "chunkana": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "results": [
+            benchmark_document(chunker, kind, size, repeat) for kind in kinds for size in sizes
+        ],
+    }
+
+
+@dataclass
+class Regression:
+    """A pipeline stage that got slower than the baseline allows."""
+
+    kind: str
+    size: str
+    stage: str
+    before: float
+    after: float
+
+    def __str__(self) -> str:
+        change = (self.after / max(self.before, 1e-9) - 1) * 100
+        return (
+            f"{self.kind}/{self.size} {self.stage}: "
+            f"{self.before * 1000:.1f}ms -> {self.after * 1000:.1f}ms (+{change:.0f}%)"
+        )
+
+
+def compare(
+    results: dict[str, Any],
+    baseline: dict[str, Any],
+    tolerance: float = 0.3,
+    min_seconds: float = MIN_COMPARED_SECONDS,
+) -> list[Regression]:
+    """
+    Compare benchmark results against a baseline.
+
+    A stage regresses if it is more than tolerance slower than in the
+    baseline. Stages below min_seconds in both runs are ignored, and
+    (kind, size) pairs missing from the baseline are skipped.
+
+    Returns:
+        Regressed stages
+    """
+    reference = {(r["kind"], r["size"]): r for r in baseline.get("results", [])}
+    regressions = []
+    for result in results["results"]:
+        base = reference.get((result["kind"], result["size"]))
+        if base is None:
+            continue
+        for stage, seconds in result["stages"].items():
+            before = base["stages"].get(stage)
+            if before is None or max(seconds, before) < min_seconds:
+                continue
+            if seconds > max(before, min_seconds) * (1 + tolerance):
+                regressions.append(
+                    Regression(result["kind"], result["size"], stage, before, seconds)
+                )
+    return regressions
+
+
+def confirm(
+    results: dict[str, Any],
+    regressions: list[Regression],
+    repeat: int = 5,
+    config: ChunkConfig | None = None,
+) -> None:
+    """
+    Re-run the documents with regressed stages to rule out noise.
+
+    Updates results in place, keeping the faster of the two runs for each
+    stage; compare() again afterwards.
+    """
+    chunker = MarkdownChunker(config or ChunkConfig())
+    pairs = {(r.kind, r.size) for r in regressions}
+    for result in results["results"]:
+        if (result["kind"], result["size"]) not in pairs:
+            continue
+        rerun = benchmark_document(chunker, result["kind"], parse_size(result["size"]), repeat)
+        stages = result["stages"]
+        for stage, seconds in rerun["stages"].items():
+            stages[stage] = min(stages[stage], seconds)
+        result["total"] = round(sum(stages.values()), 6)
+
+
+def format_table(results: dict[str, Any]) -> str:
+    """Format results as a text table of milliseconds per stage."""
+    header = ["kind", "size", "chunks", "total", *STAGES]
+    rows = [header]
+    for result in results["results"]:
+        rows.append(
+            [
+                result["kind"],
+                result["size"],
+                str(result["chunks"]),
+                f"{result['total'] * 1000:.1f}",
+                *(f"{result['stages'][stage] * 1000:.1f}" for stage in STAGES),
+            ]
+        )
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+    return "\n".join(
+        "  ".join(cell.rjust(width) for cell, width in zip(row, widths, strict=True))
+        for row in rows
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--kinds", default=",".join(KINDS), help="Comma-separated corpus kinds (default: all)"
+    )
+    parser.add_argument(
+        "--sizes", default=DEFAULT_SIZES, help=f"Comma-separated sizes (default: {DEFAULT_SIZES})"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per document (default: 5)")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument("--baseline", help="Compare against this results file")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.3,
+        help="Allowed slowdown per stage as a fraction (default: 0.3)",
+    )
+    args = parser.parse_args(argv)
+    # Pathological inputs make the chunker log warnings on every run
+    logging.getLogger("chunkana").setLevel(logging.ERROR)
+
+    kinds = [kind.strip() for kind in args.kinds.split(",") if kind.strip()]
+    unknown = [kind for kind in kinds if kind not in KINDS]
+    if unknown:
+        parser.error(f"unknown kinds: {', '.join(unknown)} (choose from {', '.join(KINDS)})")
+    try:
+        sizes = [parse_size(size) for size in args.sizes.split(",") if size.strip()]
+    except ValueError as e:
+        parser.error(str(e))
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    results = run_benchmark(kinds, sizes, repeat=args.repeat)
+    print(format_table(results))
+
+    regressions: list[Regression] = []
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        regressions = compare(results, baseline, tolerance=args.tolerance)
+        if regressions:
+            confirm(results, regressions, repeat=args.repeat)
+            regressions = compare(results, baseline, tolerance=args.tolerance)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+
+    if regressions:
+        print(f"\n{len(regressions)} stage(s) slower than baseline:", file=sys.stderr)
+        for regression in regressions:
+            print(f"  {regression}", file=sys.stderr)
+        return 1
+    if args.baseline:
+        print("\nNo regressions against baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -23,6 +23,7 @@ __version__ = "0.1.6"
 
 # Core API
 from .api import (
+    achunk_stream,
     analyze_markdown,
     chunk_file,
     chunk_file_streaming,
@@ -34,8 +35,12 @@ from .api import (
     iter_chunks,
 )
 
+# Batch
+from .batch import BatchResult, chunk_batch, chunk_files
+
 # Classes
 from .chunker import MarkdownChunker
+from .compact import CompactChunk
 from .config import ChunkConfig, ChunkerConfig
 from .exceptions import (
     ChunkanaError,
@@ -45,8 +50,13 @@ from .exceptions import (
     ValidationError,
 )
 from .hierarchy import HierarchicalChunkingResult, HierarchyBuilder
+from .incremental import RechunkResult
 from .invariant_validator import InvariantValidator
 from .invariant_validator import ValidationResult as InvariantValidationResult
+from .overlap import materialize_overlap, overlap_context
+from .parse_cache import ParseCache, ParseCacheStats
+from .preprocessing import Preprocessor, Transform
+from .profiling import PipelineStats, StageStats
 
 # Renderers
 from .renderers import (
@@ -56,10 +66,11 @@ from .renderers import (
     render_with_embedded_overlap,
     render_with_prev_overlap,
 )
+from .sampling import AnalysisEstimate, estimate_analysis, estimate_file
 from .section_splitter import SectionSplitter
 
 # Streaming
-from .streaming import StreamingChunker, StreamingConfig
+from .streaming import StreamingChunker, StreamingConfig, StreamingStats
 from .types import (
     Chunk,
     ChunkingMetrics,
@@ -69,7 +80,13 @@ from .types import (
 )
 
 # Validation
-from .validator import ValidationResult, Validator, validate_chunks
+from .validator import (
+    TieredValidator,
+    ValidationReport,
+    ValidationResult,
+    Validator,
+    validate_chunks,
+)
 
 __all__ = [
     # Version
@@ -79,26 +96,40 @@ __all__ = [
     "chunk_text",
     "chunk_file",
     "chunk_file_streaming",
+    "achunk_stream",
     "chunk_hierarchical",
     "analyze_markdown",
     "chunk_with_analysis",
     "chunk_with_metrics",
     "iter_chunks",
+    # Functions - Batch
+    "chunk_batch",
+    "chunk_files",
     # Functions - Renderers
     "render_dify_style",
     "render_with_embedded_overlap",
     "render_with_prev_overlap",
     "render_json",
     "render_inline_metadata",
+    # Functions - Sampling
+    "estimate_analysis",
+    "estimate_file",
+    # Functions - Overlap
+    "overlap_context",
+    "materialize_overlap",
     # Classes - Core
     "MarkdownChunker",
     "ChunkConfig",
     "ChunkerConfig",
     "Chunk",
+    "CompactChunk",
     "ContentAnalysis",
     "FencedBlock",
     "ChunkingResult",
     "ChunkingMetrics",
+    "RechunkResult",
+    # Classes - Batch
+    "BatchResult",
     # Classes - Exceptions
     "ChunkanaError",
     "HierarchicalInvariantError",
@@ -108,6 +139,17 @@ __all__ = [
     # Classes - Hierarchy
     "HierarchicalChunkingResult",
     "HierarchyBuilder",
+    # Classes - Parse Cache
+    "ParseCache",
+    "ParseCacheStats",
+    # Classes - Preprocessing
+    "Preprocessor",
+    "Transform",
+    # Classes - Profiling
+    "PipelineStats",
+    "StageStats",
+    # Classes - Sampling
+    "AnalysisEstimate",
     # Classes - Section Splitting
     "SectionSplitter",
     # Classes - Invariant Validation
@@ -116,8 +158,11 @@ __all__ = [
     # Classes - Streaming
     "StreamingChunker",
     "StreamingConfig",
+    "StreamingStats",
     # Classes - Validation
     "Validator",
     "ValidationResult",
+    "TieredValidator",
+    "ValidationReport",
     "validate_chunks",
 ]
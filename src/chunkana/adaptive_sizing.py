@@ -192,5 +192,5 @@ class AdaptiveSizeCalculator:
         if analysis.total_chars == 0:
             return 0.0
 
-        table_chars = sum(len(table.content) for table in analysis.tables)
+        table_chars = sum(table.size for table in analysis.tables)
         return table_chars / analysis.total_chars
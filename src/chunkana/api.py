@@ -5,8 +5,11 @@ This module provides simple functions for common chunking operations.
 All functions return consistent types (no union returns).
 """
 
-from collections.abc import Iterator
+import time
+from collections.abc import AsyncIterable, AsyncIterator, Iterator
+from concurrent.futures import Executor
 from pathlib import Path
+from typing import Any
 
 from .chunker import MarkdownChunker
 from .config import ChunkerConfig
@@ -77,7 +80,7 @@ def chunk_with_analysis(
     Returns ChunkingResult containing:
     - chunks: List[Chunk]
     - strategy_used: str
-    - processing_time: float
+    - processing_time: float (seconds)
     - total_chars: int
     - total_lines: int
 
@@ -94,10 +97,12 @@ def chunk_with_analysis(
         >>> print(f"Chunks: {len(result.chunks)}")
     """
     chunker = MarkdownChunker(config or ChunkerConfig.default())
+    start = time.perf_counter()
     chunks, strategy, analysis = chunker.chunk_with_analysis(text)
     return ChunkingResult(
         chunks=chunks,
         strategy_used=strategy,
+        processing_time=time.perf_counter() - start,
         total_chars=analysis.total_chars if analysis else 0,
         total_lines=analysis.total_lines if analysis else 0,
     )
@@ -144,6 +149,8 @@ def iter_chunks(
 
     Use this for large documents where you want to process
     chunks incrementally without loading all into memory.
+    The first chunk is yielded before the rest of the document
+    has been chunked (see MarkdownChunker.iter_chunks).
 
     Args:
         text: Markdown text to chunk
@@ -157,9 +164,7 @@ def iter_chunks(
         ...     process(chunk)
     """
     chunker = MarkdownChunker(config or ChunkerConfig.default())
-    # For now, just iterate over the list
-    # TODO: Implement true streaming in chunker
-    yield from chunker.chunk(text)
+    yield from chunker.iter_chunks(text)
 
 
 # =============================================================================
@@ -230,6 +235,7 @@ def chunk_file_streaming(
     chunk_config: ChunkerConfig | None = None,
     streaming_config: StreamingConfig | None = None,
     encoding: str = "utf-8",
+    use_mmap: bool = False,
 ) -> Iterator[Chunk]:
     """
     Chunk large markdown file in streaming mode.
@@ -247,6 +253,9 @@ def chunk_file_streaming(
         chunk_config: Chunking configuration (uses defaults if None)
         streaming_config: Streaming configuration (uses defaults if None)
         encoding: File encoding (default: utf-8)
+        use_mmap: Memory-map the file and decode only the windows
+            (StreamingChunker.chunk_file_mmap); needs an ASCII-compatible
+            encoding
 
     Yields:
         Chunk objects with streaming metadata
@@ -254,6 +263,7 @@ def chunk_file_streaming(
     Raises:
         FileNotFoundError: If file does not exist
         UnicodeDecodeError: If file cannot be decoded
+        ValueError: If use_mmap is set and the encoding is not ASCII-compatible
 
     Example:
         >>> for chunk in chunk_file_streaming("large_doc.md"):
@@ -266,10 +276,57 @@ def chunk_file_streaming(
     cfg = chunk_config or ChunkerConfig.default()
     streamer = StreamingChunker(cfg, streaming_config)
 
+    if use_mmap:
+        yield from streamer.chunk_file_mmap(str(path), encoding)
+        return
+
     # Use streaming chunker's file method
     yield from streamer.chunk_file(str(path))
 
 
+async def achunk_stream(
+    reader: AsyncIterable[Any] | Any,
+    chunk_config: ChunkerConfig | None = None,
+    streaming_config: StreamingConfig | None = None,
+    encoding: str = "utf-8",
+    executor: Executor | None = None,
+) -> AsyncIterator[Chunk]:
+    """
+    Chunk an async markdown source in streaming mode.
+
+    Non-blocking counterpart of chunk_file_streaming() for asyncio
+    services: reading happens on the event loop, chunking of each window
+    in an executor. Reading is throttled by the consumer: the next window
+    is only read once every chunk of the previous one has been consumed.
+
+    Args:
+        reader: Async iterable of bytes or str pieces (e.g. an
+            asyncio.StreamReader or an aiofiles file), or an object with an
+            async read(size) method
+        chunk_config: Chunking configuration (uses defaults if None)
+        streaming_config: Streaming configuration (uses defaults if None)
+        encoding: Encoding of byte sources (default: utf-8)
+        executor: Executor for window chunking (the event loop's default
+            executor if None)
+
+    Yields:
+        Chunk objects with streaming metadata
+
+    Raises:
+        TypeError: If reader is neither async iterable nor readable
+        UnicodeDecodeError: If bytes cannot be decoded
+
+    Example:
+        >>> async for chunk in achunk_stream(request.content):
+        ...     await embed(chunk)
+    """
+    cfg = chunk_config or ChunkerConfig.default()
+    streamer = StreamingChunker(cfg, streaming_config)
+
+    async for chunk in streamer.achunk_stream(reader, encoding=encoding, executor=executor):
+        yield chunk
+
+
 def chunk_hierarchical(
     text: str,
     config: ChunkerConfig | None = None,
@@ -0,0 +1,329 @@
+"""
+Parallel batch chunking.
+
+Chunking is pure-Python CPU work, so a single process uses one core no
+matter how many documents are queued. chunk_batch() and chunk_files()
+fan documents out over a ProcessPoolExecutor:
+
+- every worker process builds one MarkdownChunker at start-up and reuses
+  it for all documents it receives
+- documents are grouped into tasks of roughly ``batch_bytes`` (characters
+  of text for chunk_batch(), file bytes for chunk_files()) so that many
+  small documents do not pay one inter-process round trip each
+- at most a few tasks per worker are in flight or waiting to be yielded
+  in order, so arbitrarily long inputs are consumed lazily
+- a failing document yields a BatchResult with ``error`` set instead of
+  aborting the batch
+- when a worker process dies, the pool is replaced and the tasks that were
+  in flight are re-run one at a time; only the documents of the task that
+  kills its worker are reported as errors
+"""
+
+import functools
+import os
+from collections.abc import Callable, Generator, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .chunker import MarkdownChunker
+from .config import ChunkerConfig
+from .types import Chunk
+
+# Default size of a worker task: 1 Mi characters (chunk_batch) or bytes
+# (chunk_files)
+DEFAULT_BATCH_BYTES = 1 << 20
+
+# Tasks kept in flight or buffered per worker: enough to hide scheduling
+# latency
+_TASKS_PER_WORKER = 2
+
+# Per-process chunker, created by _init_worker
+_worker_chunker: MarkdownChunker | None = None
+
+
+@dataclass
+class BatchResult:
+    """
+    Outcome of chunking one document of a batch.
+
+    Attributes:
+        index: Position of the document in the input
+        chunks: Chunks of the document (empty on error)
+        source: File path for chunk_files(), None for chunk_batch()
+        error: "ExceptionType: message" if the document failed, else None
+    """
+
+    index: int
+    chunks: list[Chunk] = field(default_factory=list)
+    source: str | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the document was chunked successfully."""
+        return self.error is None
+
+
+def chunk_batch(
+    texts: Iterable[str],
+    config: ChunkerConfig | None = None,
+    max_workers: int | None = None,
+    ordered: bool = True,
+    batch_bytes: int = DEFAULT_BATCH_BYTES,
+) -> Iterator[BatchResult]:
+    """
+    Chunk many documents in parallel worker processes.
+
+    Args:
+        texts: Markdown documents; consumed lazily
+        config: Configuration used by every worker (uses defaults if None)
+        max_workers: Number of worker processes (defaults to the CPU
+            count). 1 chunks in the calling process without a pool.
+        ordered: Yield results in input order (True) or as soon as they
+            complete (False)
+        batch_bytes: Approximate amount of text per worker task, measured
+            in characters. Small documents are grouped up to this size; a
+            larger document forms a task of its own.
+
+    Yields:
+        One BatchResult per document
+
+    Raises:
+        ValueError: If max_workers or batch_bytes is less than 1
+
+    Example:
+        >>> for result in chunk_batch(documents, max_workers=8):
+        ...     if result.ok:
+        ...         index(result.chunks)
+        ...     else:
+        ...         log(result.index, result.error)
+    """
+    items = ((None, text, len(text) if isinstance(text, str) else 0) for text in texts)
+    yield from _run(items, _chunk_texts, config, max_workers, ordered, batch_bytes)
+
+
+def chunk_files(
+    paths: Iterable[str | Path],
+    config: ChunkerConfig | None = None,
+    max_workers: int | None = None,
+    ordered: bool = True,
+    batch_bytes: int = DEFAULT_BATCH_BYTES,
+    encoding: str = "utf-8",
+) -> Iterator[BatchResult]:
+    """
+    Chunk many markdown files in parallel worker processes.
+
+    Files are read inside the workers, so only paths and chunks cross
+    process boundaries. Missing or undecodable files are reported as
+    errors on their BatchResult.
+
+    Args:
+        paths: Markdown file paths; consumed lazily
+        config: Configuration used by every worker (uses defaults if None)
+        max_workers: Number of worker processes (defaults to the CPU
+            count). 1 chunks in the calling process without a pool.
+        ordered: Yield results in input order (True) or as soon as they
+            complete (False)
+        batch_bytes: Approximate number of file bytes per worker task.
+            Small files are grouped up to this size; a larger file forms
+            a task of its own.
+        encoding: File encoding (default: utf-8)
+
+    Yields:
+        One BatchResult per file, with ``source`` set to the path
+
+    Raises:
+        ValueError: If max_workers or batch_bytes is less than 1
+
+    Example:
+        >>> for result in chunk_files(Path("docs").rglob("*.md"), ordered=False):
+        ...     print(result.source, len(result.chunks))
+    """
+    items = ((str(path), str(path), _file_size(path)) for path in paths)
+    worker = functools.partial(_chunk_paths, encoding=encoding)
+    yield from _run(items, worker, config, max_workers, ordered, batch_bytes)
+
+
+# Input items are (source, payload, size); payload is the text or the file path
+_Item = tuple[str | None, str, int]
+_Task = list[tuple[int, str | None, str]]
+
+
+def _run(
+    items: Iterable[_Item],
+    worker: Callable[[_Task, MarkdownChunker | None], list[BatchResult]],
+    config: ChunkerConfig | None,
+    max_workers: int | None,
+    ordered: bool,
+    batch_bytes: int,
+) -> Iterator[BatchResult]:
+    """Group items into tasks and execute them, locally or in a pool."""
+    if max_workers is not None and max_workers < 1:
+        raise ValueError(f"max_workers must be >= 1 or None, got {max_workers}")
+    if batch_bytes < 1:
+        raise ValueError(f"batch_bytes must be >= 1, got {batch_bytes}")
+
+    config = config or ChunkerConfig.default()
+    workers = max_workers or os.cpu_count() or 1
+    tasks = _group_tasks(items, batch_bytes)
+
+    if workers == 1:
+        chunker = MarkdownChunker(config)
+        for task in tasks:
+            yield from worker(task, chunker)
+        return
+
+    executor = _start_pool(workers, config)
+    pending: dict[Future[list[BatchResult]], _Task] = {}
+    # Finished tasks waiting for an earlier task (ordered only), by the
+    # index of their first document
+    buffered: dict[int, tuple[_Task, list[BatchResult]]] = {}
+    next_index = 0
+
+    def emit(task: _Task, results: list[BatchResult]) -> Iterator[BatchResult]:
+        nonlocal next_index
+        if not ordered:
+            yield from results
+            return
+        buffered[task[0][0]] = (task, results)
+        while next_index in buffered:
+            task, results = buffered.pop(next_index)
+            yield from results
+            next_index = task[-1][0] + 1
+
+    def settle(
+        futures: Iterable[Future[list[BatchResult]]],
+    ) -> Generator[BatchResult, None, list[_Task]]:
+        """Yield the results of finished futures; return the tasks lost with the pool."""
+        lost = []
+        for future in futures:
+            task = pending.pop(future)
+            if isinstance(future.exception(), BrokenProcessPool):
+                lost.append(task)
+            else:
+                yield from emit(task, _task_results(future, task))
+        return lost
+
+    def recover(lost: list[_Task]) -> Iterator[BatchResult]:
+        """Replace a broken pool and re-run the tasks lost with it."""
+        nonlocal executor
+        # A dead worker fails every task in flight, not only its own
+        done, _ = wait(pending)
+        lost += yield from settle(done)
+        executor.shutdown(wait=True)
+        executor = _start_pool(workers, config)
+        # One at a time, so that only the task killing its worker fails
+        for task in sorted(lost, key=lambda task: task[0][0]):
+            future = executor.submit(worker, task, None)
+            wait([future])
+            if isinstance(future.exception(), BrokenProcessPool):
+                executor.shutdown(wait=True)
+                executor = _start_pool(workers, config)
+            yield from emit(task, _task_results(future, task))
+
+    def drain() -> Iterator[BatchResult]:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        lost = yield from settle(done)
+        if lost:
+            yield from recover(lost)
+
+    try:
+        for task in tasks:
+            # Buffered tasks count against the cap, so a slow task at the
+            # head cannot make the buffer grow with the input
+            while len(pending) + len(buffered) >= workers * _TASKS_PER_WORKER:
+                yield from drain()
+            try:
+                future = executor.submit(worker, task, None)
+            except BrokenProcessPool:
+                # A worker died since the last drain
+                yield from recover([])
+                future = executor.submit(worker, task, None)
+            pending[future] = task
+        while pending:
+            yield from drain()
+    finally:
+        # Also reached when the caller stops iterating early
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _start_pool(workers: int, config: ChunkerConfig) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(config,))
+
+
+def _group_tasks(items: Iterable[_Item], batch_bytes: int) -> Iterator[_Task]:
+    """Number items and group consecutive ones into tasks of ~batch_bytes."""
+    task: _Task = []
+    task_size = 0
+    for index, (source, payload, size) in enumerate(items):
+        if task and task_size + size > batch_bytes:
+            yield task
+            task, task_size = [], 0
+        task.append((index, source, payload))
+        task_size += size
+    if task:
+        yield task
+
+
+def _task_results(future: Future[list[BatchResult]], task: _Task) -> list[BatchResult]:
+    """Get the results of a finished task, or one error per document if it failed."""
+    try:
+        return future.result()
+    except Exception as e:  # e.g. BrokenProcessPool, unpicklable result
+        error = _format_error(e)
+        return [BatchResult(index=index, source=source, error=error) for index, source, _ in task]
+
+
+def _init_worker(config: ChunkerConfig) -> None:
+    """Create the chunker reused by every task in this process."""
+    global _worker_chunker
+    _worker_chunker = MarkdownChunker(config)
+
+
+def _get_worker_chunker(chunker: MarkdownChunker | None) -> MarkdownChunker:
+    """Use the given chunker, or the one created by _init_worker."""
+    chunker = chunker or _worker_chunker
+    if chunker is None:
+        raise RuntimeError("Batch worker used before _init_worker()")
+    return chunker
+
+
+def _chunk_texts(task: _Task, chunker: MarkdownChunker | None) -> list[BatchResult]:
+    """Worker: chunk in-memory documents."""
+    chunker = _get_worker_chunker(chunker)
+    results = []
+    for index, source, text in task:
+        try:
+            chunks = chunker.chunk(text)
+            results.append(BatchResult(index=index, chunks=chunks, source=source))
+        except Exception as e:
+            results.append(BatchResult(index=index, source=source, error=_format_error(e)))
+    return results
+
+
+def _chunk_paths(task: _Task, chunker: MarkdownChunker | None, encoding: str) -> list[BatchResult]:
+    """Worker: read and chunk files."""
+    chunker = _get_worker_chunker(chunker)
+    results = []
+    for index, source, path in task:
+        try:
+            text = Path(path).read_text(encoding=encoding)
+            chunks = chunker.chunk(text)
+            results.append(BatchResult(index=index, chunks=chunks, source=source))
+        except Exception as e:
+            results.append(BatchResult(index=index, source=source, error=_format_error(e)))
+    return results
+
+
+def _file_size(path: str | Path) -> int:
+    """File size for task grouping; unreadable files count as empty."""
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def _format_error(error: BaseException) -> str:
+    return f"{type(error).__name__}: {error}"
@@ -13,21 +13,39 @@ Simplified pipeline:
 from __future__ import annotations
 
 import io
-import re
-from collections.abc import Iterator
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Iterator
+from itertools import chain, islice
 from typing import TYPE_CHECKING, Any
 
 from .adaptive_sizing import AdaptiveSizeCalculator
 from .config import ChunkConfig
 from .header_processor import HeaderProcessor
 from .hierarchy import HierarchicalChunkingResult, HierarchyBuilder
+from .incremental import (
+    PipelineTrace,
+    RechunkResult,
+    RechunkState,
+    common_affixes,
+    diff_chunks,
+    header_context,
+    shift_chunk,
+    shift_moved_from,
+)
 from .metadata_recalculator import MetadataRecalculator
+from .overlap import NEXT_LENGTH_KEY, PREVIOUS_LENGTH_KEY
 from .parser import get_parser
+from .preprocessing import Preprocessor, Transform
+from .profiling import NULL_PROFILER, PipelineStats, StageProfiler, StageStats
 from .section_splitter import SectionSplitter
+from .span_locator import SpanLocator, last_line_read
 from .strategies import StrategySelector
+from .strategies.structural import StructuralStrategy
 from .types import Chunk, ChunkingMetrics, ContentAnalysis
+from .validator import TieredValidator, ValidationReport
 
 if TYPE_CHECKING:
+    from .parse_cache import ParseCache
     from .streaming import StreamingConfig
 
 # Note: MAX_OVERLAP_CONTEXT_RATIO is kept for backward compatibility
@@ -46,43 +64,42 @@ class MarkdownChunker:
     - No duplication
     """
 
-    def __init__(self, config: ChunkConfig | None = None):
+    def __init__(
+        self,
+        config: ChunkConfig | None = None,
+        parse_cache: ParseCache | None = None,
+        observer: Callable[[StageStats], None] | None = None,
+        transforms: Iterable[Transform] = (),
+    ):
         """
         Initialize chunker.
 
         Args:
             config: Chunking configuration (uses defaults if None)
+            parse_cache: Optional ParseCache shared between chunkers so that
+                re-chunking unchanged text skips parsing
+            observer: Optional callable invoked with the StageStats of each
+                pipeline stage of every chunk() call (see chunkana.profiling)
+            transforms: Preprocessing steps applied to the text before
+                parsing, after line endings are normalized and block IDs
+                stripped (see chunkana.preprocessing)
         """
         self.config = config or ChunkConfig()
-        self._parser = get_parser()  # Use singleton parser instance
+        self._parser = get_parser(cache=parse_cache)  # Singleton unless a cache is given
         self._selector = StrategySelector()
         self._header_processor = HeaderProcessor(self.config)
         self._section_splitter = SectionSplitter(self.config)
         self._metadata_recalculator = MetadataRecalculator()
         self._hierarchy_builder = HierarchyBuilder(
             include_document_summary=self.config.include_document_summary,
-            validate_invariants=self.config.validate_invariants,
+            validate_invariants=(
+                self.config.validate_invariants and self.config.validation_level != "off"
+            ),
             strict_mode=self.config.strict_mode,
         )
-
-    def _preprocess_text(self, text: str) -> str:
-        """
-        Preprocess markdown text before chunking.
-
-        Currently handles:
-        - Obsidian block ID removal (if configured)
-
-        Args:
-            text: Raw markdown text
-
-        Returns:
-            Preprocessed text
-        """
-        if self.config.strip_obsidian_block_ids:
-            # Remove Obsidian block IDs: ^identifier at end of lines
-            # Pattern: space(s) + ^ + alphanumeric + spaces/end
-            text = re.sub(r"\s+\^[a-zA-Z0-9]+\s*$", "", text, flags=re.MULTILINE)
-        return text
+        self._output_validator = TieredValidator(self.config)
+        self._observer = observer
+        self._preprocessor = Preprocessor.for_config(self.config, transforms)
 
     def chunk(self, md_text: str) -> list[Chunk]:
         """
@@ -107,18 +124,206 @@ class MarkdownChunker:
         if not md_text or not md_text.strip():
             return []
 
-        # 0. Preprocess text (e.g., strip Obsidian block IDs if configured)
-        md_text = self._preprocess_text(md_text)
+        profiler = StageProfiler(self._observer) if self._observer else NULL_PROFILER
+        normalized_text, analysis = self._prepare(md_text, profiler)
+        chunks, _ = self._chunk_prepared(normalized_text, analysis, profiler=profiler)
+        return chunks
 
-        # 1. Parse (once) - includes line ending normalization
-        analysis = self._parser.analyze(md_text)
+    def chunk_with_stats(
+        self, md_text: str, trace_allocations: bool = False
+    ) -> tuple[list[Chunk], PipelineStats]:
+        """
+        Chunk and return per-stage statistics.
 
-        # Get normalized text (line endings normalized)
-        normalized_text = md_text.replace("\r\n", "\n").replace("\r", "\n")
+        Args:
+            md_text: Raw markdown text
+            trace_allocations: Also measure memory allocated per stage (with
+                tracemalloc; makes chunking several times slower)
 
+        Returns:
+            Tuple of (chunks, stats); the chunks are the same as chunk()
+
+        Example:
+            >>> chunks, stats = chunker.chunk_with_stats(text)
+            >>> print(stats.slowest_stage, stats.stages["parse"].seconds)
+        """
+        profiler = StageProfiler(self._observer, trace_allocations=trace_allocations)
+        if not md_text or not md_text.strip():
+            return [], profiler.stats
+
+        profiler.start()
+        try:
+            normalized_text, analysis = self._prepare(md_text, profiler)
+            chunks, _ = self._chunk_prepared(normalized_text, analysis, profiler=profiler)
+        finally:
+            profiler.stop()
+        return chunks, profiler.stats
+
+    def chunk_with_validation(self, md_text: str) -> tuple[list[Chunk], ValidationReport]:
+        """
+        Chunk and check the output at config.validation_level.
+
+        chunk() does not run these checks; use this method (or
+        TieredValidator directly) where a report is needed.
+
+        Args:
+            md_text: Raw markdown text
+
+        Returns:
+            Tuple of (chunks, report); the chunks are the same as chunk()
+
+        Example:
+            >>> chunks, report = chunker.chunk_with_validation(text)
+            >>> if not report.is_valid:
+            ...     print(report.errors)
+        """
+        if not md_text or not md_text.strip():
+            return [], self._output_validator.validate([], md_text)
+
+        profiler = StageProfiler(self._observer) if self._observer else NULL_PROFILER
+        normalized_text, analysis = self._prepare(md_text, profiler)
+        chunks, _ = self._chunk_prepared(normalized_text, analysis, profiler=profiler)
+        return chunks, self._output_validator.validate(chunks, normalized_text)
+
+    def iter_chunks(self, md_text: str) -> Iterator[Chunk]:
+        """
+        Chunk a markdown document lazily.
+
+        Runs the same pipeline as chunk() as a chain of generators: the
+        strategy yields chunks section by section (structural strategy) and
+        every post-processing stage only holds a small look-ahead window.
+        The first chunk is available before the rest of the document has
+        been chunked, and memory held for chunks is bounded by the window
+        rather than the chunk count.
+
+        Parsing still covers the whole document up front.
+
+        Yields the same chunks as chunk(), in the same order. The only
+        exception is PROP-3 repair: chunk() re-sorts the final list if a
+        stage produced out-of-order start lines, whereas chunks that were
+        already yielded cannot be re-sorted.
+
+        Args:
+            md_text: Raw markdown text
+
+        Yields:
+            Chunks in document order
+        """
+        if not md_text or not md_text.strip():
+            return
+
+        normalized_text, analysis = self._prepare(md_text)
+        effective_config, adaptive_metadata = self._effective_config(normalized_text, analysis)
+
+        strategy = self._selector.select(analysis, effective_config)
+        chunks = strategy.iter_apply(normalized_text, analysis, effective_config)
+
+        chunks = self._iter_merge_small_chunks(chunks)
+        chunks = self._header_processor.iter_prevent_dangling_headers(chunks)
+        chunks = self._section_splitter.iter_split_oversize_sections(chunks)
+
+        locator = SpanLocator(normalized_text, analysis.get_line_offsets())
+        yield from self._iter_finalize(chunks, strategy.name, locator, adaptive_metadata)
+
+    def _prepare(
+        self, md_text: str, profiler: StageProfiler = NULL_PROFILER
+    ) -> tuple[str, ContentAnalysis]:
+        """
+        Preprocess and parse a document.
+
+        Returns:
+            Tuple of (normalized_text, analysis)
+        """
+        # 0. Normalize line endings and apply transforms (e.g., strip
+        # Obsidian block IDs if configured) in one preprocessing pass
+        with profiler.stage("preprocess", len(md_text)) as stage:
+            normalized_text = self._preprocessor.process(md_text)
+            stage.items_out = len(normalized_text)
+
+        # 1. Parse (once)
+        with profiler.stage("parse", len(normalized_text)) as stage:
+            analysis = self._parser.analyze(normalized_text)
+            stage.items_out = analysis.total_lines
+
+        return normalized_text, analysis
+
+    def _chunk_prepared(
+        self,
+        normalized_text: str,
+        analysis: ContentAnalysis,
+        trace: PipelineTrace | None = None,
+        profiler: StageProfiler = NULL_PROFILER,
+    ) -> tuple[list[Chunk], str]:
+        """
+        Run steps 2-10 of the pipeline on a parsed document.
+
+        Args:
+            normalized_text: Preprocessed text with normalized line endings
+            analysis: Analysis of normalized_text
+            trace: Optional trace to record intermediate state in (used by
+                rechunk())
+            profiler: Profiler to record per-stage statistics in
+
+        Returns:
+            Tuple of (chunks, strategy_name)
+        """
         # 2. Calculate adaptive size (if enabled)
+        with profiler.stage("adaptive", len(normalized_text)):
+            effective_config, adaptive_metadata = self._effective_config(normalized_text, analysis)
+
+        # 3. Select strategy
+        with profiler.stage("select", len(normalized_text)):
+            strategy = self._selector.select(analysis, effective_config)
+
+        # 4. Apply strategy
+        with profiler.stage("strategy", len(normalized_text)) as stage:
+            chunks = strategy.apply(normalized_text, analysis, effective_config)
+            stage.items_out = len(chunks)
+
+        # 5. Merge small chunks, fix dangling headers, split oversize sections
+        chunks = self._refine_chunks(chunks, trace, profiler)
+
+        # 6. Apply overlap (if enabled)
+        if self.config.enable_overlap and len(chunks) > 1:
+            with profiler.stage("overlap", len(chunks)) as stage:
+                chunks = self._apply_overlap(chunks)
+                stage.items_out = len(chunks)
+
+        with profiler.stage("metadata", len(chunks)) as stage:
+            # 7. Add standard metadata and source offsets
+            chunks = self._add_metadata(chunks, strategy.name)
+            SpanLocator(normalized_text, analysis.get_line_offsets()).locate_all(chunks)
+
+            # 8. Recalculate derived metadata (section_tags) after all post-processing
+            chunks = self._metadata_recalculator.recalculate_all(chunks)
+
+            # 9. Add adaptive sizing metadata (if enabled)
+            if self.config.use_adaptive_sizing:
+                for chunk in chunks:
+                    chunk.metadata.update(adaptive_metadata)
+            stage.items_out = len(chunks)
+
+        # 10. Validate
+        with profiler.stage("validate", len(chunks)) as stage:
+            if trace is not None:
+                trace.reordered = not self._is_ordered(chunks, 0, len(chunks))
+            self._validate(chunks, normalized_text)
+            stage.items_out = len(chunks)
+
+        return chunks, strategy.name
+
+    def _effective_config(
+        self, normalized_text: str, analysis: ContentAnalysis
+    ) -> tuple[ChunkConfig, dict[str, Any]]:
+        """
+        Calculate the adaptive chunk size (pipeline step 2).
+
+        Returns:
+            Tuple of (config to chunk with, adaptive metadata). Without
+            adaptive sizing these are self.config and an empty dict.
+        """
         effective_config = self.config
-        adaptive_metadata = {}
+        adaptive_metadata: dict[str, Any] = {}
         if self.config.use_adaptive_sizing:
             calculator = AdaptiveSizeCalculator(self.config.adaptive_config)
             adaptive_max_size = calculator.calculate_optimal_size(normalized_text, analysis)
@@ -145,44 +350,111 @@ class MarkdownChunker:
                 use_adaptive_sizing=False,  # Prevent recursion
             )
 
-        # 3. Select strategy
-        strategy = self._selector.select(analysis, effective_config)
+        return effective_config, adaptive_metadata
 
-        # 4. Apply strategy
-        chunks = strategy.apply(normalized_text, analysis, effective_config)
+    def _refine_chunks(
+        self,
+        chunks: list[Chunk],
+        trace: PipelineTrace | None = None,
+        profiler: StageProfiler = NULL_PROFILER,
+    ) -> list[Chunk]:
+        """
+        Post-process strategy output (pipeline steps 5-5.6).
+
+        Args:
+            chunks: Chunks produced by a strategy
+            trace: Optional trace to record intermediate state in
+            profiler: Profiler to record per-stage statistics in
+
+        Returns:
+            Merged, header-fixed and size-split chunks
+        """
+        if trace is not None:
+            trace.record_raw(chunks)
 
         # 5. Merge small chunks
-        chunks = self._merge_small_chunks(chunks)
+        with profiler.stage("merge", len(chunks)) as stage:
+            chunks = self._merge_small_chunks(chunks)
+            stage.items_out = len(chunks)
 
         # 5.5. Prevent dangling headers
         # CRITICAL: This MUST happen BEFORE section splitting
         # so that headers are "attached" to their content before any splitting
-        chunks = self._header_processor.prevent_dangling_headers(chunks)
+        with profiler.stage("dangling_headers", len(chunks)) as stage:
+            chunks = self._header_processor.prevent_dangling_headers(chunks)
+            stage.items_out = len(chunks)
 
         # 5.6. Split oversize sections
         # CRITICAL: This MUST happen AFTER dangling header fix
         # so that split chunks can repeat the header_stack
-        chunks = self._section_splitter.split_oversize_sections(chunks)
+        with profiler.stage("split", len(chunks)) as stage:
+            if trace is None:
+                result = self._section_splitter.split_oversize_sections(chunks)
+            else:
+                # Split chunk by chunk to remember which refined chunk each piece came from
+                result = []
+                for ordinal, chunk in enumerate(chunks):
+                    pieces = self._section_splitter.split_oversize_sections([chunk])
+                    trace.refined_starts.append(chunk.start_line)
+                    trace.ordinals.extend([ordinal] * len(pieces))
+                    result.extend(pieces)
+            stage.items_out = len(result)
+        return result
 
-        # 6. Apply overlap (if enabled)
-        if self.config.enable_overlap and len(chunks) > 1:
-            chunks = self._apply_overlap(chunks)
+    def _iter_finalize(
+        self,
+        chunks: Iterable[Chunk],
+        strategy_name: str,
+        locator: SpanLocator,
+        adaptive_metadata: dict[str, Any],
+    ) -> Iterator[Chunk]:
+        """
+        Streaming pipeline steps 6-10 (overlap, metadata, validation).
 
-        # 7. Add standard metadata
-        chunks = self._add_metadata(chunks, strategy.name)
+        A chunk is finished once its successor is known. Overlap in both
+        directions is set while both chunks are still held, so yielded
+        chunks are never read again.
+        """
+        index = 0
+        current: Chunk | None = None
+
+        for following in chunks:
+            if current is not None:
+                # 6. Apply overlap (if enabled)
+                if self.config.enable_overlap:
+                    pair = [current, following]
+                    self._apply_overlap_at(pair, 0)
+                    self._apply_overlap_at(pair, 1)
+                yield self._finish_chunk(current, index, strategy_name, locator, adaptive_metadata)
+                index += 1
+            current = following
+
+        if current is not None:
+            yield self._finish_chunk(current, index, strategy_name, locator, adaptive_metadata)
+
+    def _finish_chunk(
+        self,
+        chunk: Chunk,
+        index: int,
+        strategy_name: str,
+        locator: SpanLocator,
+        adaptive_metadata: dict[str, Any],
+    ) -> Chunk:
+        """Apply pipeline steps 7-10 to a single chunk."""
+        # 7. Add standard metadata and source offsets
+        self._add_metadata([chunk], strategy_name, start_index=index)
+        locator.locate(chunk)
 
-        # 8. Recalculate derived metadata (section_tags) after all post-processing
-        chunks = self._metadata_recalculator.recalculate_all(chunks)
+        # 8. Recalculate derived metadata (section_tags)
+        self._metadata_recalculator.recalculate_all([chunk])
 
         # 9. Add adaptive sizing metadata (if enabled)
         if self.config.use_adaptive_sizing:
-            for chunk in chunks:
-                chunk.metadata.update(adaptive_metadata)
+            chunk.metadata.update(adaptive_metadata)
 
-        # 10. Validate
-        self._validate(chunks, normalized_text)
-
-        return chunks
+        # 10. Validate (PROP-2; ordering cannot be repaired once yielded)
+        self._validate_sizes([chunk])
+        return chunk
 
     def chunk_with_metrics(self, md_text: str) -> tuple[list[Chunk], ChunkingMetrics]:
         """
@@ -207,11 +479,7 @@ class MarkdownChunker:
         if not md_text or not md_text.strip():
             return [], "none", None
 
-        # Preprocess text
-        md_text = self._preprocess_text(md_text)
-
-        analysis = self._parser.analyze(md_text)
-        normalized_text = md_text.replace("\r\n", "\n").replace("\r", "\n")
+        normalized_text, analysis = self._prepare(md_text)
 
         strategy = self._selector.select(analysis, self.config)
         chunks = strategy.apply(normalized_text, analysis, self.config)
@@ -219,6 +487,7 @@ class MarkdownChunker:
         if self.config.enable_overlap and len(chunks) > 1:
             chunks = self._apply_overlap(chunks)
 
+        SpanLocator(normalized_text, analysis.get_line_offsets()).locate_all(chunks)
         self._validate(chunks, normalized_text)
 
         return chunks, strategy.name, analysis
@@ -255,6 +524,352 @@ class MarkdownChunker:
         # Step 2: Build hierarchy
         return self._hierarchy_builder.build(chunks, md_text)
 
+    def rechunk(self, previous: RechunkResult | None, md_text: str) -> RechunkResult:
+        """
+        Re-chunk an edited document, reusing chunks of unchanged sections.
+
+        The new text is diffed line by line against the text of the previous
+        result. For the structural strategy only the top-level sections
+        touched by the edit (widened until section merges, dangling header
+        fixes and header paths can no longer reach across the boundary) are
+        run through the pipeline; chunks before the edit are reused and
+        chunks after it are copied with shifted line numbers. Overlap
+        metadata is refreshed at the two seams, and source offsets are
+        located again from the edit onwards.
+
+        Other strategies, a changed config or preprocessing transforms,
+        adaptive sizing or a previous result from another chunker fall back
+        to a full re-chunk. Either way
+        the chunks are identical to chunk(md_text) and the result reports
+        which chunks were added, changed or removed.
+
+        In practice only documents of headers and prose benefit: a single
+        code block or table selects the code_aware strategy, and list-heavy
+        text the list_aware strategy, which are always re-chunked fully.
+
+        Args:
+            previous: Result of an earlier rechunk() call on this chunker,
+                or None to chunk from scratch
+            md_text: New document text
+
+        Returns:
+            RechunkResult with the new chunks and a chunk-level diff
+
+        Example:
+            >>> result = chunker.rechunk(None, text)
+            >>> result = chunker.rechunk(result, edited_text)
+            >>> for i in result.added + result.changed:
+            ...     index(result.chunks[i])
+            >>> for chunk in result.removed:
+            ...     unindex(chunk)
+        """
+        if not md_text or not md_text.strip():
+            return RechunkResult(
+                chunks=[],
+                strategy_used="none",
+                removed=list(previous.chunks) if previous else [],
+            )
+
+        normalized_text, analysis = self._prepare(md_text)
+        state = previous._state if previous is not None else None
+
+        if (
+            previous is not None
+            and state is not None
+            and state.config == self.config.to_dict()
+            and state.transforms == self._preprocessor.transforms
+        ):
+            lines = analysis.get_lines() or normalized_text.split("\n")
+            if lines == state.lines:
+                # Nothing changed: the previous chunks are still valid
+                return RechunkResult(
+                    chunks=list(previous.chunks),
+                    strategy_used=previous.strategy_used,
+                    unchanged=list(range(len(previous.chunks))),
+                    full_rechunk=False,
+                    _state=state,
+                )
+
+            result = self._rechunk_sections(previous, normalized_text, analysis)
+            if result is not None:
+                return result
+
+        trace = PipelineTrace()
+        chunks, strategy_name = self._chunk_prepared(normalized_text, analysis, trace)
+        added, changed, removed, unchanged = diff_chunks(
+            previous.chunks if previous else [], chunks
+        )
+        lines = analysis.get_lines() or normalized_text.split("\n")
+        return RechunkResult(
+            chunks=chunks,
+            strategy_used=strategy_name,
+            added=added,
+            changed=changed,
+            removed=removed,
+            unchanged=unchanged,
+            full_rechunk=True,
+            rechunked_lines=(1, len(lines)),
+            _state=RechunkState(
+                lines=lines,
+                headers=analysis.headers,
+                config=self.config.to_dict(),
+                transforms=self._preprocessor.transforms,
+                trace=trace,
+            ),
+        )
+
+    def _rechunk_sections(
+        self, previous: RechunkResult, normalized_text: str, analysis: ContentAnalysis
+    ) -> RechunkResult | None:
+        """
+        Re-chunk only the sections touched by an edit.
+
+        Returns:
+            RechunkResult, or None if the edit needs a full re-chunk
+        """
+        state = previous._state
+        if state is None or self.config.use_adaptive_sizing:
+            return None
+        old_trace = state.trace
+        if old_trace.reordered:
+            return None
+
+        strategy = self._selector.select(analysis, self.config)
+        if (
+            strategy.name != "structural"
+            or previous.strategy_used != "structural"
+            or not analysis.headers
+            or not isinstance(strategy, StructuralStrategy)
+        ):
+            return None
+
+        old_lines = state.lines
+        new_lines = analysis.get_lines() or normalized_text.split("\n")
+        n_new = len(new_lines)
+        delta = n_new - len(old_lines)
+        prefix, suffix = common_affixes(old_lines, new_lines)
+
+        # Candidate window boundaries: lines where a top-level section starts
+        # in both versions of the document
+        level = strategy.max_structural_level
+        old_sections = {h.line: h for h in state.headers if h.level <= level}
+        new_sections = {h.line: h for h in analysis.headers if h.level <= level}
+
+        left = [1] + sorted(
+            line for line in new_sections if 1 < line <= prefix + 1 and line in old_sections
+        )
+        right = sorted(
+            line
+            for line, header in new_sections.items()
+            if line > n_new - suffix
+            and line - delta in old_sections
+            and header_context(analysis.headers, line, header.level)
+            == header_context(state.headers, line - delta, header.level)
+        ) + [n_new + 1]
+
+        li, ri = len(left) - 1, 0
+        while True:
+            start, stop = left[li], right[ri]
+            if start == 1 and stop == n_new + 1:
+                return None  # The edit reaches the whole document
+
+            window_raw = (
+                strategy.apply_sections(normalized_text, analysis, self.config, start, stop - 1)
+                if stop > start
+                else []
+            )
+
+            if len(window_raw) < 2:
+                # A single chunk skips the merge pass, so always re-run at least two
+                if ri + 1 < len(right):
+                    ri += 1
+                else:
+                    li -= 1
+                continue
+
+            if start > 1:
+                raw_before = bisect_left(old_trace.raw_starts, start)
+                if not self._is_stable_seam(
+                    old_trace.raw_metadata[max(raw_before - 2, 0) : raw_before],
+                    old_trace.raw_sizes[raw_before - 1] if raw_before else 0,
+                    [window_raw[0].metadata, old_trace.raw_metadata[raw_before]],
+                    [self._last_text_line(new_lines, start)],
+                ):
+                    li -= 1
+                    continue
+
+            if stop <= n_new:
+                raw_after = bisect_left(old_trace.raw_starts, stop - delta)
+                right_metadata = [old_trace.raw_metadata[raw_after]]
+                if not self._is_stable_seam(
+                    [c.metadata for c in window_raw[-2:]],
+                    window_raw[-1].size,
+                    right_metadata,
+                    [self._last_text_line(new_lines, stop)],
+                ) or not self._is_stable_seam(
+                    old_trace.raw_metadata[max(raw_after - 2, 0) : raw_after],
+                    old_trace.raw_sizes[raw_after - 1],
+                    right_metadata,
+                    [self._last_text_line(old_lines, stop - delta)],
+                ):
+                    ri += 1
+                    continue
+
+            break
+
+        # Run the window through the same post-processing as chunk()
+        window_trace = PipelineTrace()
+        window = self._refine_chunks(window_raw, window_trace)
+
+        # Locate the old chunks the window replaces
+        old_stop = stop - delta
+        raw_first = bisect_left(old_trace.raw_starts, start)
+        raw_last = bisect_left(old_trace.raw_starts, old_stop)
+        refined_first = bisect_left(old_trace.refined_starts, start)
+        refined_last = bisect_left(old_trace.refined_starts, old_stop)
+        final_first = bisect_left(old_trace.ordinals, refined_first)
+        final_last = bisect_left(old_trace.ordinals, refined_last)
+        refined_delta = len(window_trace.refined_starts) - (refined_last - refined_first)
+
+        for chunk in window:
+            shift_moved_from(chunk.metadata, refined_first)
+
+        prefix_chunks = list(previous.chunks[:final_first])
+        suffix_chunks = [shift_chunk(c, delta, refined_delta) for c in previous.chunks[final_last:]]
+
+        # Spans are located again from the first chunk whose search reaches
+        # the edited lines; the chunks before it keep their spans
+        relocate = next(
+            (i for i, c in enumerate(prefix_chunks) if last_line_read(c) > prefix),
+            len(prefix_chunks),
+        )
+        copy_from = relocate
+        if prefix_chunks and self.config.enable_overlap:
+            # The overlap metadata of the chunk before the window is refreshed
+            copy_from = min(copy_from, len(prefix_chunks) - 1)
+        prefix_chunks[copy_from:] = [shift_chunk(c, 0, 0) for c in prefix_chunks[copy_from:]]
+
+        chunks = prefix_chunks + window + suffix_chunks
+        first, last = len(prefix_chunks), len(prefix_chunks) + len(window)
+
+        # Steps 6-10 of chunk(), limited to the window and its seams
+        if self.config.enable_overlap:
+            for i in range(max(first - 1, 0), min(last + 1, len(chunks))):
+                self._apply_overlap_at(chunks, i)
+        self._add_metadata(window, strategy.name)
+        floor = chunks[relocate - 1].start_offset or 0 if relocate else 0
+        SpanLocator(normalized_text, analysis.get_line_offsets(), floor).locate_all(
+            chunks[relocate:]
+        )
+        self._metadata_recalculator.recalculate_all(window)
+        if not self._is_ordered(chunks, first - 1, last + 1):
+            return None  # chunk() would re-sort the whole document
+        self._validate(window, normalized_text)
+
+        for i in range(first, len(chunks)):
+            chunks[i].metadata["chunk_index"] = i
+
+        trace = PipelineTrace(
+            raw_starts=(
+                old_trace.raw_starts[:raw_first]
+                + window_trace.raw_starts
+                + [line + delta for line in old_trace.raw_starts[raw_last:]]
+            ),
+            raw_metadata=(
+                old_trace.raw_metadata[:raw_first]
+                + window_trace.raw_metadata
+                + old_trace.raw_metadata[raw_last:]
+            ),
+            raw_sizes=(
+                old_trace.raw_sizes[:raw_first]
+                + window_trace.raw_sizes
+                + old_trace.raw_sizes[raw_last:]
+            ),
+            refined_starts=(
+                old_trace.refined_starts[:refined_first]
+                + window_trace.refined_starts
+                + [line + delta for line in old_trace.refined_starts[refined_last:]]
+            ),
+            ordinals=(
+                old_trace.ordinals[:final_first]
+                + [o + refined_first for o in window_trace.ordinals]
+                + [o + refined_delta for o in old_trace.ordinals[final_last:]]
+            ),
+        )
+
+        added, changed, removed, unchanged = diff_chunks(
+            previous.chunks[final_first:final_last], window, offset=first
+        )
+        return RechunkResult(
+            chunks=chunks,
+            strategy_used=strategy.name,
+            added=added,
+            changed=changed,
+            removed=removed,
+            unchanged=list(range(first)) + unchanged + list(range(last, len(chunks))),
+            full_rechunk=False,
+            rechunked_lines=(start, stop - 1),
+            _state=RechunkState(
+                lines=new_lines,
+                headers=analysis.headers,
+                config=state.config,
+                transforms=state.transforms,
+                trace=trace,
+            ),
+        )
+
+    def _is_stable_seam(
+        self,
+        left: list[dict[str, Any]],
+        left_size: int,
+        right: list[dict[str, Any]],
+        last_lines: list[str | None],
+    ) -> bool:
+        """
+        Check that post-processing cannot reach across a section boundary.
+
+        Args:
+            left: Strategy metadata of the last (up to two) chunks before
+                the boundary
+            left_size: Size of the last strategy chunk before the boundary
+            right: Strategy metadata of candidate first chunks after it
+            last_lines: Last non-blank line before the boundary in each
+                document version
+
+        Returns:
+            True if chunks on either side are processed independently
+        """
+
+        def stub(metadata: dict[str, Any], size: int = 1) -> Chunk:
+            # Only metadata and size take part in merge decisions
+            return Chunk(content="x" * max(size, 1), start_line=1, end_line=1, metadata=metadata)
+
+        for after in map(stub, right):
+            # Small header chunks merge into a following child section
+            if left and self._should_merge_with_next(stub(left[-1], left_size), after):
+                return False
+            # Small chunks merge within a logical section
+            if any(self._same_logical_section(stub(m), after) for m in left):
+                return False
+
+        # A header ending the previous section would be moved across
+        pattern = self._header_processor.detector.header_pattern
+        for line in last_lines:
+            match = pattern.match(line) if line else None
+            if match and len(match.group(1)) >= 2:
+                return False
+
+        return True
+
+    @staticmethod
+    def _last_text_line(lines: list[str], line: int) -> str | None:
+        """Get the last non-blank line before a 1-indexed line, stripped."""
+        for i in range(line - 2, -1, -1):
+            stripped = lines[i].strip()
+            if stripped:
+                return stripped
+        return None
+
     def chunk_file_streaming(
         self, file_path: str, streaming_config: StreamingConfig | None = None
     ) -> Iterator[Chunk]:
@@ -320,6 +935,10 @@ class MarkdownChunker:
         - next_content: First N characters from next chunk (all except last)
         - overlap_size: Size of context window used
 
+        With config.lazy_overlap, previous_content_length and
+        next_content_length (N) are stored instead of the text; see
+        chunkana.overlap for materializing them.
+
         Context window size:
         - Determined by config.overlap_size (default: 200 characters)
         - Capped at adaptive maximum based on chunk size:
@@ -352,31 +971,39 @@ class MarkdownChunker:
             return chunks
 
         for i in range(len(chunks)):
-            # Previous content (for all except first)
-            if i > 0:
-                prev_chunk = chunks[i - 1]
-                # Adaptive cap: max overlap = overlap_cap_ratio of previous chunk size
-                max_overlap = int(len(prev_chunk.content) * self.config.overlap_cap_ratio)
-                effective_overlap_size = min(self.config.overlap_size, max_overlap)
-
-                overlap_text = self._extract_overlap_end(prev_chunk.content, effective_overlap_size)
-                chunks[i].metadata["previous_content"] = overlap_text
-                chunks[i].metadata["overlap_size"] = len(overlap_text)
+            self._apply_overlap_at(chunks, i)
 
-            # Next content (for all except last)
-            if i < len(chunks) - 1:
-                next_chunk = chunks[i + 1]
-                # Adaptive cap: max overlap = overlap_cap_ratio of next chunk size
-                max_overlap = int(len(next_chunk.content) * self.config.overlap_cap_ratio)
-                effective_overlap_size = min(self.config.overlap_size, max_overlap)
+        return chunks
 
-                overlap_text = self._extract_overlap_start(
-                    next_chunk.content, effective_overlap_size
-                )
+    def _apply_overlap_at(self, chunks: list[Chunk], i: int) -> None:
+        """Set overlap metadata of chunks[i] from its neighbours."""
+        # Previous content (for all except first)
+        if i > 0:
+            prev_chunk = chunks[i - 1]
+            # Adaptive cap: max overlap = overlap_cap_ratio of previous chunk size
+            max_overlap = int(len(prev_chunk.content) * self.config.overlap_cap_ratio)
+            effective_overlap_size = min(self.config.overlap_size, max_overlap)
+
+            overlap_text = self._extract_overlap_end(prev_chunk.content, effective_overlap_size)
+            if self.config.lazy_overlap:
+                chunks[i].metadata[PREVIOUS_LENGTH_KEY] = len(overlap_text)
+            else:
+                chunks[i].metadata["previous_content"] = overlap_text
+            chunks[i].metadata["overlap_size"] = len(overlap_text)
+
+        # Next content (for all except last)
+        if i < len(chunks) - 1:
+            next_chunk = chunks[i + 1]
+            # Adaptive cap: max overlap = overlap_cap_ratio of next chunk size
+            max_overlap = int(len(next_chunk.content) * self.config.overlap_cap_ratio)
+            effective_overlap_size = min(self.config.overlap_size, max_overlap)
+
+            overlap_text = self._extract_overlap_start(next_chunk.content, effective_overlap_size)
+            if self.config.lazy_overlap:
+                chunks[i].metadata[NEXT_LENGTH_KEY] = len(overlap_text)
+            else:
                 chunks[i].metadata["next_content"] = overlap_text
 
-        return chunks
-
     def _extract_overlap_end(self, content: str, size: int) -> str:
         """
         Extract overlap from end of content, respecting word boundaries.
@@ -460,6 +1087,19 @@ class MarkdownChunker:
             pass
 
         # PROP-2: Size bounds
+        self._validate_sizes(chunks)
+
+        # PROP-3: Monotonic ordering
+        for i in range(len(chunks) - 1):
+            if chunks[i].start_line > chunks[i + 1].start_line:
+                # Fix ordering
+                chunks.sort(key=lambda c: (c.start_line, c.end_line))
+                break
+
+        # PROP-4 and PROP-5 are enforced by Chunk.__post_init__
+
+    def _validate_sizes(self, chunks: list[Chunk]) -> None:
+        """PROP-2: Mark chunks above max_chunk_size as allowed oversize."""
         # v2.1: Only code_block_integrity and table_integrity are auto-assigned
         # section_integrity is REMOVED - text/lists should be split, not marked oversize
         for chunk in chunks:
@@ -475,14 +1115,13 @@ class MarkdownChunker:
                     # This indicates the chunk couldn't be split further
                     chunk.metadata["oversize_reason"] = "list_item_integrity"
 
-        # PROP-3: Monotonic ordering
-        for i in range(len(chunks) - 1):
-            if chunks[i].start_line > chunks[i + 1].start_line:
-                # Fix ordering
-                chunks.sort(key=lambda c: (c.start_line, c.end_line))
-                break
-
-        # PROP-4 and PROP-5 are enforced by Chunk.__post_init__
+    @staticmethod
+    def _is_ordered(chunks: list[Chunk], start: int, end: int) -> bool:
+        """Check that chunks[start:end] have non-decreasing start_line (PROP-3)."""
+        return all(
+            chunks[i].start_line <= chunks[i + 1].start_line
+            for i in range(max(start, 0), min(end, len(chunks)) - 1)
+        )
 
     def _merge_small_chunks(self, chunks: list[Chunk]) -> list[Chunk]:
         """
@@ -504,20 +1143,38 @@ class MarkdownChunker:
         if len(chunks) <= 1:
             return chunks
 
+        return list(self._iter_merge_small_chunks(chunks))
+
+    def _iter_merge_small_chunks(self, chunks: Iterable[Chunk]) -> Iterator[Chunk]:
+        """
+        Streaming implementation of _merge_small_chunks().
+
+        Holds the last output chunk (a later small chunk may still merge
+        into it) and one chunk of look-ahead (a small chunk may merge into
+        its successor).
+        """
+        stream = iter(chunks)
+        head = list(islice(stream, 2))
+        if len(head) <= 1:
+            yield from head
+            return
+
         # Phase 1: Merge small header chunks with their section body
-        chunks = self._merge_header_chunks(chunks)
+        merged_headers = self._iter_merge_header_chunks(chain(head, stream))
 
         # Phase 2: Size-based merging for remaining small chunks
-        result: list[Chunk] = []
-        i = 0
+        result: list[Chunk] = []  # Last output chunk, not yet final
+        chunk = next(merged_headers, None)
 
-        while i < len(chunks):
-            chunk = chunks[i]
+        while chunk is not None:
+            following = next(merged_headers, None)
+            window = [chunk] if following is None else [chunk, following]
 
             if chunk.size < self.config.min_chunk_size:
-                merged = self._try_merge(chunk, result, chunks, i)
+                merged = self._try_merge(chunk, result, window, 0)
                 if merged:
-                    i += 1
+                    # Merged into result[-1] or into window[1]
+                    chunk = window[1] if len(window) > 1 else None
                     continue
                 else:
                     # Cannot merge - check if structurally weak before flagging
@@ -525,10 +1182,12 @@ class MarkdownChunker:
                         chunk.metadata["small_chunk"] = True
                         chunk.metadata["small_chunk_reason"] = "cannot_merge"
 
-            result.append(chunk)
-            i += 1
+            if result:
+                yield result[-1]
+            result = [chunk]
+            chunk = following
 
-        return result
+        yield from result
 
     def _merge_header_chunks(self, chunks: list[Chunk]) -> list[Chunk]:
         """
@@ -550,16 +1209,18 @@ class MarkdownChunker:
         if len(chunks) <= 1:
             return chunks
 
-        result = []
-        i = 0
+        return list(self._iter_merge_header_chunks(chunks))
 
-        while i < len(chunks):
-            current = chunks[i]
+    def _iter_merge_header_chunks(self, chunks: Iterable[Chunk]) -> Iterator[Chunk]:
+        """Streaming implementation of _merge_header_chunks()."""
+        stream = iter(chunks)
+        current = next(stream, None)
 
-            # Check if this chunk should be merged with next
-            if i + 1 < len(chunks) and self._should_merge_with_next(current, chunks[i + 1]):
-                next_chunk = chunks[i + 1]
+        while current is not None:
+            next_chunk = next(stream, None)
 
+            # Check if this chunk should be merged with next
+            if next_chunk is not None and self._should_merge_with_next(current, next_chunk):
                 # Merge current header chunk with next chunk
                 merged_content = current.content + "\n\n" + next_chunk.content
                 merged_chunk = Chunk(
@@ -587,13 +1248,11 @@ class MarkdownChunker:
                 elif "section_tags" in next_chunk.metadata:
                     merged_chunk.metadata["section_tags"] = next_chunk.metadata["section_tags"]
 
-                result.append(merged_chunk)
-                i += 2  # Skip next chunk since we merged it
+                yield merged_chunk
+                current = next(stream, None)  # Skip next chunk since we merged it
             else:
-                result.append(current)
-                i += 1
-
-        return result
+                yield current
+                current = next_chunk
 
     def _should_merge_with_next(self, current: Chunk, next_chunk: Chunk) -> bool:
         """
@@ -818,18 +1477,20 @@ class MarkdownChunker:
 
         return parts1 == parts2
 
-    def _add_metadata(self, chunks: list[Chunk], strategy_name: str) -> list[Chunk]:
+    def _add_metadata(
+        self, chunks: list[Chunk], strategy_name: str, start_index: int = 0
+    ) -> list[Chunk]:
         """
         Add standard metadata to all chunks.
 
         Adds:
-        - chunk_index: sequential index
+        - chunk_index: sequential index, starting at start_index
         - content_type: text/code/table/mixed
         - has_code: boolean
         - header_path: list of ancestor headers (if available)
         - strategy: strategy that created the chunk
         """
-        for i, chunk in enumerate(chunks):
+        for i, chunk in enumerate(chunks, start_index):
             chunk.metadata["chunk_index"] = i
             # Don't overwrite content_type if already set (e.g., "preamble")
             if "content_type" not in chunk.metadata:
@@ -7,7 +7,7 @@ pairs, and sequential examples.
 """
 
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
 from .types import FencedBlock
@@ -60,6 +60,41 @@ class CodeContext:
             self.related_blocks = []
 
 
+@dataclass
+class _BlockIndex:
+    """
+    Per-document index of code blocks, built once by CodeContextBinder.
+
+    Attributes:
+        blocks: All code blocks in the document
+        md_text: Document text the index was built for
+        lines: Document lines
+        ordinals: Position of every block in blocks, keyed by id()
+        roles: Memoized role of every block (None until determined)
+    """
+
+    blocks: list[FencedBlock]
+    md_text: str
+    lines: list[str]
+    ordinals: dict[int, int] = field(default_factory=dict)
+    roles: list[CodeBlockRole | None] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        self.ordinals = {id(block): i for i, block in enumerate(self.blocks)}
+        self.roles = [None] * len(self.blocks)
+
+    def ordinal(self, block: FencedBlock) -> int | None:
+        """Position of a block in blocks (None if not indexed)."""
+        ordinal = self.ordinals.get(id(block))
+        if ordinal is not None:
+            return ordinal
+        # Equal block that is not one of the indexed objects
+        try:
+            return self.blocks.index(block)
+        except ValueError:
+            return None
+
+
 class CodeContextBinder:
     """
     Analyzes code blocks and binds them to contextual information.
@@ -71,7 +106,9 @@ class CodeContextBinder:
     - Setup code vs. example code
 
     The binder extracts surrounding explanations and identifies relationships
-    between code blocks to enable intelligent chunking.
+    between code blocks to enable intelligent chunking. Block positions and
+    roles are indexed once per document, so binding all blocks of a
+    document is linear in the number of blocks.
     """
 
     # Compiled regex patterns for role detection
@@ -117,6 +154,20 @@ class CodeContextBinder:
         self.max_context_chars_after = max_context_chars_after
         self.related_block_max_gap = related_block_max_gap
         self._cached_lines = lines  # O1: Store for reuse
+        self._index: _BlockIndex | None = None
+
+    def bind_all(self, all_blocks: list[FencedBlock], md_text: str) -> list[CodeContext]:
+        """
+        Create context bindings for all code blocks of a document.
+
+        Args:
+            all_blocks: All code blocks in the document, in document order
+            md_text: Full markdown document text
+
+        Returns:
+            One CodeContext per block, in the order of all_blocks
+        """
+        return [self.bind_context(block, md_text, all_blocks) for block in all_blocks]
 
     def bind_context(
         self,
@@ -135,6 +186,8 @@ class CodeContextBinder:
         Returns:
             CodeContext with role, explanations, and relationships
         """
+        self._get_index(all_blocks, md_text)
+
         # Determine role
         role = self._determine_role(code_block, md_text)
 
@@ -172,6 +225,18 @@ class CodeContextBinder:
         Returns:
             Classified role
         """
+        index = self._index
+        ordinal = index.ordinal(block) if index and index.md_text is md_text else None
+        if index is None or ordinal is None:
+            return self._classify_role(block, md_text)
+
+        role = index.roles[ordinal]
+        if role is None:
+            role = index.roles[ordinal] = self._classify_role(block, md_text)
+        return role
+
+    def _classify_role(self, block: FencedBlock, md_text: str) -> CodeBlockRole:
+        """Classify a code block (see _determine_role)."""
         # Check cached role first
         cached_role = self._get_cached_role(block)
         if cached_role:
@@ -254,8 +319,7 @@ class CodeContextBinder:
         Returns:
             Preceding text (trimmed to chars)
         """
-        # O1: Use cached lines if available
-        lines = self._cached_lines if self._cached_lines is not None else md_text.split("\n")
+        lines = self._get_lines(md_text)
 
         if block.start_line < 1 or block.start_line > len(lines):
             return ""
@@ -290,8 +354,7 @@ class CodeContextBinder:
         Returns:
             Extracted explanation or None
         """
-        # O1: Use cached lines if available
-        lines = self._cached_lines if self._cached_lines is not None else md_text.split("\n")
+        lines = self._get_lines(md_text)
 
         # Start from line before code block fence
         end_line_idx = code_block.start_line - 2  # 0-indexed, exclude fence
@@ -329,8 +392,7 @@ class CodeContextBinder:
         Returns:
             Extracted explanation or None
         """
-        # O1: Use cached lines if available
-        lines = self._cached_lines if self._cached_lines is not None else md_text.split("\n")
+        lines = self._get_lines(md_text)
 
         # Start from line after code block closing fence
         start_line_idx = code_block.end_line  # 0-indexed (end_line is 1-indexed)
@@ -373,9 +435,8 @@ class CodeContextBinder:
         """
         related: list[FencedBlock] = []
 
-        try:
-            block_idx = all_blocks.index(block)
-        except ValueError:
+        block_idx = self._get_index(all_blocks, md_text).ordinal(block)
+        if block_idx is None:
             return related
 
         # Check previous block
@@ -461,9 +522,8 @@ class CodeContextBinder:
         if role not in [CodeBlockRole.EXAMPLE, CodeBlockRole.SETUP]:
             return None
 
-        try:
-            block_idx = all_blocks.index(block)
-        except ValueError:
+        block_idx = self._get_index(all_blocks, md_text).ordinal(block)
+        if block_idx is None:
             return None
 
         # Check next block
@@ -501,7 +561,7 @@ class CodeContextBinder:
         self, block: FencedBlock, next_block: FencedBlock, md_text: str
     ) -> bool:
         """Check if "Output:" marker exists between two blocks."""
-        lines = md_text.split("\n")
+        lines = self._get_lines(md_text)
         if block.end_line >= len(lines) or next_block.start_line < 2:
             return False
 
@@ -513,3 +573,25 @@ class CodeContextBinder:
 
         between_text = "\n".join(lines[between_start : between_end + 1])
         return any(pattern.search(between_text) for pattern in self.OUTPUT_PATTERNS)
+
+    def _get_index(self, all_blocks: list[FencedBlock], md_text: str) -> _BlockIndex:
+        """Get the block index of a document, building it on first use."""
+        index = self._index
+        if (
+            index is None
+            or index.blocks is not all_blocks
+            or index.md_text is not md_text
+            or len(index.roles) != len(all_blocks)
+        ):
+            lines = self._cached_lines if self._cached_lines is not None else md_text.split("\n")
+            index = self._index = _BlockIndex(all_blocks, md_text, lines)
+        return index
+
+    def _get_lines(self, md_text: str) -> list[str]:
+        """Get document lines, split once per document."""
+        # O1: Use cached lines if available
+        if self._cached_lines is not None:
+            return self._cached_lines
+        if self._index is not None and self._index.md_text is md_text:
+            return self._index.lines
+        return md_text.split("\n")
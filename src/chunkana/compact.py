@@ -0,0 +1,346 @@
+"""
+Compact chunk representation for holding many chunks in memory.
+
+A Chunk keeps its metadata in a regular dict with about a dozen string
+keys. CompactChunk stores the metadata fields that nearly every chunk
+has in typed slots, keeps the other values in a tuple, shares the
+tuple of metadata keys between chunks with the same keys, and interns the
+strings that repeat across chunks (header_path, strategy, content_type,
+section tags). Its metadata property is a dict-compatible view, so code
+written against Chunk.metadata keeps working.
+
+Typical use is a re-index job that holds millions of chunks:
+
+    compact = [CompactChunk.from_chunk(c) for c in chunker.chunk(text)]
+    ...
+    chunks = [c.to_chunk() for c in compact]
+"""
+
+import sys
+from collections.abc import Iterator, MutableMapping
+from typing import Any
+
+from .types import Chunk
+
+# Metadata keys stored in slots (set on nearly every chunk by MarkdownChunker)
+CORE_METADATA_KEYS = (
+    "chunk_index",
+    "content_type",
+    "has_code",
+    "strategy",
+    "header_path",
+    "header_level",
+    "section_tags",
+    "previous_content",
+    "next_content",
+    "overlap_size",
+)
+
+_CORE = frozenset(CORE_METADATA_KEYS)
+_INTERNED = frozenset({"content_type", "strategy", "header_path"})
+
+# A key order and the position of every key in CompactChunk._extra (-1 for
+# core keys, which live in slots)
+_KeyOrder = tuple[tuple[str, ...], dict[str, int]]
+
+# Key orders are shared between chunks; bounded so arbitrary keys cannot grow it
+_KEY_ORDERS: dict[tuple[str, ...], _KeyOrder] = {}
+_MAX_KEY_ORDERS = 4096
+
+
+def _shared_keys(keys: tuple[str, ...]) -> _KeyOrder:
+    """Return the shared key order tuple and position map for keys."""
+    shared = _KEY_ORDERS.get(keys)
+    if shared is not None:
+        return shared
+    positions: dict[str, int] = {}
+    extra_count = 0
+    for key in keys:
+        if key in _CORE:
+            positions[key] = -1
+        else:
+            positions[key] = extra_count
+            extra_count += 1
+    shared = (keys, positions)
+    if len(_KEY_ORDERS) < _MAX_KEY_ORDERS:
+        _KEY_ORDERS[keys] = shared
+    return shared
+
+
+def _compact_value(key: str, value: Any) -> Any:
+    """Intern repeated strings of a core metadata value."""
+    if key in _INTERNED and type(value) is str:
+        return sys.intern(value)
+    if key == "section_tags" and isinstance(value, list):
+        return [sys.intern(tag) if type(tag) is str else tag for tag in value]
+    return value
+
+
+class CompactMetadata(MutableMapping[str, Any]):
+    """
+    Dict-compatible view of a CompactChunk's metadata.
+
+    Iterates in the insertion order of the original metadata dict.
+    Reads and writes go to the chunk's slots (core keys) or its tuple of
+    other values. copy() returns a plain dict.
+    """
+
+    __slots__ = ("_chunk",)
+
+    def __init__(self, chunk: "CompactChunk"):
+        self._chunk = chunk
+
+    def __getitem__(self, key: str) -> Any:
+        chunk = self._chunk
+        position = chunk._positions[key]  # KeyError for missing keys
+        if position < 0:
+            return getattr(chunk, "_" + key)
+        return chunk._extra[position]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        chunk = self._chunk
+        position = chunk._positions.get(key)
+        if key in _CORE:
+            setattr(chunk, "_" + key, _compact_value(key, value))
+        elif position is not None:
+            extra = chunk._extra
+            chunk._extra = (*extra[:position], value, *extra[position + 1 :])
+        else:
+            chunk._extra = (*chunk._extra, value)
+        if position is None:
+            chunk._keys, chunk._positions = _shared_keys((*chunk._keys, key))
+
+    def __delitem__(self, key: str) -> None:
+        chunk = self._chunk
+        position = chunk._positions[key]  # KeyError for missing keys
+        if position < 0:
+            setattr(chunk, "_" + key, None)
+        else:
+            chunk._extra = chunk._extra[:position] + chunk._extra[position + 1 :]
+        chunk._keys, chunk._positions = _shared_keys(tuple(k for k in chunk._keys if k != key))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._chunk._keys)
+
+    def __len__(self) -> int:
+        return len(self._chunk._keys)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._chunk._positions
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+    def copy(self) -> dict[str, Any]:
+        """Return the metadata as a plain dict."""
+        return dict(self)
+
+
+class CompactChunk:
+    """
+    Memory-compact, slotted counterpart of Chunk.
+
+    Holds the same content, line numbers, offsets and metadata as the
+    Chunk it was made from; to_chunk() gives that Chunk back (equal,
+    including the metadata key order).
+
+    Attributes:
+        content: The text content of the chunk
+        start_line: Starting line number (1-indexed)
+        end_line: Ending line number (1-indexed)
+        start_offset: Character offset of the source span, or None
+        end_offset: Character offset just past the source span, or None
+        start_byte: start_offset in UTF-8 bytes, or None
+        end_byte: end_offset in UTF-8 bytes, or None
+
+    The core metadata fields (CORE_METADATA_KEYS) are also available as
+    read-only typed attributes, None when the chunk does not have them;
+    write them through metadata.
+    """
+
+    __slots__ = (
+        "content",
+        "start_line",
+        "end_line",
+        "start_offset",
+        "end_offset",
+        "start_byte",
+        "end_byte",
+        "_chunk_index",
+        "_content_type",
+        "_has_code",
+        "_strategy",
+        "_header_path",
+        "_header_level",
+        "_section_tags",
+        "_previous_content",
+        "_next_content",
+        "_overlap_size",
+        "_keys",
+        "_positions",
+        "_extra",
+    )
+
+    content: str
+    start_line: int
+    end_line: int
+    start_offset: int | None
+    end_offset: int | None
+    start_byte: int | None
+    end_byte: int | None
+    _chunk_index: int | None
+    _content_type: str | None
+    _has_code: bool | None
+    _strategy: str | None
+    _header_path: str | None
+    _header_level: int | None
+    _section_tags: list[str] | None
+    _previous_content: str | None
+    _next_content: str | None
+    _overlap_size: int | None
+    # Metadata keys in insertion order, and their positions in _extra
+    _keys: tuple[str, ...]
+    _positions: dict[str, int]
+    # Values of non-core keys in key order
+    _extra: tuple[Any, ...]
+
+    def __init__(
+        self,
+        content: str,
+        start_line: int,
+        end_line: int,
+        metadata: dict[str, Any] | None = None,
+        start_offset: int | None = None,
+        end_offset: int | None = None,
+        start_byte: int | None = None,
+        end_byte: int | None = None,
+    ):
+        self.content = content
+        self.start_line = start_line
+        self.end_line = end_line
+        self.start_offset = start_offset
+        self.end_offset = end_offset
+        self.start_byte = start_byte
+        self.end_byte = end_byte
+        for key in CORE_METADATA_KEYS:
+            setattr(self, "_" + key, None)
+
+        keys = []
+        extra = []
+        for key, value in (metadata or {}).items():
+            if key in _CORE:
+                setattr(self, "_" + key, _compact_value(key, value))
+            else:
+                extra.append(value)
+            keys.append(key)
+        self._keys, self._positions = _shared_keys(tuple(keys))
+        self._extra = tuple(extra)
+
+    @classmethod
+    def from_chunk(cls, chunk: Chunk) -> "CompactChunk":
+        """Create a compact copy of a Chunk."""
+        return cls(
+            content=chunk.content,
+            start_line=chunk.start_line,
+            end_line=chunk.end_line,
+            metadata=chunk.metadata,
+            start_offset=chunk.start_offset,
+            end_offset=chunk.end_offset,
+            start_byte=chunk.start_byte,
+            end_byte=chunk.end_byte,
+        )
+
+    def to_chunk(self) -> Chunk:
+        """Convert back to a Chunk with a plain metadata dict."""
+        return Chunk(
+            content=self.content,
+            start_line=self.start_line,
+            end_line=self.end_line,
+            metadata=self.metadata.copy(),
+            start_offset=self.start_offset,
+            end_offset=self.end_offset,
+            start_byte=self.start_byte,
+            end_byte=self.end_byte,
+        )
+
+    @property
+    def metadata(self) -> CompactMetadata:
+        """Dict-compatible view of the chunk's metadata."""
+        return CompactMetadata(self)
+
+    @property
+    def chunk_index(self) -> int | None:
+        """Sequential index of the chunk in its document."""
+        return self._chunk_index
+
+    @property
+    def content_type(self) -> str | None:
+        """Content type ("text", "code", "table", "mixed", "preamble")."""
+        return self._content_type
+
+    @property
+    def has_code(self) -> bool | None:
+        """Whether the chunk contains code blocks."""
+        return self._has_code
+
+    @property
+    def strategy(self) -> str:
+        """Strategy that created this chunk ("unknown" if not set)."""
+        return str(self._strategy) if self._strategy is not None else "unknown"
+
+    @property
+    def header_path(self) -> str | None:
+        """Hierarchical path to the first header in the chunk."""
+        return self._header_path
+
+    @property
+    def header_level(self) -> int | None:
+        """Level of the first header in the chunk."""
+        return self._header_level
+
+    @property
+    def section_tags(self) -> list[str] | None:
+        """Section tags of the chunk."""
+        return self._section_tags
+
+    @property
+    def previous_content(self) -> str | None:
+        """Overlap context from the previous chunk."""
+        return self._previous_content
+
+    @property
+    def next_content(self) -> str | None:
+        """Overlap context from the next chunk."""
+        return self._next_content
+
+    @property
+    def overlap_size(self) -> int | None:
+        """Size of the overlap context window."""
+        return self._overlap_size
+
+    @property
+    def size(self) -> int:
+        """Size of chunk in characters."""
+        return len(self.content)
+
+    @property
+    def is_oversize(self) -> bool:
+        """Whether chunk is marked as intentionally oversize."""
+        return bool(self.metadata.get("allow_oversize", False))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to the dictionary Chunk.to_dict() gives."""
+        return self.to_chunk().to_dict()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CompactChunk):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return (
+            f"CompactChunk(start_line={self.start_line}, end_line={self.end_line}, "
+            f"size={self.size}, metadata={self.metadata!r})"
+        )
@@ -72,6 +72,17 @@ class ChunkConfig:
             for better retrieval quality (default: False)
         table_grouping_config: Configuration for table grouping behavior
             (auto-created with defaults if group_related_tables=True)
+        lazy_overlap: Store overlap context as lengths into the neighbouring
+            chunks (previous_content_length, next_content_length) instead of
+            copying the text into previous_content/next_content; see
+            chunkana.overlap (default: False)
+        validation_level: Checks run by chunk_with_validation(): "off",
+            "cheap" (linear in the chunk count), "sampled" (cheap, plus
+            the full checks for a fraction of documents) or "full"
+            (default: "cheap"); "off" also skips the tree invariant checks
+            of hierarchical mode
+        validation_sample_rate: Fraction of documents that get the full
+            checks at validation_level="sampled" (default: 0.1)
     """
 
     # Size parameters
@@ -124,6 +135,13 @@ class ChunkConfig:
     # Overlap cap ratio (limits overlap to fraction of adjacent chunk size)
     overlap_cap_ratio: float = 0.35
 
+    # Store overlap as lengths into neighbouring chunks instead of copied text
+    lazy_overlap: bool = False
+
+    # Output validation parameters
+    validation_level: str = "cheap"
+    validation_sample_rate: float = 0.1
+
     def __post_init__(self) -> None:
         """Validate configuration."""
         self._validate_size_params()
@@ -134,6 +152,7 @@ class ChunkConfig:
         self._validate_latex_params()
         self._validate_table_grouping_params()
         self._validate_overlap_cap_ratio()
+        self._validate_validation_params()
 
     def _validate_size_params(self) -> None:
         """Validate size-related parameters."""
@@ -227,6 +246,19 @@ class ChunkConfig:
                 f"got {self.overlap_cap_ratio}"
             )
 
+    def _validate_validation_params(self) -> None:
+        """Validate output validation parameters."""
+        valid_levels = {"off", "cheap", "sampled", "full"}
+        if self.validation_level not in valid_levels:
+            raise ValueError(
+                f"validation_level must be one of {valid_levels}, got {self.validation_level}"
+            )
+
+        if not 0 <= self.validation_sample_rate <= 1:
+            raise ValueError(
+                f"validation_sample_rate must be between 0 and 1, got {self.validation_sample_rate}"
+            )
+
     def get_table_grouper(self) -> Optional["TableGrouper"]:
         """
         Get TableGrouper instance if table grouping is enabled.
@@ -434,6 +466,7 @@ class ChunkConfig:
             "enable_overlap": self.enable_overlap,  # computed property
             # Chunkana extension fields
             "overlap_cap_ratio": self.overlap_cap_ratio,
+            "lazy_overlap": self.lazy_overlap,
             "use_adaptive_sizing": self.use_adaptive_sizing,
             "adaptive_config": (self.adaptive_config.to_dict() if self.adaptive_config else None),
             "include_document_summary": self.include_document_summary,
@@ -445,6 +478,8 @@ class ChunkConfig:
             "table_grouping_config": (
                 self.table_grouping_config.to_dict() if self.table_grouping_config else None
             ),
+            "validation_level": self.validation_level,
+            "validation_sample_rate": self.validation_sample_rate,
         }
         return result
 
@@ -11,6 +11,7 @@ v2.1 Changes:
 """
 
 import re
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 
 from .config import ChunkConfig
@@ -107,54 +108,110 @@ class DanglingHeaderDetector:
         Returns:
             True if current chunk has dangling header
         """
-        # Find last non-empty line
-        content = current_chunk.content.rstrip()
+        trailing = self.trailing_header(current_chunk)
+        return trailing is not None and self.dangles(trailing, self.leading_content(next_chunk))
+
+    def trailing_header_level(self, chunk: Chunk) -> int:
+        """
+        Get the level of a header the chunk ends with, if it could dangle.
+
+        Args:
+            chunk: Chunk to check
+
+        Returns:
+            Level (2-6) of the trailing header, or 0 if the chunk does not
+            end with a header lacking content
+        """
+        trailing = self.trailing_header(chunk)
+        return trailing[0] if trailing else 0
+
+    def trailing_header(self, chunk: Chunk) -> tuple[int, str, int] | None:
+        """
+        Classify the end of a chunk (steps 1-2 of the detection algorithm).
+
+        These steps depend on the chunk alone; whether the header actually
+        dangles also depends on the next chunk (see dangles()).
+
+        Args:
+            chunk: Chunk to check
+
+        Returns:
+            Tuple of (level, text, line index in the chunk) of the trailing
+            header, or None if the chunk does not end with a level 2-6
+            header lacking content
+        """
+        # Find last non-empty line and its index
+        content = chunk.content.rstrip()
         lines = content.split("\n")
 
         last_line = None
-        for line in reversed(lines):
-            stripped = line.strip()
+        last_line_idx = -1
+        for i in range(len(lines) - 1, -1, -1):
+            stripped = lines[i].strip()
             if stripped:
                 last_line = stripped
+                last_line_idx = i
                 break
 
         if not last_line:
-            return False
+            return None
 
         # Check if it's a header
         header_match = self.header_pattern.match(last_line)
         if not header_match:
-            return False
+            return None
 
         header_level = len(header_match.group(1))
 
         # v2.1: Consider levels 2-6 as potentially dangling (expanded from 3-6)
         # Level 1 is document title, usually not dangling
         if header_level < 2:
-            return False
+            return None
 
         # Check if there's minimal content after the header in current chunk
         # v2.1: Reduced threshold from 50 to 30
         content_after = self._get_content_after_last_header(lines)
         if len(content_after.strip()) > self.MIN_CONTENT_THRESHOLD:
-            return False  # Has substantial content, not dangling
+            return None  # Has substantial content, not dangling
 
-        # Check next chunk
-        next_content = next_chunk.content.lstrip()
-        if not next_content:
-            return False
+        return header_level, header_match.group(2).strip(), last_line_idx
+
+    def leading_content(self, chunk: Chunk) -> tuple[int, int]:
+        """
+        Classify the start of a chunk (step 3 of the detection algorithm).
 
-        next_first_line = next_content.split("\n")[0].strip()
+        Args:
+            chunk: Chunk to check
 
-        # If next chunk starts with a header of same or higher level, not dangling
+        Returns:
+            Tuple of (level of the header on the first non-blank line or 0,
+            length of the stripped content)
+        """
+        next_content = chunk.content.lstrip()
+        if not next_content:
+            return 0, 0
+
+        next_first_line = next_content.split("\n", 1)[0].strip()
         next_header_match = self.header_pattern.match(next_first_line)
-        if next_header_match:
-            next_level = len(next_header_match.group(1))
-            if next_level <= header_level:
-                return False  # Next chunk starts with same/higher level header
+        level = len(next_header_match.group(1)) if next_header_match else 0
+        return level, len(next_content.strip())
+
+    @staticmethod
+    def dangles(trailing: tuple[int, str, int], leading: tuple[int, int]) -> bool:
+        """
+        Check whether a trailing header dangles before a chunk (step 4).
 
-        # Next chunk has content that belongs to this header
-        return len(next_content.strip()) >= 20
+        Args:
+            trailing: trailing_header() of the current chunk
+            leading: leading_content() of the next chunk
+
+        Returns:
+            True if the next chunk holds content for the header
+        """
+        next_level, next_length = leading
+        if next_level and next_level <= trailing[0]:
+            return False  # Next chunk starts with same/higher level header
+        return next_length >= 20
 
     def _get_dangling_header_info(
         self, current_chunk: Chunk, next_chunk: Chunk, chunk_index: int
@@ -170,56 +227,23 @@ class DanglingHeaderDetector:
         Returns:
             DanglingHeaderInfo if dangling header found, None otherwise
         """
-        content = current_chunk.content.rstrip()
-        lines = content.split("\n")
-
-        # Find last non-empty line and its index
-        last_line = None
-        last_line_idx = -1
-        for i in range(len(lines) - 1, -1, -1):
-            stripped = lines[i].strip()
-            if stripped:
-                last_line = stripped
-                last_line_idx = i
-                break
-
-        if not last_line:
-            return None
-
-        header_match = self.header_pattern.match(last_line)
-        if not header_match:
-            return None
-
-        header_level = len(header_match.group(1))
-        header_text = header_match.group(2).strip()
-
-        # v2.1: Detect levels 2-6 (expanded from 3-6)
-        if header_level < 2:
+        trailing = self.trailing_header(current_chunk)
+        if trailing is None or not self.dangles(trailing, self.leading_content(next_chunk)):
             return None
-
-        # Check content after header (v2.1: threshold 30)
-        content_after = self._get_content_after_last_header(lines)
-        if len(content_after.strip()) > self.MIN_CONTENT_THRESHOLD:
-            return None
-
-        # Check next chunk
-        next_content = next_chunk.content.lstrip()
-        if not next_content or len(next_content.strip()) < 20:
-            return None
-
-        next_first_line = next_content.split("\n")[0].strip()
-        next_header_match = self.header_pattern.match(next_first_line)
-        if next_header_match:
-            next_level = len(next_header_match.group(1))
-            if next_level <= header_level:
-                return None
-
+        return self.header_info(current_chunk, trailing, chunk_index)
+
+    @staticmethod
+    def header_info(
+        chunk: Chunk, trailing: tuple[int, str, int], chunk_index: int
+    ) -> DanglingHeaderInfo:
+        """Build the DanglingHeaderInfo of a chunk whose trailing header dangles."""
+        header_level, header_text, line_idx = trailing
         return DanglingHeaderInfo(
             chunk_index=chunk_index,
-            chunk_id=current_chunk.metadata.get("chunk_id"),  # v2.1: Stable ID
+            chunk_id=chunk.metadata.get("chunk_id"),  # v2.1: Stable ID
             header_text=header_text,
             header_level=header_level,
-            header_line_in_chunk=last_line_idx,
+            header_line_in_chunk=line_idx,
         )
 
     def _get_content_after_last_header(self, lines: list[str]) -> str:
@@ -374,8 +398,9 @@ class HeaderMover:
                 import logging
 
                 logger = logging.getLogger(__name__)
+                chunk_index = header_info.chunk_index if header_info else dangling_index
                 logger.warning(
-                    f"Cannot fix dangling header in chunk {dangling_index} "
+                    f"Cannot fix dangling header in chunk {chunk_index} "
                     f"without exceeding size limits. Header: {header_line[:50]}..."
                 )
                 return chunks
@@ -447,38 +472,112 @@ class HeaderProcessor:
         """
         if len(chunks) <= 1:
             return chunks
+        return list(self._iter_fixed(chunks))
 
-        result = chunks.copy()
+    def iter_prevent_dangling_headers(self, chunks: Iterable[Chunk]) -> Iterator[Chunk]:
+        """
+        Streaming variant of prevent_dangling_headers().
 
-        # Iteratively fix dangling headers
-        # We need to iterate because fixing one dangling header might create another
-        max_iterations = 20  # Increased for complex documents
-        iteration = 0
+        Consumes chunks lazily and yields each one as soon as no later fix
+        can change it, which is usually one chunk behind the input.
 
-        while iteration < max_iterations:
-            # Use detailed detection for better tracking
-            dangling_infos = self.detector.detect_dangling_headers_detailed(result)
+        Args:
+            chunks: Chunks to process, in document order
 
-            if not dangling_infos:
-                break  # No more dangling headers
+        Yields:
+            Chunks with dangling headers fixed, identical to the list
+            returned by prevent_dangling_headers()
+        """
+        yield from self._iter_fixed(chunks)
 
-            # Fix the first dangling header found
-            # We fix one at a time because indices change after modifications
-            info = dangling_infos[0]
-            result = self.mover.fix_dangling_header(result, info.chunk_index, info)
+    def _iter_fixed(self, chunks: Iterable[Chunk]) -> Iterator[Chunk]:
+        """
+        Fix dangling headers in one left-to-right worklist pass.
 
-            iteration += 1
+        A fix only touches the dangling chunk and the one after it, so the
+        only pair it can make dangle is the one before it: the pass steps
+        back one chunk after every fix and otherwise moves forward. Headers
+        that cannot be fixed without exceeding the size limit are skipped.
+        Each fix moves a header line forward or merges two chunks, so the
+        pass ends without an iteration cap.
 
-        if iteration >= max_iterations:
-            import logging
+        Args:
+            chunks: Chunks to process, in document order
+        """
+        pending: list[Chunk] = []
+        ends = _ChunkEnds(self.detector)
+        emitted = 0
+        checked = 0  # Pairs (i, i + 1) of pending with i < checked do not dangle
 
-            logger = logging.getLogger(__name__)
-            logger.warning(
-                f"Reached maximum iterations ({max_iterations}) for dangling header fixes. "
-                f"Some dangling headers may remain."
-            )
+        for chunk in chunks:
+            pending.append(chunk)
+            pending, checked = self._fix_pending(pending, emitted, checked, ends)
+
+            ready = self._settled_count(pending, ends)
+            for settled in pending[:ready]:
+                ends.forget(settled)
+            yield from pending[:ready]
+            del pending[:ready]
+            emitted += ready
+            checked = max(checked - ready, 0)
+
+        yield from pending
+
+    def _fix_pending(
+        self, pending: list[Chunk], offset: int, checked: int, ends: "_ChunkEnds"
+    ) -> tuple[list[Chunk], int]:
+        """
+        Fix dangling headers in pending, whose first chunk is chunk ``offset``.
 
-        return result
+        Returns:
+            Tuple of (fixed pending chunks, pairs checked)
+        """
+        i = checked
+        while i < len(pending) - 1:
+            current, following = pending[i], pending[i + 1]
+            trailing = ends.trailing(current)
+            if trailing is None or not self.detector.dangles(trailing, ends.leading(following)):
+                i += 1
+                continue
+
+            # header_moved_from_id falls back to the position in the whole document
+            info = self.detector.header_info(current, trailing, i + offset)
+            fixed = self.mover.fix_dangling_header(pending, i, info)
+            if fixed is pending:
+                i += 1  # Cannot fix without exceeding size limits
+                continue
+
+            ends.forget(current)
+            ends.forget(following)
+            pending = fixed
+            i = max(i - 1, 0)  # The previous chunk now has a new successor
+
+        return pending, i
+
+    def _settled_count(self, pending: list[Chunk], ends: "_ChunkEnds") -> int:
+        """
+        Count leading pending chunks that no later fix can change.
+
+        A chunk only changes when it dangles itself or its predecessor does.
+        A chunk that does not dangle now can only start to when its
+        successor grows (by a fix of the successor), which matters only if
+        the successor is still too short to count as content for a trailing
+        header. A dangling chunk left unfixed (too large to fix) can become
+        fixable when its successor changes.
+        """
+        settled = [False] * len(pending)  # Successor of the last one is unknown
+        for i in range(len(pending) - 2, -1, -1):
+            trailing = ends.trailing(pending[i])
+            if settled[i + 1] or trailing is None:
+                settled[i] = True
+            else:
+                leading = ends.leading(pending[i + 1])
+                settled[i] = leading[1] >= 20 and not self.detector.dangles(trailing, leading)
+
+        count = 0
+        while count < len(pending) and settled[count]:
+            count += 1
+        return count
 
     def update_header_paths(self, chunks: list[Chunk]) -> list[Chunk]:
         """
@@ -502,3 +601,35 @@ class HeaderProcessor:
                 chunk.metadata["header_path_needs_update"] = True
 
         return chunks
+
+
+class _ChunkEnds:
+    """
+    Cache of the trailing-header and leading-content classification of
+    chunks, so each chunk's lines are split once however often its pairs
+    are re-examined.
+    """
+
+    def __init__(self, detector: DanglingHeaderDetector):
+        self.detector = detector
+        self._trailing: dict[int, tuple[Chunk, tuple[int, str, int] | None]] = {}
+        self._leading: dict[int, tuple[Chunk, tuple[int, int]]] = {}
+
+    def trailing(self, chunk: Chunk) -> tuple[int, str, int] | None:
+        """Cached DanglingHeaderDetector.trailing_header()."""
+        entry = self._trailing.get(id(chunk))
+        if entry is None:
+            entry = self._trailing[id(chunk)] = (chunk, self.detector.trailing_header(chunk))
+        return entry[1]
+
+    def leading(self, chunk: Chunk) -> tuple[int, int]:
+        """Cached DanglingHeaderDetector.leading_content()."""
+        entry = self._leading.get(id(chunk))
+        if entry is None:
+            entry = self._leading[id(chunk)] = (chunk, self.detector.leading_content(chunk))
+        return entry[1]
+
+    def forget(self, chunk: Chunk) -> None:
+        """Drop a chunk that will not be examined again."""
+        self._trailing.pop(id(chunk), None)
+        self._leading.pop(id(chunk), None)
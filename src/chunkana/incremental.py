@@ -0,0 +1,252 @@
+"""
+Incremental re-chunking support.
+
+MarkdownChunker.rechunk() compares an edited document with the lines of
+a previous result, re-runs the pipeline only for the top-level sections
+touched by the edit and splices the new chunks between the unchanged
+ones. This module holds the result type, the pipeline trace that makes
+splicing possible, and the pure helpers used to plan and report a
+re-chunk.
+"""
+
+import difflib
+from dataclasses import dataclass, field
+from typing import Any
+
+from .preprocessing import Transform
+from .types import Chunk, Header
+
+# Raw strategy metadata that decides whether chunks merge across a boundary
+_BOUNDARY_METADATA_KEYS = ("header_level", "content_type", "header_path")
+
+
+@dataclass
+class PipelineTrace:
+    """
+    Intermediate state recorded while chunking a document.
+
+    Attributes:
+        raw_starts: start_line of each chunk produced by the strategy
+        raw_metadata: Boundary-relevant metadata of each strategy chunk
+        raw_sizes: Size of each strategy chunk
+        refined_starts: start_line of each chunk after merging and the
+            dangling header fix (before oversize splitting)
+        ordinals: For each final chunk, the index of the refined chunk it
+            was split from
+        reordered: Whether validation had to re-sort the final chunks
+    """
+
+    raw_starts: list[int] = field(default_factory=list)
+    raw_metadata: list[dict[str, Any]] = field(default_factory=list)
+    raw_sizes: list[int] = field(default_factory=list)
+    refined_starts: list[int] = field(default_factory=list)
+    ordinals: list[int] = field(default_factory=list)
+    reordered: bool = False
+
+    def record_raw(self, chunks: list[Chunk]) -> None:
+        """Record strategy output before any post-processing."""
+        for chunk in chunks:
+            self.raw_starts.append(chunk.start_line)
+            self.raw_metadata.append(
+                {k: chunk.metadata[k] for k in _BOUNDARY_METADATA_KEYS if k in chunk.metadata}
+            )
+            self.raw_sizes.append(chunk.size)
+
+
+@dataclass
+class RechunkState:
+    """State a RechunkResult keeps so the next edit can be re-chunked."""
+
+    lines: list[str]
+    headers: list[Header]
+    config: dict[str, Any]
+    transforms: tuple[Transform, ...]  # Preprocessing steps of the chunker
+    trace: PipelineTrace
+
+
+@dataclass
+class RechunkResult:
+    """
+    Result of MarkdownChunker.rechunk().
+
+    ``chunks`` is always identical to what chunk() returns for the new
+    text. The remaining fields describe how it differs from the previous
+    result, comparing chunk content. Chunks reported as unchanged keep
+    their content but may carry shifted line numbers, a new chunk_index
+    or refreshed overlap metadata.
+
+    Attributes:
+        chunks: Chunks of the new document
+        strategy_used: Strategy that produced the chunks
+        added: Indices into chunks of chunks with new content
+        changed: Indices into chunks of chunks whose content replaced an
+            old chunk at the same position
+        removed: Old chunks whose content no longer appears
+        unchanged: Indices into chunks of chunks carried over unchanged
+        full_rechunk: True when the whole document was re-chunked
+        rechunked_lines: (start_line, end_line) of the re-chunked region in
+            the new document, or None when nothing had to be re-chunked
+    """
+
+    chunks: list[Chunk]
+    strategy_used: str
+    added: list[int] = field(default_factory=list)
+    changed: list[int] = field(default_factory=list)
+    removed: list[Chunk] = field(default_factory=list)
+    unchanged: list[int] = field(default_factory=list)
+    full_rechunk: bool = True
+    rechunked_lines: tuple[int, int] | None = None
+    _state: RechunkState | None = field(default=None, repr=False, compare=False)
+
+    @property
+    def chunk_count(self) -> int:
+        """Number of chunks produced."""
+        return len(self.chunks)
+
+    @property
+    def has_changes(self) -> bool:
+        """Whether any chunk content was added, changed or removed."""
+        return bool(self.added or self.changed or self.removed)
+
+
+def common_affixes(old_lines: list[str], new_lines: list[str]) -> tuple[int, int]:
+    """
+    Count leading and trailing lines shared by two documents.
+
+    Args:
+        old_lines: Lines of the previous document
+        new_lines: Lines of the new document
+
+    Returns:
+        Tuple of (prefix, suffix) line counts. The two never overlap:
+        prefix + suffix <= min(len(old_lines), len(new_lines)).
+    """
+    limit = min(len(old_lines), len(new_lines))
+
+    prefix = 0
+    while prefix < limit and old_lines[prefix] == new_lines[prefix]:
+        prefix += 1
+
+    suffix = 0
+    while suffix < limit - prefix and old_lines[-1 - suffix] == new_lines[-1 - suffix]:
+        suffix += 1
+
+    return prefix, suffix
+
+
+def header_context(headers: list[Header], line: int, level: int) -> tuple[tuple[int, str], ...]:
+    """
+    Get the ancestor headers in effect for a header at a given line.
+
+    These are the headers a section starting at ``line`` with a header of
+    ``level`` inherits in its header_path.
+
+    Args:
+        headers: All document headers in line order
+        line: Line of the section header (1-indexed)
+        level: Level of the section header
+
+    Returns:
+        (level, text) of each ancestor, outermost first
+    """
+    stack: list[Header] = []
+    for header in headers:
+        if header.line >= line:
+            break
+        while stack and stack[-1].level >= header.level:
+            stack.pop()
+        stack.append(header)
+    return tuple((h.level, h.text) for h in stack if h.level < level)
+
+
+def shift_moved_from(metadata: dict[str, Any], offset: int) -> None:
+    """
+    Shift index-based header_moved_from_id values in place.
+
+    The dangling header fix falls back to the position of the source chunk
+    when chunks have no chunk_id, so the value moves with the number of
+    chunks in front of it.
+
+    Args:
+        metadata: Chunk metadata to update
+        offset: Number of positions to shift by
+    """
+    value = metadata.get("header_moved_from_id")
+    if value is None or offset == 0:
+        return
+
+    def _shift(item: str) -> str:
+        return str(int(item) + offset) if item.isdigit() else item
+
+    if isinstance(value, str):
+        metadata["header_moved_from_id"] = _shift(value)
+    elif isinstance(value, list):
+        metadata["header_moved_from_id"] = [_shift(v) for v in value]
+
+
+def shift_chunk(chunk: Chunk, line_delta: int, moved_from_delta: int) -> Chunk:
+    """
+    Copy a chunk whose text moved within the document.
+
+    Source offsets are copied unchanged; they depend on the text around
+    the chunk, so chunks near or after an edit are located again with
+    SpanLocator.
+
+    Args:
+        chunk: Chunk from a previous result (left untouched)
+        line_delta: Number of lines the chunk moved by
+        moved_from_delta: Shift for index-based header_moved_from_id values
+
+    Returns:
+        New chunk with shifted line numbers and copied metadata
+    """
+    shifted = Chunk(
+        content=chunk.content,
+        start_line=chunk.start_line + line_delta,
+        end_line=chunk.end_line + line_delta,
+        metadata=dict(chunk.metadata),
+        start_offset=chunk.start_offset,
+        end_offset=chunk.end_offset,
+        start_byte=chunk.start_byte,
+        end_byte=chunk.end_byte,
+    )
+    shift_moved_from(shifted.metadata, moved_from_delta)
+    return shifted
+
+
+def diff_chunks(
+    old_chunks: list[Chunk], new_chunks: list[Chunk], offset: int = 0
+) -> tuple[list[int], list[int], list[Chunk], list[int]]:
+    """
+    Compare two chunk sequences by content.
+
+    Args:
+        old_chunks: Chunks before the edit
+        new_chunks: Chunks after the edit
+        offset: Added to every reported index into new_chunks
+
+    Returns:
+        Tuple of (added, changed, removed, unchanged). added, changed and
+        unchanged are indices into new_chunks; removed holds old chunks.
+    """
+    added: list[int] = []
+    changed: list[int] = []
+    removed: list[Chunk] = []
+    unchanged: list[int] = []
+
+    matcher = difflib.SequenceMatcher(
+        None,
+        [c.content for c in old_chunks],
+        [c.content for c in new_chunks],
+        autojunk=False,
+    )
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            unchanged.extend(range(offset + j1, offset + j2))
+            continue
+        paired = min(i2 - i1, j2 - j1) if tag == "replace" else 0
+        changed.extend(range(offset + j1, offset + j1 + paired))
+        added.extend(range(offset + j1 + paired, offset + j2))
+        removed.extend(old_chunks[i1 + paired : i2])
+
+    return added, changed, removed, unchanged
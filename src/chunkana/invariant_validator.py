@@ -177,6 +177,10 @@ class InvariantValidator:
         - Overlap
         - Content duplication
 
+        Lines are looked up in a set of normalized chunk lines first; only
+        the lines not found there are searched in the joined chunk text, so
+        the usual case is linear in the document size.
+
         Args:
             chunks: List of chunks
             original: Original text
@@ -199,15 +203,16 @@ class InvariantValidator:
         if not original_lines:
             return 1.0
 
-        # Collect all text from chunks (normalized)
-        chunks_text = normalize(" ".join(c.content for c in chunks))
+        # Most lines are copied verbatim into a chunk: match them by hash
+        chunk_lines = {normalize(line) for c in chunks for line in c.content.split("\n")}
+        missing = {line for line in original_lines if line not in chunk_lines}
 
-        # Count how many original lines are found
-        found = 0
-        for line in original_lines:
-            if line in chunks_text:
-                found += 1
+        if missing:
+            # The rest may span lines or chunks, or be part of a longer line
+            chunks_text = normalize(" ".join(c.content for c in chunks))
+            missing = {line for line in missing if line not in chunks_text}
 
+        found = sum(1 for line in original_lines if line not in missing)
         return found / len(original_lines)
 
     def validate_no_dangling(self, chunks: list[Chunk]) -> bool:
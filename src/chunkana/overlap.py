@@ -0,0 +1,100 @@
+"""
+Lazy overlap context.
+
+By default the chunker copies overlap context into every chunk's metadata
+(previous_content, next_content). With ChunkConfig(lazy_overlap=True) it
+records only how much of each neighbour's content is context:
+
+- previous_content_length: length of the suffix of the previous chunk
+- next_content_length: length of the prefix of the next chunk
+
+The context text is then materialized on demand from the neighbouring
+chunks. Neighbours are found by chunk_index, so a list of chunks that was
+re-sorted still resolves correctly; a neighbour missing from the list
+(e.g. after filtering) gives empty context.
+"""
+
+from .types import Chunk
+
+PREVIOUS_LENGTH_KEY = "previous_content_length"
+NEXT_LENGTH_KEY = "next_content_length"
+
+
+def overlap_context(chunks: list[Chunk]) -> list[tuple[str, str]]:
+    """
+    Get the (previous, next) overlap context of each chunk.
+
+    Works for materialized overlap (previous_content/next_content) and lazy
+    overlap (lengths into the neighbouring chunks) alike. Chunks without
+    overlap get empty strings.
+
+    Args:
+        chunks: Chunks in document order
+
+    Returns:
+        One (previous_content, next_content) pair per chunk
+    """
+    by_index = {
+        chunk.metadata["chunk_index"]: chunk
+        for chunk in chunks
+        if isinstance(chunk.metadata.get("chunk_index"), int)
+    }
+
+    result = []
+    for i, chunk in enumerate(chunks):
+        metadata = chunk.metadata
+        previous = metadata.get("previous_content", "")
+        if PREVIOUS_LENGTH_KEY in metadata:
+            neighbour = _neighbour(chunks, by_index, i, -1)
+            if neighbour is not None:
+                content = neighbour.content
+                previous = content[len(content) - metadata[PREVIOUS_LENGTH_KEY] :]
+
+        next_ = metadata.get("next_content", "")
+        if NEXT_LENGTH_KEY in metadata:
+            neighbour = _neighbour(chunks, by_index, i, 1)
+            if neighbour is not None:
+                next_ = neighbour.content[: metadata[NEXT_LENGTH_KEY]]
+
+        result.append((previous, next_))
+    return result
+
+
+def materialize_overlap(chunks: list[Chunk]) -> list[Chunk]:
+    """
+    Replace lazy overlap lengths with previous_content/next_content text.
+
+    Modifies the chunks in place; the result has the metadata the chunker
+    produces with lazy_overlap=False.
+
+    Args:
+        chunks: Chunks in document order
+
+    Returns:
+        The same chunks
+    """
+    contexts = overlap_context(chunks)
+    for chunk, (previous, next_) in zip(chunks, contexts, strict=True):
+        metadata = chunk.metadata
+        if PREVIOUS_LENGTH_KEY not in metadata and NEXT_LENGTH_KEY not in metadata:
+            continue
+        # Rebuild to keep the key positions of the materialized layout
+        materialized = {}
+        for key, value in metadata.items():
+            if key == PREVIOUS_LENGTH_KEY:
+                materialized["previous_content"] = previous
+            elif key == NEXT_LENGTH_KEY:
+                materialized["next_content"] = next_
+            else:
+                materialized[key] = value
+        chunk.metadata = materialized
+    return chunks
+
+
+def _neighbour(chunks: list[Chunk], by_index: dict[int, Chunk], i: int, step: int) -> Chunk | None:
+    """Find the chunk before (step=-1) or after (step=1) chunks[i]."""
+    index = chunks[i].metadata.get("chunk_index")
+    if isinstance(index, int):
+        return by_index.get(index + step)
+    j = i + step
+    return chunks[j] if 0 <= j < len(chunks) else None
@@ -0,0 +1,181 @@
+"""
+Content-addressed cache for parsed documents.
+
+Re-chunking the same document with different ChunkConfig values (for
+example when comparing max_chunk_size or overlap settings) repeats
+Parser.analyze on identical text. ParseCache stores the resulting
+ContentAnalysis, including its line array, keyed by a hash of the
+normalized text so repeat calls skip parsing entirely.
+
+Cached analyses are shared between callers and must be treated as
+read-only.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from .types import ContentAnalysis
+
+
+@dataclass
+class ParseCacheStats:
+    """
+    Counters for a ParseCache.
+
+    Attributes:
+        hits: Lookups answered from the cache
+        misses: Lookups that required parsing
+        evictions: Entries dropped to respect the cache bounds
+        entries: Number of analyses currently cached
+        cached_chars: Total characters of the documents currently cached
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    cached_chars: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": self.entries,
+            "cached_chars": self.cached_chars,
+            "hit_rate": self.hit_rate,
+        }
+
+
+class ParseCache:
+    """
+    LRU cache of ContentAnalysis objects keyed by normalized text.
+
+    The cache is bounded by entry count and, optionally, by the total
+    number of characters of cached documents. Least recently used entries
+    are evicted first. All operations are thread-safe.
+
+    Usage:
+        >>> cache = ParseCache(max_entries=64)
+        >>> chunker = MarkdownChunker(config, parse_cache=cache)
+        >>> chunker.chunk(text)  # parses
+        >>> MarkdownChunker(other_config, parse_cache=cache).chunk(text)  # cache hit
+        >>> cache.stats.hits
+        1
+    """
+
+    def __init__(self, max_entries: int = 128, max_chars: int | None = None):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Maximum number of cached analyses
+            max_chars: Optional bound on the total characters of cached
+                documents. A document larger than this bound is not cached.
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1, got {max_entries}")
+        if max_chars is not None and max_chars < 1:
+            raise ValueError(f"max_chars must be >= 1 or None, got {max_chars}")
+
+        self.max_entries = max_entries
+        self.max_chars = max_chars
+        self._entries: OrderedDict[str, ContentAnalysis] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._cached_chars = 0
+
+    @staticmethod
+    def make_key(normalized_text: str) -> str:
+        """
+        Build the cache key for already-normalized text.
+
+        Args:
+            normalized_text: Text with line endings normalized to \\n
+
+        Returns:
+            Hex digest identifying the text content
+        """
+        data = normalized_text.encode("utf-8", "surrogatepass")
+        return hashlib.blake2b(data, digest_size=20).hexdigest()
+
+    def get(self, key: str) -> ContentAnalysis | None:
+        """
+        Look up an analysis and mark it as recently used.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Cached ContentAnalysis, or None on a miss
+        """
+        with self._lock:
+            analysis = self._entries.get(key)
+            if analysis is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return analysis
+
+    def put(self, key: str, analysis: ContentAnalysis) -> None:
+        """
+        Store an analysis, evicting least recently used entries as needed.
+
+        Args:
+            key: Key from make_key()
+            analysis: Analysis of the text the key was built from
+        """
+        size = analysis.total_chars
+        if self.max_chars is not None and size > self.max_chars:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._cached_chars -= previous.total_chars
+            self._entries[key] = analysis
+            self._cached_chars += size
+
+            while len(self._entries) > self.max_entries or (
+                self.max_chars is not None and self._cached_chars > self.max_chars
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._cached_chars -= evicted.total_chars
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries. Counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._cached_chars = 0
+
+    @property
+    def stats(self) -> ParseCacheStats:
+        """Snapshot of the cache counters."""
+        with self._lock:
+            return ParseCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                cached_chars=self._cached_chars,
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
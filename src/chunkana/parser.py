@@ -1,4 +1,7 @@
 import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 from .types import (
     ContentAnalysis,
@@ -6,12 +9,544 @@ from .types import (
     Header,
     LatexBlock,
     LatexType,
+    LineView,
     ListBlock,
     ListItem,
     ListType,
     TableBlock,
 )
 
+if TYPE_CHECKING:
+    from .parse_cache import ParseCache
+
+# O1c: Pre-compiled helper patterns (previously rebuilt on every call)
+_TABLE_SEPARATOR_PATTERN = re.compile(r"-{3,}")
+
+# First non-whitespace characters that can start a list item
+_LIST_MARKER_CHARS = frozenset("-*+0123456789")
+
+
+@lru_cache(maxsize=64)
+def fence_closing_pattern(fence_char: str, fence_length: int) -> re.Pattern[str]:
+    """Compiled closing-fence pattern for a given fence character and length."""
+    return re.compile(rf"^(\s*)({re.escape(fence_char)}{{{fence_length},}})\s*$")
+
+
+@lru_cache(maxsize=16)
+def latex_env_end_pattern(env_name: str) -> re.Pattern[str]:
+    """Compiled \\end{...} pattern for a LaTeX environment name."""
+    return re.compile(rf"^\\end\{{{re.escape(env_name)}\*?\}}")
+
+
+@dataclass
+class _ScanResult:
+    """Elements and running metrics produced by a single line scan."""
+
+    positions: list[int]
+    code_blocks: list[FencedBlock] = field(default_factory=list)
+    latex_blocks: list[LatexBlock] = field(default_factory=list)
+    headers: list[Header] = field(default_factory=list)
+    tables: list[TableBlock] = field(default_factory=list)
+    list_blocks: list[ListBlock] = field(default_factory=list)
+    code_chars: int = 0
+    latex_chars: int = 0
+    list_chars: int = 0
+    list_item_count: int = 0
+    max_list_depth: int = 0
+    has_checkbox_lists: bool = False
+    max_header_depth: int = 0
+    has_preamble: bool = False
+    preamble_end_line: int = 0
+    sentence_count: int = 0
+    sentence_chars: int = 0
+
+
+class _LineScanner:
+    """
+    Line tokenizer behind Parser.analyze.
+
+    scan() classifies every line once for the elements strategy selection
+    always needs: code blocks, headers and tables.
+
+    Fences are tracked with the semantics each family had when it was
+    extracted by a pass of its own:
+
+    - code blocks close only on a matching fence (an inner fence line is
+      content)
+    - headers and tables skip lines inside a fence stack, where any fence
+      line that does not close the innermost fence opens a nested one
+    - lists keep a fence stack of their own that ignores the lines absorbed
+      into a list block
+
+    Lists, LaTeX and sentence statistics are scanned later, only when first
+    read from the analysis (scan_family()); LaTeX skips the lines of the
+    extracted code blocks, passed in as a per-line mask.
+    """
+
+    def __init__(self, parser: "Parser", lines: list[str]) -> None:
+        self._parser = parser
+        self._lines = lines
+        self._n = len(lines)
+        self.result = _ScanResult(positions=[])
+
+        # Fence state: (fence_char, fence_length, language, start_idx, start_pos)
+        self._fence: tuple[str, int, str, int, int] | None = None
+
+        # Nested fence stack of (fence_char, fence_length) for headers and
+        # tables in scan(), or for lists in scan_family()
+        self._fence_stack: list[tuple[str, int]] = []
+
+        # LaTeX state: (latex_type, env_name, start_idx, start_pos)
+        self._latex: tuple[LatexType, str | None, int, int] | None = None
+
+        # Table state: index of the header row, or -1 when not in a table
+        self._table_start = -1
+
+        # List state
+        self._list_items: list[ListItem] = []
+        self._list_ends: list[int] = []  # end line index (exclusive) per item
+        self._list_type: ListType | None = None
+        self._list_max_depth = 0
+        self._list_end_idx = 0
+        self._list_lookahead: ListItem | None = None
+
+        # Preamble state
+        self._seen_content = False
+
+        # Sentence state: the piece of text since the last '.', tracked as
+        # (length, first non-whitespace offset, last non-whitespace end)
+        self._piece_len = 0
+        self._piece_first = -1
+        self._piece_last = 0
+
+    def scan(self) -> _ScanResult:
+        """Scan code blocks, headers and tables and close any open blocks."""
+        positions = self.result.positions
+        pos = 0
+        for i, line in enumerate(self._lines):
+            positions.append(pos)
+            if "```" in line or "~~~" in line:
+                self._step_code(i, line, pos)
+                in_fence = self._step_fence_stack(line)
+            else:
+                in_fence = bool(self._fence_stack)
+            if not in_fence:
+                self._step_header(i, line, pos)
+            if not self._seen_content and not self.result.headers and line.strip():
+                self._seen_content = True
+            self._step_table(i, line, in_fence)
+            pos += len(line) + 1
+        positions.append(pos)
+
+        end = self._n
+        if self._fence is not None:
+            self._close_code(end_idx=end, end_pos=pos, is_closed=False)
+        if self._table_start >= 0:
+            self._close_table(end_idx=end)
+        return self.result
+
+    def scan_family(
+        self, family: str, positions: list[int], in_code: bytearray | None = None
+    ) -> _ScanResult:
+        """
+        Scan one lazily parsed family: "lists", "latex" or "sentences".
+
+        Args:
+            family: Family to scan
+            positions: Line start offsets from scan()
+            in_code: For "latex", 1 for every line of a fenced code block
+                (fences included)
+
+        Returns:
+            Scan result with the family's elements and metrics filled in
+        """
+        lines = self._lines
+        self.result.positions = positions
+        if family == "lists":
+            for i, line in enumerate(lines):
+                self._step_list(i, line)
+            if self._list_items:
+                self._close_list()
+        elif family == "latex":
+            assert in_code is not None
+            for i, line in enumerate(lines):
+                self._step_latex(i, line, positions[i], bool(in_code[i]))
+            if self._latex is not None:
+                self._close_latex(end_idx=self._n - 1, end_pos=positions[-1])
+        else:
+            for i, line in enumerate(lines):
+                self._step_sentences(i, line)
+            if self._n:
+                self._finish_piece()
+        return self.result
+
+    # ------------------------------------------------------------------
+    # Code fences
+    # ------------------------------------------------------------------
+
+    def _step_code(self, i: int, line: str, pos: int) -> None:
+        """Advance the code block fence state on a line that may be a fence."""
+        if self._fence is not None:
+            fence_char, fence_length = self._fence[0], self._fence[1]
+            if self._parser._is_fence_closing(line, fence_char, fence_length):
+                self._close_code(end_idx=i, end_pos=pos + len(line) + 1, is_closed=True)
+            return
+
+        fence_info = self._parser._is_fence_opening(line)
+        if fence_info:
+            fence_char, fence_length, language = fence_info
+            self._fence = (fence_char, fence_length, language, i, pos)
+
+    def _step_fence_stack(self, line: str) -> bool:
+        """Advance the nested fence stack; return True if the line is skipped."""
+        stack = self._fence_stack
+        if stack and self._parser._is_fence_closing(line, *stack[-1]):
+            stack.pop()
+            return True
+        fence_info = self._parser._is_fence_opening(line)
+        if fence_info:
+            stack.append(fence_info[:2])
+            return True
+        return bool(stack)
+
+    def _close_code(self, end_idx: int, end_pos: int, is_closed: bool) -> None:
+        assert self._fence is not None
+        fence_char, fence_length, language, start_idx, start_pos = self._fence
+        content = LineView(self._lines, start_idx + 1, end_idx if is_closed else self._n)
+        block = FencedBlock(
+            language=language if language else None,
+            content="",
+            start_line=start_idx + 1,
+            end_line=min(end_idx + 1, self._n),
+            start_pos=start_pos,
+            end_pos=end_pos,
+            fence_char=fence_char,
+            fence_length=fence_length,
+            is_closed=is_closed,
+        )
+        block._set_lines(content)
+        self.result.code_blocks.append(block)
+        self.result.code_chars += len(content)
+        self._fence = None
+
+    # ------------------------------------------------------------------
+    # LaTeX
+    # ------------------------------------------------------------------
+
+    def _step_latex(self, i: int, line: str, pos: int, in_code: bool) -> None:
+        """Advance LaTeX state. Open blocks consume lines regardless of fences."""
+        if self._latex is not None:
+            latex_type, env_name = self._latex[0], self._latex[1]
+            if latex_type == LatexType.DISPLAY:
+                closed = self._parser._is_display_delimiter(line)
+            else:
+                closed = self._parser._is_environment_end(line, env_name or "")
+            if closed:
+                self._close_latex(end_idx=i, end_pos=pos + len(line) + 1)
+            return
+
+        if in_code:
+            return
+
+        if "$$" in line:
+            if line.count("$$") >= 2:
+                # Single line display math
+                self._add_latex(
+                    latex_type=LatexType.DISPLAY,
+                    start_idx=i,
+                    end_idx=i,
+                    start_pos=pos,
+                    end_pos=pos + len(line),
+                )
+            else:
+                self._latex = (LatexType.DISPLAY, None, i, pos)
+            return
+
+        if "\\begin{" in line:
+            env_name = self._parser._is_environment_start(line)
+            if env_name:
+                self._latex = (LatexType.ENVIRONMENT, env_name, i, pos)
+
+    def _close_latex(self, end_idx: int, end_pos: int) -> None:
+        assert self._latex is not None
+        latex_type, env_name, start_idx, start_pos = self._latex
+        self._add_latex(
+            latex_type=latex_type,
+            start_idx=start_idx,
+            end_idx=end_idx,
+            start_pos=start_pos,
+            end_pos=end_pos,
+            env_name=env_name,
+        )
+        self._latex = None
+
+    def _add_latex(
+        self,
+        latex_type: LatexType,
+        start_idx: int,
+        end_idx: int,
+        start_pos: int,
+        end_pos: int,
+        env_name: str | None = None,
+    ) -> None:
+        content = LineView(self._lines, start_idx, end_idx + 1)
+        block = self._parser._create_latex_block(
+            content="",
+            latex_type=latex_type,
+            start_line=start_idx + 1,
+            end_line=end_idx + 1,
+            start_pos=start_pos,
+            end_pos=end_pos,
+            env_name=env_name,
+        )
+        block._set_lines(content)
+        self.result.latex_blocks.append(block)
+        self.result.latex_chars += len(content)
+
+    # ------------------------------------------------------------------
+    # Headers and preamble
+    # ------------------------------------------------------------------
+
+    def _step_header(self, i: int, line: str, pos: int) -> None:
+        result = self.result
+        header_match = self._parser.HEADER_PATTERN.match(line) if line[:1] == "#" else None
+        if header_match is None:
+            return
+
+        level = len(header_match.group(1))
+        if not result.headers and self._seen_content:
+            result.has_preamble = True
+            result.preamble_end_line = i
+        result.headers.append(
+            Header(
+                level=level,
+                text=header_match.group(2).strip(),
+                line=i + 1,  # 1-indexed
+                pos=pos,
+            )
+        )
+        if level > result.max_header_depth:
+            result.max_header_depth = level
+
+    # ------------------------------------------------------------------
+    # Tables
+    # ------------------------------------------------------------------
+
+    def _step_table(self, i: int, line: str, in_fence: bool) -> None:
+        if self._table_start >= 0:
+            if "|" in line:
+                return
+            self._close_table(end_idx=i)
+
+        if in_fence or "|" not in line or i + 1 >= self._n:
+            return
+        next_line = self._lines[i + 1]
+        if "|" in next_line and _TABLE_SEPARATOR_PATTERN.search(next_line):
+            self._table_start = i
+
+    def _close_table(self, end_idx: int) -> None:
+        """Close the open table; end_idx is the index of the first non-row line."""
+        start_idx = self._table_start
+        table = TableBlock(
+            content="",
+            start_line=start_idx + 1,
+            end_line=end_idx,
+            column_count=max(self._lines[start_idx].count("|") - 1, 1),
+            row_count=max(end_idx - start_idx - 2, 0),
+        )
+        table._set_lines(LineView(self._lines, start_idx, end_idx))
+        self.result.tables.append(table)
+        self._table_start = -1
+
+    # ------------------------------------------------------------------
+    # Lists
+    # ------------------------------------------------------------------
+
+    def _step_list(self, i: int, line: str) -> None:
+        if self._list_items:
+            if not line.strip():
+                # Empty line: the block continues only if the next line is an
+                # item of the same type. Keep the parsed item for reuse.
+                if i + 1 < self._n:
+                    next_item = self._parser._try_parse_list_item(self._lines[i + 1], i + 2)
+                    if next_item and next_item.list_type == self._list_type:
+                        self._list_lookahead = next_item
+                        return
+                self._close_list()
+                return
+
+            item = self._list_lookahead or self._parser._try_parse_list_item(line, i + 1)
+            self._list_lookahead = None
+            if item is None:
+                # Continuation line, not seen by the fence stack
+                self._list_ends[-1] = i + 1
+                self._list_end_idx = i
+                return
+            if item.list_type == self._list_type:
+                self._add_list_item(i, item)
+                return
+            # Type changed - close this block and start a new one here (the
+            # fence stack is empty while a block is open)
+            self._close_list()
+            self._start_list(i, item)
+            return
+
+        if "```" in line or "~~~" in line:
+            in_fence = self._step_fence_stack(line)
+        else:
+            in_fence = bool(self._fence_stack)
+        if not in_fence:
+            item = self._parser._try_parse_list_item(line, i + 1)
+            if item:
+                self._start_list(i, item)
+
+    def _start_list(self, i: int, item: ListItem) -> None:
+        self._list_type = item.list_type
+        self._add_list_item(i, item)
+
+    def _add_list_item(self, i: int, item: ListItem) -> None:
+        self._list_items.append(item)
+        self._list_ends.append(i + 1)
+        if item.depth > self._list_max_depth:
+            self._list_max_depth = item.depth
+        self._list_end_idx = i
+
+    def _close_list(self) -> None:
+        result = self.result
+        items = self._list_items
+        lines = self._lines
+        for item, end in zip(items, self._list_ends, strict=True):
+            start = item.line_number - 1
+            if end - start > 1:
+                # Item text continues on the following lines (stripped)
+                column = len(lines[start]) - item.size
+                item._set_lines(LineView(lines, start, end, column=column, strip=True))
+            result.list_chars += item.size
+            if item.list_type == ListType.CHECKBOX:
+                result.has_checkbox_lists = True
+
+        result.list_blocks.append(
+            ListBlock(
+                items=items,
+                start_line=items[0].line_number,
+                end_line=self._list_end_idx + 1,
+                list_type=self._parser._determine_primary_type(items),
+                max_depth=self._list_max_depth,
+            )
+        )
+        result.list_item_count += len(items)
+        if self._list_max_depth > result.max_list_depth:
+            result.max_list_depth = self._list_max_depth
+
+        self._list_items = []
+        self._list_ends = []
+        self._list_type = None
+        self._list_max_depth = 0
+        self._list_lookahead = None
+
+    # ------------------------------------------------------------------
+    # Sentences
+    # ------------------------------------------------------------------
+
+    def _step_sentences(self, i: int, line: str) -> None:
+        """
+        Accumulate sentence statistics without re-joining the document.
+
+        Equivalent to splitting "\\n".join(lines) on "." and averaging the
+        stripped, non-empty pieces.
+        """
+        if i > 0:
+            self._piece_len += 1  # the joining newline is whitespace
+        if "." not in line:
+            self._extend_piece(line)
+            return
+        parts = line.split(".")
+        self._extend_piece(parts[0])
+        for part in parts[1:]:
+            self._finish_piece()
+            self._extend_piece(part)
+
+    def _extend_piece(self, text: str) -> None:
+        stripped_left = text.lstrip()
+        if stripped_left:
+            if self._piece_first < 0:
+                self._piece_first = self._piece_len + len(text) - len(stripped_left)
+            self._piece_last = self._piece_len + len(text.rstrip())
+        self._piece_len += len(text)
+
+    def _finish_piece(self) -> None:
+        if self._piece_first >= 0:
+            self.result.sentence_count += 1
+            self.result.sentence_chars += self._piece_last - self._piece_first
+        self._piece_len = 0
+        self._piece_first = -1
+        self._piece_last = 0
+
+
+class _FamilyLoader:
+    """
+    Computes the lazily parsed fields of one analysis (see LAZY_FIELDS).
+
+    Keeps references to the analysis' line array, line offsets and code
+    blocks; nothing is copied.
+    """
+
+    def __init__(
+        self,
+        parser: "Parser",
+        lines: list[str],
+        positions: list[int],
+        code_blocks: list[FencedBlock],
+        total_chars: int,
+    ) -> None:
+        self._parser = parser
+        self._lines = lines
+        self._positions = positions
+        self._code_blocks = code_blocks
+        self._total_chars = total_chars
+
+    def __call__(self, family: str) -> dict[str, Any]:
+        """Scan a family and return its ContentAnalysis fields by name."""
+        lines = self._lines
+        total_chars = self._total_chars
+        scanner = _LineScanner(self._parser, lines)
+
+        if family == "latex" and not any("$$" in line or "\\begin{" in line for line in lines):
+            scan = scanner.result  # No line can open a LaTeX block
+        else:
+            in_code = self._in_code() if family == "latex" else None
+            scan = scanner.scan_family(family, self._positions, in_code)
+
+        if family == "lists":
+            return {
+                "list_count": len(scan.list_blocks),
+                "list_item_count": scan.list_item_count,
+                "list_blocks": scan.list_blocks,
+                "list_ratio": scan.list_chars / total_chars if total_chars > 0 else 0.0,
+                "max_list_depth": scan.max_list_depth,
+                "has_checkbox_lists": scan.has_checkbox_lists,
+            }
+        if family == "latex":
+            return {
+                "latex_blocks": scan.latex_blocks,
+                "latex_block_count": len(scan.latex_blocks),
+                "latex_ratio": scan.latex_chars / total_chars if total_chars > 0 else 0.0,
+            }
+        return {
+            "avg_sentence_length": (
+                scan.sentence_chars / scan.sentence_count if scan.sentence_count else 0.0
+            )
+        }
+
+    def _in_code(self) -> bytearray:
+        """Mark the lines of fenced code blocks, fence lines included."""
+        in_code = bytearray(len(self._lines))
+        for block in self._code_blocks:
+            in_code[block.start_line - 1 : block.end_line] = b"\x01" * (
+                block.end_line - block.start_line + 1
+            )
+        return in_code
+
 
 class Parser:
     """
@@ -25,7 +560,17 @@ class Parser:
     - Lists
     - Content metrics
 
+    analyze() makes one eager pass over the lines (_LineScanner.scan()) for
+    code blocks, headers, tables, the preamble and the code ratio. Lists,
+    LaTeX and the average sentence length are not parsed there: each of
+    these families is scanned in a pass of its own (scan_family(), run by
+    _FamilyLoader) the first time one of its fields is read from the
+    ContentAnalysis (see LAZY_FIELDS).
+
     All line endings are normalized to Unix-style (\\n) before processing.
+
+    An optional ParseCache lets repeat analysis of unchanged text skip
+    parsing; the cached ContentAnalysis is returned as-is.
     """
 
     # Regex patterns
@@ -36,11 +581,25 @@ class Parser:
     # O1b: Pre-compiled fence detection pattern for performance
     FENCE_PATTERN = re.compile(r"^(\s*)(`{3,}|~{3,})(\w*)\s*$")
 
+    # LaTeX environments treated as atomic blocks
+    LATEX_ENV_START_PATTERN = re.compile(
+        r"^\\begin\{(equation|align|gather|multline|eqnarray)\*?\}"
+    )
+
     # O3: Pre-compiled list item patterns (early termination)
     CHECKBOX_PATTERN = re.compile(r"^(\s*)([-*+])\s+\[([ xX])\]\s+(.+)$")
     NUMBERED_PATTERN = re.compile(r"^(\s*)(\d+\.)\s+(.+)$")
     BULLET_PATTERN = re.compile(r"^(\s*)([-*+])\s+(.+)$")
 
+    def __init__(self, cache: "ParseCache | None" = None):
+        """
+        Initialize parser.
+
+        Args:
+            cache: Optional cache of analyses keyed by normalized text
+        """
+        self.cache = cache
+
     def analyze(self, md_text: str) -> ContentAnalysis:
         """
         Analyze a markdown document.
@@ -54,71 +613,50 @@ class Parser:
         # 1. Normalize line endings (CRITICAL - must be first)
         md_text = self._normalize_line_endings(md_text)
 
+        if self.cache is None:
+            return self._analyze_normalized(md_text)
+
+        key = self.cache.make_key(md_text)
+        analysis = self.cache.get(key)
+        if analysis is None:
+            analysis = self._analyze_normalized(md_text)
+            self.cache.put(key, analysis)
+        return analysis
+
+    def _analyze_normalized(self, md_text: str) -> ContentAnalysis:
+        """Analyze text whose line endings are already normalized."""
         # O1: Single split operation for entire pipeline
         lines = md_text.split("\n") if md_text else []
-        positions = self._build_position_index(lines)
 
-        # 2. Extract elements using shared line array and position index
-        code_blocks = self._extract_code_blocks(lines, positions)
-        latex_blocks = self._extract_latex_blocks(lines, positions, code_blocks)
-        headers = self._extract_headers(lines, positions)
-        tables = self._extract_tables(lines, positions)
-        list_blocks = self._extract_lists(lines, positions)
+        # 2. Extract code blocks, headers and tables in one pass; lists,
+        # LaTeX and sentence statistics are parsed on first access
+        scan = _LineScanner(self, lines).scan()
 
-        # 3. Calculate metrics
+        # 3. Derive ratios
         total_chars = len(md_text)
-        total_lines = len(lines) if md_text else 0
-
-        code_chars = sum(len(b.content) for b in code_blocks)
-        code_ratio = code_chars / total_chars if total_chars > 0 else 0.0
-
-        max_header_depth = max((h.level for h in headers), default=0)
-
-        # Calculate list metrics
-        list_chars = sum(len(item.content) for block in list_blocks for item in block.items)
-        list_ratio = list_chars / total_chars if total_chars > 0 else 0.0
-        list_item_count = sum(block.item_count for block in list_blocks)
-        max_list_depth = max((block.max_depth for block in list_blocks), default=0)
-        has_checkbox_lists = any(
-            any(item.list_type == ListType.CHECKBOX for item in block.items)
-            for block in list_blocks
-        )
-
-        # Calculate LaTeX metrics
-        latex_chars = sum(len(block.content) for block in latex_blocks)
-        latex_ratio = latex_chars / total_chars if total_chars > 0 else 0.0
-
-        # 4. Detect preamble using shared line array
-        has_preamble, preamble_end = self._detect_preamble(lines, positions, headers)
+        total_lines = len(lines)
 
-        # 5. Calculate average sentence length using shared line array
-        avg_sent_length = self._calculate_avg_sentence_length(lines)
+        code_ratio = scan.code_chars / total_chars if total_chars > 0 else 0.0
 
-        return ContentAnalysis(
+        analysis = ContentAnalysis(
             total_chars=total_chars,
             total_lines=total_lines,
             code_ratio=code_ratio,
-            code_block_count=len(code_blocks),
-            header_count=len(headers),
-            max_header_depth=max_header_depth,
-            table_count=len(tables),
-            list_count=len(list_blocks),
-            list_item_count=list_item_count,
-            code_blocks=code_blocks,
-            headers=headers,
-            tables=tables,
-            list_blocks=list_blocks,
-            latex_blocks=latex_blocks,
-            has_preamble=has_preamble,
-            preamble_end_line=preamble_end,
-            list_ratio=list_ratio,
-            max_list_depth=max_list_depth,
-            has_checkbox_lists=has_checkbox_lists,
-            avg_sentence_length=avg_sent_length,
-            latex_block_count=len(latex_blocks),
-            latex_ratio=latex_ratio,
+            code_block_count=len(scan.code_blocks),
+            header_count=len(scan.headers),
+            max_header_depth=scan.max_header_depth,
+            table_count=len(scan.tables),
+            code_blocks=scan.code_blocks,
+            headers=scan.headers,
+            tables=scan.tables,
+            has_preamble=scan.has_preamble,
+            preamble_end_line=scan.preamble_end_line,
             _lines=lines,  # O1: Store line array for strategy optimization
+            _line_offsets=scan.positions,
         )
+        analysis._loader = _FamilyLoader(self, lines, scan.positions, scan.code_blocks, total_chars)
+        analysis._pending = {"lists", "latex", "sentences"}
+        return analysis
 
     def _normalize_line_endings(self, text: str) -> str:
         """
@@ -140,31 +678,6 @@ class Parser:
         # Normalize: First convert CRLF to LF, then convert remaining CR to LF
         return text.replace("\r\n", "\n").replace("\r", "\n")
 
-    def _build_position_index(self, lines: list[str]) -> list[int]:
-        """
-        Build cumulative position index for O(1) position lookups.
-
-        O0 Optimization: Replaces O(n×m) position calculations with O(1) array lookups.
-
-        Args:
-            lines: Array of text lines from document
-
-        Returns:
-            Array where index i gives character position of line i in document.
-            Position includes all preceding lines plus newline characters.
-
-        Example:
-            For document "hello\nworld\n":
-            lines = ["hello", "world"]
-            positions = [0, 6]  # "hello" starts at 0, "world" starts at 6
-        """
-        positions = [0]
-        cumulative = 0
-        for line in lines:
-            cumulative += len(line) + 1  # +1 for newline character
-            positions.append(cumulative)
-        return positions
-
     def _is_fence_opening(self, line: str) -> tuple[str, int, str] | None:
         """
         Check if line is a fence opening.
@@ -222,74 +735,9 @@ class Parser:
         # 1. Start with same fence character
         # 2. Have equal or greater length
         # 3. Contain only fence characters and whitespace
-        pattern = rf"^(\s*)({re.escape(fence_char)}{{{fence_length},}})\s*$"
-        return bool(re.match(pattern, line))
-
-    def _extract_code_blocks(self, lines: list[str], positions: list[int]) -> list[FencedBlock]:
-        """
-        Extract fenced code blocks with nested fencing support.
-
-        Handles:
-        - Standard ``` fences
-        - Quadruple ````, quintuple ````` fences
-        - Tilde fencing (~~~, ~~~~, ~~~~~)
-        - Mixed fence types (backticks containing tildes and vice versa)
-        - Unclosed fences (extend to end of document)
-        - Indented fences
-
-        Args:
-            lines: Pre-split document lines (O1 optimization)
-            positions: Pre-computed position index (O0 optimization)
-
-        Returns:
-            List of FencedBlock objects with complete metadata.
-        """
-        blocks = []
-
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-
-            # Check for fence opening
-            fence_info = self._is_fence_opening(line)
-            if fence_info:
-                fence_char, fence_length, language = fence_info
-                start_line = i + 1  # 1-indexed
-                start_pos = positions[i]  # O0: O(1) lookup instead of O(i) sum
-
-                # Collect fence content
-                content_lines = []
-                i += 1
-                is_closed = False
-
-                while i < len(lines):
-                    if self._is_fence_closing(lines[i], fence_char, fence_length):
-                        is_closed = True
-                        break
-                    content_lines.append(lines[i])
-                    i += 1
-
-                # Calculate end position
-                end_line = min(i + 1, len(lines))  # 1-indexed
-                end_pos = positions[min(i + 1, len(lines))]  # O0: O(1) lookup
-
-                blocks.append(
-                    FencedBlock(
-                        language=language if language else None,
-                        content="\n".join(content_lines),
-                        start_line=start_line,
-                        end_line=end_line,
-                        start_pos=start_pos,
-                        end_pos=end_pos,
-                        fence_char=fence_char,
-                        fence_length=fence_length,
-                        is_closed=is_closed,
-                    )
-                )
-
-            i += 1
-
-        return blocks
+        if fence_char not in line:
+            return False
+        return fence_closing_pattern(fence_char, fence_length).match(line) is not None
 
     def _is_display_delimiter(self, line: str) -> bool:
         """
@@ -313,8 +761,7 @@ class Parser:
         Returns:
             Environment name if found, None otherwise
         """
-        pattern = r"^\\begin\{(equation|align|gather|multline|eqnarray)\*?\}"
-        match = re.match(pattern, line.strip())
+        match = self.LATEX_ENV_START_PATTERN.match(line.strip())
         if match:
             return match.group(1)
         return None
@@ -330,8 +777,7 @@ class Parser:
         Returns:
             True if line ends the specified environment
         """
-        pattern = rf"^\\end\{{{re.escape(env_name)}\*?\}}"
-        return bool(re.match(pattern, line.strip()))
+        return latex_env_end_pattern(env_name).match(line.strip()) is not None
 
     def _create_latex_block(
         self,
@@ -368,381 +814,6 @@ class Parser:
             environment_name=env_name,
         )
 
-    def _extract_latex_blocks(
-        self, lines: list[str], positions: list[int], code_blocks: list[FencedBlock]
-    ) -> list[LatexBlock]:
-        """
-        Extract LaTeX formula blocks from markdown.
-
-        Handles:
-        - Display math: $$...$$
-        - Equation environments: \\begin{equation}...\\end{equation}
-        - Ignores LaTeX inside code blocks
-
-        Args:
-            lines: Pre-split document lines (O1 optimization)
-            positions: Pre-computed position index (O0 optimization)
-            code_blocks: Already extracted code blocks (to skip LaTeX inside them)
-
-        Returns:
-            List of LatexBlock objects
-        """
-        blocks = []
-
-        # Build code block line ranges for quick lookup
-        code_ranges = [(b.start_line, b.end_line) for b in code_blocks]
-
-        i = 0
-        while i < len(lines):
-            line_num = i + 1  # 1-indexed
-
-            # Skip if inside code block
-            in_code = any(start <= line_num <= end for start, end in code_ranges)
-            if in_code:
-                i += 1
-                continue
-
-            # Check for display math delimiter
-            if self._is_display_delimiter(lines[i]):
-                start_line = line_num
-                start_pos = positions[i]  # O0: O(1) lookup
-                content_lines = [lines[i]]
-
-                # Check if single-line or multi-line
-                if lines[i].strip().count("$$") >= 2:
-                    # Single line display math
-                    end_line = line_num
-                    end_pos = start_pos + len(lines[i])
-                    blocks.append(
-                        self._create_latex_block(
-                            content=lines[i],
-                            latex_type=LatexType.DISPLAY,
-                            start_line=start_line,
-                            end_line=end_line,
-                            start_pos=start_pos,
-                            end_pos=end_pos,
-                        )
-                    )
-                    i += 1
-                    continue
-
-                # Multi-line display math - find closing $$
-                i += 1
-                while i < len(lines):
-                    content_lines.append(lines[i])
-                    if self._is_display_delimiter(lines[i]):
-                        # Found closing delimiter
-                        end_line = i + 1
-                        end_pos = positions[i + 1]  # O0: O(1) lookup
-                        blocks.append(
-                            self._create_latex_block(
-                                content="\n".join(content_lines),
-                                latex_type=LatexType.DISPLAY,
-                                start_line=start_line,
-                                end_line=end_line,
-                                start_pos=start_pos,
-                                end_pos=end_pos,
-                            )
-                        )
-                        i += 1
-                        break
-                    i += 1
-                else:
-                    # Unclosed display math - extends to end
-                    end_line = len(lines)
-                    end_pos = positions[-1] if positions else 0
-                    blocks.append(
-                        self._create_latex_block(
-                            content="\n".join(content_lines),
-                            latex_type=LatexType.DISPLAY,
-                            start_line=start_line,
-                            end_line=end_line,
-                            start_pos=start_pos,
-                            end_pos=end_pos,
-                        )
-                    )
-                continue
-
-            # Check for environment start
-            env_name = self._is_environment_start(lines[i])
-            if env_name:
-                start_line = line_num
-                start_pos = positions[i]  # O0: O(1) lookup
-                content_lines = [lines[i]]
-
-                # Find matching end
-                i += 1
-                while i < len(lines):
-                    content_lines.append(lines[i])
-                    if self._is_environment_end(lines[i], env_name):
-                        end_line = i + 1
-                        end_pos = positions[i + 1]  # O0: O(1) lookup
-                        blocks.append(
-                            self._create_latex_block(
-                                content="\n".join(content_lines),
-                                latex_type=LatexType.ENVIRONMENT,
-                                start_line=start_line,
-                                end_line=end_line,
-                                start_pos=start_pos,
-                                end_pos=end_pos,
-                                env_name=env_name,
-                            )
-                        )
-                        i += 1
-                        break
-                    i += 1
-                else:
-                    # Unclosed environment - extends to end
-                    end_line = len(lines)
-                    end_pos = positions[-1] if positions else 0
-                    blocks.append(
-                        self._create_latex_block(
-                            content="\n".join(content_lines),
-                            latex_type=LatexType.ENVIRONMENT,
-                            start_line=start_line,
-                            end_line=end_line,
-                            start_pos=start_pos,
-                            end_pos=end_pos,
-                            env_name=env_name,
-                        )
-                    )
-                continue
-
-            i += 1
-
-        return blocks
-
-    def _extract_headers(self, lines: list[str], positions: list[int]) -> list[Header]:
-        """
-        Extract markdown headers.
-
-        Handles:
-        - ATX headers (# through ######)
-        - Ignores headers inside code blocks
-        - Supports nested fences and tilde fencing
-
-        Args:
-            lines: Pre-split document lines (O1 optimization)
-            positions: Pre-computed position index (O0 optimization)
-
-        Returns:
-            List of extracted Header objects
-        """
-        headers = []
-
-        # Track fence state with stack for nested fences
-        fence_stack: list[tuple[str, int]] = []  # (char, length) tuples
-
-        for i, line in enumerate(lines):
-            # Check for fence closing FIRST (if inside fence)
-            if fence_stack:
-                current_fence_char, current_fence_length = fence_stack[-1]
-                if self._is_fence_closing(line, current_fence_char, current_fence_length):
-                    fence_stack.pop()
-                    continue
-
-            # Check for fence opening
-            fence_info = self._is_fence_opening(line)
-            if fence_info:
-                fence_char, fence_length, _ = fence_info
-                fence_stack.append((fence_char, fence_length))
-                continue
-
-            # Skip if inside fence
-            if fence_stack:
-                continue
-
-            # Check for header
-            header_match = re.match(r"^(#{1,6})\s+(.+)$", line)
-            if header_match:
-                level = len(header_match.group(1))
-                text = header_match.group(2).strip()
-                pos = positions[i]  # O0: O(1) lookup
-
-                headers.append(
-                    Header(
-                        level=level,
-                        text=text,
-                        line=i + 1,  # 1-indexed
-                        pos=pos,
-                    )
-                )
-
-        return headers
-
-    def _extract_tables(self, lines: list[str], positions: list[int]) -> list[TableBlock]:
-        """
-        Extract markdown tables.
-
-        A table is identified by:
-        - Row with | characters
-        - Followed by separator row with |---|
-        - Ignores tables inside code blocks
-        - Supports nested fences and tilde fencing
-
-        Args:
-            lines: Pre-split document lines (O1 optimization)
-            positions: Pre-computed position index (O0 optimization)
-
-        Returns:
-            List of extracted table blocks
-        """
-        tables = []
-
-        # Track fence state with stack for nested fences
-        fence_stack: list[tuple[str, int]] = []  # (char, length) tuples
-
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-
-            # Check for fence closing FIRST (if inside fence)
-            if fence_stack:
-                current_fence_char, current_fence_length = fence_stack[-1]
-                if self._is_fence_closing(line, current_fence_char, current_fence_length):
-                    fence_stack.pop()
-                    i += 1
-                    continue
-
-            # Check for fence opening
-            fence_info = self._is_fence_opening(line)
-            if fence_info:
-                fence_char, fence_length, _ = fence_info
-                fence_stack.append((fence_char, fence_length))
-                i += 1
-                continue
-
-            # Skip if inside fence
-            if fence_stack:
-                i += 1
-                continue
-
-            # Check for table start: line with | followed by separator
-            if "|" in line and i + 1 < len(lines):
-                next_line = lines[i + 1]
-                if "|" in next_line and re.search(r"-{3,}", next_line):
-                    # Found table
-                    start_line = i + 1  # 1-indexed
-                    table_lines = [line, next_line]
-
-                    # Count columns from header
-                    column_count = line.count("|") - 1
-                    if line.startswith("|"):
-                        column_count = line.count("|") - 1
-
-                    # Collect remaining rows
-                    i += 2
-                    while i < len(lines) and "|" in lines[i]:
-                        table_lines.append(lines[i])
-                        i += 1
-
-                    end_line = i  # 1-indexed (line after last table row)
-                    row_count = len(table_lines) - 2  # Exclude header and separator
-
-                    tables.append(
-                        TableBlock(
-                            content="\n".join(table_lines),
-                            start_line=start_line,
-                            end_line=end_line,
-                            column_count=max(column_count, 1),
-                            row_count=max(row_count, 0),
-                        )
-                    )
-                    continue
-
-            i += 1
-
-        return tables
-
-    def _detect_preamble(
-        self, lines: list[str], positions: list[int], headers: list[Header]
-    ) -> tuple[bool, int]:
-        """
-        Detect if document has preamble (content before first header).
-
-        Args:
-            lines: Pre-split document lines (O1 optimization)
-            positions: Pre-computed position index (O0 optimization)
-            headers: Extracted headers from document
-
-        Returns:
-            Tuple of (has_preamble, preamble_end_line)
-        """
-        if not headers:
-            # No headers = entire document could be preamble
-            return False, 0
-
-        first_header_line = headers[0].line
-
-        # Check if there's non-whitespace content before first header
-        for i in range(first_header_line - 1):
-            if lines[i].strip():
-                return True, first_header_line - 1
-
-        return False, 0
-
-    def _extract_lists(self, lines: list[str], positions: list[int]) -> list[ListBlock]:
-        """
-        Extract list blocks from markdown.
-
-        Handles:
-        - Bullet lists (-, *, +)
-        - Numbered lists (1., 2., etc.)
-        - Checkbox lists (- [ ], - [x])
-        - Nested lists
-        - Continuation lines
-        - Ignores lists inside code blocks
-        - Supports nested fences and tilde fencing
-
-        Args:
-            lines: Pre-split document lines (O1 optimization)
-            positions: Pre-computed position index (O0 optimization)
-
-        Returns:
-            List of extracted list blocks
-        """
-        blocks = []
-
-        # Track fence state with stack for nested fences
-        fence_stack: list[tuple[str, int]] = []  # (char, length) tuples
-
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-
-            # Check for fence closing FIRST (if inside fence)
-            if fence_stack:
-                current_fence_char, current_fence_length = fence_stack[-1]
-                if self._is_fence_closing(line, current_fence_char, current_fence_length):
-                    fence_stack.pop()
-                    i += 1
-                    continue
-
-            # Check for fence opening
-            fence_info = self._is_fence_opening(line)
-            if fence_info:
-                fence_char, fence_length, _ = fence_info
-                fence_stack.append((fence_char, fence_length))
-                i += 1
-                continue
-
-            # Skip if inside fence
-            if fence_stack:
-                i += 1
-                continue
-
-            # Try to parse as list item
-            item = self._try_parse_list_item(line, i + 1)
-            if item:
-                # Collect entire list block
-                block, end_idx = self._collect_list_block(lines, i)
-                blocks.append(block)
-                i = end_idx + 1
-            else:
-                i += 1
-
-        return blocks
-
     def _try_parse_list_item(self, line: str, line_number: int) -> ListItem | None:
         """
         Try to parse a line as a list item.
@@ -754,6 +825,10 @@ class Parser:
         Returns:
             ListItem if successful, None otherwise
         """
+        # O3: Cheap marker check before running any pattern
+        if line.lstrip()[:1] not in _LIST_MARKER_CHARS:
+            return None
+
         # O3: Use pre-compiled patterns with early termination
         # Checkbox pattern (must check first as it's a subset of bullet)
         checkbox_match = self.CHECKBOX_PATTERN.match(line)
@@ -796,87 +871,6 @@ class Parser:
 
         return None
 
-    def _collect_list_block(self, lines: list[str], start_idx: int) -> tuple[ListBlock, int]:
-        """Collect an entire list block starting from start_idx."""
-        items = []
-        max_depth = 0
-        end_idx = start_idx
-        first_item_type = None
-
-        i = start_idx
-        while i < len(lines):
-            line = lines[i]
-
-            # Empty line - check if list continues
-            if not line.strip():
-                should_continue, new_i = self._should_continue_list(lines, i, first_item_type)
-                if should_continue:
-                    i = new_i
-                    continue
-                break
-
-            # Try to parse as list item
-            item = self._try_parse_list_item(line, i + 1)
-            if item:
-                if first_item_type is None:
-                    first_item_type = item.list_type
-                elif item.list_type != first_item_type:
-                    # Type changed - close this block
-                    break
-
-                items.append(item)
-                max_depth = max(max_depth, item.depth)
-                end_idx = i
-                i += 1
-            elif items:
-                # Continuation line
-                if line.strip():
-                    items[-1].content += "\n" + line.strip()
-                    end_idx = i
-                i += 1
-            else:
-                break
-
-        if not items:
-            # Return a dummy block that will be filtered out
-            dummy_block = ListBlock(
-                items=[],
-                start_line=start_idx + 1,
-                end_line=start_idx + 1,
-                list_type=ListType.BULLET,
-                max_depth=0,
-            )
-            return dummy_block, start_idx
-
-        primary_type = self._determine_primary_type(items)
-        block = ListBlock(
-            items=items,
-            start_line=items[0].line_number,
-            end_line=end_idx + 1,
-            list_type=primary_type,
-            max_depth=max_depth,
-        )
-
-        return block, end_idx
-
-    def _should_continue_list(
-        self, lines: list[str], current_idx: int, first_item_type: ListType | None
-    ) -> tuple[bool, int]:
-        """Check if list continues after empty line."""
-        if current_idx + 1 >= len(lines):
-            return False, current_idx
-
-        next_item = self._try_parse_list_item(lines[current_idx + 1], current_idx + 2)
-        if not next_item:
-            return False, current_idx
-
-        # Check if type changes
-        if first_item_type and next_item.list_type != first_item_type:
-            return False, current_idx
-
-        # Continue past the empty line
-        return True, current_idx + 1
-
     def _determine_primary_type(self, items: list[ListItem]) -> ListType:
         """Determine predominant list type from items."""
         type_counts: dict[ListType, int] = {}
@@ -897,33 +891,6 @@ class Parser:
         lines = md_text.split("\n")
         return sum(len(lines[i]) + 1 for i in range(line - 1))
 
-    def _calculate_avg_sentence_length(self, lines: list[str]) -> float:
-        """
-        Calculate average sentence length in characters.
-
-        Simple heuristic: split on periods followed by space or end of line.
-        Filters out empty sentences and normalizes to typical technical writing.
-
-        Args:
-            lines: Pre-split document lines (O1 optimization)
-
-        Returns:
-            Average sentence length in characters, 0.0 if no sentences found
-        """
-        # Reconstruct text from lines for sentence analysis
-        text = "\n".join(lines)
-        if not text:
-            return 0.0
-
-        # Split on period followed by space/newline/end
-        sentences = [s.strip() for s in text.split(".") if s.strip()]
-
-        if not sentences:
-            return 0.0
-
-        total_length = sum(len(s) for s in sentences)
-        return total_length / len(sentences)
-
 
 # ============================================================================
 # Module-Level Parser Singleton (Performance Optimization)
@@ -935,13 +902,20 @@ class Parser:
 _parser_singleton = None
 
 
-def get_parser() -> Parser:
+def get_parser(cache: "ParseCache | None" = None) -> Parser:
     """
     Get the singleton Parser instance.
 
+    Args:
+        cache: Optional parse cache. When given, a parser bound to that
+            cache is returned instead of the shared uncached singleton.
+
     Returns:
-        Shared Parser instance
+        Shared Parser instance, or a Parser using the given cache
     """
+    if cache is not None:
+        return Parser(cache=cache)
+
     global _parser_singleton
     if _parser_singleton is None:
         _parser_singleton = Parser()
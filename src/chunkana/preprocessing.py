@@ -0,0 +1,176 @@
+"""
+Preprocessing of raw text before parsing.
+
+A Preprocessor normalizes line endings and then applies a sequence of
+transforms: Obsidian block-ID stripping (ChunkConfig.strip_obsidian_block_ids)
+and any transforms passed to MarkdownChunker(transforms=...), e.g.
+
+    chunker = MarkdownChunker(config, transforms=[STRIP_HTML_COMMENTS, STRIP_ZERO_WIDTH])
+
+Transforms work on the whole text or, with per_line=True, on single lines.
+Consecutive line transforms share one pass over the lines. Each transform
+runs only if the text contains one of its triggers, so text that needs no
+change is not copied.
+"""
+
+import re
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from itertools import groupby
+
+from .config import ChunkConfig
+
+
+@dataclass(frozen=True)
+class Transform:
+    """
+    One preprocessing step.
+
+    Attributes:
+        apply: Function from text (or one line, without its newline) to the
+            transformed text
+        per_line: Apply to every line instead of the whole text
+        triggers: Substrings of which the text (and, for line transforms,
+            the line) must contain at least one for the step to run; empty
+            runs it always
+    """
+
+    apply: Callable[[str], str]
+    per_line: bool = False
+    triggers: tuple[str, ...] = ()
+
+    def applies_to(self, text: str) -> bool:
+        """Whether text contains a trigger (always True without triggers)."""
+        return not self.triggers or any(trigger in text for trigger in self.triggers)
+
+
+# Obsidian block ID (^identifier) ending a line; starting with the literal
+# "^" lets the regex engine skip to candidates
+_BLOCK_ID_PATTERN = re.compile(r"\^[a-zA-Z0-9]+[^\S\n]*$", re.MULTILINE)
+_HTML_COMMENT_PATTERN = re.compile(r"<!--.*?-->", re.DOTALL)
+# Zero-width space, non-joiner, joiner, word joiner and byte order mark
+_ZERO_WIDTH_CHARS = ("\u200b", "\u200c", "\u200d", "\u2060", "\ufeff")
+_ZERO_WIDTH_TABLE = dict.fromkeys(map(ord, _ZERO_WIDTH_CHARS))
+
+
+def _strip_block_ids(text: str) -> str:
+    """Remove block IDs that start a line or follow whitespace, and that whitespace."""
+    pieces: list[str] = []
+    last = 0
+    for match in _BLOCK_ID_PATTERN.finditer(text):
+        start = match.start()
+        if start and not text[start - 1].isspace():
+            continue  # e.g. x^2
+        while start > last and text[start - 1] != "\n" and text[start - 1].isspace():
+            start -= 1
+        pieces.append(text[last:start])
+        last = match.end()
+    if not pieces:
+        return text
+    pieces.append(text[last:])
+    return "".join(pieces)
+
+
+STRIP_BLOCK_IDS = Transform(_strip_block_ids, triggers=("^",))
+STRIP_HTML_COMMENTS = Transform(
+    lambda text: _HTML_COMMENT_PATTERN.sub("", text), triggers=("<!--",)
+)
+STRIP_ZERO_WIDTH = Transform(
+    lambda text: text.translate(_ZERO_WIDTH_TABLE), triggers=_ZERO_WIDTH_CHARS
+)
+
+
+class Preprocessor:
+    """
+    Normalizes line endings and applies transforms in order.
+
+    Args:
+        transforms: Steps applied after line endings are normalized
+    """
+
+    def __init__(self, transforms: Iterable[Transform] = ()):
+        self.transforms = tuple(transforms)
+        # Passes over the text: one text transform, or consecutive line ones
+        self._passes: list[tuple[Transform, ...]] = []
+        for per_line, steps in groupby(self.transforms, key=lambda step: step.per_line):
+            if per_line:
+                self._passes.append(tuple(steps))
+            else:
+                self._passes.extend((step,) for step in steps)
+
+    @classmethod
+    def for_config(
+        cls, config: ChunkConfig, transforms: Iterable[Transform] = ()
+    ) -> "Preprocessor":
+        """
+        Preprocessor for a chunking configuration.
+
+        Args:
+            config: Chunking configuration (strip_obsidian_block_ids)
+            transforms: Additional steps, applied after the configured ones
+
+        Returns:
+            Preprocessor
+        """
+        steps = [STRIP_BLOCK_IDS] if config.strip_obsidian_block_ids else []
+        return cls([*steps, *transforms])
+
+    def process(self, text: str) -> str:
+        """
+        Preprocess text.
+
+        Args:
+            text: Raw markdown text
+
+        Returns:
+            Text with "\\n" line endings and all transforms applied
+        """
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+
+        for steps in self._passes:
+            first = next((i for i, step in enumerate(steps) if step.applies_to(text)), None)
+            if first is None:
+                continue
+            # Later steps of a pass may apply to the output of earlier ones
+            active = list(steps[first:])
+            text = self._map_lines(text, active) if active[0].per_line else active[0].apply(text)
+        return text
+
+    @staticmethod
+    def _map_lines(text: str, steps: list[Transform]) -> str:
+        """Apply line transforms in one pass over the lines they apply to."""
+        if not all(step.triggers for step in steps):
+            lines = text.split("\n")
+            for i, line in enumerate(lines):
+                for step in steps:
+                    if step.applies_to(line):
+                        line = step.apply(line)
+                lines[i] = line
+            return "\n".join(lines)
+
+        # Only lines containing a trigger can change; find them with
+        # str.find instead of visiting every line
+        spans: set[tuple[int, int]] = set()
+        for trigger in {trigger for step in steps for trigger in step.triggers}:
+            pos = text.find(trigger)
+            while pos != -1:
+                start = text.rfind("\n", 0, pos) + 1
+                end = text.find("\n", pos)
+                if end == -1:
+                    end = len(text)
+                spans.add((start, end))
+                pos = text.find(trigger, end)
+
+        pieces: list[str] = []
+        last = 0
+        for start, end in sorted(spans):
+            line = text[start:end]
+            for step in steps:
+                if step.applies_to(line):
+                    line = step.apply(line)
+            pieces.append(text[last:start])
+            pieces.append(line)
+            last = end
+        pieces.append(text[last:])
+        return "".join(pieces)
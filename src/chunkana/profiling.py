@@ -0,0 +1,212 @@
+"""
+Per-stage statistics of the chunking pipeline.
+
+MarkdownChunker.chunk_with_stats() returns a PipelineStats alongside the
+chunks; an observer passed to MarkdownChunker(observer=...) is called with
+the StageStats of every stage of every chunk() call, e.g. to export them
+to a metrics system:
+
+    def export(stage: StageStats) -> None:
+        histogram(f"chunkana.{stage.name}.seconds").observe(stage.seconds)
+
+    chunker = MarkdownChunker(config, observer=export)
+
+Stages run in the order of STAGES. items_in/items_out count characters
+of text, lines for the output of parse, and chunks from the strategy
+stage on; adaptive and select have no output count. The overlap stage is
+skipped (calls == 0) without overlap or with fewer than two chunks.
+"""
+
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+STAGES = (
+    "preprocess",
+    "parse",
+    "adaptive",
+    "select",
+    "strategy",
+    "merge",
+    "dangling_headers",
+    "split",
+    "overlap",
+    "metadata",
+    "validate",
+)
+
+
+@dataclass
+class StageStats:
+    """
+    Statistics of one pipeline stage.
+
+    Attributes:
+        name: Stage name (one of STAGES)
+        seconds: Wall time spent in the stage
+        calls: Number of times the stage ran (0 if it was skipped)
+        items_in: Input size (characters or chunks, see module docstring)
+        items_out: Output size (characters, lines or chunks)
+        allocated_bytes: Net memory allocated by the stage (memory still
+            held when it finished), or None if allocations were not traced
+        peak_bytes: Peak memory allocated during the stage, or None if
+            allocations were not traced
+    """
+
+    name: str
+    seconds: float = 0.0
+    calls: int = 0
+    items_in: int = 0
+    items_out: int = 0
+    allocated_bytes: int | None = None
+    peak_bytes: int | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "name": self.name,
+            "seconds": self.seconds,
+            "calls": self.calls,
+            "items_in": self.items_in,
+            "items_out": self.items_out,
+            "allocated_bytes": self.allocated_bytes,
+            "peak_bytes": self.peak_bytes,
+        }
+
+
+@dataclass
+class PipelineStats:
+    """
+    Statistics of one chunk() call.
+
+    Attributes:
+        stages: StageStats by stage name, in pipeline order
+    """
+
+    stages: dict[str, StageStats] = field(
+        default_factory=lambda: {name: StageStats(name) for name in STAGES}
+    )
+
+    @property
+    def total_seconds(self) -> float:
+        """Wall time spent in all stages."""
+        return sum(stage.seconds for stage in self.stages.values())
+
+    @property
+    def slowest_stage(self) -> str | None:
+        """Name of the stage with the most wall time, or None if nothing ran."""
+        ran = [stage for stage in self.stages.values() if stage.calls]
+        return max(ran, key=lambda stage: stage.seconds).name if ran else None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "total_seconds": self.total_seconds,
+            "stages": {name: stage.to_dict() for name, stage in self.stages.items()},
+        }
+
+
+class StageRecord:
+    """Handle a stage uses to report its output size."""
+
+    __slots__ = ("items_out",)
+
+    def __init__(self) -> None:
+        self.items_out = 0
+
+
+class StageProfiler:
+    """
+    Records StageStats for one pipeline run.
+
+    Args:
+        observer: Optional callable invoked with the StageStats of each
+            stage when it finishes
+        trace_allocations: Measure allocations per stage with tracemalloc
+            (slows chunking down several times; tracemalloc must be
+            tracing, see start())
+    """
+
+    def __init__(
+        self,
+        observer: Callable[[StageStats], None] | None = None,
+        trace_allocations: bool = False,
+    ):
+        self.stats = PipelineStats()
+        self._observer = observer
+        self._trace_allocations = trace_allocations
+        self._started_tracing = False
+
+    def start(self) -> None:
+        """Start tracemalloc if allocations are traced and it is not running."""
+        if self._trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def stop(self) -> None:
+        """Stop tracemalloc if start() started it."""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    @contextmanager
+    def stage(self, name: str, items_in: int) -> Iterator[StageRecord]:
+        """
+        Time a stage.
+
+        Args:
+            name: Stage name (one of STAGES)
+            items_in: Input size of the stage
+
+        Yields:
+            StageRecord to set items_out on
+        """
+        record = StageRecord()
+        tracing = self._trace_allocations and tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+            memory_before = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        yield record
+        elapsed = time.perf_counter() - start
+
+        stats = self.stats.stages[name]
+        stats.seconds += elapsed
+        stats.calls += 1
+        stats.items_in += items_in
+        stats.items_out += record.items_out
+        if tracing:
+            current, peak = tracemalloc.get_traced_memory()
+            stats.allocated_bytes = (stats.allocated_bytes or 0) + current - memory_before
+            stats.peak_bytes = max(stats.peak_bytes or 0, peak - memory_before)
+        if self._observer is not None:
+            self._observer(stats)
+
+
+class _NullStage:
+    """Reusable no-op context for stages nobody measures."""
+
+    __slots__ = ("record",)
+
+    def __init__(self) -> None:
+        self.record = StageRecord()
+
+    def __enter__(self) -> StageRecord:
+        return self.record
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+
+class _NullProfiler(StageProfiler):
+    """Profiler used when nobody asked for stats; stage() does no work."""
+
+    def stage(self, name: str, items_in: int) -> _NullStage:  # type: ignore[override]
+        return _NULL_STAGE
+
+
+_NULL_STAGE = _NullStage()
+NULL_PROFILER = _NullProfiler()
@@ -8,6 +8,8 @@ They do NOT modify Chunk objects - they only produce formatted strings/dicts.
 import json
 from typing import TYPE_CHECKING
 
+from ..overlap import overlap_context
+
 if TYPE_CHECKING:
     from ..types import Chunk
 
@@ -94,7 +96,8 @@ def render_with_embedded_overlap(chunks: list["Chunk"]) -> list[str]:
     Use case: "rich context" mode. Whether this matches v2 include_metadata=False
     is determined by baseline test fixtures and renderer golden outputs.
 
-    Does not modify chunks.
+    Lazy overlap (lazy_overlap=True) is materialized from the neighbouring
+    chunks in the list. Does not modify chunks.
 
     Args:
         chunks: List of Chunk objects
@@ -103,10 +106,8 @@ def render_with_embedded_overlap(chunks: list["Chunk"]) -> list[str]:
         List of strings with embedded overlap
     """
     result = []
-    for chunk in chunks:
+    for chunk, (prev, next_) in zip(chunks, overlap_context(chunks), strict=True):
         parts = []
-        prev = chunk.metadata.get("previous_content", "")
-        next_ = chunk.metadata.get("next_content", "")
         if prev:
             parts.append(prev)
         parts.append(chunk.content)
@@ -126,7 +127,8 @@ def render_with_prev_overlap(chunks: list["Chunk"]) -> list[str]:
     Use case: "sliding window" mode. Whether this matches v2 include_metadata=False
     is determined by baseline test fixtures and renderer golden outputs.
 
-    Does not modify chunks.
+    Lazy overlap (lazy_overlap=True) is materialized from the neighbouring
+    chunks in the list. Does not modify chunks.
 
     Args:
         chunks: List of Chunk objects
@@ -135,9 +137,8 @@ def render_with_prev_overlap(chunks: list["Chunk"]) -> list[str]:
         List of strings with previous overlap only
     """
     result = []
-    for chunk in chunks:
+    for chunk, (prev, _) in zip(chunks, overlap_context(chunks), strict=True):
         parts = []
-        prev = chunk.metadata.get("previous_content", "")
         if prev:
             parts.append(prev)
         parts.append(chunk.content)
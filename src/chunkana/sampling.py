@@ -0,0 +1,269 @@
+"""
+Approximate document analysis from evenly spaced samples.
+
+Strategy selection only reads a few metrics of the analysis (code_ratio,
+list_ratio, header_count, max_header_depth, table_count, code_block_count
+and list_count). For very large documents these can be estimated from
+samples without reading the whole input:
+
+    estimate = estimate_file("huge.md", sample_count=16, sample_size=65536)
+    name, confidence = estimate.select_strategy(config)
+
+Samples are cut at line boundaries. Whether a sample starts inside a code
+fence is inferred from the fence lines it contains (only opening fences
+carry an info string), so code cut by the sample start is counted as code
+and not as headers or list items. Documents no larger than all samples
+together are analyzed in full.
+"""
+
+import mmap
+import os
+from dataclasses import dataclass
+
+from .config import ChunkConfig
+from .parser import Parser, get_parser
+from .strategies import StrategySelector
+from .types import ContentAnalysis
+
+DEFAULT_SAMPLE_COUNT = 16
+DEFAULT_SAMPLE_SIZE = 65_536
+
+
+@dataclass
+class AnalysisEstimate:
+    """
+    Whole-document metrics estimated from samples.
+
+    Attributes:
+        analysis: Metrics extrapolated to the whole document: counts are
+            scaled by total_size / sampled_size, ratios are averaged over
+            the samples. Extracted elements (code_blocks, headers, ...)
+            are left empty
+        samples: Analysis of every sample, in document order
+        sampled_size: Size of all samples together
+        total_size: Size of the document (characters for text, bytes for
+            files)
+    """
+
+    analysis: ContentAnalysis
+    samples: list[ContentAnalysis]
+    sampled_size: int
+    total_size: int
+
+    @property
+    def coverage(self) -> float:
+        """Share of the document that was sampled (1.0 if all of it)."""
+        if self.total_size <= 0:
+            return 1.0
+        return min(self.sampled_size / self.total_size, 1.0)
+
+    def select_strategy(self, config: ChunkConfig | None = None) -> tuple[str, float]:
+        """
+        Select a strategy from the estimated metrics.
+
+        Args:
+            config: Chunking configuration (uses defaults if None)
+
+        Returns:
+            Tuple of (strategy name, confidence). Confidence is 1.0 when the
+            whole document was analyzed; otherwise it is the share of the
+            sampled text whose own analysis selects the same strategy, so a
+            low value means that parts of the document differ and the
+            choice depends on where the samples fell.
+        """
+        config = config or ChunkConfig()
+        selector = StrategySelector()
+        name = selector.select(self.analysis, config).name
+        sampled_chars = sum(sample.total_chars for sample in self.samples)
+        if self.coverage >= 1.0 or not sampled_chars:
+            return name, 1.0
+
+        agreeing = sum(
+            sample.total_chars
+            for sample in self.samples
+            if selector.select(sample, config).name == name
+        )
+        return name, agreeing / sampled_chars
+
+
+def estimate_analysis(
+    text: str,
+    sample_count: int = DEFAULT_SAMPLE_COUNT,
+    sample_size: int = DEFAULT_SAMPLE_SIZE,
+) -> AnalysisEstimate:
+    """
+    Estimate the analysis of a document from samples of its text.
+
+    Args:
+        text: Markdown text
+        sample_count: Number of evenly spaced samples
+        sample_size: Characters per sample
+
+    Returns:
+        AnalysisEstimate with sizes in characters
+
+    Raises:
+        ValueError: If sample_count or sample_size is not positive
+    """
+    _validate(sample_count, sample_size)
+    total = len(text)
+    if total <= sample_count * sample_size:
+        return _exact(text, total)
+
+    samples: list[str] = []
+    for start, end in _sample_bounds(total, sample_count, sample_size):
+        # Whole lines only
+        start = text.find("\n", start, end) + 1 if start else 0
+        end = text.rfind("\n", start, end) + 1 if end < total else total
+        samples.append(text[start:end])
+    return _estimate(samples, sum(map(len, samples)), total)
+
+
+def estimate_bytes(
+    data: bytes | mmap.mmap,
+    sample_count: int = DEFAULT_SAMPLE_COUNT,
+    sample_size: int = DEFAULT_SAMPLE_SIZE,
+    encoding: str = "utf-8",
+) -> AnalysisEstimate:
+    """
+    Estimate the analysis of an encoded document, e.g. a memory-mapped file.
+
+    Only the samples are decoded (undecodable bytes are replaced).
+
+    Args:
+        data: Encoded markdown text
+        sample_count: Number of evenly spaced samples
+        sample_size: Bytes per sample
+        encoding: ASCII-compatible text encoding
+
+    Returns:
+        AnalysisEstimate with sizes in bytes
+
+    Raises:
+        ValueError: If sample_count or sample_size is not positive
+    """
+    _validate(sample_count, sample_size)
+    total = len(data)
+    if total <= sample_count * sample_size:
+        return _exact(bytes(data).decode(encoding, errors="replace"), total)
+
+    samples: list[str] = []
+    sampled_size = 0
+    for start, end in _sample_bounds(total, sample_count, sample_size):
+        # Whole lines only
+        start = data.find(b"\n", start, end) + 1 if start else 0
+        end = data.rfind(b"\n", start, end) + 1 if end < total else total
+        piece = data[start:end]
+        sampled_size += len(piece)
+        samples.append(piece.decode(encoding, errors="replace"))
+    return _estimate(samples, sampled_size, total)
+
+
+def estimate_file(
+    file_path: str,
+    sample_count: int = DEFAULT_SAMPLE_COUNT,
+    sample_size: int = DEFAULT_SAMPLE_SIZE,
+    encoding: str = "utf-8",
+) -> AnalysisEstimate:
+    """
+    Estimate the analysis of a file, reading only the samples.
+
+    Args:
+        file_path: Path to markdown file
+        sample_count: Number of evenly spaced samples
+        sample_size: Bytes per sample
+        encoding: ASCII-compatible file encoding
+
+    Returns:
+        AnalysisEstimate with sizes in bytes
+    """
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return estimate_bytes(b"", sample_count, sample_size, encoding)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return estimate_bytes(data, sample_count, sample_size, encoding)
+
+
+def _validate(sample_count: int, sample_size: int) -> None:
+    if sample_count < 1:
+        raise ValueError(f"sample_count must be positive, got {sample_count}")
+    if sample_size < 1:
+        raise ValueError(f"sample_size must be positive, got {sample_size}")
+
+
+def _sample_bounds(total: int, sample_count: int, sample_size: int) -> list[tuple[int, int]]:
+    """(start, end) of evenly spaced samples, the first and last at the ends."""
+    if sample_count == 1:
+        starts = [(total - sample_size) // 2]
+    else:
+        step = (total - sample_size) / (sample_count - 1)
+        starts = [round(i * step) for i in range(sample_count)]
+    return [(start, start + sample_size) for start in starts]
+
+
+def _exact(text: str, total: int) -> AnalysisEstimate:
+    """Analyze a document small enough to be covered by the samples."""
+    analysis = get_parser().analyze(text)
+    return AnalysisEstimate(analysis, [analysis], total, total)
+
+
+def _estimate(samples: list[str], sampled_size: int, total_size: int) -> AnalysisEstimate:
+    """Analyze the samples and extrapolate their metrics to the document."""
+    parser = get_parser()
+    analyses = [_analyze_sample(parser, sample) for sample in samples if sample]
+    chars = sum(analysis.total_chars for analysis in analyses)
+    scale = total_size / sampled_size if sampled_size else 1.0
+
+    def count(name: str) -> int:
+        observed = sum(int(getattr(analysis, name)) for analysis in analyses)
+        return max(round(observed * scale), observed)
+
+    def ratio(name: str) -> float:
+        if not chars:
+            return 0.0
+        return sum(float(getattr(a, name)) * a.total_chars for a in analyses) / chars
+
+    estimated = ContentAnalysis(
+        total_chars=round(chars * scale),
+        total_lines=count("total_lines"),
+        code_ratio=ratio("code_ratio"),
+        code_block_count=count("code_block_count"),
+        header_count=count("header_count"),
+        max_header_depth=max((a.max_header_depth for a in analyses), default=0),
+        table_count=count("table_count"),
+        list_count=count("list_count"),
+        list_item_count=count("list_item_count"),
+        list_ratio=ratio("list_ratio"),
+        max_list_depth=max((a.max_list_depth for a in analyses), default=0),
+    )
+    return AnalysisEstimate(estimated, analyses, sampled_size, total_size)
+
+
+def _analyze_sample(parser: Parser, sample: str) -> ContentAnalysis:
+    """Analyze a sample, reopening the code fence it starts inside of."""
+    fence = _open_fence_at_start(parser, sample)
+    return parser.analyze(f"{fence}\n{sample}" if fence else sample)
+
+
+def _open_fence_at_start(parser: Parser, sample: str) -> str | None:
+    """
+    Infer whether a sample starts inside a code fence.
+
+    Fence lines alternate between opening and closing, and only opening
+    fences carry an info string. The sample starts inside a fence when
+    more fences with an info string fall on odd positions (openings if the
+    first fence line closes a block) than on even ones.
+
+    Returns:
+        Fence marker of the block the sample starts in, or None
+    """
+    fences: list[tuple[str, bool]] = []
+    for line in sample.split("\n"):
+        if line.lstrip()[:3] not in ("```", "~~~"):
+            continue
+        fence_info = parser._is_fence_opening(line)
+        if fence_info:
+            fence_char, fence_length, language = fence_info
+            fences.append((fence_char * fence_length, bool(language)))
+    balance = sum(1 if i % 2 else -1 for i, (_, has_info) in enumerate(fences) if has_info)
+    return fences[0][0] if balance > 0 else None
@@ -26,11 +26,27 @@ Line Number Semantics:
 """
 
 import re
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 
 from .config import ChunkConfig
 from .types import Chunk
 
+_NEWLINE = re.compile(r"\n")
+_PARAGRAPH_BREAK = re.compile(r"\n\n+")
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+")
+
+
+def _strip_span(text: str, start: int, end: int) -> tuple[int, int] | None:
+    """Narrow text[start:end] to its stripped part, or None if it is blank."""
+    piece = text[start:end]
+    stripped = piece.strip()
+    if not stripped:
+        return None
+    start += len(piece) - len(piece.lstrip())
+    return start, start + len(stripped)
+
 
 @dataclass
 class SegmentWithPosition:
@@ -85,16 +101,26 @@ class SectionSplitter:
         Returns:
             List of chunks with oversize sections split
         """
-        result = []
+        return list(self.iter_split_oversize_sections(chunks))
+
+    def iter_split_oversize_sections(self, chunks: Iterable[Chunk]) -> Iterator[Chunk]:
+        """
+        Streaming variant of split_oversize_sections().
+
+        Every chunk is split on its own, so pieces are yielded as soon as
+        their source chunk arrives.
+
+        Args:
+            chunks: Chunks to process, in document order
 
+        Yields:
+            Chunks with oversize sections split
+        """
         for chunk in chunks:
             if self._needs_splitting(chunk):
-                split_chunks = self._split_chunk(chunk)
-                result.extend(split_chunks)
+                yield from self._split_chunk(chunk)
             else:
-                result.append(chunk)
-
-        return result
+                yield chunk
 
     def _needs_splitting(self, chunk: Chunk) -> bool:
         """Check if chunk needs to be split."""
@@ -120,8 +146,8 @@ class SectionSplitter:
         Find segments with their line positions in the original document.
 
         Strategy:
-        1. Split body into segments (existing logic)
-        2. For each segment, find its position in original content
+        1. Split body into (start, end) spans (list items, paragraphs, sentences)
+        2. Attribute lines to each span from a newline table of the body
         3. Calculate line offsets from original.start_line
 
         Args:
@@ -135,61 +161,39 @@ class SectionSplitter:
         if not body.strip():
             return []
 
-        # Use existing segment finding logic
-        segments = self._find_segments(body)
+        spans = self._find_segment_spans(body)
 
-        # Filter out empty segments
-        segments = [s for s in segments if s.strip()]
-
-        if len(segments) <= 1:
+        if len(spans) <= 1:
             return []
 
-        # Calculate positions for segments
-        return self._calculate_segment_positions(segments, body, original)
+        return self._positions_from_spans(spans, body, original)
 
-    def _calculate_segment_positions(
-        self, segments: list[str], body: str, original: Chunk
+    def _positions_from_spans(
+        self, spans: list[tuple[int, int]], body: str, original: Chunk
     ) -> list[SegmentWithPosition]:
         """
-        Calculate line positions for segments.
+        Calculate line positions for segment spans.
 
-        Algorithm:
-        1. Find body start line in original content
-        2. For each segment:
-           a. Find segment start position in body
-           b. Count lines from body start to segment start
-           c. Count lines in segment
-           d. Calculate absolute line numbers
+        The newline positions of body are collected once; the number of
+        lines before any offset is then a binary search instead of a
+        count over the body prefix.
 
         Args:
-            segments: List of segment strings
+            spans: (start, end) offsets of segments in body, in order
             body: Body text (without header_stack)
             original: Original chunk being split
 
         Returns:
             List of segments with position information
         """
-        result = []
         body_start_line = self._find_body_start_line(original.content)
+        newlines = [m.start() for m in _NEWLINE.finditer(body)]
 
-        current_pos = 0
-        for i, segment in enumerate(segments):
-            # Find segment in body
-            segment_start = body.find(segment, current_pos)
-            if segment_start == -1:
-                # Fallback: use sequential positioning
-                if i == 0:
-                    segment_start = 0
-                else:
-                    # Estimate position based on previous segments
-                    prev_segments_length = sum(
-                        len(s) + 2 for s in segments[:i]
-                    )  # +2 for separators
-                    segment_start = min(prev_segments_length, len(body))
-
-            # Count lines from body start to segment start
-            lines_before = body[:segment_start].count("\n")
-            lines_in_segment = segment.count("\n")
+        result = []
+        for start, end in spans:
+            segment = body[start:end]
+            lines_before = bisect_left(newlines, start)
+            lines_in_segment = bisect_left(newlines, end) - lines_before
 
             # Calculate line offsets from original chunk start
             start_line_offset = body_start_line + lines_before
@@ -204,9 +208,39 @@ class SectionSplitter:
                 )
             )
 
+        return result
+
+    def _calculate_segment_positions(
+        self, segments: list[str], body: str, original: Chunk
+    ) -> list[SegmentWithPosition]:
+        """
+        Calculate line positions for segment strings.
+
+        Each segment is searched for after the end of the previous one; a
+        segment that is not found is placed just after its predecessor.
+
+        Args:
+            segments: List of segment strings
+            body: Body text (without header_stack)
+            original: Original chunk being split
+
+        Returns:
+            List of segments with position information
+        """
+        spans = []
+        current_pos = 0
+        for i, segment in enumerate(segments):
+            segment_start = body.find(segment, current_pos)
+            if segment_start == -1:
+                # Fallback: sequential positioning (+2 for the separator)
+                segment_start = min(current_pos + 2, len(body)) if i else 0
+            spans.append((segment_start, segment_start + len(segment)))
             current_pos = segment_start + len(segment)
 
-        return result
+        positions = self._positions_from_spans(spans, body, original)
+        for position, segment in zip(positions, segments, strict=True):
+            position.content = position.original_text = segment
+        return positions
 
     def _find_body_start_line(self, content: str) -> int:
         """
@@ -345,6 +379,18 @@ class SectionSplitter:
         """
         Find segments for splitting.
 
+        Args:
+            body: Body text to segment
+
+        Returns:
+            List of segments
+        """
+        return [body[start:end] for start, end in self._find_segment_spans(body)]
+
+    def _find_segment_spans(self, body: str) -> list[tuple[int, int]]:
+        """
+        Find segment spans for splitting.
+
         Priority:
         1. List items (numbered or bulleted)
         2. Paragraphs (separated by \\n\\n)
@@ -354,72 +400,76 @@ class SectionSplitter:
             body: Body text to segment
 
         Returns:
-            List of segments
+            List of (start, end) offsets of stripped, non-empty segments
         """
         # Try list items first
-        list_segments = self._split_by_list_items(body)
-        if len(list_segments) > 1:
-            return list_segments
+        list_spans = self._list_item_spans(body)
+        if len(list_spans) > 1:
+            return list_spans
 
         # Try paragraphs
-        para_segments = self._split_by_paragraphs(body)
-        if len(para_segments) > 1:
-            return para_segments
+        para_spans = self._separated_spans(body, _PARAGRAPH_BREAK)
+        if len(para_spans) > 1:
+            return para_spans
 
         # Fallback to sentences
-        return self._split_by_sentences(body)
+        return self._separated_spans(body, _SENTENCE_BREAK)
 
-    def _split_by_list_items(self, body: str) -> list[str]:
+    def _list_item_spans(self, body: str) -> list[tuple[int, int]]:
         """
         Split by list items (numbered or bulleted).
 
+        Text before the first list marker is not part of any segment.
+
         Args:
             body: Body text
 
         Returns:
-            List of segments (each starting with a list marker)
+            List of spans (each starting with a list marker)
         """
-        matches = list(self.list_item_pattern.finditer(body))
+        starts = [match.start() for match in self.list_item_pattern.finditer(body)]
 
-        if len(matches) <= 1:
-            return [body]
-
-        segments = []
-        for i, match in enumerate(matches):
-            start = match.start()
-            end = matches[i + 1].start() if i + 1 < len(matches) else len(body)
-            segment = body[start:end].strip()
-            if segment:
-                segments.append(segment)
+        if len(starts) <= 1:
+            return []
 
-        return segments if segments else [body]
+        ends = starts[1:] + [len(body)]
+        spans = (_strip_span(body, start, end) for start, end in zip(starts, ends, strict=True))
+        return [span for span in spans if span]
 
-    def _split_by_paragraphs(self, body: str) -> list[str]:
+    def _separated_spans(self, body: str, separator: re.Pattern[str]) -> list[tuple[int, int]]:
         """
-        Split by paragraphs (double newline).
+        Split by a separator pattern (paragraph or sentence breaks).
 
         Args:
             body: Body text
+            separator: Pattern matching the text between segments
 
         Returns:
-            List of paragraph segments
+            List of spans between separators
         """
-        paragraphs = re.split(r"\n\n+", body)
-        return [p.strip() for p in paragraphs if p.strip()]
+        spans = []
+        start = 0
+        for match in separator.finditer(body):
+            span = _strip_span(body, start, match.start())
+            if span:
+                spans.append(span)
+            start = match.end()
+        span = _strip_span(body, start, len(body))
+        if span:
+            spans.append(span)
+        return spans
 
-    def _split_by_sentences(self, body: str) -> list[str]:
-        """
-        Split by sentences (fallback).
+    def _split_by_list_items(self, body: str) -> list[str]:
+        """Split by list items; returns [body] when there is nothing to split."""
+        return [body[start:end] for start, end in self._list_item_spans(body)] or [body]
 
-        Args:
-            body: Body text
+    def _split_by_paragraphs(self, body: str) -> list[str]:
+        """Split by paragraphs (double newline)."""
+        return [body[start:end] for start, end in self._separated_spans(body, _PARAGRAPH_BREAK)]
 
-        Returns:
-            List of sentence segments
-        """
-        # Simple sentence splitting on . ! ?
-        sentences = re.split(r"(?<=[.!?])\s+", body)
-        return [s.strip() for s in sentences if s.strip()]
+    def _split_by_sentences(self, body: str) -> list[str]:
+        """Split by sentences (fallback)."""
+        return [body[start:end] for start, end in self._separated_spans(body, _SENTENCE_BREAK)]
 
     def _pack_segments_into_chunks_with_lines(
         self, original: Chunk, header_stack: str, segments: list[SegmentWithPosition]
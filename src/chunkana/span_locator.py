@@ -0,0 +1,244 @@
+"""
+Source span location for chunks.
+
+Sets start_offset/end_offset (characters) and start_byte/end_byte (UTF-8)
+on chunks, so consumers can slice the chunked text instead of searching
+for chunk content.
+
+Chunks are located near their line range: every search is bounded by a
+region a little larger than the chunk, so locating all chunks of a
+document is linear in its size.
+"""
+
+from bisect import bisect_right
+from collections.abc import Iterable
+
+from .types import Chunk
+
+# Content lines tried as the start of a span before falling back to the
+# line range (keeps locating linear for content rewritten by post-processing)
+_START_CANDIDATES = 3
+
+# Lines searched around the line range of a chunk beyond its own line count
+_LINE_SLACK = 8
+
+
+def last_line_read(chunk: Chunk) -> int:
+    """
+    Last source line read when locating a chunk.
+
+    The span of a chunk depends only on the lines up to this one and on
+    the start of the chunk located before it, so an edit below this line
+    leaves the span unchanged.
+
+    Args:
+        chunk: Chunk to locate
+
+    Returns:
+        Line number (1-indexed, may exceed the line count)
+    """
+    return max(chunk.start_line, chunk.end_line) + chunk.content.count("\n") + 1 + _LINE_SLACK
+
+
+class SpanLocator:
+    """
+    Locate chunks in the normalized text they were chunked from.
+
+    Chunks must be located in document order. Searches are anchored at
+    the line table: content is looked for from the first character of
+    start_line up to the end of end_line, so an identical paragraph or
+    code block earlier in the document is never picked. Only when it does
+    not start there is it looked for above start_line (lines moved into
+    the chunk, e.g. dangling headers), but not before the start of the
+    previous chunk, and then below end_line (miscounted lines).
+
+    Content copied verbatim from the source is located as a whole, so its
+    span is exactly content.strip(). Otherwise the span starts at the
+    first character of its first source line and ends after the last
+    character of its last source line, both found by matching the chunk's
+    first and last non-blank lines. Header lines repeated at the top of
+    continuation chunks (continued_from_header) are not part of the span.
+    """
+
+    def __init__(self, text: str, line_offsets: list[int] | None = None, floor: int = 0):
+        """
+        Initialize span locator.
+
+        Args:
+            text: Normalized text the chunks were produced from
+            line_offsets: Line start offsets of text followed by
+                len(text) + 1 (ContentAnalysis.get_line_offsets()); computed
+                if None
+            floor: Start offset of the chunk preceding the first chunk to
+                locate; no span starts before it
+        """
+        self.text = text
+        self.line_offsets = line_offsets or self._compute_line_offsets(text)
+        self._ascii = text.isascii()
+        self._line_bytes: list[int] | None = None  # UTF-8 offset of every line start
+        self._floor = floor
+
+    def locate_all(self, chunks: Iterable[Chunk]) -> None:
+        """Set source offsets on every chunk."""
+        for chunk in chunks:
+            self.locate(chunk)
+
+    def locate(self, chunk: Chunk) -> None:
+        """
+        Set start_offset, end_offset, start_byte and end_byte of a chunk.
+
+        Args:
+            chunk: Chunk produced from self.text
+        """
+        start, end = self.span(chunk)
+        self._floor = start
+        chunk.start_offset = start
+        chunk.end_offset = end
+        chunk.start_byte = self.byte_offset(start)
+        chunk.end_byte = self.byte_offset(end)
+
+    def span(self, chunk: Chunk) -> tuple[int, int]:
+        """
+        Find the source span of a chunk.
+
+        Args:
+            chunk: Chunk produced from self.text
+
+        Returns:
+            Tuple of (start_offset, end_offset) in characters
+        """
+        text = self.text
+        offsets = self.line_offsets
+        n = len(offsets) - 1
+        first_line = min(max(chunk.start_line, 1), n)
+        last_line = min(max(chunk.end_line, first_line), n)
+
+        lines = [line.strip() for line in chunk.content.split("\n")]
+        lines = [line for line in lines if line]
+        continued = bool(chunk.metadata.get("continued_from_header"))
+        if continued:
+            # Skip the repeated header_stack; it belongs to an earlier chunk
+            body_start = 0
+            while body_start < len(lines) - 1 and lines[body_start].startswith("#"):
+                body_start += 1
+            lines = lines[body_start:]
+        if not lines:
+            start = offsets[first_line - 1]
+            return start, start
+
+        # The span starts on first_line, or below it when post-processing
+        # miscounted lines; above it only for lines moved into the chunk
+        # (dangling headers), and never before the previous chunk
+        anchor = offsets[first_line - 1]
+        limit = offsets[last_line] - 1  # End of last_line
+        floor = max(offsets[max(first_line - 1 - _LINE_SLACK, 0)], self._floor)
+        # Nothing after region_end is read (see last_line_read())
+        region_end = offsets[min(last_line + len(lines) + _LINE_SLACK, n)] - 1
+
+        # Verbatim content: the span is the stripped content itself
+        stripped = chunk.content.strip()
+        if not continued:
+            pos = self._find_near(stripped, anchor, limit, floor, region_end)
+            if pos is None:
+                pos = self._find_below(stripped, limit, region_end)
+            if pos is not None:
+                return pos, pos + len(stripped)
+
+        found = self._find_start(lines, anchor, limit, floor, region_end)
+        if found is None:
+            # Content not found (rewritten by post-processing): use the lines
+            start = anchor
+            while start < offsets[first_line] - 1 and text[start].isspace():
+                start += 1
+        else:
+            start = found
+
+        if not continued and text.startswith(stripped, start, region_end):
+            return start, start + len(stripped)
+
+        end = self._find_end(lines[-1], last_line, start, region_end)
+        if end is None:
+            end = offsets[last_line] - 1
+            while end > start and text[end - 1].isspace():
+                end -= 1
+        return start, max(end, start)
+
+    def byte_offset(self, offset: int) -> int:
+        """
+        Convert a character offset into a UTF-8 byte offset.
+
+        Args:
+            offset: Character offset into self.text
+
+        Returns:
+            Byte offset into self.text.encode("utf-8")
+        """
+        if self._ascii:
+            return offset
+        if self._line_bytes is None:
+            self._line_bytes = self._compute_line_bytes()
+        i = bisect_right(self.line_offsets, offset) - 1
+        line_start = self.line_offsets[i]
+        return self._line_bytes[i] + len(self.text[line_start:offset].encode("utf-8"))
+
+    def _find_start(
+        self, lines: list[str], anchor: int, limit: int, floor: int, region_end: int
+    ) -> int | None:
+        """Offset of the first content line found near the chunk's lines, else below them."""
+        candidates = lines[:_START_CANDIDATES]
+        for line in candidates:
+            pos = self._find_near(line, anchor, limit, floor, region_end)
+            if pos is not None:
+                return pos
+        for line in candidates:
+            pos = self._find_below(line, limit, region_end)
+            if pos is not None:
+                return pos
+        return None
+
+    def _find_near(
+        self, needle: str, anchor: int, limit: int, floor: int, region_end: int
+    ) -> int | None:
+        """
+        Find where a chunk's content starts within its own lines.
+
+        The first occurrence starting in [anchor, limit] (from first_line to
+        the end of last_line), else the last one starting in [floor, anchor).
+        """
+        text = self.text
+        pos = text.find(needle, anchor, min(limit + len(needle), region_end))
+        if pos == -1:
+            pos = text.rfind(needle, floor, min(anchor + len(needle) - 1, region_end))
+        return pos if pos != -1 else None
+
+    def _find_below(self, needle: str, limit: int, region_end: int) -> int | None:
+        """First occurrence after last_line (post-processing miscounted lines)."""
+        pos = self.text.find(needle, limit, region_end)
+        return pos if pos != -1 else None
+
+    def _find_end(self, line: str, last_line: int, start: int, region_end: int) -> int | None:
+        """Offset after the last content line found at or before last_line."""
+        text = self.text
+        anchor = self.line_offsets[last_line] - 1  # End of last_line
+        pos = text.rfind(line, start, anchor) if start < anchor else -1
+        if pos == -1:
+            pos = text.find(line, max(start, anchor), region_end)
+        return pos + len(line) if pos != -1 else None
+
+    def _compute_line_bytes(self) -> list[int]:
+        offsets = self.line_offsets
+        line_bytes = [0]
+        for i in range(len(offsets) - 1):
+            line = self.text[offsets[i] : offsets[i + 1] - 1]
+            line_bytes.append(line_bytes[-1] + len(line.encode("utf-8")) + 1)
+        return line_bytes
+
+    @staticmethod
+    def _compute_line_offsets(text: str) -> list[int]:
+        offsets = [0]
+        pos = text.find("\n")
+        while pos != -1:
+            offsets.append(pos + 1)
+            pos = text.find("\n", pos + 1)
+        offsets.append(len(text) + 1)
+        return offsets
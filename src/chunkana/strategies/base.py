@@ -3,10 +3,11 @@ Base strategy class for markdown_chunker v2.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from typing import TYPE_CHECKING
 
 from ..config import ChunkConfig
-from ..types import Chunk, ContentAnalysis, LatexType
+from ..types import Chunk, ContentAnalysis, LineIndex
 
 if TYPE_CHECKING:
     from ..table_grouping import TableGroup
@@ -64,6 +65,25 @@ class BaseStrategy(ABC):
         """
         pass
 
+    def iter_apply(
+        self, md_text: str, analysis: ContentAnalysis, config: ChunkConfig
+    ) -> Iterator[Chunk]:
+        """
+        Apply strategy, yielding chunks in document order.
+
+        Strategies that can produce their output piece by piece override
+        this; the default yields the result of apply().
+
+        Args:
+            md_text: Normalized markdown text
+            analysis: Document analysis results
+            config: Chunking configuration
+
+        Yields:
+            The chunks apply() returns
+        """
+        yield from self.apply(md_text, analysis, config)
+
     def _create_chunk(
         self, content: str, start_line: int, end_line: int, **metadata: object
     ) -> Chunk:
@@ -182,30 +202,23 @@ class BaseStrategy(ABC):
         Returns:
             List of (block_start, block_end, block_type) tuples
         """
-        atomic_ranges: list[tuple[int, int, str]] = []
-
-        # Add code blocks in range
-        for code_block in analysis.code_blocks:
-            if start_line <= code_block.start_line <= end_line:
-                atomic_ranges.append((code_block.start_line, code_block.end_line, "code"))
-
-        # Add table blocks in range
-        for table_block in analysis.tables:
-            if start_line <= table_block.start_line <= end_line:
-                atomic_ranges.append((table_block.start_line, table_block.end_line, "table"))
-
-        # Add LaTeX blocks in range (only if configured)
-        for latex_block in analysis.latex_blocks:
-            if start_line <= latex_block.start_line <= end_line and latex_block.latex_type in (
-                LatexType.DISPLAY,
-                LatexType.ENVIRONMENT,
-            ):
-                atomic_ranges.append((latex_block.start_line, latex_block.end_line, "latex"))
-
-        # Sort by start line
-        atomic_ranges.sort(key=lambda x: x[0])
-
-        return atomic_ranges
+        return analysis.get_atomic_index().starting_in(start_line, end_line)
+
+    def _get_line_index(self, analysis: ContentAnalysis, lines: list[str]) -> LineIndex:
+        """
+        Get the line index for sizing line ranges without joining them.
+
+        Args:
+            analysis: Document analysis
+            lines: Document lines the strategy works on (analysis.get_lines()
+                or the split text)
+
+        Returns:
+            The analysis' line index, or one built from lines if the analysis
+            has no cached line array
+        """
+        index = analysis.get_line_index()
+        return index if index is not None else LineIndex.from_lines(lines)
 
     def _split_text_to_size(self, text: str, start_line: int, config: ChunkConfig) -> list[Chunk]:
         """
@@ -7,7 +7,7 @@ Consolidates CodeStrategy + MixedStrategy + TableStrategy.
 
 from ..code_context import CodeBlockRole, CodeContext, CodeContextBinder
 from ..config import ChunkConfig
-from ..types import Chunk, ContentAnalysis, FencedBlock, LatexType
+from ..types import Chunk, ContentAnalysis, FencedBlock
 from .base import BaseStrategy
 
 
@@ -195,10 +195,7 @@ class CodeAwareStrategy(BaseStrategy):
             lines=lines,  # O1: Share line array
         )
 
-        code_contexts = [
-            binder.bind_context(block, md_text, analysis.code_blocks)
-            for block in analysis.code_blocks
-        ]
+        code_contexts = binder.bind_all(analysis.code_blocks, md_text)
 
         # Group related contexts and create index mapping
         context_groups = self._group_related_contexts(code_contexts, config)
@@ -226,11 +223,11 @@ class CodeAwareStrategy(BaseStrategy):
         context_groups: list[list[CodeContext]],
     ) -> dict[int, list[CodeContext]]:
         """Build mapping from context index to group."""
+        positions = {id(ctx): i for i, ctx in enumerate(code_contexts)}
         context_to_group: dict[int, list[CodeContext]] = {}
         for group in context_groups:
             for ctx in group:
-                idx = code_contexts.index(ctx)
-                context_to_group[idx] = group
+                context_to_group[positions[id(ctx)]] = group
         return context_to_group
 
     def _process_atomic_blocks_with_context(
@@ -248,6 +245,7 @@ class CodeAwareStrategy(BaseStrategy):
         current_line = 1
         processed_blocks: set[int] = set()
         processed_table_lines: set[int] = set()
+        block_positions = self._index_code_blocks(analysis.code_blocks)
 
         for block_start, block_end, block_type in atomic_ranges:
             # Handle text before atomic block
@@ -258,7 +256,7 @@ class CodeAwareStrategy(BaseStrategy):
                 new_chunks, new_line = self._process_code_block_with_context(
                     lines,
                     md_text,
-                    analysis,
+                    block_positions,
                     block_start,
                     block_end,
                     code_contexts,
@@ -328,7 +326,7 @@ class CodeAwareStrategy(BaseStrategy):
         self,
         lines: list[str],
         md_text: str,
-        analysis: ContentAnalysis,
+        block_positions: dict[tuple[int, int], int],
         block_start: int,
         block_end: int,
         code_contexts: list[CodeContext],
@@ -337,7 +335,7 @@ class CodeAwareStrategy(BaseStrategy):
         config: ChunkConfig,
     ) -> tuple[list[Chunk], int]:
         """Process code block with context binding."""
-        code_block_idx = self._find_code_block_index(analysis.code_blocks, block_start, block_end)
+        code_block_idx = block_positions.get((block_start, block_end))
 
         if code_block_idx is None or code_block_idx in processed_blocks:
             return [], block_end + 1
@@ -349,8 +347,8 @@ class CodeAwareStrategy(BaseStrategy):
             chunk = self._create_grouped_code_chunk(group, code_contexts, lines, md_text, config)
             # Mark all blocks in group as processed
             for ctx in group:
-                idx = code_contexts.index(ctx)
-                processed_blocks.add(idx)
+                block = ctx.code_block
+                processed_blocks.add(block_positions[(block.start_line, block.end_line)])
             last_block = group[-1].code_block
             return [chunk], last_block.end_line + 1
         else:
@@ -485,25 +483,7 @@ class CodeAwareStrategy(BaseStrategy):
         Returns list of (start_line, end_line, block_type) tuples,
         sorted by start_line.
         """
-        ranges = []
-
-        # Add code blocks
-        for block in analysis.code_blocks:
-            ranges.append((block.start_line, block.end_line, "code"))
-
-        # Add tables
-        for table in analysis.tables:
-            ranges.append((table.start_line, table.end_line, "table"))
-
-        # Add LaTeX blocks (only display and environment types)
-        for latex in analysis.latex_blocks:
-            if latex.latex_type in (LatexType.DISPLAY, LatexType.ENVIRONMENT):
-                ranges.append((latex.start_line, latex.end_line, "latex"))
-
-        # Sort by start line
-        ranges.sort(key=lambda x: x[0])
-
-        return ranges
+        return list(analysis.get_atomic_index().ranges)
 
     def _group_related_contexts(
         self, contexts: list[CodeContext], config: ChunkConfig
@@ -516,6 +496,10 @@ class CodeAwareStrategy(BaseStrategy):
         - Code/Output pairs (if bind_output_blocks is enabled)
         - Related blocks with same language in close proximity
 
+        Args:
+            contexts: Code contexts in document order
+            config: Chunking configuration
+
         Returns:
             List of context groups, each group is a list of related contexts
         """
@@ -533,9 +517,16 @@ class CodeAwareStrategy(BaseStrategy):
             group = [context]
             processed.add(i)
 
-            # Look for related contexts
-            for j, other_context in enumerate(contexts):
-                if j in processed or i == j:
+            # Look for related contexts. Earlier contexts are all processed;
+            # later ones can only be related as the next block or as a
+            # Before/After pair within related_block_max_gap lines.
+            end_line = context.code_block.end_line
+            for j in range(i + 1, len(contexts)):
+                other_context = contexts[j]
+                gap = other_context.code_block.start_line - end_line
+                if j > i + 1 and gap > config.related_block_max_gap:
+                    break
+                if j in processed:
                     continue
 
                 # Check if contexts are related
@@ -583,24 +574,21 @@ class CodeAwareStrategy(BaseStrategy):
             return True
         return bool(ctx2.related_blocks and ctx1.code_block in ctx2.related_blocks)
 
-    def _find_code_block_index(
-        self, code_blocks: list[FencedBlock], start_line: int, end_line: int
-    ) -> int | None:
+    def _index_code_blocks(self, code_blocks: list[FencedBlock]) -> dict[tuple[int, int], int]:
         """
-        Find the index of a code block by its line range.
+        Index code blocks by their line range.
 
         Args:
             code_blocks: List of code blocks
-            start_line: Start line to match
-            end_line: End line to match
 
         Returns:
-            Index of matching block, or None if not found
+            Mapping from (start_line, end_line) to the index of the first
+            block with that range
         """
+        positions: dict[tuple[int, int], int] = {}
         for i, block in enumerate(code_blocks):
-            if block.start_line == start_line and block.end_line == end_line:
-                return i
-        return None
+            positions.setdefault((block.start_line, block.end_line), i)
+        return positions
 
     def _create_context_enhanced_chunk(
         self,
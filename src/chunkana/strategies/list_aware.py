@@ -8,7 +8,7 @@ Preserves list hierarchies and binds context paragraphs.
 import re
 
 from ..config import ChunkConfig
-from ..types import Chunk, ContentAnalysis, Header, ListBlock, ListItem, ListType
+from ..types import Chunk, ContentAnalysis, Header, LineIndex, ListBlock, ListItem, ListType
 from .base import BaseStrategy
 
 
@@ -104,13 +104,15 @@ class ListAwareStrategy(BaseStrategy):
         if not list_blocks:
             return self._split_text_to_size(md_text, 1, config)
 
-        chunks = self._process_all_list_blocks(lines, list_blocks, headers, config)
+        index = self._get_line_index(analysis, lines)
+        chunks = self._process_all_list_blocks(lines, index, list_blocks, headers, config)
         chunks = self._process_remaining_text(chunks, lines, list_blocks, headers, config)
         return chunks
 
     def _process_all_list_blocks(
         self,
         lines: list[str],
+        index: LineIndex,
         list_blocks: list[ListBlock],
         headers: list[Header],
         config: ChunkConfig,
@@ -128,14 +130,16 @@ class ListAwareStrategy(BaseStrategy):
             # Handle content before list block
             if current_line < block.start_line:
                 block_processed, chunks, current_line = self._process_text_before_list(
-                    chunks, lines, current_line, block, config, headers
+                    chunks, lines, index, current_line, block, config, headers
                 )
                 if block_processed:
                     processed_blocks.add(id(block))
                     continue
 
             # Handle list block
-            chunks, current_line = self._process_list_block(chunks, lines, block, config, headers)
+            chunks, current_line = self._process_list_block(
+                chunks, lines, index, block, config, headers
+            )
             processed_blocks.add(id(block))
 
         return chunks
@@ -171,6 +175,7 @@ class ListAwareStrategy(BaseStrategy):
         self,
         chunks: list[Chunk],
         lines: list[str],
+        index: LineIndex,
         current_line: int,
         block: ListBlock,
         config: ChunkConfig,
@@ -189,24 +194,22 @@ class ListAwareStrategy(BaseStrategy):
             return False, chunks, current_line
 
         intro_context = self._extract_introduction_context(text_before, block, config)
-        if intro_context:
-            # Try to bind introduction with list
-            list_content = self._reconstruct_list_block(block, lines)
-            combined = intro_context + "\n\n" + list_content
-
-            if len(combined) <= config.max_chunk_size:
-                chunk = self._create_list_chunk(
-                    combined,
-                    current_line,
-                    block.end_line,
-                    block,
-                    has_context_binding=True,
-                )
-                # Add header_path to chunk
-                self._add_header_path_to_chunk(chunk, headers, current_line)
-                chunks.append(chunk)
-                # Return True to indicate block was processed
-                return True, chunks, block.end_line + 1
+        # Try to bind introduction with list, if both fit
+        list_size = index.size(block.start_line, block.end_line)
+        if intro_context and len(intro_context) + 2 + list_size <= config.max_chunk_size:
+            combined = intro_context + "\n\n" + self._reconstruct_list_block(block, lines)
+            chunk = self._create_list_chunk(
+                combined,
+                current_line,
+                block.end_line,
+                block,
+                has_context_binding=True,
+            )
+            # Add header_path to chunk
+            self._add_header_path_to_chunk(chunk, headers, current_line)
+            chunks.append(chunk)
+            # Return True to indicate block was processed
+            return True, chunks, block.end_line + 1
 
         # Process text separately
         text_chunks = self._split_text_to_size(text_before, current_line, config)
@@ -221,16 +224,15 @@ class ListAwareStrategy(BaseStrategy):
         self,
         chunks: list[Chunk],
         lines: list[str],
+        index: LineIndex,
         block: ListBlock,
         config: ChunkConfig,
         headers: list[Header],
     ) -> tuple[list[Chunk], int]:
         """Process a list block."""
-        list_content = self._reconstruct_list_block(block, lines)
-
-        if len(list_content) <= config.max_chunk_size:
+        if index.size(block.start_line, block.end_line) <= config.max_chunk_size:
             chunk = self._create_list_chunk(
-                list_content,
+                self._reconstruct_list_block(block, lines),
                 block.start_line,
                 block.end_line,
                 block,
@@ -330,13 +332,15 @@ class ListAwareStrategy(BaseStrategy):
         chunks: list[Chunk] = []
         current_items: list[ListItem] = []
         current_start_line: int | None = None
+        # Same for every chunk of the block
+        block_stats = self._list_block_stats(block)
 
         for item in block.items:
             # Start new group at top-level items
             if item.depth == 0 and current_items:
                 # Check if current group fits
                 group_text, actual_end_line = self._reconstruct_item_group(
-                    current_items, lines, block
+                    current_items, lines, block, item
                 )
 
                 if current_start_line is None:
@@ -349,6 +353,7 @@ class ListAwareStrategy(BaseStrategy):
                         actual_end_line,
                         block,
                         has_context_binding=False,
+                        block_stats=block_stats,
                     )
                     chunks.append(chunk)
                 else:
@@ -359,6 +364,7 @@ class ListAwareStrategy(BaseStrategy):
                         actual_end_line,
                         block,
                         has_context_binding=False,
+                        block_stats=block_stats,
                     )
                     self._set_oversize_metadata(chunk, "list_hierarchy_integrity", config)
                     chunks.append(chunk)
@@ -374,7 +380,9 @@ class ListAwareStrategy(BaseStrategy):
 
         # Handle last group
         if current_items:
-            group_text, actual_end_line = self._reconstruct_item_group(current_items, lines, block)
+            group_text, actual_end_line = self._reconstruct_item_group(
+                current_items, lines, block, None
+            )
 
             if current_start_line is None:
                 current_start_line = current_items[0].line_number
@@ -386,6 +394,7 @@ class ListAwareStrategy(BaseStrategy):
                     actual_end_line,
                     block,
                     has_context_binding=False,
+                    block_stats=block_stats,
                 )
                 chunks.append(chunk)
             else:
@@ -395,6 +404,7 @@ class ListAwareStrategy(BaseStrategy):
                     actual_end_line,
                     block,
                     has_context_binding=False,
+                    block_stats=block_stats,
                 )
                 self._set_oversize_metadata(chunk, "list_hierarchy_integrity", config)
                 chunks.append(chunk)
@@ -402,7 +412,11 @@ class ListAwareStrategy(BaseStrategy):
         return chunks
 
     def _reconstruct_item_group(
-        self, items: list[ListItem], lines: list[str], block: ListBlock
+        self,
+        items: list[ListItem],
+        lines: list[str],
+        block: ListBlock,
+        next_item: ListItem | None,
     ) -> tuple[str, int]:
         """
         Reconstruct markdown for a group of list items.
@@ -411,6 +425,8 @@ class ListAwareStrategy(BaseStrategy):
             items: Items to reconstruct
             lines: All document lines
             block: Parent list block (used to determine end boundary)
+            next_item: Item following the group in the block, or None if
+                the group ends the block
 
         Returns:
             Tuple of (markdown_text, actual_end_line)
@@ -423,22 +439,7 @@ class ListAwareStrategy(BaseStrategy):
         # Find the actual end line including continuation lines
         # If this is the last item in the block, use block's end_line
         # Otherwise, use the line before the next item starts
-        last_item_line = items[-1].line_number
-
-        # Find where this group actually ends
-        if last_item_line == block.items[-1].line_number:
-            # This is the last item in the block, use block's end line
-            end_line = block.end_line
-        else:
-            # Find the next item after our last item
-            last_item_idx = block.items.index(items[-1])
-            if last_item_idx + 1 < len(block.items):
-                next_item = block.items[last_item_idx + 1]
-                # End just before the next item starts
-                end_line = next_item.line_number - 1
-            else:
-                # Shouldn't happen, but fallback to block end
-                end_line = block.end_line
+        end_line = block.end_line if next_item is None else next_item.line_number - 1
 
         group_lines = lines[start_line - 1 : end_line]
         return "\n".join(group_lines), end_line
@@ -450,6 +451,7 @@ class ListAwareStrategy(BaseStrategy):
         end_line: int,
         list_block: ListBlock,
         has_context_binding: bool,
+        block_stats: tuple[list[str], dict[str, int] | None] | None = None,
     ) -> Chunk:
         """
         Create chunk with list-specific metadata.
@@ -460,10 +462,40 @@ class ListAwareStrategy(BaseStrategy):
             end_line: Ending line
             list_block: Source list block
             has_context_binding: Whether introduction is included
+            block_stats: Result of _list_block_stats(list_block), for
+                callers creating several chunks from one block
 
         Returns:
             Chunk with metadata
         """
+        list_types, checkbox_stats = block_stats or self._list_block_stats(list_block)
+
+        return self._create_chunk(
+            content,
+            start_line,
+            end_line,
+            content_type="list",
+            has_nested_lists=list_block.has_nested,
+            max_list_depth=list_block.max_depth,
+            list_item_count=list_block.item_count,
+            has_context_binding=has_context_binding,
+            context_type="introduction" if has_context_binding else None,
+            list_types=list(list_types),
+            checkbox_stats=dict(checkbox_stats) if checkbox_stats else None,
+            hierarchy_preserved=True,
+            header_path="",  # Will be filled by _add_header_path_to_chunk
+        )
+
+    def _list_block_stats(self, list_block: ListBlock) -> tuple[list[str], dict[str, int] | None]:
+        """
+        Collect the list types and checkbox stats of a list block.
+
+        Args:
+            list_block: List block
+
+        Returns:
+            Tuple of (list types, checkbox stats or None)
+        """
         # Collect list types
         list_types = {item.list_type.value for item in list_block.items}
 
@@ -483,21 +515,7 @@ class ListAwareStrategy(BaseStrategy):
                     "unchecked": unchecked,
                 }
 
-        return self._create_chunk(
-            content,
-            start_line,
-            end_line,
-            content_type="list",
-            has_nested_lists=list_block.has_nested,
-            max_list_depth=list_block.max_depth,
-            list_item_count=list_block.item_count,
-            has_context_binding=has_context_binding,
-            context_type="introduction" if has_context_binding else None,
-            list_types=list(list_types),
-            checkbox_stats=checkbox_stats,
-            hierarchy_preserved=True,
-            header_path="",  # Will be filled by _add_header_path_to_chunk
-        )
+        return list(list_types), checkbox_stats
 
     def _add_header_path_to_chunk(
         self, chunk: Chunk, headers: list[Header], start_line: int
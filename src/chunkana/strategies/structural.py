@@ -6,6 +6,7 @@ Simplified from 1720 lines to ~150 lines.
 """
 
 import re
+from collections.abc import Iterator
 
 from ..config import ChunkConfig
 from ..types import Chunk, ContentAnalysis, Header
@@ -38,8 +39,11 @@ class StructuralStrategy(BaseStrategy):
                 Default: 2 (H1, H2 structural; H3, H4, H5, H6 local)
         """
         self.max_structural_level = max_structural_level
-        # O4: Header stack cache for performance optimization
+        # O4: Header stack cache for performance optimization. Stacks are
+        # keyed by line number, so they are only valid for the header list
+        # they were built from (see _get_contextual_header_stack)
         self._header_stack_cache: dict[int, list[Header]] = {}
+        self._header_stack_headers: list[Header] | None = None
 
     @property
     def name(self) -> str:
@@ -61,8 +65,16 @@ class StructuralStrategy(BaseStrategy):
 
         Splits document by headers into sections.
         """
+        return list(self.iter_apply(md_text, analysis, config))
+
+    def iter_apply(
+        self, md_text: str, analysis: ContentAnalysis, config: ChunkConfig
+    ) -> Iterator[Chunk]:
+        """
+        Apply structural strategy, yielding chunks section by section.
+        """
         if not md_text.strip():
-            return []
+            return
 
         # O1: Use cached lines from analysis (fallback for backward compatibility)
         lines = analysis.get_lines()
@@ -73,36 +85,87 @@ class StructuralStrategy(BaseStrategy):
 
         if not headers:
             # No headers - use fallback behavior
-            return self._split_text_to_size(md_text, 1, config)
+            yield from self._split_text_to_size(md_text, 1, config)
+            return
 
-        chunks = []
+        yield from self._iter_sections(lines, analysis, config, 1, len(lines))
+
+    def apply_sections(
+        self,
+        md_text: str,
+        analysis: ContentAnalysis,
+        config: ChunkConfig,
+        start_line: int,
+        end_line: int,
+    ) -> list[Chunk]:
+        """
+        Apply structural strategy to a run of whole sections.
+
+        Produces exactly the chunks apply() would produce for the sections
+        starting within [start_line, end_line]. Used by incremental
+        re-chunking to re-run only the sections touched by an edit.
+
+        Args:
+            md_text: Full normalized document text
+            analysis: Analysis of the full document
+            config: Chunking configuration
+            start_line: First line of the run (1 or a structural header line)
+            end_line: Last line of the run (line before a structural header,
+                or the last line of the document)
+
+        Returns:
+            Chunks for the sections in the run
+        """
+        lines = analysis.get_lines()
+        if lines is None:
+            lines = md_text.split("\n")
+
+        return list(self._iter_sections(lines, analysis, config, start_line, end_line))
+
+    def _iter_sections(
+        self,
+        lines: list[str],
+        analysis: ContentAnalysis,
+        config: ChunkConfig,
+        range_start: int,
+        range_end: int,
+    ) -> Iterator[Chunk]:
+        """Chunk the preamble and the sections starting within a line range."""
+        headers = analysis.headers
 
         # Handle preamble (content before first header)
         # Preamble gets special header_path "/__preamble__" to distinguish
         # from structural content
         first_header_line = headers[0].line if headers else len(lines) + 1
-        if first_header_line > 1:
+        if first_header_line > 1 and range_start == 1:
             preamble_lines = lines[: first_header_line - 1]
             preamble_content = "\n".join(preamble_lines)
             if preamble_content.strip():
-                chunks.append(
-                    self._create_chunk(
-                        preamble_content,
-                        1,
-                        first_header_line - 1,
-                        content_type="preamble",
-                        header_path="/__preamble__",
-                        section_tags=[],  # NEW: always present, empty for preamble
-                        header_level=0,  # NEW: 0 for preamble (no structural context)
-                    )
+                yield self._create_chunk(
+                    preamble_content,
+                    1,
+                    first_header_line - 1,
+                    content_type="preamble",
+                    header_path="/__preamble__",
+                    section_tags=[],  # NEW: always present, empty for preamble
+                    header_level=0,  # NEW: 0 for preamble (no structural context)
                 )
 
         # Filter to structural headers only (level <= max_structural_level)
         # H3+ headers don't create new sections - they stay inside parent section
         structural_headers = [h for h in headers if h.level <= self.max_structural_level]
+        # Content from a leading H3+ header up to the first structural header
+        # is neither preamble nor part of a section, so it forms its own
+        if headers and headers[0].level > self.max_structural_level:
+            structural_headers.insert(0, headers[0])
 
         # Process sections between STRUCTURAL headers only
         for i, header in enumerate(structural_headers):
+            if header.line < range_start:
+                continue
+            if header.line > range_end:
+                break
+
             # Determine section boundaries
             start_line = header.line
 
@@ -132,26 +195,22 @@ class StructuralStrategy(BaseStrategy):
                     "section_tags": section_tags,  # NEW: always present
                 }
 
-                chunks.append(
-                    self._create_chunk(
-                        section_content,
-                        start_line,
-                        end_line,
-                        **chunk_meta,
-                    )
+                yield self._create_chunk(
+                    section_content,
+                    start_line,
+                    end_line,
+                    **chunk_meta,
                 )
             else:
                 # Split large section into sub-chunks
-                section_chunks = self._split_large_section(
-                    section_content, start_line, end_line, headers, analysis, config
+                yield from self._split_large_section(
+                    section_content, section_lines, start_line, end_line, headers, analysis, config
                 )
-                chunks.extend(section_chunks)
-
-        return chunks
 
     def _split_large_section(
         self,
         section_content: str,
+        section_lines: list[str],
         start_line: int,
         end_line: int,
         headers: list[Header],
@@ -162,6 +221,7 @@ class StructuralStrategy(BaseStrategy):
 
         Args:
             section_content: Content of the section
+            section_lines: Lines of the section
             start_line: Starting line of section
             end_line: Ending line of section
             headers: All document headers
@@ -177,7 +237,7 @@ class StructuralStrategy(BaseStrategy):
         if atomic_blocks:
             # Split preserving atomic blocks
             section_chunks = self._split_section_preserving_atomic(
-                section_content, start_line, atomic_blocks, config
+                section_lines, start_line, atomic_blocks, config
             )
         else:
             # No atomic blocks - simple split
@@ -260,9 +320,16 @@ class StructuralStrategy(BaseStrategy):
         Returns:
             List of headers forming the contextual stack (ancestors)
         """
-        # O4: Check cache first
+        # O4: Reset the cache for another document. Identity rather than a
+        # per-call reset, because iter_apply() generators of different
+        # documents may be interleaved on one strategy instance
+        if all_headers is not self._header_stack_headers:
+            self._header_stack_cache.clear()
+            self._header_stack_headers = all_headers
+
+        # O4: Check cache first (callers extend the stack, so hand out copies)
         if chunk_start_line in self._header_stack_cache:
-            return self._header_stack_cache[chunk_start_line]
+            return list(self._header_stack_cache[chunk_start_line])
 
         stack: list[Header] = []
 
@@ -279,7 +346,7 @@ class StructuralStrategy(BaseStrategy):
 
         # O4: Cache the result before returning
         self._header_stack_cache[chunk_start_line] = stack
-        return stack
+        return list(stack)
 
     def _get_contextual_level(self, header_stack: list[Header]) -> int:
         """
@@ -527,7 +594,7 @@ class StructuralStrategy(BaseStrategy):
 
     def _split_section_preserving_atomic(
         self,
-        section_content: str,
+        lines: list[str],
         section_start_line: int,
         atomic_blocks: list[tuple[int, int, str]],
         config: ChunkConfig,
@@ -535,7 +602,7 @@ class StructuralStrategy(BaseStrategy):
         """Split section while preserving atomic blocks (code, tables, LaTeX).
 
         Args:
-            section_content: Content of the section
+            lines: Lines of the section
             section_start_line: Starting line of section
             atomic_blocks: List of (start, end, type) for atomic blocks
             config: Chunking configuration
@@ -543,7 +610,6 @@ class StructuralStrategy(BaseStrategy):
         Returns:
             List of chunks with atomic blocks preserved
         """
-        lines = section_content.split("\n")
         chunks = []
         current_line = section_start_line
 
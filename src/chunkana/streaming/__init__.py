@@ -5,9 +5,11 @@ Provides memory-efficient chunking for files >10MB through buffered processing.
 """
 
 from .config import StreamingConfig
+from .memory import StreamingStats
 from .streaming_chunker import StreamingChunker
 
 __all__ = [
     "StreamingConfig",
     "StreamingChunker",
+    "StreamingStats",
 ]
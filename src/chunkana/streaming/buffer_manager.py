@@ -4,10 +4,45 @@ Buffer management for streaming processing.
 Handles file reading and buffer window management.
 """
 
+import codecs
 import io
-from collections.abc import Iterator
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any
 
 from .config import StreamingConfig
+from .fence_tracker import FenceTracker
+from .memory import MemoryBudget
+from .split_detector import SplitDetector
+
+# Bytes or characters requested per read() from an async source
+_READ_SIZE = 64 * 1024
+
+
+@dataclass
+class Window:
+    """
+    A run of complete lines cut at safe boundaries.
+
+    Attributes:
+        text: Text of the window, with its line endings
+        start_line: Document line number of the first line (1-indexed)
+        line_count: Number of lines in the window
+        chars_processed: Characters (bytes for memory-mapped files) read
+            up to the end of the window
+        reopen: Text that re-enters the block the previous window was
+            force-cut in (empty for windows starting at a safe boundary)
+        start_offset: Character offset of the window in the document
+        start_byte: UTF-8 byte offset of the window in the document
+    """
+
+    text: str
+    start_line: int
+    line_count: int
+    chars_processed: int
+    reopen: str = ""
+    start_offset: int = 0
+    start_byte: int = 0
 
 
 class BufferManager:
@@ -53,9 +88,271 @@ class BufferManager:
         if buffer:
             yield (buffer, overlap_buffer, bytes_processed)
 
+    def read_safe_windows(
+        self,
+        stream: Iterable[str],
+        detector: SplitDetector,
+        budget: MemoryBudget | None = None,
+    ) -> Iterator[Window]:
+        """
+        Read windows that start and end at safe boundaries.
+
+        See WindowBuilder for how windows are cut.
+
+        Args:
+            stream: Text stream (or other iterable of lines) to read
+            detector: Chooses split points among safe boundaries
+            budget: Memory budget to enforce (created from the config if None)
+
+        Yields:
+            Windows in document order
+        """
+        builder = WindowBuilder(detector, budget or MemoryBudget(self.config))
+        for line in stream:
+            window = builder.push(line)
+            if window is not None:
+                yield window
+
+        window = builder.flush()
+        if window is not None:
+            yield window
+
+    async def aread_safe_windows(
+        self,
+        reader: AsyncIterable[Any] | Any,
+        detector: SplitDetector,
+        budget: MemoryBudget | None = None,
+        encoding: str = "utf-8",
+    ) -> AsyncIterator[Window]:
+        """
+        Read windows like read_safe_windows() from an async source.
+
+        Args:
+            reader: Async iterable of bytes or str pieces (e.g. an
+                asyncio.StreamReader or an aiofiles file), or an object
+                with an async read(size) method
+            detector: Chooses split points among safe boundaries
+            budget: Memory budget to enforce (created from the config if None)
+            encoding: Encoding of byte sources
+
+        Yields:
+            Windows in document order
+        """
+        builder = WindowBuilder(detector, budget or MemoryBudget(self.config))
+        async for line in aiter_lines(reader, encoding):
+            window = builder.push(line)
+            if window is not None:
+                yield window
+
+        window = builder.flush()
+        if window is not None:
+            yield window
+
     def _extract_overlap(self, buffer: list[str]) -> list[str]:
         """Extract overlap lines from buffer end."""
         n = self.config.overlap_lines
         if len(buffer) <= n:
             return buffer[:]
         return buffer[-n:]
+
+
+class WindowBuilder:
+    """
+    Cut a sequence of lines into windows at safe boundaries.
+
+    Lines are pushed one at a time, so the source may be synchronous or
+    asynchronous. Every line belongs to exactly one window. Once the
+    buffer reaches the window size, or its estimated working set exceeds
+    the memory ceiling, it is cut at the split point chosen by the
+    detector. While no boundary in the buffer is safe (e.g. inside a long
+    code block) the buffer keeps growing, up to the memory ceiling: a
+    block that alone exceeds it is cut where it would cross the ceiling,
+    and the next window re-enters the block (see Window.reopen).
+    """
+
+    def __init__(self, detector: SplitDetector, budget: MemoryBudget):
+        """
+        Initialize window builder.
+
+        Args:
+            detector: Chooses split points among safe boundaries
+            budget: Memory budget to enforce
+        """
+        self.detector = detector
+        self.budget = budget
+        self._buffer: list[str] = []
+        self._safe: list[bool] = []
+        self._costs: list[int] = []  # MemoryBudget.line_cost() of each buffered line
+        self._buffer_size = 0
+        self._buffer_cost = 0
+        self._chars_processed = 0
+        self._start_line = 1
+        self._start_byte = 0
+        self._reopen = ""
+        self._tracker = FenceTracker()
+        self._start_tracker = FenceTracker()  # Block state at the start of the buffer
+        # Set when a split attempt failed; retry once a new safe boundary appears
+        self._blocked = False
+
+    def push(self, line: str) -> Window | None:
+        """
+        Add the next line.
+
+        Args:
+            line: Line with its line ending
+
+        Returns:
+            The window completed by this line, if any
+        """
+        buffer = self._buffer
+        budget = self.budget
+        is_safe = self.detector.is_safe_boundary(
+            buffer[-1] if buffer else None, line, self._tracker
+        )
+        self._tracker.track_line(line)
+        buffer.append(line)
+        self._safe.append(is_safe)
+        cost = budget.line_cost(line)
+        self._costs.append(cost)
+        self._buffer_size += len(line)
+        self._buffer_cost += cost
+        self._chars_processed += len(line)
+
+        over_budget = budget.exceeded(self._buffer_cost)
+        if self._buffer_size < budget.window_size and not over_budget:
+            return None
+
+        split = None
+        if not self._blocked or is_safe:
+            split = self.detector.find_safe_split(buffer, self._safe)
+            self._blocked = split is None
+
+        forced = split is None
+        if forced and not over_budget:
+            return None
+        split = self._fitting_split() if split is None else split
+
+        return self._cut(split, forced)
+
+    def flush(self) -> Window | None:
+        """
+        Return the remaining lines as the last window.
+
+        Returns:
+            The last window, or None if no lines are buffered
+        """
+        if not self._buffer:
+            return None
+        return self._cut(len(self._buffer), forced=False)
+
+    def _cut(self, split: int, forced: bool) -> Window:
+        """Emit the first split lines of the buffer as a window."""
+        lines = self._buffer[:split]
+        text = "".join(lines)
+        window_cost = sum(self._costs[:split])
+        self.budget.record_window(window_cost, len(text), forced)
+        chars_processed = self._chars_processed - (self._buffer_size - len(text))
+        window = Window(
+            text,
+            self._start_line,
+            split,
+            chars_processed,
+            self._reopen,
+            chars_processed - len(text),
+            self._start_byte,
+        )
+
+        if forced:
+            # The block alone exceeds the ceiling: the next window re-enters it
+            for line in lines:
+                self._start_tracker.track_line(line)
+            self._reopen = self._start_tracker.reopening_text()
+        else:
+            self._start_tracker.reset()  # Safe boundaries are outside every block
+            self._reopen = ""
+        self._start_line += split
+        self._start_byte += len(text) if text.isascii() else len(text.encode("utf-8"))
+        self._buffer = self._buffer[split:]
+        self._safe = self._safe[split:]
+        self._costs = self._costs[split:]
+        self._buffer_size -= len(text)
+        self._buffer_cost -= window_cost
+        return window
+
+    def _fitting_split(self) -> int:
+        """Largest split point whose window fits the budget (at least one line)."""
+        split = len(self._costs)
+        buffer_cost = self._buffer_cost
+        while split > 1 and self.budget.exceeded(buffer_cost):
+            split -= 1
+            buffer_cost -= self._costs[split]
+        return split
+
+
+async def aiter_lines(
+    reader: AsyncIterable[Any] | Any, encoding: str = "utf-8"
+) -> AsyncIterator[str]:
+    """
+    Yield the lines of an async byte or text source.
+
+    Pieces may be split anywhere, also inside a multi-byte character or
+    a line. Line endings are translated to "\\n", as in a file opened in
+    text mode.
+
+    Args:
+        reader: Async iterable of bytes or str pieces, or an object with an
+            async read(size) method
+        encoding: Encoding of byte sources
+
+    Yields:
+        Lines with their line endings
+
+    Raises:
+        TypeError: If reader is neither async iterable nor readable
+    """
+    decoder: io.IncrementalNewlineDecoder | None = None
+    parts: list[str] = []  # Pieces of an incomplete line
+
+    async for piece in _aiter_pieces(reader):
+        if decoder is None:
+            byte_source = not isinstance(piece, str)
+            inner = codecs.getincrementaldecoder(encoding)() if byte_source else None
+            decoder = io.IncrementalNewlineDecoder(inner, translate=True)
+            end_of_input = b"" if byte_source else ""
+        text = decoder.decode(piece)
+
+        start = 0
+        end = text.find("\n")
+        while end != -1:
+            line = text[start : end + 1]
+            if parts:
+                parts.append(line)
+                line = "".join(parts)
+                parts = []
+            yield line
+            start = end + 1
+            end = text.find("\n", start)
+        if start < len(text):
+            parts.append(text[start:])
+
+    if decoder is not None:
+        tail = decoder.decode(end_of_input, final=True)
+        if tail:
+            parts.append(tail)
+    if parts:
+        yield "".join(parts)
+
+
+async def _aiter_pieces(reader: AsyncIterable[Any] | Any) -> AsyncIterator[Any]:
+    """Yield the pieces of an async iterable or an async read() source."""
+    if hasattr(reader, "__aiter__"):
+        async for piece in reader:
+            yield piece
+    elif hasattr(reader, "read"):
+        while piece := await reader.read(_READ_SIZE):
+            yield piece
+    else:
+        raise TypeError(
+            f"reader must be an async iterable or have an async read() method, "
+            f"got {type(reader).__name__}"
+        )
@@ -12,12 +12,34 @@ class StreamingConfig:
 
     Attributes:
         buffer_size: Maximum bytes per buffer window (default: 100KB)
-        overlap_lines: Lines to keep as context between buffers (default: 20)
-        max_memory_mb: Memory usage ceiling in megabytes (default: 100)
+        overlap_lines: Lines to keep as context between buffers in
+            BufferManager.read_windows (default: 20). StreamingChunker does
+            not repeat lines across windows
+        max_memory_mb: Ceiling for the estimated working set in megabytes;
+            windows shrink below buffer_size to stay under it (default: 100)
         safe_split_threshold: Where to start looking for split point (default: 0.8)
+        sampled_strategy: Select one strategy for the whole file from
+            evenly spaced samples before chunking (see chunkana.sampling)
+            and chunk every window with it, instead of selecting a
+            strategy per window. Applies to chunk_file() and
+            chunk_file_mmap() (default: False)
+        sample_count: Number of samples for sampled_strategy (default: 16)
+        sample_size: Bytes per sample for sampled_strategy (default: 64KB)
     """
 
     buffer_size: int = 100_000
     overlap_lines: int = 20
     max_memory_mb: int = 100
     safe_split_threshold: float = 0.8
+    sampled_strategy: bool = False
+    sample_count: int = 16
+    sample_size: int = 65_536
+
+    def __post_init__(self) -> None:
+        """Validate configuration."""
+        if self.max_memory_mb <= 0:
+            raise ValueError(f"max_memory_mb must be positive, got {self.max_memory_mb}")
+        if self.sample_count < 1:
+            raise ValueError(f"sample_count must be positive, got {self.sample_count}")
+        if self.sample_size < 1:
+            raise ValueError(f"sample_size must be positive, got {self.sample_size}")
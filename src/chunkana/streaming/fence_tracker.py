@@ -1,23 +1,33 @@
 """
 Fence tracking for streaming processing.
 
-Tracks code fence state across buffer windows to prevent mid-block splits.
+Tracks code fence and LaTeX block state across buffer windows to prevent
+mid-block splits. Follows the same rules as the parser, so a line the
+tracker reports as outside every block is also outside every block of
+the parsed window.
 """
 
 import re
 
+from ..parser import Parser, fence_closing_pattern, latex_env_end_pattern
+
 
 class FenceTracker:
     """
-    Track code fence state across buffer boundaries.
+    Track code fence and LaTeX state across buffer boundaries.
 
-    Maintains fence stack to detect when inside code blocks.
+    Fences do not nest: inside an open fence, only a matching closing
+    fence is significant. Display math ($$) and LaTeX environments are
+    tracked outside code fences, as the parser does.
     """
 
     def __init__(self) -> None:
         """Initialize fence tracker."""
         self._fence_stack: list[tuple[str, int]] = []
-        self._fence_pattern = re.compile(r"^(\s*)(`{3,}|~{3,})(\w*)\s*$")
+        # ("display", None) or ("environment", env_name) while inside LaTeX
+        self._latex: tuple[str, str | None] | None = None
+        # \end{...} matcher of the open environment
+        self._latex_end: re.Pattern[str] | None = None
 
     def track_line(self, line: str) -> None:
         """
@@ -26,33 +36,97 @@ class FenceTracker:
         Args:
             line: Line to analyze
         """
-        if self._fence_stack:
-            char, length = self._fence_stack[-1]
-            if self._is_closing(line, char, length):
-                self._fence_stack.pop()
-                return
-
-        fence_info = self._is_opening(line)
-        if fence_info:
-            self._fence_stack.append(fence_info)
+        in_code = self._track_fence(line)
+        self._track_latex(line, in_code)
 
     def is_inside_fence(self) -> bool:
         """Check if currently inside fence."""
         return len(self._fence_stack) > 0
 
+    def is_inside_block(self) -> bool:
+        """Check if currently inside a code fence or a LaTeX block."""
+        return bool(self._fence_stack) or self._latex is not None
+
     def get_fence_info(self) -> tuple[str, int] | None:
         """Get current fence details if inside fence."""
         if self._fence_stack:
             return self._fence_stack[-1]
         return None
 
+    def reopening_text(self) -> str:
+        """
+        Text that re-enters the current blocks at the start of a new window.
+
+        Returns:
+            Opening "$$" or \\begin line and/or fence line (empty if outside
+            every block)
+        """
+        text = ""
+        if self._latex is not None:
+            kind, env_name = self._latex
+            text += "$$\n" if kind == "display" else f"\\begin{{{env_name}}}\n"
+        if self._fence_stack:
+            char, length = self._fence_stack[-1]
+            text += char * length + "\n"
+        return text
+
+    def copy(self) -> "FenceTracker":
+        """Create an independent tracker with the same state."""
+        tracker = FenceTracker()
+        tracker._fence_stack = list(self._fence_stack)
+        tracker._latex = self._latex
+        tracker._latex_end = self._latex_end
+        return tracker
+
     def reset(self) -> None:
         """Clear fence state."""
         self._fence_stack.clear()
+        self._latex = None
+        self._latex_end = None
+
+    def _track_fence(self, line: str) -> bool:
+        """Advance fence state; return True if the line belongs to a code block."""
+        if self._fence_stack:
+            char, length = self._fence_stack[-1]
+            if self._is_closing(line, char, length):
+                self._fence_stack.pop()
+            return True
+
+        fence_info = self._is_opening(line)
+        if fence_info:
+            self._fence_stack.append(fence_info)
+            return True
+        return False
+
+    def _track_latex(self, line: str, in_code: bool) -> None:
+        """Advance LaTeX state. Open blocks consume lines regardless of fences."""
+        if self._latex is not None:
+            if self._latex_end is None:
+                closed = "$$" in line
+            else:
+                closed = self._latex_end.match(line.strip()) is not None
+            if closed:
+                self._latex = None
+                self._latex_end = None
+            return
+
+        if in_code:
+            return
+
+        if "$$" in line:
+            if line.count("$$") < 2:
+                self._latex = ("display", None)
+            return
+
+        if "\\begin{" in line:
+            match = Parser.LATEX_ENV_START_PATTERN.match(line.strip())
+            if match:
+                self._latex = ("environment", match.group(1))
+                self._latex_end = latex_env_end_pattern(match.group(1))
 
     def _is_opening(self, line: str) -> tuple[str, int] | None:
         """Detect fence opening."""
-        match = self._fence_pattern.match(line)
+        match = Parser.FENCE_PATTERN.match(line)
         if match:
             fence_chars = match.group(2)
             return (fence_chars[0], len(fence_chars))
@@ -60,5 +134,4 @@ class FenceTracker:
 
     def _is_closing(self, line: str, char: str, length: int) -> bool:
         """Detect fence closing."""
-        pattern = rf"^(\s*)({re.escape(char)}{{{length},}})\s*$"
-        return bool(re.match(pattern, line))
+        return char in line and fence_closing_pattern(char, length).match(line) is not None
@@ -0,0 +1,159 @@
+"""
+Memory accounting for streaming processing.
+
+Estimates the working set of the streaming chunker (buffered lines, the
+chunks waiting to be yielded and the base chunker's intermediate
+structures for one window) and derives window sizes that keep it under
+StreamingConfig.max_memory_mb.
+"""
+
+import sys
+from dataclasses import dataclass
+
+from ..types import Chunk
+from .config import StreamingConfig
+
+# Peak allocation of chunking a window, per character and per line.
+# Measured with tracemalloc over prose, header, list, table, code and LaTeX
+# heavy inputs and rounded up; list-heavy text is the worst case.
+CHUNKING_BYTES_PER_CHAR = 8
+CHUNKING_BYTES_PER_LINE = 500
+
+# Smallest window target, in characters
+MIN_WINDOW_SIZE = 1_000
+
+# Reference slot of a list item
+_POINTER_SIZE = 8
+
+
+@dataclass
+class StreamingStats:
+    """
+    Memory statistics of one streaming run.
+
+    All byte values are estimates (see MemoryBudget).
+
+    Attributes:
+        memory_limit_bytes: Ceiling derived from max_memory_mb
+        peak_memory_bytes: Largest working set observed
+        windows: Number of windows read
+        window_size: Current window target in characters
+        min_window_size: Smallest window target used
+        forced_splits: Windows cut inside a code fence or LaTeX block
+            because the block alone would exceed the ceiling
+    """
+
+    memory_limit_bytes: int = 0
+    peak_memory_bytes: int = 0
+    windows: int = 0
+    window_size: int = 0
+    min_window_size: int = 0
+    forced_splits: int = 0
+
+
+class MemoryBudget:
+    """
+    Track the estimated working set and adapt the window size.
+
+    The working set of a buffer is the size of its line objects plus the
+    peak the base chunker needs to chunk it as one window, plus the bytes
+    held outside the buffer (chunks not yet yielded, header context).
+    After every window the window target is set to the number of
+    characters that fit the remaining budget at the observed bytes per
+    character, capped by StreamingConfig.buffer_size.
+    """
+
+    def __init__(self, config: StreamingConfig):
+        """
+        Initialize memory budget.
+
+        Args:
+            config: Streaming configuration
+        """
+        self.config = config
+        self.limit = config.max_memory_mb * 1024 * 1024
+        self.held_bytes = 0
+        self.stats = StreamingStats(
+            memory_limit_bytes=self.limit,
+            window_size=config.buffer_size,
+            min_window_size=config.buffer_size,
+        )
+
+    @property
+    def window_size(self) -> int:
+        """Current window target in characters."""
+        return self.stats.window_size
+
+    def line_cost(self, line: str) -> int:
+        """
+        Estimate what one buffered line adds to the working set.
+
+        The line object with its list slot, plus its share of the base
+        chunker's peak when the buffer is chunked as one window.
+
+        Args:
+            line: Buffered line
+
+        Returns:
+            Estimated bytes
+        """
+        return (
+            sys.getsizeof(line)
+            + _POINTER_SIZE
+            + CHUNKING_BYTES_PER_CHAR * len(line)
+            + CHUNKING_BYTES_PER_LINE
+        )
+
+    def span_cost(self, nbytes: int, lines: int) -> int:
+        """
+        Estimate the working set of a window read from a byte buffer.
+
+        Equals line_cost() summed over ASCII lines of the same total size;
+        for other text it is an upper bound, as characters take at least
+        one byte.
+
+        Args:
+            nbytes: Size of the window in bytes
+            lines: Number of lines in the window
+
+        Returns:
+            Estimated bytes
+        """
+        per_line = sys.getsizeof("") + _POINTER_SIZE + CHUNKING_BYTES_PER_LINE
+        return (1 + CHUNKING_BYTES_PER_CHAR) * nbytes + per_line * lines
+
+    def exceeded(self, buffer_cost: int) -> bool:
+        """Check whether a buffer of this cost plus held bytes is over the ceiling."""
+        return buffer_cost + self.held_bytes > self.limit
+
+    def record_window(self, buffer_cost: int, chars: int, forced: bool = False) -> None:
+        """
+        Record a window and adapt the window target to its density.
+
+        Args:
+            buffer_cost: Sum of line_cost() over the window
+            chars: Characters in the window
+            forced: Whether the window was cut inside a block
+        """
+        stats = self.stats
+        stats.windows += 1
+        stats.forced_splits += forced
+        stats.peak_memory_bytes = max(stats.peak_memory_bytes, buffer_cost + self.held_bytes)
+
+        bytes_per_char = max(buffer_cost, 1) / max(chars, 1)
+        affordable = int((self.limit - self.held_bytes) / bytes_per_char)
+        stats.window_size = min(max(affordable, MIN_WINDOW_SIZE), self.config.buffer_size)
+        stats.min_window_size = min(stats.min_window_size, stats.window_size)
+
+    def hold(self, nbytes: int) -> None:
+        """Set the bytes held outside the buffer and update the peak."""
+        self.held_bytes = nbytes
+        self.stats.peak_memory_bytes = max(self.stats.peak_memory_bytes, nbytes)
+
+
+def chunk_bytes(chunk: Chunk) -> int:
+    """Approximate size of a chunk with its content and metadata."""
+    size = sys.getsizeof(chunk) + sys.getsizeof(chunk.content) + sys.getsizeof(chunk.metadata)
+    for key, value in chunk.metadata.items():
+        size += sys.getsizeof(key) + sys.getsizeof(value)
+    return size
@@ -0,0 +1,344 @@
+"""
+Window reading over memory-mapped files.
+
+Line boundaries, code fences, LaTeX blocks and split points are found
+directly in the byte buffer, so only the text of each window is decoded.
+A file of any size is read without holding it as one string and without
+creating an object per line.
+
+Windows follow the rules of WindowBuilder: they are cut at safe
+boundaries chosen with the SplitDetector priorities, grow while no
+boundary is safe, and are cut inside a block only when the block alone
+exceeds the memory ceiling. Window sizes and the split threshold are
+measured in bytes rather than in characters and lines, and each window end
+is chosen from the window start rather than from the lines a stream reader
+has already buffered, so windows (and therefore chunks) can differ from the
+ones read from a text stream, also for ASCII text.
+"""
+
+import bisect
+import codecs
+import mmap
+import re
+import sys
+from collections.abc import Iterator
+
+from ..parser import Parser
+from .buffer_manager import Window
+from .fence_tracker import FenceTracker
+from .memory import MemoryBudget
+from .split_detector import SplitDetector
+
+# Substrings of every line that can open or close a fence or LaTeX block.
+# Only these lines are decoded and passed to the FenceTracker.
+_BLOCK_EVENT_PATTERN = re.compile(rb"```|~~~|\$\$|\\begin\{|\\end\{")
+_HEADER_START_PATTERN = re.compile(rb"^#", re.MULTILINE)
+_BLANK_LINE_PATTERN = re.compile(rb"^[ \t\r\f\v]*\n", re.MULTILINE)
+
+# End of a block that is still open at the scan position
+_OPEN = sys.maxsize
+
+
+def check_encoding(encoding: str) -> None:
+    """
+    Check that an encoding can be scanned byte-wise.
+
+    Boundaries are found by searching ASCII bytes ("\\n", "#", "|", ...),
+    which requires an encoding in which these bytes never occur inside a
+    multi-byte character.
+
+    Args:
+        encoding: Encoding name
+
+    Raises:
+        LookupError: If the encoding is unknown
+        ValueError: If the encoding is not ASCII-compatible
+    """
+    name = codecs.lookup(encoding).name
+    if name in ("utf-8", "ascii") or name.startswith(("iso8859-", "cp125")):
+        return
+    raise ValueError(
+        f"Memory-mapped chunking needs an ASCII-compatible encoding "
+        f"(UTF-8, ASCII, Latin-1, ...), got {encoding!r}"
+    )
+
+
+class MmapWindowReader:
+    """
+    Cut a byte buffer (usually an mmap) into windows at safe boundaries.
+
+    A block map of byte ranges inside fences and LaTeX blocks is built
+    lazily, ahead of the current window, from the lines containing fence
+    or LaTeX markers. Lines are delimited by "\\n"; CRLF line endings are
+    translated in the decoded windows, lone CR line endings are not
+    supported.
+    """
+
+    def __init__(
+        self,
+        data: bytes | mmap.mmap,
+        detector: SplitDetector,
+        budget: MemoryBudget,
+        encoding: str = "utf-8",
+    ):
+        """
+        Initialize memory-mapped window reader.
+
+        Args:
+            data: Memory-mapped file (or bytes) to read
+            detector: Provides the split threshold
+            budget: Memory budget to enforce
+            encoding: Encoding of the buffer
+
+        Raises:
+            ValueError: If the encoding is not ASCII-compatible
+        """
+        check_encoding(encoding)
+        self.data = data
+        self.size = len(data)
+        self.detector = detector
+        self.budget = budget
+        self.encoding = encoding
+        # Boundaries b with _block_starts[i] < b < _block_ends[i] are inside a block
+        self._block_starts: list[int] = []
+        self._block_ends: list[int] = []
+        self._scan_pos = 0
+        self._scan_tracker = FenceTracker()
+        self._start_tracker = FenceTracker()  # Block state at the start of the window
+
+    def windows(self) -> Iterator[Window]:
+        """
+        Read windows in document order.
+
+        Yields:
+            Windows whose chars_processed is the byte offset of their end
+        """
+        pos = 0
+        line = 1
+        reopen = ""
+        offset = 0  # Offsets into the decoded text
+        byte_offset = 0
+        while pos < self.size:
+            split, forced = self._next_split(pos)
+
+            raw = self.data[pos:split]
+            text = raw.decode(self.encoding)
+            if "\r" in text:
+                text = text.replace("\r\n", "\n")
+            line_count = text.count("\n") + (not text.endswith("\n"))
+            cost = self.budget.span_cost(len(raw), line_count)
+            del raw
+            self.budget.record_window(cost, split - pos, forced)
+            window = Window(text, line, line_count, split, reopen, offset, byte_offset)
+
+            if forced:
+                # The block alone exceeds the ceiling: the next window re-enters it
+                for _, _, event_line in self._event_lines(pos, split):
+                    self._start_tracker.track_line(event_line)
+                reopen = self._start_tracker.reopening_text()
+            else:
+                self._start_tracker.reset()
+                reopen = ""
+            self._drop_blocks(split)
+            pos = split
+            line += line_count
+            offset += len(text)
+            byte_offset += len(text) if text.isascii() else len(text.encode("utf-8"))
+            yield window
+
+    def _next_split(self, pos: int) -> tuple[int, bool]:
+        """Choose the end of the window starting at pos; return (end, forced)."""
+        size = self.size
+        end = self._line_start_after(min(pos + self.budget.window_size, size))
+        while True:
+            limit = self._fit(pos, end)
+            over_budget = limit < end
+            if not over_budget and end == size:
+                return size, False
+
+            # The line crossing the ceiling is part of the buffer, as in WindowBuilder
+            search_end = self._next_line_start(limit) if over_budget else end
+            split = self._find_split(pos, search_end)
+            if split is not None:
+                return split, False
+            if over_budget:
+                return limit, True
+
+            # No safe boundary yet: grow the window up to the next one
+            boundary = self._next_safe(end)
+            end = size if boundary >= size else self._next_line_start(boundary)
+
+    def _find_split(self, pos: int, end: int) -> int | None:
+        """
+        Best safe boundary strictly between pos and end.
+
+        Same priorities as SplitDetector.find_safe_split(): from the
+        threshold onwards the line before a header, then a paragraph
+        boundary, then any boundary not directly after a header; otherwise
+        the last such boundary before the threshold.
+        """
+        data = self.data
+        offset = int((end - pos) * self.detector.threshold)
+        lo = self._line_start_after(max(pos + offset, pos + 1))
+        if lo >= end:
+            lo = self._line_start(end - 1)
+        if lo <= pos:
+            return None  # A single line has no boundary to split at
+
+        for match in _HEADER_START_PATTERN.finditer(data, lo, end):
+            boundary = match.start()
+            if self._is_header(boundary) and self._is_safe(boundary):
+                return boundary
+
+        for match in _BLANK_LINE_PATTERN.finditer(data, self._line_start(lo - 1), end):
+            boundary = match.end()
+            if boundary >= end:
+                break
+            if boundary < lo:
+                continue
+            next_line = data[boundary : self._next_line_start(boundary)]
+            if next_line.strip() and self._is_safe(boundary):
+                return boundary
+
+        boundary = lo
+        while boundary < end:
+            block_end = self._block_end(boundary)
+            if block_end is not None:
+                boundary = block_end
+            elif self._is_table_boundary(boundary) or self._is_header(
+                self._line_start(boundary - 1)
+            ):
+                boundary = self._next_line_start(boundary)
+            else:
+                return boundary
+
+        boundary = self._line_start(lo - 1)
+        while boundary > pos:
+            block_start = self._block_start(boundary)
+            if block_start is not None:
+                boundary = block_start
+            elif self._is_table_boundary(boundary) or self._is_header(
+                self._line_start(boundary - 1)
+            ):
+                boundary = self._line_start(boundary - 1)
+            else:
+                return boundary
+        return None
+
+    def _next_safe(self, boundary: int) -> int:
+        """First safe boundary at or after a line start (size if none)."""
+        while boundary < self.size:
+            block_end = self._block_end(boundary)
+            if block_end is not None:
+                boundary = block_end
+            elif self._is_table_boundary(boundary):
+                boundary = self._next_line_start(boundary)
+            else:
+                return boundary
+        return self.size
+
+    def _fit(self, pos: int, end: int) -> int:
+        """Largest line start up to end whose window fits the budget (at least one line)."""
+        if self._fits(pos, end):
+            return end
+        lo = self._next_line_start(pos)
+        hi = end
+        while True:
+            mid = self._line_start((lo + hi) // 2)
+            if mid <= lo:
+                return lo
+            if self._fits(pos, mid):
+                lo = mid
+            else:
+                hi = mid
+
+    def _fits(self, pos: int, end: int) -> bool:
+        """Check whether the window [pos, end) fits the budget."""
+        nbytes = end - pos
+        if self.budget.exceeded(self.budget.span_cost(nbytes, 0)):
+            return False  # Too large whatever the line count; skip counting
+        lines = self.data[pos:end].count(b"\n")
+        return not self.budget.exceeded(self.budget.span_cost(nbytes, lines + 1))
+
+    # Block map
+
+    def _is_safe(self, boundary: int) -> bool:
+        return self._block_end(boundary) is None and not self._is_table_boundary(boundary)
+
+    def _block_end(self, boundary: int) -> int | None:
+        """End of the block the boundary is inside (None if outside every block)."""
+        self._scan_to(boundary)
+        i = bisect.bisect_left(self._block_starts, boundary) - 1
+        if i < 0 or boundary >= self._block_ends[i]:
+            return None
+        while self._block_ends[i] == _OPEN and self._scan_pos < self.size:
+            self._scan_to(self._line_start_after(min(self._scan_pos + (1 << 20), self.size)))
+        return min(self._block_ends[i], self.size)
+
+    def _block_start(self, boundary: int) -> int | None:
+        """Start of the block the boundary is inside (None if outside every block)."""
+        if self._block_end(boundary) is None:
+            return None
+        return self._block_starts[bisect.bisect_left(self._block_starts, boundary) - 1]
+
+    def _scan_to(self, end: int) -> None:
+        """Extend the block map up to a line start."""
+        if end <= self._scan_pos:
+            return
+        tracker = self._scan_tracker
+        for line_start, line_end, line in self._event_lines(self._scan_pos, end):
+            was_inside = tracker.is_inside_block()
+            tracker.track_line(line)
+            inside = tracker.is_inside_block()
+            if inside and not was_inside:
+                self._block_starts.append(line_start)
+                self._block_ends.append(_OPEN)
+            elif was_inside and not inside:
+                self._block_ends[-1] = line_end
+        self._scan_pos = end
+
+    def _event_lines(self, start: int, end: int) -> Iterator[tuple[int, int, str]]:
+        """Yield (start, end, text) of the lines in [start, end) with block markers."""
+        data = self.data
+        line_end = start
+        for match in _BLOCK_EVENT_PATTERN.finditer(data, start, end):
+            if match.start() < line_end:
+                continue  # Another marker on a line already seen
+            line_start = data.rfind(b"\n", line_end, match.start()) + 1 or line_end
+            line_end = data.find(b"\n", match.end(), end) + 1 or end
+            yield line_start, line_end, data[line_start:line_end].decode(self.encoding)
+
+    def _drop_blocks(self, boundary: int) -> None:
+        """Forget blocks that end at or before a boundary."""
+        n = bisect.bisect_right(self._block_ends, boundary)
+        del self._block_starts[:n]
+        del self._block_ends[:n]
+
+    # Lines
+
+    def _is_header(self, line_start: int) -> bool:
+        data = self.data
+        if data[line_start : line_start + 1] != b"#":
+            return False
+        line = data[line_start : self._next_line_start(line_start)].decode(self.encoding)
+        return Parser.HEADER_PATTERN.match(line) is not None
+
+    def _is_table_boundary(self, boundary: int) -> bool:
+        """Check whether the lines around a boundary both contain "|"."""
+        data = self.data
+        return (
+            data.find(b"|", self._line_start(boundary - 1), boundary) != -1
+            and data.find(b"|", boundary, self._next_line_start(boundary)) != -1
+        )
+
+    def _line_start(self, offset: int) -> int:
+        """Start of the line containing offset."""
+        return self.data.rfind(b"\n", 0, offset) + 1
+
+    def _next_line_start(self, offset: int) -> int:
+        """Start of the line after the one containing offset (size at the end)."""
+        return self.data.find(b"\n", offset) + 1 or self.size
+
+    def _line_start_after(self, offset: int) -> int:
+        """First line start at or after offset (offset > 0)."""
+        return self.data.find(b"\n", offset - 1) + 1 or self.size
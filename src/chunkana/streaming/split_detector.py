@@ -2,8 +2,14 @@
 Safe split point detection for streaming processing.
 
 Detects optimal boundaries for splitting buffer windows.
+
+A boundary is the position before a line. It is safe when cutting there
+cannot break an atomic block apart:
+- it is not inside a code fence or a LaTeX block
+- it does not separate two table rows (both lines contain "|")
 """
 
+from ..parser import Parser
 from .fence_tracker import FenceTracker
 
 
@@ -30,62 +36,101 @@ class SplitDetector:
         Priority:
         1. Line before header
         2. Paragraph boundary (double newline)
-        3. Single newline outside fence
+        3. Any other safe boundary
         4. Fallback: threshold position
 
         Args:
             buffer: Lines in buffer
-            fence_tracker: Fence state tracker
+            fence_tracker: Fence state at the start of the buffer (not modified)
 
         Returns:
             Index to split at (exclusive)
         """
-        start_idx = int(len(buffer) * self.threshold)
-
-        # Try header boundary
-        idx = self._try_split_at_header(buffer, start_idx)
+        safe = self.safe_boundaries(buffer, fence_tracker)
+        idx = self.find_safe_split(buffer, safe)
         if idx is not None:
             return idx
 
-        # Try paragraph boundary
-        idx = self._try_split_at_paragraph(buffer, start_idx)
-        if idx is not None:
-            return idx
+        # Fallback: split at threshold
+        return self._fallback_split(int(len(buffer) * self.threshold))
 
-        # Try newline outside fence
-        idx = self._try_split_at_newline(buffer, start_idx, fence_tracker)
-        if idx is not None:
-            return idx
+    def safe_boundaries(self, buffer: list[str], fence_tracker: FenceTracker) -> list[bool]:
+        """
+        Classify every boundary in buffer.
 
-        # Fallback: split at threshold
-        return self._fallback_split(start_idx)
+        Args:
+            buffer: Lines in buffer
+            fence_tracker: Fence state at the start of the buffer (not modified)
 
-    def _try_split_at_header(self, buffer: list[str], start_idx: int) -> int | None:
-        """Detect line before header."""
-        for i in range(start_idx, len(buffer)):
-            if i + 1 < len(buffer):
-                next_line = buffer[i + 1]
-                if next_line.strip().startswith("#"):
-                    return i + 1
+        Returns:
+            List where item i tells whether cutting before buffer[i] is safe
+        """
+        tracker = fence_tracker.copy()
+        safe = []
+        previous: str | None = None
+        for line in buffer:
+            safe.append(self.is_safe_boundary(previous, line, tracker))
+            tracker.track_line(line)
+            previous = line
+        return safe
+
+    def is_safe_boundary(self, previous: str | None, line: str, tracker: FenceTracker) -> bool:
+        """
+        Check whether cutting between two lines is safe.
+
+        Args:
+            previous: Line before the boundary (None at the start of input)
+            line: Line after the boundary
+            tracker: Fence state after ``previous``
+
+        Returns:
+            True if no fence, LaTeX block or table spans the boundary
+        """
+        if tracker.is_inside_block():
+            return False
+        return previous is None or "|" not in previous or "|" not in line
+
+    def find_safe_split(self, buffer: list[str], safe: list[bool]) -> int | None:
+        """
+        Find the best safe split point in buffer.
+
+        Boundaries from the threshold position onwards are preferred, in
+        priority order; otherwise the last safe boundary before it is used.
+        The start and end of the buffer are never returned.
+
+        Args:
+            buffer: Lines in buffer
+            safe: Output of safe_boundaries() for buffer
+
+        Returns:
+            Index to split at (exclusive), or None if no boundary is safe
+        """
+        start_idx = max(int(len(buffer) * self.threshold), 1)
+
+        for accept in (self._is_header_boundary, self._is_paragraph_boundary, self._is_boundary):
+            for i in range(start_idx, len(buffer)):
+                if safe[i] and accept(buffer, i):
+                    return i
+
+        for i in range(min(start_idx, len(buffer)) - 1, 0, -1):
+            if safe[i] and self._is_boundary(buffer, i):
+                return i
         return None
 
-    def _try_split_at_paragraph(self, buffer: list[str], start_idx: int) -> int | None:
+    def _is_header_boundary(self, buffer: list[str], i: int) -> bool:
+        """Detect line before header."""
+        return self._is_header(buffer[i])
+
+    def _is_paragraph_boundary(self, buffer: list[str], i: int) -> bool:
         """Detect paragraph boundary."""
-        for i in range(start_idx, len(buffer) - 1):
-            if not buffer[i].strip() and buffer[i + 1].strip():
-                return i + 1
-        return None
+        return not buffer[i - 1].strip() and bool(buffer[i].strip())
 
-    def _try_split_at_newline(
-        self, buffer: list[str], start_idx: int, fence_tracker: FenceTracker
-    ) -> int | None:
-        """Detect newline outside fence."""
-        tracker_copy = FenceTracker()
-        for i, line in enumerate(buffer):
-            tracker_copy.track_line(line)
-            if i >= start_idx and not tracker_copy.is_inside_fence() and not line.strip():
-                return i + 1
-        return None
+    def _is_boundary(self, buffer: list[str], i: int) -> bool:
+        """Any boundary that does not separate a header from its content."""
+        return not self._is_header(buffer[i - 1])
+
+    def _is_header(self, line: str) -> bool:
+        return line[:1] == "#" and Parser.HEADER_PATTERN.match(line) is not None
 
     def _fallback_split(self, start_idx: int) -> int:
         """Fallback split at threshold."""
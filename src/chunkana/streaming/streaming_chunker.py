@@ -2,24 +2,56 @@
 Streaming chunker for large markdown files.
 
 Provides memory-efficient chunking through buffered processing.
+
+The input is read in windows that are cut only at safe boundaries
+(never inside a code fence, LaTeX block or table), and each window is
+chunked on its own. Every source line belongs to exactly one window, so
+no content is emitted twice. Chunks carry document-global line numbers
+and chunk indices, header paths include the headers of earlier windows,
+and overlap metadata is filled in across window boundaries.
+
+achunk_stream() does the same for async sources, chunking each window in
+an executor so the event loop stays responsive, and chunk_file_mmap()
+for memory-mapped files, decoding nothing but the windows.
+
+With StreamingConfig.sampled_strategy, chunk_file() and chunk_file_mmap()
+select one strategy for the whole file from samples read up front and
+chunk every window with it.
 """
 
+import asyncio
 import io
-from collections.abc import Iterator
+import mmap
+import os
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable, Iterator
+from concurrent.futures import Executor
+from dataclasses import replace
+from typing import Any
 
 from ..chunker import MarkdownChunker
 from ..config import ChunkConfig
+from ..parser import Parser
+from ..sampling import AnalysisEstimate, estimate_bytes, estimate_file
 from ..types import Chunk
-from .buffer_manager import BufferManager
+from .buffer_manager import BufferManager, Window
 from .config import StreamingConfig
+from .fence_tracker import FenceTracker
+from .memory import MemoryBudget, StreamingStats, chunk_bytes
+from .mmap_reader import MmapWindowReader, check_encoding
 from .split_detector import SplitDetector
 
+# (line within window, level, text) of a header
+_WindowHeader = tuple[int, int, str]
+
 
 class StreamingChunker:
     """
     Stream-based markdown chunker for large files.
 
-    Processes files in buffer windows to limit memory usage.
+    Processes files in buffer windows to limit memory usage: at most one
+    window of text plus the chunks of one window are held at a time, and
+    windows shrink when their estimated working set would exceed
+    StreamingConfig.max_memory_mb.
     """
 
     def __init__(
@@ -39,6 +71,10 @@ class StreamingChunker:
         self.base_chunker = MarkdownChunker(chunk_config)
         self.buffer_manager = BufferManager(self.streaming_config)
         self.split_detector = SplitDetector(self.streaming_config.safe_split_threshold)
+        # Memory statistics of the latest chunk_stream() run
+        self.stats = StreamingStats()
+        # Strategy estimate of the latest file run with sampled_strategy
+        self.last_estimate: AnalysisEstimate | None = None
 
     def chunk_file(self, file_path: str) -> Iterator[Chunk]:
         """
@@ -50,8 +86,13 @@ class StreamingChunker:
         Yields:
             Chunk objects
         """
+        chunker = self._file_chunker(
+            lambda config: estimate_file(file_path, config.sample_count, config.sample_size)
+        )
         with open(file_path, encoding="utf-8") as f:
-            yield from self.chunk_stream(f)
+            budget = MemoryBudget(self.streaming_config)
+            windows = self.buffer_manager.read_safe_windows(f, self.split_detector, budget)
+            yield from self._chunk_windows(windows, budget, chunker)
 
     def chunk_stream(self, stream: io.TextIOBase) -> Iterator[Chunk]:
         """
@@ -61,38 +102,295 @@ class StreamingChunker:
             stream: Text stream to process
 
         Yields:
-            Chunk objects with streaming metadata
+            Chunk objects with streaming metadata (stream_chunk_index,
+            stream_window_index, bytes_processed) and document-global
+            start_line, end_line and chunk_index
+
+        The estimated working set is kept under max_memory_mb; the
+        statistics of the run are available in self.stats.
+        """
+        budget = MemoryBudget(self.streaming_config)
+        windows = self.buffer_manager.read_safe_windows(stream, self.split_detector, budget)
+        yield from self._chunk_windows(windows, budget)
+
+    def chunk_file_mmap(self, file_path: str, encoding: str = "utf-8") -> Iterator[Chunk]:
+        """
+        Chunk file in streaming mode over a memory map.
+
+        Line, fence and split boundaries are found in the mapped bytes and
+        only the text of each window is decoded, so neither the whole file
+        nor its lines are ever held as Python strings. Windows follow the
+        same rules as in chunk_file() but are sized in bytes, with the split
+        threshold as a byte position rather than a line count, so windows,
+        and therefore chunks, can differ from chunk_file() even for ASCII
+        text. Lines must end in "\n" or "\r\n".
+
+        Args:
+            file_path: Path to markdown file
+            encoding: ASCII-compatible file encoding (UTF-8, Latin-1, ...)
+
+        Yields:
+            Chunk objects; bytes_processed is a byte offset
+
+        Raises:
+            ValueError: If the encoding is not ASCII-compatible
+        """
+        check_encoding(encoding)
+        with open(file_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return  # Empty files cannot be mapped
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                chunker = self._file_chunker(
+                    lambda config: estimate_bytes(
+                        data, config.sample_count, config.sample_size, encoding
+                    )
+                )
+                budget = MemoryBudget(self.streaming_config)
+                reader = MmapWindowReader(data, self.split_detector, budget, encoding)
+                yield from self._chunk_windows(reader.windows(), budget, chunker)
+
+    def _file_chunker(
+        self, estimate: Callable[[StreamingConfig], AnalysisEstimate]
+    ) -> MarkdownChunker | None:
+        """
+        Chunker for the windows of a file.
+
+        With sampled_strategy (and no strategy_override), a chunker applying
+        the strategy selected from estimate(streaming_config); otherwise
+        None, and windows are chunked by base_chunker.
+        """
+        self.last_estimate = None
+        config = self.streaming_config
+        if not config.sampled_strategy or self.chunk_config.strategy_override:
+            return None
+        self.last_estimate = estimate(config)
+        name, _ = self.last_estimate.select_strategy(self.chunk_config)
+        return MarkdownChunker(replace(self.chunk_config, strategy_override=name))
+
+    def _chunk_windows(
+        self,
+        windows: Iterable[Window],
+        budget: MemoryBudget,
+        chunker: MarkdownChunker | None = None,
+    ) -> Iterator[Chunk]:
+        """Chunk windows in order and link them into one document."""
+        self.stats = budget.stats
+        sequencer = _ChunkSequencer(self, budget)
+        context: list[tuple[int, str]] = []  # Header stack before the current window
+
+        for window_index, window in enumerate(windows):
+            headers = self._find_headers(window)
+
+            for chunk in self._process_window(window, headers, context, chunker):
+                ready = sequencer.add(chunk, window_index, window)
+                if ready is not None:
+                    yield ready
+
+            context = self._advance_context(context, headers)
+
+        if sequencer.pending is not None:
+            yield sequencer.pending
+
+    async def achunk_stream(
+        self,
+        reader: AsyncIterable[Any] | Any,
+        encoding: str = "utf-8",
+        executor: Executor | None = None,
+    ) -> AsyncIterator[Chunk]:
+        """
+        Chunk an async source without blocking the event loop.
+
+        Windows are read from the source on the event loop and chunked in
+        an executor. The next window is only read once every chunk of the
+        previous one has been consumed, so a slow consumer throttles
+        reading and at most one window of chunks is buffered.
+
+        Args:
+            reader: Async iterable of bytes or str pieces (e.g. an
+                asyncio.StreamReader or an aiofiles file), or an object
+                with an async read(size) method
+            encoding: Encoding of byte sources
+            executor: Executor for window chunking (the event loop's
+                default executor if None)
+
+        Yields:
+            The same chunks chunk_stream() yields for the decoded text
         """
-        chunk_index = 0
-
-        for window_index, (buffer, overlap, bytes_processed) in enumerate(
-            self.buffer_manager.read_windows(stream)
-        ):
-            # Process window
-            for chunk in self._process_window(buffer, overlap, window_index, chunk_index):
-                chunk.metadata["stream_chunk_index"] = chunk_index
-                chunk.metadata["stream_window_index"] = window_index
-                chunk.metadata["bytes_processed"] = bytes_processed
-                yield chunk
-                chunk_index += 1
+        loop = asyncio.get_running_loop()
+        budget = MemoryBudget(self.streaming_config)
+        self.stats = budget.stats
+        sequencer = _ChunkSequencer(self, budget)
+        context: list[tuple[int, str]] = []
+
+        windows = self.buffer_manager.aread_safe_windows(
+            reader, self.split_detector, budget, encoding
+        )
+        window_index = 0
+        async for window in windows:
+            chunks, headers = await loop.run_in_executor(
+                executor, self._chunk_window, window, context
+            )
+
+            for chunk in chunks:
+                ready = sequencer.add(chunk, window_index, window)
+                if ready is not None:
+                    yield ready
+
+            context = self._advance_context(context, headers)
+            window_index += 1
+
+        if sequencer.pending is not None:
+            yield sequencer.pending
+
+    def _chunk_window(
+        self, window: Window, context: list[tuple[int, str]]
+    ) -> tuple[list[Chunk], list[_WindowHeader]]:
+        """Chunk one window eagerly (executor job of achunk_stream)."""
+        headers = self._find_headers(window)
+        return list(self._process_window(window, headers, context)), headers
 
     def _process_window(
         self,
-        buffer: list[str],
-        overlap: list[str],
-        window_index: int,
-        start_chunk_index: int,
+        window: Window,
+        headers: list[_WindowHeader],
+        context: list[tuple[int, str]],
+        chunker: MarkdownChunker | None = None,
     ) -> Iterator[Chunk]:
-        """Process buffer window."""
-        # Combine overlap with buffer
-        full_lines = overlap + buffer
-        text = "".join(full_lines)
+        """Chunk one window (with base_chunker by default) and map its chunks into the document."""
+        text = window.reopen + window.text
 
         if not text.strip():
             return
 
-        # Chunk window using base chunker
-        chunks = self.base_chunker.chunk(text)
+        # Lines of window.reopen are not part of the document
+        line_offset = window.start_line - 1 - window.reopen.count("\n")
+        last_line = window.start_line + window.line_count - 1
+        reopen_bytes = len(window.reopen.encode("utf-8"))
+        for chunk in (chunker or self.base_chunker).iter_chunks(text):
+            if context:
+                self._add_context(chunk, headers, context)
+            start_line = min(chunk.start_line + line_offset, last_line)
+            chunk.start_line = max(start_line, window.start_line)
+            chunk.end_line = max(min(chunk.end_line + line_offset, last_line), chunk.start_line)
+            self._shift_offsets(chunk, window, reopen_bytes)
+            yield chunk
+
+    @staticmethod
+    def _shift_offsets(chunk: Chunk, window: Window, reopen_bytes: int) -> None:
+        """Map the source offsets of a window chunk into the document."""
+        if chunk.start_offset is None or chunk.end_offset is None:
+            return
+        reopen_chars = len(window.reopen)
+        chunk.start_offset = window.start_offset + max(chunk.start_offset - reopen_chars, 0)
+        chunk.end_offset = window.start_offset + max(chunk.end_offset - reopen_chars, 0)
+        if chunk.start_byte is not None and chunk.end_byte is not None:
+            chunk.start_byte = window.start_byte + max(chunk.start_byte - reopen_bytes, 0)
+            chunk.end_byte = window.start_byte + max(chunk.end_byte - reopen_bytes, 0)
+
+    def _find_headers(self, window: Window) -> list[_WindowHeader]:
+        """Find headers outside code fences, as the parser does."""
+        headers: list[_WindowHeader] = []
+        tracker = FenceTracker()
+        for line in window.reopen.splitlines(keepends=True):
+            tracker.track_line(line)
+        first = window.reopen.count("\n") + 1
+        for i, line in enumerate(window.text.split("\n"), first):
+            was_inside = tracker.is_inside_fence()
+            tracker.track_line(line)
+            if was_inside or tracker.is_inside_fence() or line[:1] != "#":
+                continue
+            match = Parser.HEADER_PATTERN.match(line)
+            if match:
+                headers.append((i, len(match.group(1)), match.group(2).strip()))
+        return headers
+
+    def _add_context(
+        self, chunk: Chunk, headers: list[_WindowHeader], context: list[tuple[int, str]]
+    ) -> None:
+        """
+        Prefix a window-relative header_path with headers of earlier windows.
+
+        A context header stays in effect until the window has a header of
+        the same or a higher level before the chunk (or as the chunk's
+        first, path-defining header). Chunks of strategies that set no
+        header path get the path of the headers in effect at their start.
+        """
+        path = chunk.metadata.get("header_path")
+        if not isinstance(path, str):
+            # The strategy sets no header path; use the headers in effect
+            stack = self._advance_context(context, [h for h in headers if h[0] <= chunk.start_line])
+            chunk.metadata["header_path"] = self._path(stack)
+            return
+
+        if path == "/__preamble__":
+            # Text before the first header of a later window continues the
+            # section the previous window ended in
+            chunk.metadata["header_path"] = self._path(context)
+            chunk.metadata["content_type"] = "section"
+            chunk.metadata["header_level"] = context[-1][0]
+            return
+
+        levels = [level for line, level, _ in headers if line < chunk.start_line]
+        levels += [
+            level
+            for line, level, text in headers
+            if line == chunk.start_line and path.endswith("/" + text)
+        ]
+        cutoff = min(levels, default=7)
+        inherited = [(level, text) for level, text in context if level < cutoff]
+        if inherited:
+            suffix = path if path != "/" else ""
+            chunk.metadata["header_path"] = self._path(inherited) + suffix
+
+    def _advance_context(
+        self, context: list[tuple[int, str]], headers: list[_WindowHeader]
+    ) -> list[tuple[int, str]]:
+        """Header stack after a window, given the stack before it."""
+        stack = list(context)
+        for _, level, text in headers:
+            while stack and stack[-1][0] >= level:
+                stack.pop()
+            stack.append((level, text))
+        return stack
+
+    def _link_overlap(self, previous: Chunk, chunk: Chunk) -> None:
+        """Set overlap metadata between the last chunk of a window and the next one."""
+        if not self.chunk_config.enable_overlap:
+            return
+        pair = [previous, chunk]
+        self.base_chunker._apply_overlap_at(pair, 0)
+        self.base_chunker._apply_overlap_at(pair, 1)
+
+    @staticmethod
+    def _path(stack: list[tuple[int, str]]) -> str:
+        return "/" + "/".join(text for _, text in stack)
+
+
+class _ChunkSequencer:
+    """
+    Number the chunks of consecutive windows.
+
+    Holds back the latest chunk until its successor is known, so overlap
+    metadata can be set across window boundaries.
+    """
+
+    def __init__(self, chunker: StreamingChunker, budget: MemoryBudget):
+        self.chunker = chunker
+        self.budget = budget
+        self.chunk_index = 0
+        self.pending: Chunk | None = None
+
+    def add(self, chunk: Chunk, window_index: int, window: Window) -> Chunk | None:
+        """Add the next chunk; return the previous one, which is now complete."""
+        chunk.metadata["chunk_index"] = self.chunk_index
+        chunk.metadata["stream_chunk_index"] = self.chunk_index
+        chunk.metadata["stream_window_index"] = window_index
+        chunk.metadata["bytes_processed"] = window.chars_processed
+        self.chunk_index += 1
 
-        # Yield chunks
-        yield from chunks
+        ready = self.pending
+        if ready is not None and ready.metadata["stream_window_index"] != window_index:
+            self.chunker._link_overlap(ready, chunk)
+        self.pending = chunk
+        self.budget.hold(chunk_bytes(chunk))
+        return ready
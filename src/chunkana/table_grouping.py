@@ -138,7 +138,7 @@ class TableGrouper:
 
         groups: list[TableGroup] = []
         current_tables: list[TableBlock] = [tables[0]]
-        current_size = len(tables[0].content)
+        current_size = tables[0].size
 
         for i in range(1, len(tables)):
             table = tables[i]
@@ -146,11 +146,11 @@ class TableGrouper:
 
             if self._should_group(prev_table, table, headers, current_size, len(current_tables)):
                 current_tables.append(table)
-                current_size += len(table.content)
+                current_size += table.size
             else:
                 groups.append(self._create_group(current_tables, lines))
                 current_tables = [table]
-                current_size = len(table.content)
+                current_size = table.size
 
         # Add last group
         if current_tables:
@@ -210,7 +210,7 @@ class TableGrouper:
 
     def _check_size_limit(self, current_size: int, table: TableBlock) -> bool:
         """Check if adding table would exceed max_group_size."""
-        return current_size + len(table.content) <= self.config.max_group_size
+        return current_size + table.size <= self.config.max_group_size
 
     def _check_distance(self, prev_table: TableBlock, table: TableBlock) -> bool:
         """Check if tables are within max_distance_lines."""
@@ -4,8 +4,11 @@ Consolidated type definitions for markdown_chunker v2.
 All types in one file - no duplication between parser and chunker.
 """
 
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import Enum
+from itertools import accumulate
 from typing import Any
 
 
@@ -25,8 +28,83 @@ class LatexType(Enum):
     INLINE = "inline"  # $...$ (optional extraction)
 
 
+class LineView:
+    """
+    Lines [start, end) of a shared line array, joined on demand.
+
+    Blocks found by the parser keep a LineView of the document lines as
+    their content instead of a copy of the text; reading block.content
+    joins the lines. With column, the first line starts at that offset;
+    with strip, the following lines are stripped (list item continuations).
+    Pickling or copying a LineView produces the joined string.
+    """
+
+    __slots__ = ("lines", "start", "end", "column", "strip")
+
+    def __init__(
+        self, lines: list[str], start: int, end: int, column: int = 0, strip: bool = False
+    ):
+        self.lines = lines
+        self.start = start
+        self.end = end
+        self.column = column
+        self.strip = strip
+
+    def __str__(self) -> str:
+        lines, start, end = self.lines, self.start, self.end
+        if start >= end:
+            return ""
+        if not self.column and not self.strip:
+            return "\n".join(lines[start:end])
+        rest = lines[start + 1 : end]
+        if self.strip:
+            rest = [line.strip() for line in rest]
+        return "\n".join([lines[start][self.column :], *rest])
+
+    def __len__(self) -> int:
+        """Length of the joined text, computed without joining."""
+        lines, start, end = self.lines, self.start, self.end
+        if start >= end:
+            return 0
+        length = len(lines[start]) - self.column + (end - start - 1)
+        if self.strip:
+            return length + sum(len(lines[i].strip()) for i in range(start + 1, end))
+        return length + sum(map(len, lines[start + 1 : end]))
+
+    def __reduce__(self) -> tuple[type[str], tuple[str]]:
+        return (str, (str(self),))
+
+
+class _LineContent:
+    """content attribute of parsed blocks; joins a LineView when read."""
+
+    def __get__(self, obj: Any, objtype: type | None = None) -> Any:
+        if obj is None:
+            return self
+        value = obj._content
+        return str(value) if isinstance(value, LineView) else value
+
+    def __set__(self, obj: Any, value: "str | LineView") -> None:
+        obj._content = value
+
+
+class _LineBacked:
+    """Base of blocks whose content may be a LineView (stored in _content)."""
+
+    _content: "str | LineView"
+
+    @property
+    def size(self) -> int:
+        """Length of content in characters, without joining a LineView."""
+        return len(self._content)
+
+    def _set_lines(self, view: LineView) -> None:
+        """Make content a view of document lines (used by the parser)."""
+        self._content = view
+
+
 @dataclass
-class ListItem:
+class ListItem(_LineBacked):
     """
     Represents a single item in a markdown list.
 
@@ -78,7 +156,7 @@ class ListBlock:
 
 
 @dataclass
-class FencedBlock:
+class FencedBlock(_LineBacked):
     """
     Represents a fenced code block in markdown.
 
@@ -116,7 +194,7 @@ class FencedBlock:
 
 
 @dataclass
-class TableBlock:
+class TableBlock(_LineBacked):
     """
     Represents a markdown table.
 
@@ -154,7 +232,7 @@ class Header:
 
 
 @dataclass
-class LatexBlock:
+class LatexBlock(_LineBacked):
     """
     Represents a LaTeX mathematical formula block.
 
@@ -178,12 +256,167 @@ class LatexBlock:
     environment_name: str | None = None
 
 
+for _block_type in (ListItem, FencedBlock, TableBlock, LatexBlock):
+    _block_type.content = _LineContent()  # type: ignore[assignment]
+
+
+# Block type of an atomic range: "code", "table" or "latex"
+AtomicRange = tuple[int, int, str]
+
+
+@dataclass
+class AtomicBlockIndex:
+    """
+    Sorted interval index of the atomic blocks of a document.
+
+    Atomic blocks are code blocks, tables and display/environment LaTeX
+    blocks. Ranges are sorted by start line (code before table before
+    LaTeX on equal start lines), so blocks starting in a line range and the
+    block covering a line are found by bisection.
+
+    Attributes:
+        ranges: (start_line, end_line, block_type) of every atomic block
+    """
+
+    ranges: list[AtomicRange]
+    _starts: list[int] = field(init=False, repr=False)
+    # Largest end line among ranges[: i + 1]
+    _max_ends: list[int] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.ranges.sort(key=lambda r: r[0])
+        self._starts = [start for start, _, _ in self.ranges]
+        self._max_ends = []
+        max_end = 0
+        for _, end, _ in self.ranges:
+            max_end = max(max_end, end)
+            self._max_ends.append(max_end)
+
+    @classmethod
+    def from_blocks(
+        cls,
+        code_blocks: list[FencedBlock],
+        tables: list[TableBlock],
+        latex_blocks: list[LatexBlock],
+    ) -> "AtomicBlockIndex":
+        """
+        Build the index from extracted blocks.
+
+        Args:
+            code_blocks: Fenced code blocks
+            tables: Tables
+            latex_blocks: LaTeX blocks (inline formulas are not atomic)
+
+        Returns:
+            Index of the atomic blocks
+        """
+        ranges: list[AtomicRange] = [(b.start_line, b.end_line, "code") for b in code_blocks]
+        ranges.extend((t.start_line, t.end_line, "table") for t in tables)
+        ranges.extend(
+            (b.start_line, b.end_line, "latex")
+            for b in latex_blocks
+            if b.latex_type in (LatexType.DISPLAY, LatexType.ENVIRONMENT)
+        )
+        return cls(ranges)
+
+    def starting_in(self, start_line: int, end_line: int) -> list[AtomicRange]:
+        """
+        Get the blocks that start within a line range.
+
+        Args:
+            start_line: Range start (1-indexed, inclusive)
+            end_line: Range end (1-indexed, inclusive)
+
+        Returns:
+            Blocks in document order
+        """
+        lo = bisect_left(self._starts, start_line)
+        hi = bisect_right(self._starts, end_line)
+        return self.ranges[lo:hi]
+
+    def block_at(self, line: int) -> AtomicRange | None:
+        """
+        Get the block covering a line.
+
+        Args:
+            line: Line number (1-indexed)
+
+        Returns:
+            The last-starting block covering the line, or None
+        """
+        i = bisect_right(self._starts, line) - 1
+        while i >= 0 and self._max_ends[i] >= line:
+            if self.ranges[i][1] >= line:
+                return self.ranges[i]
+            i -= 1
+        return None
+
+    def is_atomic(self, line: int) -> bool:
+        """Check whether a line is inside an atomic block."""
+        return self.block_at(line) is not None
+
+
+@dataclass
+class LineIndex:
+    """
+    Prefix sums of the line lengths of a document.
+
+    The size of any line range is the difference of two offsets, so
+    strategies can check whether a range fits into a chunk before joining
+    its lines.
+
+    Attributes:
+        offsets: Character offset of the start of every line, followed by
+            len(text) + 1 (the sum of all line lengths plus newlines)
+    """
+
+    offsets: list[int]
+
+    @classmethod
+    def from_lines(cls, lines: list[str]) -> "LineIndex":
+        """
+        Build the index from a line array.
+
+        Args:
+            lines: Lines of the text, without newlines
+
+        Returns:
+            Index of the lines
+        """
+        offsets = [0]
+        offsets.extend(accumulate(len(line) + 1 for line in lines))
+        return cls(offsets)
+
+    def size(self, start_line: int, end_line: int) -> int:
+        """
+        Get the size of a line range.
+
+        Args:
+            start_line: Range start (1-indexed, inclusive)
+            end_line: Range end (1-indexed, inclusive); clipped to the
+                last line
+
+        Returns:
+            len("\\n".join(lines[start_line - 1 : end_line])), in O(1)
+        """
+        end = min(end_line, len(self.offsets) - 1)
+        if end < start_line:
+            return 0
+        return self.offsets[end] - self.offsets[start_line - 1] - 1
+
+
 @dataclass
 class ContentAnalysis:
     """
     Result of analyzing a markdown document.
 
     Contains metrics and extracted elements for strategy selection.
+
+    Analyses made by Parser.analyze() compute the list, LaTeX and sentence
+    fields (LAZY_FIELDS) on first access: a document routed to a strategy
+    that never reads them does not pay for parsing them. Reading any field
+    of a family computes the whole family; compute_all() computes all of
+    them (also done before pickling).
     """
 
     # Basic metrics
@@ -221,6 +454,32 @@ class ContentAnalysis:
     # O1: Line array optimization (optional, backward compatible)
     # Private field excluded from repr to avoid clutter in debug output
     _lines: list[str] | None = field(default=None, repr=False)
+    # Character offset of every line start, plus len(text) + 1
+    _line_offsets: list[int] | None = field(default=None, repr=False)
+    _atomic_index: AtomicBlockIndex | None = field(default=None, repr=False, compare=False)
+    # Families of LAZY_FIELDS not computed yet, and the callable computing
+    # one: it returns the values of the family's fields by name
+    _pending: set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+    _loader: Callable[[str], dict[str, Any]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def compute_all(self) -> None:
+        """Compute every lazily parsed field that has not been computed yet."""
+        for family in sorted(self._pending):
+            self._load(family)
+
+    def _load(self, family: str) -> None:
+        """Compute the fields of a pending family."""
+        assert self._loader is not None
+        self.__dict__.update(self._loader(family))
+        self._pending.discard(family)
+
+    def __getstate__(self) -> dict[str, Any]:
+        self.compute_all()
+        state = self.__dict__.copy()
+        state["_loader"] = None
+        return state
 
     def get_lines(self) -> list[str] | None:
         """
@@ -236,6 +495,86 @@ class ContentAnalysis:
         """
         return self._lines
 
+    def get_line_offsets(self) -> list[int] | None:
+        """
+        Get cached line start offsets if available.
+
+        Returns:
+            Character offset of the start of every line in the normalized
+            text, followed by len(text) + 1, or None if not available.
+        """
+        return self._line_offsets
+
+    def get_line_index(self) -> LineIndex | None:
+        """
+        Get the prefix sums of the line lengths.
+
+        Built from the line offsets, or from the cached line array for
+        analyses created without offsets.
+
+        Returns:
+            Line index over get_lines(), or None if no line array is cached
+        """
+        if self._line_offsets is None:
+            if self._lines is None:
+                return None
+            self._line_offsets = LineIndex.from_lines(self._lines).offsets
+        return LineIndex(self._line_offsets)
+
+    def get_atomic_index(self) -> AtomicBlockIndex:
+        """
+        Get the interval index of atomic blocks (code, tables, LaTeX).
+
+        Built by the parser; built from the block lists on first use for
+        analyses created elsewhere.
+
+        Returns:
+            Atomic block index
+        """
+        if self._atomic_index is None:
+            self._atomic_index = AtomicBlockIndex.from_blocks(
+                self.code_blocks, self.tables, self.latex_blocks
+            )
+        return self._atomic_index
+
+
+# Fields of ContentAnalysis that Parser.analyze() computes on first access,
+# by element family
+LAZY_FIELDS = {
+    "list_count": "lists",
+    "list_item_count": "lists",
+    "list_blocks": "lists",
+    "list_ratio": "lists",
+    "max_list_depth": "lists",
+    "has_checkbox_lists": "lists",
+    "latex_blocks": "latex",
+    "latex_block_count": "latex",
+    "latex_ratio": "latex",
+    "avg_sentence_length": "sentences",
+}
+
+
+def _lazy_field(name: str, family: str) -> property:
+    """Property computing a family of ContentAnalysis fields on first access."""
+
+    def get(self: ContentAnalysis) -> Any:
+        if family in self._pending:
+            self._load(family)
+        return self.__dict__[name]
+
+    def set_(self: ContentAnalysis, value: Any) -> None:
+        # Assigning one field first computes the rest of its family
+        if family in self.__dict__.get("_pending", ()):
+            self._load(family)
+        self.__dict__[name] = value
+
+    return property(get, set_)
+
+
+# Installed after @dataclass so the generated __init__ keeps the fields
+for _name, _family in LAZY_FIELDS.items():
+    setattr(ContentAnalysis, _name, _lazy_field(_name, _family))
+
 
 @dataclass
 class Chunk:
@@ -251,6 +590,19 @@ class Chunk:
             in source document. Line ranges may overlap between adjacent chunks.
             For precise chunk location, use the content text itself.
         metadata: Additional information about the chunk
+        start_offset: Character offset of the chunk in the chunked text, or
+            None if unknown. text[start_offset:end_offset] is the source
+            span of the chunk: for content copied verbatim from the source it
+            equals content.strip(); for content assembled from several pieces
+            (merged chunks, repeated header_stack) it runs from the first to
+            the last source character the content was taken from.
+        end_offset: Character offset just past the chunk's source span
+        start_byte: start_offset in UTF-8 bytes
+        end_byte: end_offset in UTF-8 bytes
+
+    Offsets refer to the text after line ending normalization ("\n") and
+    optional Obsidian block ID stripping, which is the input itself for
+    documents with Unix line endings.
 
     Metadata Fields:
         chunk_index (int): Sequential index of chunk in document
@@ -287,12 +639,21 @@ class Chunk:
         overlap_size (int, optional): Size of context window (in characters)
             used for previous_content/next_content metadata extraction.
             Does NOT indicate physical text overlap in chunk.content.
+        previous_content_length (int, optional): With lazy_overlap, length of
+            the previous chunk's suffix that forms previous_content (which is
+            then not stored; see chunkana.overlap).
+        next_content_length (int, optional): With lazy_overlap, length of the
+            next chunk's prefix that forms next_content.
     """
 
     content: str
     start_line: int
     end_line: int
     metadata: dict[str, Any] = field(default_factory=dict)
+    start_offset: int | None = None
+    end_offset: int | None = None
+    start_byte: int | None = None
+    end_byte: int | None = None
 
     def __post_init__(self) -> None:
         """Validate chunk on creation."""
@@ -302,6 +663,14 @@ class Chunk:
             raise ValueError(
                 f"end_line ({self.end_line}) must be >= start_line ({self.start_line})"
             )
+        if (
+            self.start_offset is not None
+            and self.end_offset is not None
+            and self.end_offset < self.start_offset
+        ):
+            raise ValueError(
+                f"end_offset ({self.end_offset}) must be >= start_offset ({self.start_offset})"
+            )
         if not self.content.strip():
             raise ValueError("Chunk content cannot be empty or whitespace-only")
 
@@ -327,15 +696,25 @@ class Chunk:
         return str(result) if result is not None else "unknown"
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for serialization."""
-        return {
+        """
+        Convert to dictionary for serialization.
+
+        Source offsets are included only when set, so chunks without them
+        serialize as before offsets existed.
+        """
+        data: dict[str, Any] = {
             "content": self.content,
             "start_line": self.start_line,
             "end_line": self.end_line,
             "size": self.size,
             "line_count": self.end_line - self.start_line + 1,
-            "metadata": self.metadata,
         }
+        for key in ("start_offset", "end_offset", "start_byte", "end_byte"):
+            value = getattr(self, key)
+            if value is not None:
+                data[key] = value
+        data["metadata"] = self.metadata
+        return data
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Chunk":
@@ -354,6 +733,10 @@ class Chunk:
             start_line=data["start_line"],
             end_line=data["end_line"],
             metadata=data.get("metadata", {}),
+            start_offset=data.get("start_offset"),
+            end_offset=data.get("end_offset"),
+            start_byte=data.get("start_byte"),
+            end_byte=data.get("end_byte"),
         )
 
     def to_json(self) -> str:
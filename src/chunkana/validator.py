@@ -6,9 +6,12 @@ Validates chunking results against domain properties PROP-1 through PROP-5.
 **Feature: architecture-redesign**
 """
 
-from dataclasses import dataclass
+import random
+import time
+from dataclasses import dataclass, field
 
 from .config import ChunkConfig
+from .invariant_validator import InvariantValidator
 from .types import Chunk
 
 
@@ -218,3 +221,111 @@ def validate_chunks(
     """
     validator = Validator(config)
     return validator.validate(chunks, original_text, strict)
+
+
+@dataclass
+class ValidationReport:
+    """
+    Result of the validation run at the end of chunking.
+
+    Attributes:
+        level: Validation level that was configured
+        full: Whether the full (document-sized) checks ran
+        errors: Violations of hard properties
+        warnings: Quality issues
+        coverage: Line recall, if the full checks ran
+        timings: Seconds spent per tier ("cheap", "full")
+    """
+
+    level: str
+    full: bool = False
+    errors: list[str] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+    coverage: float | None = None
+    timings: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def is_valid(self) -> bool:
+        """Whether no errors were found."""
+        return not self.errors
+
+    @property
+    def elapsed(self) -> float:
+        """Total seconds spent validating."""
+        return sum(self.timings.values())
+
+
+class TieredValidator:
+    """
+    Runs the checks selected by ChunkConfig.validation_level.
+
+    Levels:
+    - off: no checks
+    - cheap: checks linear in the number of chunks (PROP-3, PROP-4, PROP-5,
+      dangling headers, oversize reasons)
+    - sampled: cheap checks, plus the full checks for a random fraction
+      (validation_sample_rate) of documents
+    - full: cheap checks plus PROP-1 and line recall
+    """
+
+    def __init__(self, config: ChunkConfig, rng: random.Random | None = None):
+        self.config = config
+        self._rng = rng or random.Random()
+        self._validator = Validator(config)
+        self._invariants = InvariantValidator(config, strict=config.strict_mode)
+
+    def validate(self, chunks: list[Chunk], original_text: str) -> ValidationReport:
+        """
+        Validate chunks at the configured level.
+
+        Args:
+            chunks: List of chunks to validate
+            original_text: Normalized text the chunks were made from
+
+        Returns:
+            ValidationReport with findings and timings
+        """
+        level = self.config.validation_level
+        report = ValidationReport(level=level)
+        if level == "off":
+            return report
+
+        started = time.perf_counter()
+        self._run_cheap(chunks, original_text, report)
+        report.timings["cheap"] = time.perf_counter() - started
+
+        if level == "full" or (
+            level == "sampled" and self._rng.random() < self.config.validation_sample_rate
+        ):
+            started = time.perf_counter()
+            self._run_full(chunks, original_text, report)
+            report.timings["full"] = time.perf_counter() - started
+            report.full = True
+
+        return report
+
+    def _run_cheap(self, chunks: list[Chunk], original_text: str, report: ValidationReport) -> None:
+        """Checks linear in the number of chunks."""
+        ordering = self._validator._check_monotonic_ordering(chunks)
+        if ordering:
+            report.errors.append(ordering)
+        report.errors.extend(self._validator._check_no_empty_chunks(chunks))
+        report.errors.extend(self._validator._check_valid_line_numbers(chunks, original_text))
+
+        issues = report.errors if self.config.strict_mode else report.warnings
+        dangling = self._invariants._check_no_dangling_headers(chunks)
+        if dangling:
+            issues.append(f"Found {len(dangling)} dangling headers at chunks: {dangling}")
+        oversize = self._invariants._check_no_invalid_oversize(chunks)
+        if oversize:
+            issues.append(f"Found {len(oversize)} invalid oversize chunks: {oversize}")
+
+    def _run_full(self, chunks: list[Chunk], original_text: str, report: ValidationReport) -> None:
+        """Checks that read the whole document."""
+        content_loss = self._validator._check_no_content_loss(chunks, original_text)
+        if content_loss:
+            report.warnings.append(content_loss)
+
+        report.coverage = self._invariants._calculate_line_recall(chunks, original_text)
+        if report.coverage < 0.95:
+            report.warnings.append(f"Content coverage {report.coverage:.1%} < 95%")
@@ -0,0 +1,97 @@
+"""
+Tests for the benchmark suite in benchmarks/.
+
+Checks that the corpus is deterministic and that the stage-timed pipeline
+produces the same chunks as MarkdownChunker.chunk(); no timings are asserted.
+"""
+
+import json
+
+import pytest
+
+from benchmarks.corpus import KINDS, format_size, generate, parse_size
+from benchmarks.run import STAGES, compare, main, time_stages
+from chunkana import ChunkConfig, MarkdownChunker
+
+
+class TestCorpus:
+    """Tests for the deterministic corpus generator."""
+
+    @pytest.mark.parametrize("kind", list(KINDS))
+    def test_deterministic(self, kind):
+        """The same arguments give the same document of at least the requested size."""
+        text = generate(kind, 4096)
+
+        assert text == generate(kind, 4096)
+        assert text != generate(kind, 4096, seed=1)
+        assert len(text.encode("utf-8")) >= 4096
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            generate("unknown", 1024)
+        with pytest.raises(ValueError):
+            generate("mixed", 0)
+        with pytest.raises(ValueError):
+            parse_size("tenKB")
+
+    def test_sizes(self):
+        assert parse_size("1KB") == 1024
+        assert parse_size("100mb") == 100 * 1024**2
+        assert parse_size("512") == 512
+        assert format_size(parse_size("10KB")) == "10KB"
+        assert format_size(1500) == "1500B"
+
+
+class TestStageTiming:
+    """Tests for per-stage timing and baseline comparison."""
+
+    @pytest.mark.parametrize("kind", list(KINDS))
+    @pytest.mark.parametrize("overlap_size", [0, 200])
+    def test_same_chunks_as_chunk(self, kind, overlap_size):
+        """time_stages() runs the same pipeline as MarkdownChunker.chunk()."""
+        chunker = MarkdownChunker(ChunkConfig(overlap_size=overlap_size))
+        text = generate(kind, 8192)
+
+        chunks, timings = time_stages(chunker, text)
+
+        assert [c.to_dict() for c in chunks] == [c.to_dict() for c in chunker.chunk(text)]
+        assert set(timings) == set(STAGES)
+
+    def test_compare(self):
+        """Only stages slower than tolerance and above the noise floor regress."""
+        baseline = {
+            "results": [
+                {
+                    "kind": "mixed",
+                    "size": "1MB",
+                    "stages": {"parse": 0.100, "merge": 0.001, "split": 0.050},
+                }
+            ]
+        }
+        results = {
+            "results": [
+                {
+                    "kind": "mixed",
+                    "size": "1MB",
+                    "stages": {"parse": 0.150, "merge": 0.003, "split": 0.055},
+                },
+                {"kind": "latex", "size": "1MB", "stages": {"parse": 1.0}},
+            ]
+        }
+
+        regressions = compare(results, baseline, tolerance=0.3, min_seconds=0.005)
+
+        assert [(r.kind, r.size, r.stage) for r in regressions] == [("mixed", "1MB", "parse")]
+        assert "+50%" in str(regressions[0])
+
+    def test_main_writes_results(self, tmp_path):
+        output = tmp_path / "results.json"
+
+        status = main(
+            ["--kinds", "mixed", "--sizes", "1KB", "--repeat", "1", "--output", str(output)]
+        )
+        results = json.loads(output.read_text(encoding="utf-8"))
+
+        assert status == 0
+        assert [(r["kind"], r["size"]) for r in results["results"]] == [("mixed", "1KB")]
+        assert set(results["results"][0]["stages"]) == set(STAGES)
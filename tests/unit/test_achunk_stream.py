@@ -0,0 +1,144 @@
+"""
+Tests for the asyncio streaming API (achunk_stream).
+"""
+
+import asyncio
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from chunkana import ChunkConfig, achunk_stream
+from chunkana.streaming import StreamingChunker, StreamingConfig
+from chunkana.streaming.buffer_manager import aiter_lines
+
+CHUNK_CONFIG = ChunkConfig(max_chunk_size=400, min_chunk_size=50, overlap_size=40)
+STREAMING_CONFIG = StreamingConfig(buffer_size=500)
+
+DOCUMENT = "".join(
+    f"## Раздел {i}\n\nText of section {i}, naïve café. " + "word " * (10 * (i % 4)) + "\n\n"
+    "```python\n"
+    f"value = {i}\n"
+    "```\n\n"
+    for i in range(30)
+)
+
+
+class PieceReader:
+    """Async iterable that hands out fixed-size pieces and counts them."""
+
+    def __init__(self, data, size):
+        self.pieces = [data[i : i + size] for i in range(0, len(data), size)]
+        self.read = 0
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for piece in self.pieces:
+            self.read += 1
+            yield piece
+
+
+class ReadableSource:
+    """Object with an async read(size) method."""
+
+    def __init__(self, text):
+        self.stream = io.StringIO(text)
+
+    async def read(self, size):
+        return self.stream.read(size)
+
+
+def _dicts(chunks):
+    return [c.to_dict() for c in chunks]
+
+
+def _expected(text=DOCUMENT):
+    chunker = StreamingChunker(CHUNK_CONFIG, STREAMING_CONFIG)
+    return _dicts(chunker.chunk_stream(io.StringIO(text)))
+
+
+async def _collect(reader, **kwargs):
+    chunker = StreamingChunker(CHUNK_CONFIG, STREAMING_CONFIG)
+    return [chunk async for chunk in chunker.achunk_stream(reader, **kwargs)]
+
+
+class TestAchunkStream:
+    """Tests for StreamingChunker.achunk_stream()."""
+
+    @pytest.mark.parametrize("size", [1, 7, 4096])
+    def test_bytes_source_matches_chunk_stream(self, size):
+        """Byte pieces split anywhere (even inside characters) give the same chunks."""
+        reader = PieceReader(DOCUMENT.encode("utf-8"), size)
+
+        chunks = asyncio.run(_collect(reader))
+
+        assert _dicts(chunks) == _expected()
+
+    def test_readable_text_source(self):
+        """Sources with an async read() method are read until exhausted."""
+        chunks = asyncio.run(_collect(ReadableSource(DOCUMENT)))
+
+        assert _dicts(chunks) == _expected()
+
+    def test_consumer_throttles_reading(self):
+        """Only the windows needed for the chunks consumed so far are read."""
+        reader = PieceReader(DOCUMENT.encode("utf-8"), 100)
+
+        async def first_chunk():
+            chunker = StreamingChunker(CHUNK_CONFIG, STREAMING_CONFIG)
+            stream = chunker.achunk_stream(reader)
+            chunk = await stream.__anext__()
+            await stream.aclose()
+            return chunk
+
+        chunk = asyncio.run(first_chunk())
+
+        assert chunk.metadata["chunk_index"] == 0
+        assert 0 < reader.read < len(reader.pieces) / 2
+
+    def test_windows_are_chunked_in_executor(self):
+        """Every window is submitted to the given executor."""
+
+        class CountingExecutor(ThreadPoolExecutor):
+            submitted = 0
+
+            def submit(self, fn, /, *args, **kwargs):
+                CountingExecutor.submitted += 1
+                return super().submit(fn, *args, **kwargs)
+
+        with CountingExecutor(max_workers=1) as executor:
+            reader = PieceReader(DOCUMENT, 64)
+            chunks = asyncio.run(_collect(reader, executor=executor))
+
+        windows = {c.metadata["stream_window_index"] for c in chunks}
+        assert CountingExecutor.submitted == len(windows) > 1
+
+    def test_invalid_reader(self):
+        """Readers must be async iterable or readable."""
+        with pytest.raises(TypeError, match="async iterable"):
+            asyncio.run(_collect(DOCUMENT))
+
+
+class TestAiterLines:
+    """Tests for async line decoding."""
+
+    def test_line_endings_are_translated(self):
+        """CRLF and CR split across pieces become single newlines."""
+        reader = PieceReader(b"one\r\ntwo\rthree\r\n\r\nfour", 1)
+
+        async def lines():
+            return [line async for line in aiter_lines(reader)]
+
+        assert asyncio.run(lines()) == ["one\n", "two\n", "three\n", "\n", "four"]
+
+
+def test_api_achunk_stream():
+    """The module-level function streams with the given configs."""
+
+    async def collect():
+        reader = PieceReader(DOCUMENT.encode("utf-8"), 1000)
+        return [c async for c in achunk_stream(reader, CHUNK_CONFIG, STREAMING_CONFIG)]
+
+    assert _dicts(asyncio.run(collect())) == _expected()
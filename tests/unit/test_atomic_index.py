@@ -0,0 +1,83 @@
+"""
+Tests for the atomic block interval index (ContentAnalysis.get_atomic_index).
+"""
+
+from chunkana.parser import get_parser
+from chunkana.types import AtomicBlockIndex, ContentAnalysis
+
+DOCUMENT = """# Title
+
+Intro paragraph.
+
+```python
+x = 1
+```
+
+| a | b |
+|---|---|
+| 1 | 2 |
+
+Inline $x$ math is not atomic.
+
+$$
+E = mc^2
+$$
+
+Closing paragraph.
+"""
+
+
+def _index() -> AtomicBlockIndex:
+    return get_parser().analyze(DOCUMENT).get_atomic_index()
+
+
+class TestAtomicBlockIndex:
+    """Tests for AtomicBlockIndex queries."""
+
+    def test_ranges_sorted_with_types(self):
+        """Code, tables and display LaTeX are indexed in document order."""
+        assert _index().ranges == [(5, 7, "code"), (9, 11, "table"), (15, 17, "latex")]
+
+    def test_starting_in(self):
+        """Blocks are selected by their start line."""
+        index = _index()
+
+        assert index.starting_in(1, 4) == []
+        assert index.starting_in(5, 9) == [(5, 7, "code"), (9, 11, "table")]
+        assert index.starting_in(6, 20) == [(9, 11, "table"), (15, 17, "latex")]
+
+    def test_block_at(self):
+        """The block covering a line is found; other lines are not atomic."""
+        index = _index()
+
+        assert index.block_at(6) == (5, 7, "code")
+        assert index.block_at(11) == (9, 11, "table")
+        assert index.is_atomic(15)
+        assert not index.is_atomic(8)
+        assert not index.is_atomic(13)
+        assert not index.is_atomic(100)
+
+    def test_nested_ranges(self):
+        """A line inside an earlier, longer range is still found."""
+        index = AtomicBlockIndex([(1, 20, "code"), (3, 4, "table")])
+
+        assert index.block_at(10) == (1, 20, "code")
+        assert index.block_at(4) == (3, 4, "table")
+
+    def test_built_lazily_for_hand_made_analysis(self):
+        """Analyses created without the parser build the index on demand."""
+        analysis = get_parser().analyze(DOCUMENT)
+        copy = ContentAnalysis(
+            total_chars=analysis.total_chars,
+            total_lines=analysis.total_lines,
+            code_ratio=analysis.code_ratio,
+            code_block_count=analysis.code_block_count,
+            header_count=analysis.header_count,
+            max_header_depth=analysis.max_header_depth,
+            table_count=analysis.table_count,
+            code_blocks=analysis.code_blocks,
+            tables=analysis.tables,
+            latex_blocks=analysis.latex_blocks,
+        )
+
+        assert copy.get_atomic_index().ranges == analysis.get_atomic_index().ranges
@@ -0,0 +1,153 @@
+"""
+Tests for parallel batch chunking (chunk_batch / chunk_files).
+"""
+
+import os
+import time
+
+import pytest
+
+from chunkana import ChunkerConfig, chunk_batch, chunk_files, chunk_markdown
+from chunkana.batch import BatchResult, _group_tasks, _run
+
+CONFIG = ChunkerConfig(max_chunk_size=300, min_chunk_size=50, overlap_size=50)
+
+DOCUMENTS = [
+    f"# Document {i}\n\n"
+    + "\n\n".join(f"## Part {j}\n\nText {i}.{j} " + "word " * (10 * j) for j in range(4))
+    for i in range(12)
+]
+
+
+def _dicts(chunks):
+    return [c.to_dict() for c in chunks]
+
+
+def _slow_head_worker(task, chunker):
+    """Worker whose first document takes a while."""
+    if task[0][0] == 0:
+        time.sleep(0.5)
+    return [BatchResult(index=index, source=source) for index, source, _ in task]
+
+
+def _crashing_worker(task, chunker):
+    """Worker whose process dies on document 3."""
+    if any(index == 3 for index, _, _ in task):
+        os._exit(1)
+    return [BatchResult(index=index, source=source) for index, source, _ in task]
+
+
+class TestChunkBatch:
+    """Tests for chunk_batch()."""
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_ordered_results_match_chunk_markdown(self, max_workers):
+        """Ordered results come back in input order with identical chunks."""
+        results = list(chunk_batch(DOCUMENTS, CONFIG, max_workers=max_workers, batch_bytes=500))
+
+        assert [r.index for r in results] == list(range(len(DOCUMENTS)))
+        for result, text in zip(results, DOCUMENTS, strict=True):
+            assert result.ok
+            assert result.source is None
+            assert _dicts(result.chunks) == _dicts(chunk_markdown(text, CONFIG))
+
+    def test_unordered_results_cover_all_documents(self):
+        """As-completed mode yields every document exactly once."""
+        results = list(chunk_batch(DOCUMENTS, CONFIG, max_workers=2, ordered=False, batch_bytes=1))
+
+        assert sorted(r.index for r in results) == list(range(len(DOCUMENTS)))
+        by_index = {r.index: r for r in results}
+        assert _dicts(by_index[5].chunks) == _dicts(chunk_markdown(DOCUMENTS[5], CONFIG))
+
+    def test_errors_are_captured_per_document(self):
+        """A failing document does not abort the batch."""
+        texts = [DOCUMENTS[0], 12345, DOCUMENTS[1]]
+
+        results = list(chunk_batch(texts, CONFIG, max_workers=1))  # type: ignore[list-item]
+
+        assert [r.ok for r in results] == [True, False, True]
+        assert results[1].chunks == []
+        assert results[1].error.startswith("AttributeError")
+
+    def test_ordered_buffer_is_bounded(self):
+        """A slow first task does not let later results pile up."""
+        consumed = 0
+
+        def items():
+            nonlocal consumed
+            for _ in range(200):
+                consumed += 1
+                yield (None, "x", 1)
+
+        results = _run(items(), _slow_head_worker, CONFIG, 2, True, 1)
+
+        assert next(results).index == 0
+        # Cap of 2 workers x 2 tasks, plus the task waiting for a slot and
+        # the item read ahead by grouping
+        assert consumed <= 6
+        assert [r.index for r in results] == list(range(1, 200))
+
+    @pytest.mark.parametrize("ordered", [True, False])
+    def test_dead_worker_fails_only_its_task(self, ordered):
+        """A worker process that dies does not abort the batch."""
+        items = [(None, "x", 1) for _ in range(12)]
+
+        results = list(_run(items, _crashing_worker, CONFIG, 2, ordered, 1))
+
+        assert sorted(r.index for r in results) == list(range(12))
+        if ordered:
+            assert [r.index for r in results] == list(range(12))
+        failed = [r for r in results if not r.ok]
+        assert [r.index for r in failed] == [3]
+        assert failed[0].error.startswith("BrokenProcessPool")
+
+    def test_empty_input(self):
+        """No documents, no results."""
+        assert list(chunk_batch([], CONFIG, max_workers=2)) == []
+
+    def test_invalid_parameters(self):
+        """Worker count and batch size must be positive."""
+        with pytest.raises(ValueError, match="max_workers"):
+            list(chunk_batch(DOCUMENTS, max_workers=0))
+        with pytest.raises(ValueError, match="batch_bytes"):
+            list(chunk_batch(DOCUMENTS, batch_bytes=0))
+
+
+class TestChunkFiles:
+    """Tests for chunk_files()."""
+
+    def test_files_and_missing_file(self, tmp_path):
+        """Files are chunked in workers; a missing file is reported as an error."""
+        paths = []
+        for i, text in enumerate(DOCUMENTS[:4]):
+            path = tmp_path / f"doc{i}.md"
+            path.write_text(text, encoding="utf-8")
+            paths.append(path)
+        paths.insert(2, tmp_path / "missing.md")
+
+        results = list(chunk_files(paths, CONFIG, max_workers=2, batch_bytes=200))
+
+        assert [r.source for r in results] == [str(p) for p in paths]
+        assert not results[2].ok
+        assert results[2].error.startswith("FileNotFoundError")
+        assert _dicts(results[3].chunks) == _dicts(chunk_markdown(DOCUMENTS[2], CONFIG))
+
+
+class TestTaskGrouping:
+    """Tests for byte-size based task grouping."""
+
+    def test_groups_small_documents_up_to_budget(self):
+        """Consecutive documents share a task until the budget is reached."""
+        items = [(None, "x" * size, size) for size in (40, 40, 40, 100, 10)]
+
+        tasks = list(_group_tasks(items, batch_bytes=100))
+
+        assert [[index for index, _, _ in task] for task in tasks] == [[0, 1], [2], [3], [4]]
+
+    def test_large_document_forms_own_task(self):
+        """A document above the budget is never dropped or split."""
+        items = [(None, "x", 1), (None, "y" * 500, 500), (None, "z", 1)]
+
+        tasks = list(_group_tasks(items, batch_bytes=100))
+
+        assert [len(task) for task in tasks] == [1, 1, 1]
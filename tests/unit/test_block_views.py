@@ -0,0 +1,114 @@
+"""
+Tests for block content backed by views of the document lines (LineView).
+"""
+
+import copy
+import pickle
+
+from chunkana.parser import Parser
+from chunkana.types import FencedBlock, LineView, TableBlock
+
+DOCUMENT = """# Title
+
+```python
+def f():
+    return 1
+```
+
+| A | B |
+|---|---|
+| 1 | 2 |
+
+- first item
+  continued here
+    and here
+- second item
+
+$$
+x^2
+$$
+
+```
+```
+"""
+
+
+class TestLineView:
+    """Tests for LineView itself."""
+
+    def test_join_and_length(self):
+        lines = ["alpha", "  beta  ", "", "gamma"]
+
+        for view, expected in (
+            (LineView(lines, 0, 4), "alpha\n  beta  \n\ngamma"),
+            (LineView(lines, 1, 2), "  beta  "),
+            (LineView(lines, 2, 2), ""),
+            (LineView(lines, 0, 2, column=2, strip=True), "pha\nbeta"),
+        ):
+            assert str(view) == expected
+            assert len(view) == len(expected)
+
+    def test_pickles_as_string(self):
+        view = LineView(["a", "b"], 0, 2)
+
+        assert pickle.loads(pickle.dumps(view)) == "a\nb"
+        assert copy.deepcopy(view) == "a\nb"
+
+
+class TestParsedBlocks:
+    """Blocks found by the parser refer to the document lines."""
+
+    def test_content(self):
+        analysis = Parser().analyze(DOCUMENT)
+        items = analysis.list_blocks[0].items
+
+        assert [block.content for block in analysis.code_blocks] == [
+            "def f():\n    return 1",
+            "",
+        ]
+        assert analysis.tables[0].content == "| A | B |\n|---|---|\n| 1 | 2 |"
+        assert analysis.latex_blocks[0].content == "$$\nx^2\n$$"
+        assert [item.content for item in items] == [
+            "first item\ncontinued here\nand here",
+            "second item",
+        ]
+
+    def test_no_copies(self):
+        """Multi-line content is a view; size needs no join."""
+        analysis = Parser().analyze(DOCUMENT)
+        blocks = [
+            analysis.code_blocks[0],
+            analysis.tables[0],
+            analysis.latex_blocks[0],
+            analysis.list_blocks[0].items[0],
+        ]
+
+        for block in blocks:
+            assert isinstance(block._content, LineView)
+            assert block._content.lines is analysis.get_lines()
+            assert block.size == len(block.content)
+        code_chars = sum(block.size for block in analysis.code_blocks)
+        assert analysis.code_ratio == code_chars / analysis.total_chars
+
+    def test_assignment_and_pickle(self):
+        analysis = Parser().analyze(DOCUMENT)
+        block = analysis.code_blocks[0]
+
+        restored = pickle.loads(pickle.dumps(block))
+        assert restored == block
+        assert restored._content == block.content
+
+        block.content = "replaced"
+        assert block.content == "replaced"
+        assert block.size == 8
+
+
+def test_constructed_directly():
+    """Blocks built by hand keep the string they were given."""
+    block = FencedBlock(language="python", content="print(1)", start_line=1, end_line=3)
+    table = TableBlock(content="| a |\n|---|", start_line=1, end_line=2)
+
+    assert block.content == "print(1)"
+    assert block.size == 8
+    assert table.size == len(table.content)
+    assert "content='print(1)'" in repr(block)
@@ -0,0 +1,93 @@
+"""
+Tests for CodeContextBinder.
+"""
+
+from chunkana import ChunkConfig, MarkdownChunker
+from chunkana.code_context import CodeBlockRole, CodeContextBinder
+from chunkana.parser import get_parser
+
+
+def _snippet(i: int) -> str:
+    return (
+        f"## Function {i}\n\n"
+        f"Call function {i}:\n\n```python\nf{i}()\n```\n\n"
+        f"Output:\n\n```\nresult {i}\n```\n\n"
+        f"Before:\n\n```js\nold{i}()\n```\n\nAfter:\n\n```js\nnew{i}()\n```\n"
+    )
+
+
+DOCUMENT = "# API\n\n" + "\n".join(_snippet(i) for i in range(20))
+
+
+def _bind(text=DOCUMENT):
+    analysis = get_parser().analyze(text)
+    binder = CodeContextBinder(lines=analysis.get_lines())
+    return binder, analysis
+
+
+class TestBindAll:
+    """Tests for binding every block of a document."""
+
+    def test_same_as_bind_context(self):
+        """bind_all() gives the contexts of per-block bind_context() calls."""
+        binder, analysis = _bind()
+        blocks = analysis.code_blocks
+
+        contexts = binder.bind_all(blocks, DOCUMENT)
+        expected = [CodeContextBinder().bind_context(block, DOCUMENT, blocks) for block in blocks]
+
+        assert contexts == expected
+
+    def test_roles_and_relations(self):
+        """Output and Before/After blocks are bound to their neighbours."""
+        binder, analysis = _bind()
+        blocks = analysis.code_blocks
+
+        contexts = binder.bind_all(blocks, DOCUMENT)
+
+        assert [c.role for c in contexts[:4]] == [
+            CodeBlockRole.EXAMPLE,
+            CodeBlockRole.OUTPUT,
+            CodeBlockRole.BEFORE,
+            CodeBlockRole.AFTER,
+        ]
+        assert contexts[0].output_block is blocks[1]
+        assert contexts[2].related_blocks == [blocks[3]]
+
+    def test_roles_are_classified_once(self, monkeypatch):
+        """Each block's role is determined once per document."""
+        binder, analysis = _bind()
+        calls = []
+        classify = binder._classify_role
+
+        def counting_classify(block, md_text):
+            calls.append(block.start_line)
+            return classify(block, md_text)
+
+        monkeypatch.setattr(binder, "_classify_role", counting_classify)
+        binder.bind_all(analysis.code_blocks, DOCUMENT)
+
+        assert sorted(calls) == [block.start_line for block in analysis.code_blocks]
+
+    def test_block_not_in_document(self):
+        """A block missing from all_blocks has no related or output blocks."""
+        binder, analysis = _bind()
+        block, *others = analysis.code_blocks
+
+        context = binder.bind_context(block, DOCUMENT, others)
+
+        assert context.related_blocks == []
+        assert context.output_block is None
+
+
+class TestCodeAwareGrouping:
+    """Tests for grouping bound contexts in CodeAwareStrategy."""
+
+    def test_pairs_are_grouped(self):
+        """Code/Output and Before/After pairs end up in one chunk each."""
+        config = ChunkConfig(max_chunk_size=200, min_chunk_size=10, overlap_size=0)
+        chunks = MarkdownChunker(config).chunk(DOCUMENT)
+
+        relationships = [c.metadata.get("code_relationship") for c in chunks]
+        assert relationships.count("code_output") == 20
+        assert relationships.count("before_after") == 20
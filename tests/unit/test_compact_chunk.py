@@ -0,0 +1,96 @@
+"""
+Tests for CompactChunk.
+"""
+
+import pickle
+import sys
+
+import pytest
+
+from chunkana import Chunk, ChunkConfig, CompactChunk, chunk_markdown
+
+DOCUMENT = "".join(
+    f"## Section {i}\n\nParagraph {i} with enough text to form a chunk of its own.\n\n"
+    "Second paragraph of the section, also long enough.\n\n"
+    for i in range(8)
+)
+
+
+@pytest.fixture
+def chunks() -> list[Chunk]:
+    return chunk_markdown(
+        DOCUMENT, ChunkConfig(max_chunk_size=150, min_chunk_size=20, overlap_size=50)
+    )
+
+
+class TestCompactChunk:
+    """Tests for CompactChunk conversion and metadata access."""
+
+    def test_roundtrip(self, chunks):
+        """to_chunk() gives back an equal Chunk with the same metadata key order."""
+        for chunk in chunks:
+            restored = CompactChunk.from_chunk(chunk).to_chunk()
+
+            assert restored == chunk
+            assert list(restored.metadata) == list(chunk.metadata)
+            assert CompactChunk.from_chunk(chunk).to_dict() == chunk.to_dict()
+
+    def test_typed_attributes(self, chunks):
+        """Core metadata fields are typed attributes."""
+        chunk = chunks[1]
+        compact = CompactChunk.from_chunk(chunk)
+
+        assert compact.chunk_index == chunk.metadata["chunk_index"]
+        assert compact.header_path == chunk.metadata["header_path"]
+        assert compact.strategy == chunk.strategy
+        assert compact.previous_content == chunk.metadata.get("previous_content")
+        assert compact.size == chunk.size
+
+    def test_metadata_view(self):
+        """The metadata view reads, writes and deletes like a dict."""
+        compact = CompactChunk(
+            "text", 1, 1, metadata={"strategy": "structural", "custom": 1, "chunk_index": 0}
+        )
+        metadata = compact.metadata
+
+        metadata["custom"] = 2
+        metadata["header_level"] = 2
+        metadata["other"] = "x"
+        del metadata["strategy"]
+
+        assert metadata == {"custom": 2, "chunk_index": 0, "header_level": 2, "other": "x"}
+        assert list(metadata) == ["custom", "chunk_index", "header_level", "other"]
+        assert "strategy" not in metadata
+        assert compact.strategy == "unknown"
+        assert metadata.get("missing", "default") == "default"
+        assert {**metadata} == metadata.copy()
+        with pytest.raises(KeyError):
+            metadata["strategy"]
+
+        del metadata["custom"]
+        assert metadata["other"] == "x"
+        assert compact._extra == ("x",)
+
+    def test_core_key_set_to_none(self):
+        """A core key explicitly set to None is present."""
+        compact = CompactChunk("text", 1, 1, metadata={"header_path": None})
+
+        assert compact.metadata == {"header_path": None}
+
+    def test_strings_interned_and_keys_shared(self, chunks):
+        """Repeated strings and key orders are shared between chunks."""
+        first, second = (CompactChunk.from_chunk(c) for c in chunks[2:4])
+        copy = CompactChunk.from_chunk(
+            Chunk.from_dict(pickle.loads(pickle.dumps(chunks[2].to_dict())))
+        )
+
+        assert copy.header_path is first.header_path
+        assert first.strategy is second.strategy
+        assert copy._keys is first._keys
+
+    def test_no_instance_dict(self, chunks):
+        """CompactChunk is slotted."""
+        compact = CompactChunk.from_chunk(chunks[0])
+
+        assert not hasattr(compact, "__dict__")
+        assert sys.getsizeof(compact) < sys.getsizeof(chunks[0]) + sys.getsizeof(chunks[0].metadata)
@@ -134,6 +134,49 @@ class TestExtendedAPI:
 
         assert MarkdownChunker is not None
 
+    def test_parse_cache_exports(self):
+        """Verify parse cache classes are exported."""
+        from chunkana import ParseCache, ParseCacheStats
+
+        assert ParseCache is not None
+        assert ParseCacheStats is not None
+
+    def test_profiling_exports(self):
+        """Verify pipeline statistics classes are exported."""
+        from chunkana import PipelineStats, StageStats
+
+        assert PipelineStats is not None
+        assert StageStats is not None
+
+    def test_preprocessing_exports(self):
+        """Verify preprocessing classes are exported."""
+        from chunkana import Preprocessor, Transform
+
+        assert Preprocessor is not None
+        assert Transform is not None
+
+    def test_sampling_exports(self):
+        """Verify sampled analysis API is exported."""
+        from chunkana import AnalysisEstimate, estimate_analysis, estimate_file
+
+        assert callable(estimate_analysis)
+        assert callable(estimate_file)
+        assert AnalysisEstimate is not None
+
+    def test_batch_exports(self):
+        """Verify batch chunking API is exported."""
+        from chunkana import BatchResult, chunk_batch, chunk_files
+
+        assert callable(chunk_batch)
+        assert callable(chunk_files)
+        assert BatchResult is not None
+
+    def test_rechunk_result_export(self):
+        """Verify incremental re-chunking result is exported."""
+        from chunkana import RechunkResult
+
+        assert RechunkResult is not None
+
 
 class TestAllExportsWork:
     """Verify all __all__ exports actually work."""
@@ -0,0 +1,78 @@
+"""
+Tests for the worklist dangling-header fixer (HeaderProcessor).
+"""
+
+from chunkana import Chunk, ChunkConfig
+from chunkana.header_processor import DanglingHeaderDetector, HeaderProcessor
+
+BODY = "Body text long enough to count as content for a header."
+
+
+def _runbook(sections: int) -> list[Chunk]:
+    """Chunks that each end with the header of the next chunk's content."""
+    chunks = []
+    for i in range(sections):
+        chunks.append(
+            Chunk(
+                content=f"{BODY} Step {i}.\n\n### Step {i + 1}",
+                start_line=3 * i + 1,
+                end_line=3 * i + 3,
+                metadata={"chunk_id": f"c{i}"},
+            )
+        )
+    return chunks
+
+
+class TestWorklistFixer:
+    """Tests for HeaderProcessor.prevent_dangling_headers()."""
+
+    def test_fixes_more_than_twenty_headers(self):
+        """Every dangling header is fixed; there is no iteration cap."""
+        processor = HeaderProcessor(ChunkConfig(max_chunk_size=1000))
+
+        result = processor.prevent_dangling_headers(_runbook(100))
+
+        assert DanglingHeaderDetector().detect_dangling_headers(result) == []
+        assert sum(1 for c in result if c.metadata.get("dangling_header_fixed")) == 99
+
+    def test_unfixable_header_does_not_block_later_fixes(self):
+        """A header too large to move or merge is skipped, later ones are fixed."""
+        big = "x" * 180
+        chunks = [
+            Chunk(content=f"{big}\n\n## Stuck", start_line=1, end_line=3),
+            Chunk(content=f"{big} first body", start_line=4, end_line=4),
+            Chunk(content=f"{BODY}\n\n## Movable", start_line=5, end_line=7),
+            Chunk(content=BODY, start_line=8, end_line=8),
+        ]
+        processor = HeaderProcessor(
+            ChunkConfig(max_chunk_size=200, min_chunk_size=10, overlap_size=0)
+        )
+
+        result = processor.prevent_dangling_headers(chunks)
+
+        assert result[0].content.endswith("## Stuck")
+        assert result[-1].content.startswith("## Movable")
+
+    def test_chunk_ends_classified_once(self, monkeypatch):
+        """Each chunk's trailing header is classified at most once."""
+        detector_calls = []
+        original = DanglingHeaderDetector.trailing_header
+
+        def counting(self, chunk):
+            detector_calls.append(chunk)  # Keeps the chunk (and its id) alive
+            return original(self, chunk)
+
+        monkeypatch.setattr(DanglingHeaderDetector, "trailing_header", counting)
+        processor = HeaderProcessor(ChunkConfig(max_chunk_size=1000))
+
+        processor.prevent_dangling_headers(_runbook(50))
+
+        assert len(detector_calls) == len({id(c) for c in detector_calls})
+
+    def test_no_iteration_warning(self, caplog):
+        """Long runbooks no longer hit an iteration limit."""
+        processor = HeaderProcessor(ChunkConfig(max_chunk_size=1000))
+
+        processor.prevent_dangling_headers(_runbook(60))
+
+        assert "maximum iterations" not in caplog.text
@@ -0,0 +1,50 @@
+"""
+Tests for InvariantValidator line recall.
+"""
+
+from chunkana import Chunk, ChunkConfig
+from chunkana.invariant_validator import InvariantValidator
+
+LINE_A = "First significant line of the document."
+LINE_B = "Second significant line of the document."
+LINE_C = "Third significant line of the document."
+
+
+def _recall(contents: list[str], original: str) -> float:
+    chunks = [Chunk(content=c, start_line=1, end_line=1) for c in contents]
+    return InvariantValidator(ChunkConfig())._calculate_line_recall(chunks, original)
+
+
+class TestLineRecall:
+    """Tests for InvariantValidator._calculate_line_recall()."""
+
+    def test_verbatim_lines(self):
+        """Lines copied into chunks are found, whitespace-normalized."""
+        original = f"{LINE_A}\n\n  {LINE_B}  \nshort\n{LINE_C}"
+
+        assert _recall([f"{LINE_A}\n{LINE_B}", f"{LINE_C}"], original) == 1.0
+
+    def test_missing_lines(self):
+        """Recall is the fraction of significant lines found."""
+        original = f"{LINE_A}\n{LINE_B}\n{LINE_C}\n{LINE_C}"
+
+        assert _recall([LINE_A, LINE_B], original) == 0.5
+
+    def test_line_inside_longer_line(self):
+        """A line that is part of a longer chunk line counts as found."""
+        assert _recall([f"> {LINE_A} More text."], LINE_A) == 1.0
+
+    def test_line_wrapped_across_chunk_lines(self):
+        """A line broken over lines or chunks counts as found."""
+        original = f"{LINE_A}\n{LINE_B}"
+        wrapped = [
+            "First significant line\nof the document.",
+            "Second significant",
+            "line of the document.",
+        ]
+
+        assert _recall(wrapped, original) == 1.0
+
+    def test_no_significant_lines(self):
+        """A document without significant lines has full recall."""
+        assert _recall([], "# Title\n\nshort\n") == 1.0
@@ -0,0 +1,122 @@
+"""
+Tests for the lazy chunking pipeline (iter_chunks).
+"""
+
+from itertools import zip_longest
+
+from chunkana import ChunkConfig, MarkdownChunker, iter_chunks
+from chunkana.header_processor import HeaderProcessor
+from chunkana.strategies.structural import StructuralStrategy
+from chunkana.types import Chunk
+
+CONFIG = ChunkConfig(max_chunk_size=300, min_chunk_size=50, overlap_size=50)
+
+
+def _document(sections: int) -> str:
+    parts = ["# Manual", "", "Short introduction."]
+    for i in range(sections):
+        parts += ["", f"## Topic {i}", "", f"Topic {i} body. " + "word " * (i % 7 * 15)]
+        if i % 3 == 0:
+            parts += ["", f"### Detail {i}"]
+    return "\n".join(parts)
+
+
+def _items(chunks):
+    """Content, lines and metadata including key order."""
+    return [(c.content, c.start_line, c.end_line, list(c.metadata.items())) for c in chunks]
+
+
+class TestIterChunks:
+    """iter_chunks() yields what chunk() returns."""
+
+    def test_matches_chunk(self):
+        """Same chunks, metadata and metadata key order as chunk()."""
+        text = _document(40)
+        for config in (CONFIG, ChunkConfig(), ChunkConfig(max_chunk_size=500, overlap_size=0)):
+            chunker = MarkdownChunker(config)
+            assert _items(chunker.iter_chunks(text)) == _items(chunker.chunk(text))
+
+    def test_matches_chunk_for_other_strategies(self):
+        """Strategies without a lazy implementation go through the same stages."""
+        text = "\n\n".join(f"- item {i} " + "text " * (i % 9) for i in range(60))
+        for strategy in ("list_aware", "fallback", "code_aware"):
+            chunker = MarkdownChunker(ChunkConfig(max_chunk_size=300, strategy_override=strategy))
+            assert _items(chunker.iter_chunks(text)) == _items(chunker.chunk(text))
+
+    def test_empty_text(self):
+        """Blank text yields nothing."""
+        assert list(MarkdownChunker(CONFIG).iter_chunks("  \n")) == []
+
+    def test_first_chunk_before_document_is_processed(self, monkeypatch):
+        """Only the first sections are chunked when the first chunk is yielded."""
+        created = []
+        original = StructuralStrategy._create_chunk
+
+        def counting(self, *args, **kwargs):
+            created.append(args[1])
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(StructuralStrategy, "_create_chunk", counting)
+
+        chunks = MarkdownChunker(CONFIG).iter_chunks(_document(200))
+        first = next(chunks)
+
+        assert first.metadata["chunk_index"] == 0
+        assert 0 < len(created) < 10
+        assert len(list(chunks)) > 100
+
+    def test_interleaved_generators(self):
+        """Two documents chunked alternately by one chunker do not interfere."""
+        chunker = MarkdownChunker(CONFIG)
+        text_a, text_b = _document(30), _document(25).replace("# Manual", "# Handbook")
+        gen_a, gen_b = chunker.iter_chunks(text_a), chunker.iter_chunks(text_b)
+
+        out_a: list[Chunk] = []
+        out_b: list[Chunk] = []
+        for a, b in zip_longest(gen_a, gen_b):
+            if a is not None:
+                out_a.append(a)
+            if b is not None:
+                out_b.append(b)
+
+        assert _items(out_a) == _items(MarkdownChunker(CONFIG).chunk(text_a))
+        assert _items(out_b) == _items(MarkdownChunker(CONFIG).chunk(text_b))
+
+    def test_api_iter_chunks(self):
+        """The module-level helper uses the lazy pipeline."""
+        text = _document(10)
+        assert _items(iter_chunks(text, CONFIG)) == _items(MarkdownChunker(CONFIG).chunk(text))
+
+
+class TestStreamingDanglingHeaders:
+    """HeaderProcessor.iter_prevent_dangling_headers() matches the list version."""
+
+    def _chunks(self) -> list[Chunk]:
+        body = "Body text that belongs to the header above it."
+        contents = [
+            f"Intro paragraph.\n\n## First\n\n{body}\n\n### Dangling",
+            body,
+            "Tiny",
+            f"## Second\n\n{body}\n\n### Also dangling",
+            f"{body} More words.",
+            "### Only a header\n\n#### Deeper",
+            body,
+        ]
+        chunks = []
+        line = 1
+        for content in contents:
+            end = line + content.count("\n")
+            chunks.append(Chunk(content=content, start_line=line, end_line=end))
+            line = end + 1
+        return chunks
+
+    def test_matches_list_version(self):
+        processor = HeaderProcessor(
+            ChunkConfig(max_chunk_size=200, min_chunk_size=10, overlap_size=20)
+        )
+
+        expected = processor.prevent_dangling_headers(self._chunks())
+        streamed = list(processor.iter_prevent_dangling_headers(iter(self._chunks())))
+
+        assert _items(streamed) == _items(expected)
+        assert any(c.metadata.get("dangling_header_fixed") for c in streamed)
@@ -0,0 +1,105 @@
+"""
+Tests for lazily parsed ContentAnalysis fields (lists, LaTeX, sentences).
+"""
+
+import pickle
+
+from chunkana import ChunkConfig, ContentAnalysis, MarkdownChunker
+from chunkana.parser import Parser
+from chunkana.types import LAZY_FIELDS
+
+DOCUMENT = """# Title
+
+Intro text. Second sentence.
+
+- item one
+- item two
+  continued
+
+$$
+E = mc^2
+$$
+
+```python
+- not a list item
+$$ not latex $$
+```
+"""
+
+
+class TestLazyAnalysis:
+    """Tests for fields computed on first access."""
+
+    def test_pending_until_read(self):
+        analysis = Parser().analyze(DOCUMENT)
+
+        assert analysis._pending == {"lists", "latex", "sentences"}
+        assert analysis.list_count == 1
+        assert analysis._pending == {"latex", "sentences"}
+        assert analysis.list_blocks[0].items[1].content == "item two\ncontinued"
+
+    def test_values(self):
+        """Fences found by the eager scan exclude lines from the lazy families."""
+        analysis = Parser().analyze(DOCUMENT)
+
+        assert analysis.list_item_count == 2
+        assert analysis.latex_block_count == 1
+        assert analysis.latex_blocks[0].start_line == 9
+        assert analysis.avg_sentence_length > 0
+        assert not analysis._pending
+        assert [r[2] for r in analysis.get_atomic_index().ranges] == ["latex", "code"]
+
+    def test_no_latex_markers(self):
+        analysis = Parser().analyze("# Title\n\nPlain text without formulas.\n")
+
+        assert analysis.latex_blocks == []
+        assert analysis.latex_ratio == 0.0
+
+    def test_selection_skips_unused_families(self):
+        """Code documents and strategy overrides never parse lists or sentences."""
+        for config in (ChunkConfig(), ChunkConfig(strategy_override="fallback")):
+            chunker = MarkdownChunker(config)
+            normalized, analysis = chunker._prepare(DOCUMENT)
+            chunker._chunk_prepared(normalized, analysis)
+
+            assert analysis._pending == {"lists", "sentences"}
+
+    def test_assignment_computes_family(self):
+        """Assigning one field keeps the rest of its family."""
+        analysis = Parser().analyze(DOCUMENT)
+
+        analysis.list_count = 5
+
+        assert analysis.list_count == 5
+        assert analysis.list_item_count == 2
+        assert "lists" not in analysis._pending
+
+    def test_equality_and_pickle(self):
+        """Lazy analyses compare and pickle like fully computed ones."""
+        analysis = Parser().analyze(DOCUMENT)
+        computed = Parser().analyze(DOCUMENT)
+        computed.compute_all()
+
+        assert analysis == computed
+        restored = pickle.loads(pickle.dumps(Parser().analyze(DOCUMENT)))
+        assert restored == computed
+        assert restored._loader is None
+
+    def test_constructed_directly(self):
+        """ContentAnalysis built by hand keeps the values it was given."""
+        analysis = ContentAnalysis(
+            total_chars=10,
+            total_lines=1,
+            code_ratio=0.0,
+            code_block_count=0,
+            header_count=0,
+            max_header_depth=0,
+            table_count=0,
+            list_count=3,
+            list_ratio=0.5,
+        )
+
+        assert analysis.list_count == 3
+        assert analysis.list_ratio == 0.5
+        assert analysis.latex_blocks == []
+        assert set(LAZY_FIELDS) <= set(vars(analysis))
@@ -0,0 +1,84 @@
+"""
+Tests for lazy overlap context (ChunkConfig.lazy_overlap).
+"""
+
+from chunkana import ChunkConfig, MarkdownChunker
+from chunkana.overlap import materialize_overlap, overlap_context
+from chunkana.renderers import render_with_embedded_overlap, render_with_prev_overlap
+from chunkana.streaming import StreamingChunker, StreamingConfig
+
+DOCUMENT = "".join(
+    f"## Section {i}\n\nParagraph {i} has several words so that overlap can break at a space. "
+    f"It continues with a second sentence for section {i}.\n\n"
+    for i in range(10)
+)
+
+
+def _chunks(lazy: bool, **kwargs):
+    config = ChunkConfig(
+        max_chunk_size=200, min_chunk_size=20, overlap_size=60, lazy_overlap=lazy, **kwargs
+    )
+    return MarkdownChunker(config).chunk(DOCUMENT)
+
+
+class TestLazyOverlap:
+    """Tests for overlap stored as lengths into neighbouring chunks."""
+
+    def test_no_text_in_metadata(self):
+        """Lazy chunks carry lengths instead of overlap text."""
+        chunks = _chunks(lazy=True)
+
+        assert len(chunks) > 2
+        assert not any("previous_content" in c.metadata for c in chunks)
+        assert not any("next_content" in c.metadata for c in chunks)
+        assert chunks[1].metadata["previous_content_length"] == chunks[1].metadata["overlap_size"]
+        assert "previous_content_length" not in chunks[0].metadata
+        assert "next_content_length" not in chunks[-1].metadata
+
+    def test_materialize_matches_eager(self):
+        """materialize_overlap() gives the metadata of lazy_overlap=False."""
+        eager = _chunks(lazy=False)
+        lazy = materialize_overlap(_chunks(lazy=True))
+
+        assert [c.to_dict() for c in lazy] == [c.to_dict() for c in eager]
+        assert [list(c.metadata) for c in lazy] == [list(c.metadata) for c in eager]
+
+    def test_overlap_context(self):
+        """overlap_context() resolves lazy and materialized overlap alike."""
+        eager = _chunks(lazy=False)
+
+        assert overlap_context(_chunks(lazy=True)) == overlap_context(eager)
+        assert overlap_context(eager)[1] == (
+            eager[1].metadata["previous_content"],
+            eager[1].metadata["next_content"],
+        )
+
+    def test_renderers_materialize(self):
+        """Overlap-embedding renderers give the same output in both modes."""
+        eager, lazy = _chunks(lazy=False), _chunks(lazy=True)
+
+        assert render_with_embedded_overlap(lazy) == render_with_embedded_overlap(eager)
+        assert render_with_prev_overlap(lazy) == render_with_prev_overlap(eager)
+
+    def test_resolved_by_chunk_index(self):
+        """Neighbours are found by chunk_index; missing neighbours give no context."""
+        lazy = _chunks(lazy=True)
+        expected = overlap_context(lazy)
+
+        assert overlap_context(lazy[::-1]) == expected[::-1]
+        assert overlap_context([lazy[2]]) == [("", "")]
+
+    def test_streaming(self, tmp_path):
+        """Streamed chunks resolve across window boundaries."""
+        path = tmp_path / "doc.md"
+        path.write_text(DOCUMENT * 5, encoding="utf-8")
+        config = ChunkConfig(
+            max_chunk_size=200, min_chunk_size=20, overlap_size=60, lazy_overlap=True
+        )
+        eager_config = ChunkConfig(max_chunk_size=200, min_chunk_size=20, overlap_size=60)
+        streaming = StreamingConfig(buffer_size=500)
+
+        lazy = list(StreamingChunker(config, streaming).chunk_file(str(path)))
+        eager = list(StreamingChunker(eager_config, streaming).chunk_file(str(path)))
+
+        assert [c.to_dict() for c in materialize_overlap(lazy)] == [c.to_dict() for c in eager]
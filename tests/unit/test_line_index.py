@@ -0,0 +1,64 @@
+"""
+Tests for the line-length prefix sums (ContentAnalysis.get_line_index).
+"""
+
+from chunkana import ChunkConfig, MarkdownChunker
+from chunkana.parser import get_parser
+from chunkana.types import ContentAnalysis, LineIndex
+
+DOCUMENT = "# Title\n\nFirst line\nsecond\n\n\n- item\n  more\nlast"
+
+
+class TestLineIndex:
+    """Tests for LineIndex.size()."""
+
+    def test_size_matches_join(self):
+        """Every range has the size of its joined lines."""
+        lines = DOCUMENT.split("\n")
+        index = get_parser().analyze(DOCUMENT).get_line_index()
+
+        assert index is not None
+        for start in range(1, len(lines) + 1):
+            for end in range(start - 1, len(lines) + 3):
+                assert index.size(start, end) == len("\n".join(lines[start - 1 : end]))
+
+    def test_from_lines(self):
+        """Built from lines, the index equals the parser's offsets."""
+        analysis = get_parser().analyze(DOCUMENT)
+
+        assert LineIndex.from_lines(DOCUMENT.split("\n")).offsets == analysis.get_line_offsets()
+        assert LineIndex.from_lines([]).size(1, 5) == 0
+
+    def test_analysis_without_offsets(self):
+        """Analyses with only a line array build the index on first use."""
+        analysis = ContentAnalysis(
+            total_chars=7,
+            total_lines=2,
+            code_ratio=0.0,
+            code_block_count=0,
+            header_count=0,
+            max_header_depth=0,
+            table_count=0,
+            _lines=["abc", "de"],
+        )
+
+        assert analysis.get_line_index() == LineIndex([0, 4, 7])
+        assert analysis.get_line_offsets() == [0, 4, 7]
+        analysis._lines = None
+        analysis._line_offsets = None
+        assert analysis.get_line_index() is None
+
+
+class TestLongLists:
+    """Oversize lists are split without rescanning the block per group."""
+
+    def test_split_list_groups(self):
+        items = "".join(f"- item {i}\n  continuation {i}\n" for i in range(300))
+        config = ChunkConfig(max_chunk_size=200, overlap_size=0, strategy_override="list_aware")
+
+        chunks = MarkdownChunker(config).chunk("Items:\n\n" + items)
+
+        list_chunks = [chunk for chunk in chunks if chunk.metadata.get("content_type") == "list"]
+        assert "".join(chunk.content + "\n" for chunk in list_chunks).count("- item") == 300
+        assert all(chunk.metadata["list_types"] == ["bullet"] for chunk in list_chunks)
+        assert list_chunks[-1].content.endswith("continuation 299")
@@ -0,0 +1,144 @@
+"""
+Tests for memory-mapped streaming (StreamingChunker.chunk_file_mmap).
+"""
+
+import pytest
+
+from chunkana import ChunkConfig, chunk_file_streaming
+from chunkana.streaming import StreamingChunker, StreamingConfig
+from chunkana.streaming.memory import MemoryBudget
+from chunkana.streaming.mmap_reader import MmapWindowReader
+from chunkana.streaming.split_detector import SplitDetector
+
+DOCUMENT = "".join(
+    f"## Section {i}\n\nText of section {i}, naïve café. " + "word " * (10 * (i % 4)) + "\n\n"
+    "```python\n"
+    f"value = {i}\n"
+    "```\n\n"
+    "| a | b |\n|---|---|\n| 1 | 2 |\n\n"
+    for i in range(40)
+)
+
+
+def _write(tmp_path, text, encoding="utf-8"):
+    path = tmp_path / "doc.md"
+    path.write_bytes(text.encode(encoding))
+    return path
+
+
+def _windows(data, buffer_size=500, max_memory_mb=100):
+    config = StreamingConfig(buffer_size=buffer_size, max_memory_mb=max_memory_mb)
+    reader = MmapWindowReader(data, SplitDetector(), MemoryBudget(config))
+    return list(reader.windows())
+
+
+class TestMmapWindowReader:
+    """Tests for window cutting over bytes."""
+
+    def test_windows_cover_document_at_safe_boundaries(self):
+        """Windows partition the text, never inside a fence or table."""
+        windows = _windows(DOCUMENT.encode())
+
+        assert len(windows) > 1
+        assert "".join(w.text for w in windows) == DOCUMENT
+        next_line = 1
+        for window in windows:
+            assert window.start_line == next_line
+            assert window.line_count == window.text.count("\n")
+            next_line += window.line_count
+            assert window.text.count("```") % 2 == 0
+            assert not window.text.startswith("|")
+
+    def test_chars_processed_is_byte_offset(self):
+        """Windows report the byte offset of their end."""
+        data = DOCUMENT.encode()
+        windows = _windows(data)
+
+        assert windows[-1].chars_processed == len(data)
+        for window in windows:
+            assert data[: window.chars_processed].decode().endswith(window.text)
+
+    def test_crlf_is_translated(self):
+        """CRLF line endings are decoded as in text mode."""
+        windows = _windows(DOCUMENT.replace("\n", "\r\n").encode())
+
+        assert "".join(w.text for w in windows) == DOCUMENT
+
+    def test_oversized_block_is_cut_and_reopened(self):
+        """A code block larger than the ceiling is cut and re-entered."""
+        text = "Intro.\n\n```python\n" + "x = 1\n" * 4000 + "```\n\nOutro.\n"
+
+        windows = _windows(text.encode(), buffer_size=100_000, max_memory_mb=1)
+
+        assert len(windows) > 1
+        assert "".join(w.text for w in windows) == text
+        assert "```\n" in [w.reopen for w in windows]
+        assert all(w.text.count("x = 1") < 4000 for w in windows)
+
+    def test_encoding_must_be_ascii_compatible(self):
+        """Encodings whose bytes cannot be scanned are rejected."""
+        budget = MemoryBudget(StreamingConfig())
+        with pytest.raises(ValueError, match="ASCII-compatible"):
+            MmapWindowReader(b"", SplitDetector(), budget, encoding="utf-16")
+
+
+class TestChunkFileMmap:
+    """Tests for StreamingChunker.chunk_file_mmap()."""
+
+    def test_same_chunks_as_chunk_file_for_one_window(self, tmp_path):
+        """A file that fits one window gives the chunks of chunk_file()."""
+        path = _write(tmp_path, DOCUMENT)
+        chunker = StreamingChunker(ChunkConfig(max_chunk_size=400))
+
+        mapped = [c.to_dict() for c in chunker.chunk_file_mmap(str(path))]
+        expected = [c.to_dict() for c in chunker.chunk_file(str(path))]
+
+        # bytes_processed counts bytes instead of characters
+        assert mapped[-1]["metadata"].pop("bytes_processed") == len(DOCUMENT.encode())
+        for chunk in [*mapped, *expected]:
+            chunk["metadata"].pop("bytes_processed", None)
+        assert mapped == expected
+
+    def test_multiple_windows(self, tmp_path):
+        """Small windows keep content, line numbers and header paths global."""
+        path = _write(tmp_path, DOCUMENT)
+        chunker = StreamingChunker(
+            ChunkConfig(max_chunk_size=400, min_chunk_size=50),
+            StreamingConfig(buffer_size=500),
+        )
+
+        chunks = list(chunker.chunk_file_mmap(str(path)))
+
+        lines = DOCUMENT.split("\n")
+        assert chunker.stats.windows > 1
+        assert sorted(w for c in chunks for w in c.content.split()) == sorted(DOCUMENT.split())
+        assert [c.metadata["chunk_index"] for c in chunks] == list(range(len(chunks)))
+        for chunk in chunks:
+            first = chunk.content.split("\n")[0]
+            assert lines[chunk.start_line - 1] == first
+            if chunk.metadata["stream_window_index"] > 0:
+                assert chunk.metadata["header_path"].startswith("/Section")
+
+    def test_latin1_file(self, tmp_path):
+        """ASCII-compatible single-byte encodings are decoded per window."""
+        path = _write(tmp_path, DOCUMENT, encoding="latin-1")
+        chunker = StreamingChunker(ChunkConfig(), StreamingConfig(buffer_size=500))
+
+        chunks = list(chunker.chunk_file_mmap(str(path), encoding="latin-1"))
+
+        assert "naïve café" in chunks[0].content
+
+    def test_empty_file(self, tmp_path):
+        """Empty files yield no chunks."""
+        path = _write(tmp_path, "")
+
+        assert list(StreamingChunker(ChunkConfig()).chunk_file_mmap(str(path))) == []
+
+    def test_api_use_mmap(self, tmp_path):
+        """chunk_file_streaming(use_mmap=True) reads through the memory map."""
+        path = _write(tmp_path, DOCUMENT)
+
+        mapped = list(chunk_file_streaming(path, use_mmap=True))
+        expected = list(chunk_file_streaming(path))
+
+        assert [c.content for c in mapped] == [c.content for c in expected]
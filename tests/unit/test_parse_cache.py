@@ -0,0 +1,120 @@
+"""
+Tests for the content-addressed parse cache.
+"""
+
+import pytest
+
+from chunkana import ChunkConfig, MarkdownChunker, ParseCache
+from chunkana.parser import Parser, get_parser
+
+DOCUMENT = """# Title
+
+Intro paragraph.
+
+## Section
+
+```python
+print("hello")
+```
+
+- item one
+- item two
+"""
+
+
+class TestParseCache:
+    """Tests for ParseCache bookkeeping."""
+
+    def test_hit_returns_same_analysis(self):
+        """Second analysis of unchanged text is served from the cache."""
+        cache = ParseCache()
+        parser = Parser(cache=cache)
+
+        first = parser.analyze(DOCUMENT)
+        second = parser.analyze(DOCUMENT)
+
+        assert second is first
+        assert second.get_lines() is not None
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+
+    def test_key_uses_normalized_text(self):
+        """CRLF and LF versions of a document share one entry."""
+        cache = ParseCache()
+        parser = Parser(cache=cache)
+
+        parser.analyze(DOCUMENT)
+        parser.analyze(DOCUMENT.replace("\n", "\r\n"))
+
+        assert len(cache) == 1
+        assert cache.stats.hits == 1
+
+    def test_lru_eviction_by_entries(self):
+        """Least recently used entry is evicted first."""
+        cache = ParseCache(max_entries=2)
+        parser = Parser(cache=cache)
+
+        a = parser.analyze("# A\n\ntext a")
+        parser.analyze("# B\n\ntext b")
+        parser.analyze("# A\n\ntext a")  # refresh A
+        parser.analyze("# C\n\ntext c")  # evicts B
+
+        assert cache.stats.evictions == 1
+        assert parser.analyze("# A\n\ntext a") is a
+        assert cache.make_key("# B\n\ntext b") not in cache
+
+    def test_size_bound(self):
+        """Entries are evicted to respect max_chars; oversized docs are skipped."""
+        cache = ParseCache(max_chars=30)
+        parser = Parser(cache=cache)
+
+        parser.analyze("a" * 20)
+        parser.analyze("b" * 20)
+        parser.analyze("c" * 40)
+
+        stats = cache.stats
+        assert stats.entries == 1
+        assert stats.evictions == 1
+        assert stats.cached_chars == 20
+
+    def test_invalid_bounds(self):
+        """Non-positive bounds are rejected."""
+        with pytest.raises(ValueError):
+            ParseCache(max_entries=0)
+        with pytest.raises(ValueError):
+            ParseCache(max_chars=0)
+
+    def test_get_parser_with_cache(self):
+        """get_parser() keeps the uncached singleton and binds caches on request."""
+        cache = ParseCache()
+
+        assert get_parser() is get_parser()
+        assert get_parser().cache is None
+        assert get_parser(cache=cache).cache is cache
+
+
+class TestChunkerWithParseCache:
+    """Tests for sharing a ParseCache between chunkers."""
+
+    def test_rechunk_with_other_config_skips_parsing(self):
+        """Chunkers with different configs reuse one analysis."""
+        cache = ParseCache()
+        small = MarkdownChunker(
+            ChunkConfig(max_chunk_size=100, min_chunk_size=10, overlap_size=20), cache
+        )
+        large = MarkdownChunker(ChunkConfig(max_chunk_size=2000), parse_cache=cache)
+
+        small.chunk(DOCUMENT)
+        large.chunk(DOCUMENT)
+
+        assert cache.stats.misses == 1
+        assert cache.stats.hits == 1
+
+    def test_cached_output_matches_uncached(self):
+        """Chunking from a cached analysis gives identical output."""
+        config = ChunkConfig(max_chunk_size=120, min_chunk_size=10, overlap_size=20)
+        expected = [c.to_dict() for c in MarkdownChunker(config).chunk(DOCUMENT)]
+
+        chunker = MarkdownChunker(config, parse_cache=ParseCache())
+        for _ in range(3):
+            assert [c.to_dict() for c in chunker.chunk(DOCUMENT)] == expected
@@ -374,3 +374,96 @@ inner
         assert result.code_blocks[0].fence_char == "`"
         assert result.code_blocks[1].fence_char == "~"
         assert result.code_blocks[2].fence_char == "`"
+
+
+class TestPerFamilyFenceState:
+    """Tests that each element family keeps the fence handling of its own pass."""
+
+    def test_inner_fence_does_not_unhide_headers(self):
+        """Headers after an inner ``` inside a ```` block stay hidden."""
+        text = """````markdown
+```python
+x = 1
+```
+# Not a header
+````
+
+# Real header"""
+        result = Parser().analyze(text)
+
+        assert [h.text for h in result.headers] == ["Real header"]
+        assert len(result.code_blocks) == 1
+
+    def test_fence_line_inside_fence_nests_for_headers_and_tables(self):
+        """A fence line that does not close the block hides headers until matched."""
+        text = """```
+```python
+```
+# Hidden
+| a | b |
+|---|---|
+```
+
+# Shown"""
+        result = Parser().analyze(text)
+
+        assert [(b.start_line, b.end_line) for b in result.code_blocks] == [(1, 3), (7, 9)]
+        assert [h.text for h in result.headers] == ["Shown"]
+        assert result.table_count == 0
+
+    def test_fence_absorbed_into_list_is_not_tracked_for_lists(self):
+        """An opening fence taken as list continuation does not hide later items."""
+        text = """- item
+```
+
+1. one
+```
+
+1. two"""
+        result = Parser().analyze(text)
+
+        assert [(b.start_line, b.end_line) for b in result.code_blocks] == [(2, 5)]
+        assert [[i.content for i in b.items] for b in result.list_blocks] == [
+            ["item\n```"],
+            ["one\n```", "two"],
+        ]
+
+    def test_tables_and_lists_ignored_inside_tilde_fence(self):
+        """Tables and lists inside a fence are not extracted."""
+        text = """~~~
+| a | b |
+|---|---|
+- item
+~~~
+
+- real item"""
+        result = Parser().analyze(text)
+
+        assert result.table_count == 0
+        assert result.list_count == 1
+        assert result.list_blocks[0].items[0].content == "real item"
+
+    def test_metrics_match_extracted_elements(self):
+        """Single-pass metrics agree with the extracted elements."""
+        text = """Intro. Second sentence.
+
+# Title
+
+```python
+print("hi")
+```
+
+- [ ] todo
+  more text
+- [x] done"""
+        result = Parser().analyze(text)
+
+        code_chars = sum(len(b.content) for b in result.code_blocks)
+        list_chars = sum(len(i.content) for b in result.list_blocks for i in b.items)
+        assert result.code_ratio == code_chars / result.total_chars
+        assert result.list_ratio == list_chars / result.total_chars
+        assert result.list_blocks[0].items[0].content == "todo\nmore text"
+        assert result.has_checkbox_lists is True
+        assert result.has_preamble is True
+        assert result.preamble_end_line == 2
+        assert result.avg_sentence_length > 0
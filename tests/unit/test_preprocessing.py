@@ -0,0 +1,83 @@
+"""
+Tests for text preprocessing before parsing (chunkana.preprocessing).
+"""
+
+from chunkana import ChunkConfig, MarkdownChunker
+from chunkana.preprocessing import (
+    STRIP_BLOCK_IDS,
+    STRIP_HTML_COMMENTS,
+    STRIP_ZERO_WIDTH,
+    Preprocessor,
+    Transform,
+)
+
+
+class TestPreprocessor:
+    """Tests for Preprocessor.process()."""
+
+    def test_line_endings(self):
+        assert Preprocessor().process("a\r\nb\rc\n") == "a\nb\nc\n"
+
+    def test_unchanged_text_is_not_copied(self):
+        text = "# Title\n\nx^2 and <b>bold</b>\n"
+        preprocessor = Preprocessor([STRIP_BLOCK_IDS, STRIP_HTML_COMMENTS, STRIP_ZERO_WIDTH])
+
+        assert preprocessor.process(text) is text
+
+    def test_block_ids(self):
+        """Block IDs are removed without joining lines."""
+        preprocessor = Preprocessor([STRIP_BLOCK_IDS])
+
+        assert preprocessor.process("Para one ^abc\n\nPara two\n") == "Para one\n\nPara two\n"
+        assert preprocessor.process("- item\n^list1\n") == "- item\n\n"
+        assert preprocessor.process("a ^b ^c\r\nx^2\n\t^id  ") == "a ^b\nx^2\n"
+
+    def test_html_comments_and_zero_width(self):
+        preprocessor = Preprocessor([STRIP_HTML_COMMENTS, STRIP_ZERO_WIDTH])
+        text = "Text<!-- note\nspanning lines -->\nzero\u200bwidth\ufeff\n"
+
+        assert preprocessor.process(text) == "Text\nzerowidth\n"
+
+    def test_line_transforms_in_order(self):
+        """Consecutive line transforms run in one pass, in order."""
+        upper = Transform(str.upper, per_line=True)
+        exclaim = Transform(lambda line: line + "!", per_line=True, triggers=("B",))
+        preprocessor = Preprocessor([upper, exclaim])
+
+        assert preprocessor._passes == [(upper, exclaim)]
+        assert preprocessor.process("a\nb\n") == "A\nB!\n"
+
+    def test_triggered_line_transform(self):
+        """Line transforms with triggers only visit the lines containing one."""
+        seen: list[str] = []
+
+        def mark(line: str) -> str:
+            seen.append(line)
+            return f"[{line}]"
+
+        preprocessor = Preprocessor([Transform(mark, per_line=True, triggers=("@", "#"))])
+
+        assert preprocessor.process("a\n@b\nc #d\ne") == "a\n[@b]\n[c #d]\ne"
+        assert seen == ["@b", "c #d"]
+
+
+class TestChunkerTransforms:
+    """Tests for MarkdownChunker(transforms=...)."""
+
+    def test_transforms_apply_before_parsing(self):
+        text = "# Title\n\n<!--\n# Hidden\n-->\nBody text.\n"
+        chunker = MarkdownChunker(ChunkConfig(), transforms=[STRIP_HTML_COMMENTS])
+
+        chunks = chunker.chunk(text)
+
+        assert all("Hidden" not in chunk.content for chunk in chunks)
+        assert "Body text." in chunks[-1].content
+
+    def test_block_ids_from_config(self):
+        config = ChunkConfig(strip_obsidian_block_ids=True)
+        text = "# Title\n\nFirst paragraph. ^p1\n\nSecond paragraph.\n"
+
+        chunks = MarkdownChunker(config).chunk(text)
+
+        assert "^p1" not in chunks[0].content
+        assert "First paragraph.\n\nSecond paragraph." in chunks[0].content
@@ -0,0 +1,97 @@
+"""
+Tests for per-stage pipeline statistics (chunkana.profiling).
+"""
+
+import tracemalloc
+
+from chunkana import ChunkConfig, MarkdownChunker, chunk_with_analysis
+from chunkana.profiling import STAGES, StageStats
+
+DOCUMENT = "".join(
+    f"## Section {i}\n\nParagraph {i} with enough text to form a chunk of its own.\n\n"
+    f"```python\nprint({i})\n```\n\n"
+    for i in range(10)
+)
+
+
+def _chunker(**kwargs) -> MarkdownChunker:
+    config = ChunkConfig(max_chunk_size=200, min_chunk_size=20, overlap_size=50)
+    return MarkdownChunker(config, **kwargs)
+
+
+class TestChunkWithStats:
+    """Tests for MarkdownChunker.chunk_with_stats()."""
+
+    def test_same_chunks_as_chunk(self):
+        chunks, _ = _chunker().chunk_with_stats(DOCUMENT)
+
+        assert [c.to_dict() for c in chunks] == [c.to_dict() for c in _chunker().chunk(DOCUMENT)]
+
+    def test_stage_counts(self):
+        """Every stage runs once and counts chain from one stage to the next."""
+        chunks, stats = _chunker().chunk_with_stats(DOCUMENT)
+        stages = stats.stages
+
+        assert list(stages) == list(STAGES)
+        assert all(stage.calls == 1 for stage in stages.values())
+        assert stages["preprocess"].items_in == len(DOCUMENT)
+        assert stages["parse"].items_out == DOCUMENT.count("\n") + 1
+        for before, after in zip(STAGES[4:], STAGES[5:], strict=False):
+            assert stages[before].items_out == stages[after].items_in
+        assert stages["validate"].items_out == len(chunks)
+        assert stats.total_seconds > 0
+        assert stats.slowest_stage in STAGES
+        assert stages["parse"].allocated_bytes is None
+
+    def test_skipped_overlap(self):
+        """Stages that do not run have no calls."""
+        config = ChunkConfig(max_chunk_size=200, min_chunk_size=20, overlap_size=0)
+        _, stats = MarkdownChunker(config).chunk_with_stats(DOCUMENT)
+
+        assert stats.stages["overlap"].calls == 0
+        assert stats.stages["overlap"].seconds == 0.0
+
+    def test_empty_document(self):
+        chunks, stats = _chunker().chunk_with_stats("  \n")
+
+        assert chunks == []
+        assert stats.slowest_stage is None
+
+    def test_trace_allocations(self):
+        """Allocations are measured when asked for; tracemalloc is restored."""
+        _, stats = _chunker().chunk_with_stats(DOCUMENT, trace_allocations=True)
+
+        assert stats.stages["parse"].peak_bytes > 0
+        assert all(stage.allocated_bytes is not None for stage in stats.stages.values())
+        assert not tracemalloc.is_tracing()
+        assert stats.to_dict()["stages"]["parse"]["peak_bytes"] > 0
+
+
+class TestObserver:
+    """Tests for the observer hook."""
+
+    def test_called_per_stage(self):
+        """chunk() reports each stage to the observer in pipeline order."""
+        seen: list[StageStats] = []
+        chunker = _chunker(observer=seen.append)
+
+        chunker.chunk(DOCUMENT)
+        chunker.chunk(DOCUMENT)
+
+        assert [stage.name for stage in seen] == list(STAGES) * 2
+        assert seen[0] is not seen[len(STAGES)]
+        assert all(stage.calls == 1 for stage in seen)
+
+    def test_not_called_for_empty_document(self):
+        seen: list[StageStats] = []
+
+        _chunker(observer=seen.append).chunk("")
+
+        assert seen == []
+
+
+def test_chunking_result_processing_time():
+    """chunk_with_analysis() fills in processing_time."""
+    result = chunk_with_analysis(DOCUMENT)
+
+    assert result.processing_time > 0
@@ -0,0 +1,241 @@
+"""
+Tests for incremental re-chunking (MarkdownChunker.rechunk).
+"""
+
+import random
+
+from chunkana import ChunkConfig, MarkdownChunker, RechunkResult, Transform
+
+
+def _section(title: str, paragraphs: int) -> str:
+    body = "\n\n".join(
+        f"Paragraph {i} of {title} explains one more detail about {title.lower()}."
+        for i in range(paragraphs)
+    )
+    return f"## {title}\n\n{body}"
+
+
+def _document(titles: list[str]) -> str:
+    sections = "\n\n".join(_section(title, 3) for title in titles)
+    return f"# Guide\n\nIntroduction to the guide.\n\n{sections}\n"
+
+
+TITLES = ["Install", "Configure", "Deploy", "Monitor", "Upgrade", "Troubleshoot"]
+CONFIG = ChunkConfig(max_chunk_size=400, min_chunk_size=50, overlap_size=50)
+
+
+def _dicts(chunks):
+    return [c.to_dict() for c in chunks]
+
+
+def _spans(chunk):
+    return chunk.start_offset, chunk.end_offset, chunk.start_byte, chunk.end_byte
+
+
+class TestRechunkEquivalence:
+    """rechunk() must always agree with a fresh chunk()."""
+
+    def test_initial_rechunk_is_full(self):
+        """Without a previous result everything is new."""
+        chunker = MarkdownChunker(CONFIG)
+        text = _document(TITLES)
+
+        result = chunker.rechunk(None, text)
+
+        assert isinstance(result, RechunkResult)
+        assert result.full_rechunk
+        assert result.strategy_used == "structural"
+        assert _dicts(result.chunks) == _dicts(MarkdownChunker(CONFIG).chunk(text))
+        assert result.added == list(range(len(result.chunks)))
+
+    def test_edit_in_middle_section_is_local(self):
+        """Editing one section re-runs only the sections around it."""
+        chunker = MarkdownChunker(CONFIG)
+        text = _document(TITLES)
+        previous = chunker.rechunk(None, text)
+
+        new_text = text.replace("Paragraph 1 of Deploy", "Paragraph 1 of Deploy (revised)")
+        result = chunker.rechunk(previous, new_text)
+
+        assert not result.full_rechunk
+        assert result.rechunked_lines is not None
+        start, end = result.rechunked_lines
+        assert start > 1 and end < len(new_text.split("\n"))
+        assert _dicts(result.chunks) == _dicts(MarkdownChunker(CONFIG).chunk(new_text))
+
+        edited = [i for i, c in enumerate(result.chunks) if "(revised)" in c.content]
+        assert result.changed == edited
+        assert not result.added
+        assert not result.removed
+        assert len(result.unchanged) == len(result.chunks) - len(edited)
+
+    def test_inserted_lines_shift_following_chunks(self):
+        """Chunks after an insertion are reused with shifted line numbers."""
+        chunker = MarkdownChunker(CONFIG)
+        text = _document(TITLES)
+        previous = chunker.rechunk(None, text)
+
+        new_text = text.replace(
+            "Paragraph 0 of Configure",
+            "Extra line one.\nExtra line two.\n\nParagraph 0 of Configure",
+        )
+        result = chunker.rechunk(previous, new_text)
+
+        assert not result.full_rechunk
+        assert _dicts(result.chunks) == _dicts(MarkdownChunker(CONFIG).chunk(new_text))
+
+        old_last = previous.chunks[-1]
+        new_last = result.chunks[-1]
+        assert new_last.content == old_last.content
+        assert new_last.start_line == old_last.start_line + 3
+
+    def test_added_and_removed_sections_are_reported(self):
+        """Inserting and deleting whole sections shows up as added/removed chunks."""
+        chunker = MarkdownChunker(CONFIG)
+        previous = chunker.rechunk(None, _document(TITLES))
+
+        titles = ["Install", "Configure", "Backup", "Deploy", "Upgrade", "Troubleshoot"]
+        new_text = _document(titles)
+        result = chunker.rechunk(previous, new_text)
+
+        assert _dicts(result.chunks) == _dicts(MarkdownChunker(CONFIG).chunk(new_text))
+        assert any("## Backup" in result.chunks[i].content for i in result.added + result.changed)
+        assert any("## Monitor" in c.content for c in result.removed)
+
+    def test_repeated_random_edits(self):
+        """A chain of edits stays equal to chunking each version from scratch."""
+        rng = random.Random(7)
+        chunker = MarkdownChunker(CONFIG)
+        text = _document(TITLES)
+        result = chunker.rechunk(None, text)
+
+        for step in range(25):
+            lines = text.split("\n")
+            pos = rng.randrange(1, len(lines))
+            kind = rng.random()
+            if kind < 0.4:
+                lines.insert(pos, f"Inserted sentence number {step} with a few words.")
+            elif kind < 0.7 and len(lines) > 10:
+                del lines[pos]
+            elif kind < 0.85:
+                lines[pos:pos] = ["", f"## Added {step}", "", "Body of the added section.", ""]
+            else:
+                lines[pos] = lines[pos] + " edited"
+            text = "\n".join(lines)
+
+            result = chunker.rechunk(result, text)
+
+            assert _dicts(result.chunks) == _dicts(MarkdownChunker(CONFIG).chunk(text))
+            assert sorted(result.added + result.changed + result.unchanged) == list(
+                range(len(result.chunks))
+            )
+
+    def test_offsets_over_repeated_edits(self):
+        """Reused and shifted chunks keep the offsets of a fresh chunk()."""
+        rng = random.Random(0)
+        config = ChunkConfig(max_chunk_size=80, min_chunk_size=10, overlap_size=30)
+        paragraphs = ["lorem foo", "bar baz qux", "lorem foo bar", "naïve café déjà vu"]
+        sections = [
+            f"## Part {i}\n\n" + "\n\n".join(rng.choices(paragraphs, k=3)) for i in range(12)
+        ]
+        text = "# Title\n\n" + "\n\n".join(sections) + "\n"
+        chunker = MarkdownChunker(config)
+        result = chunker.rechunk(None, text)
+
+        incremental = 0
+        for step in range(60):
+            lines = text.split("\n")
+            pos = rng.randrange(1, len(lines))
+            kind = rng.random()
+            if kind < 0.3:
+                lines[pos:pos] = ["", f"#### deep {step}", "", "lorem foo", ""]
+            elif kind < 0.5 and len(lines) > 10:
+                del lines[pos]
+            else:
+                lines.insert(pos, rng.choice(paragraphs))
+            text = "\n".join(lines)
+
+            result = chunker.rechunk(result, text)
+
+            incremental += not result.full_rechunk
+            assert [_spans(c) for c in result.chunks] == [
+                _spans(c) for c in MarkdownChunker(config).chunk(text)
+            ]
+        assert incremental > 20
+
+
+class TestRechunkFallbacks:
+    """Cases that re-chunk the whole document."""
+
+    def test_unchanged_text_reuses_everything(self):
+        """Identical text returns the previous chunks without work."""
+        chunker = MarkdownChunker(CONFIG)
+        text = _document(TITLES)
+        previous = chunker.rechunk(None, text)
+
+        result = chunker.rechunk(previous, text)
+
+        assert not result.has_changes
+        assert result.rechunked_lines is None
+        assert result.chunks == previous.chunks
+
+    def test_non_structural_document_falls_back(self):
+        """Documents chunked by other strategies are re-chunked fully."""
+        chunker = MarkdownChunker(CONFIG)
+        text = "Plain text without headers.\n\nSecond paragraph of plain text."
+        previous = chunker.rechunk(None, text)
+
+        new_text = text + "\n\nThird paragraph."
+        result = chunker.rechunk(previous, new_text)
+
+        assert result.full_rechunk
+        assert _dicts(result.chunks) == _dicts(MarkdownChunker(CONFIG).chunk(new_text))
+        assert result.has_changes
+
+    def test_result_from_other_config_falls_back(self):
+        """A previous result produced with another config is not spliced."""
+        text = _document(TITLES)
+        previous = MarkdownChunker(CONFIG).rechunk(None, text)
+
+        other = ChunkConfig(max_chunk_size=600, min_chunk_size=50, overlap_size=50)
+        new_text = text.replace("Paragraph 2 of Monitor", "Paragraph 2 of Monitor, edited")
+        result = MarkdownChunker(other).rechunk(previous, new_text)
+
+        assert result.full_rechunk
+        assert _dicts(result.chunks) == _dicts(MarkdownChunker(other).chunk(new_text))
+
+    def test_result_from_other_transforms_falls_back(self):
+        """Chunks produced with other preprocessing transforms are not reused."""
+        text = _document(TITLES) + "\nSecret: hunter2\n"
+        previous = MarkdownChunker(CONFIG).rechunk(None, text)
+
+        redact = Transform(lambda line: "[redacted]", per_line=True, triggers=("Secret:",))
+        chunker = MarkdownChunker(CONFIG, transforms=[redact])
+        result = chunker.rechunk(previous, text)
+
+        assert result.full_rechunk
+        assert _dicts(result.chunks) == _dicts(
+            MarkdownChunker(CONFIG, transforms=[redact]).chunk(text)
+        )
+        assert "hunter2" not in result.chunks[-1].content
+
+    def test_previous_result_is_not_modified(self):
+        """Re-chunking leaves the previous result intact."""
+        chunker = MarkdownChunker(CONFIG)
+        text = _document(TITLES)
+        previous = chunker.rechunk(None, text)
+        before = _dicts(previous.chunks)
+
+        chunker.rechunk(previous, "Intro line.\n\n" + text)
+
+        assert _dicts(previous.chunks) == before
+
+    def test_empty_text_removes_all_chunks(self):
+        """Clearing the document reports every old chunk as removed."""
+        chunker = MarkdownChunker(CONFIG)
+        previous = chunker.rechunk(None, _document(TITLES))
+
+        result = chunker.rechunk(previous, "   \n")
+
+        assert result.chunks == []
+        assert result.removed == previous.chunks
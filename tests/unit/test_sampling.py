@@ -0,0 +1,154 @@
+"""
+Tests for sampled document analysis (chunkana.sampling).
+"""
+
+import pytest
+
+from chunkana import ChunkConfig, estimate_analysis, estimate_file
+from chunkana.parser import Parser
+from chunkana.sampling import _open_fence_at_start, estimate_bytes
+from chunkana.strategies import StrategySelector
+from chunkana.streaming import StreamingChunker, StreamingConfig
+
+SECTION = """## Section {i}
+
+Some prose for section {i}. It has two sentences.
+
+```python
+def handler_{i}():
+    return {i}
+```
+
+- first point
+- second point
+
+"""
+
+DOCUMENT = "# Title\n\n" + "".join(SECTION.format(i=i) for i in range(200))
+
+
+class TestEstimateAnalysis:
+    """Tests for estimate_analysis()."""
+
+    def test_small_document_is_exact(self):
+        """Documents covered by the samples are analyzed in full."""
+        estimate = estimate_analysis(DOCUMENT, sample_count=4, sample_size=len(DOCUMENT))
+        full = Parser().analyze(DOCUMENT)
+
+        assert estimate.coverage == 1.0
+        assert estimate.analysis == full
+        assert estimate.select_strategy() == ("code_aware", 1.0)
+
+    def test_sampled_metrics(self):
+        """Sampled metrics extrapolate to about the full-document values."""
+        estimate = estimate_analysis(DOCUMENT, sample_count=5, sample_size=2000)
+        full = Parser().analyze(DOCUMENT)
+        analysis = estimate.analysis
+
+        assert estimate.coverage < 0.5
+        assert len(estimate.samples) == 5
+        assert all(sample.total_lines > 1 for sample in estimate.samples)
+        assert analysis.code_ratio == pytest.approx(full.code_ratio, rel=0.25)
+        assert analysis.list_ratio == pytest.approx(full.list_ratio, rel=0.25)
+        assert analysis.header_count == pytest.approx(full.header_count, rel=0.25)
+        assert analysis.code_block_count == pytest.approx(full.code_block_count, rel=0.25)
+        assert analysis.max_header_depth == 2
+
+    def test_select_strategy(self):
+        config = ChunkConfig()
+        estimate = estimate_analysis(DOCUMENT, sample_count=5, sample_size=2000)
+        expected = StrategySelector().select(Parser().analyze(DOCUMENT), config).name
+
+        name, confidence = estimate.select_strategy(config)
+
+        assert name == expected
+        assert confidence == 1.0
+
+    def test_mixed_document_confidence(self):
+        """Samples that disagree with the selection lower the confidence."""
+        prose = "".join(f"Paragraph {i} of plain prose without structure.\n\n" for i in range(400))
+        estimate = estimate_analysis(DOCUMENT + prose, sample_count=8, sample_size=2000)
+
+        name, confidence = estimate.select_strategy()
+
+        assert name == "code_aware"
+        assert 0.0 < confidence < 1.0
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            estimate_analysis(DOCUMENT, sample_count=0)
+        with pytest.raises(ValueError):
+            estimate_analysis(DOCUMENT, sample_size=0)
+
+
+class TestFenceInference:
+    """Samples starting inside a code fence."""
+
+    def test_starts_inside_fence(self):
+        sample = "    return 1\n```\n\n# Header\n\n```python\nx = 1\n```\n"
+
+        assert _open_fence_at_start(Parser(), sample) == "```"
+
+    def test_starts_outside_fence(self):
+        sample = "text\n\n```python\n# comment\n```\n\n~~~js\nx\n~~~\n"
+
+        assert _open_fence_at_start(Parser(), sample) is None
+        assert _open_fence_at_start(Parser(), "no fences\n") is None
+
+
+class TestEstimateFile:
+    """Tests for estimate_file() and estimate_bytes()."""
+
+    def test_same_as_text_for_ascii(self, tmp_path):
+        path = tmp_path / "doc.md"
+        path.write_text(DOCUMENT, encoding="utf-8")
+
+        from_text = estimate_analysis(DOCUMENT, sample_count=5, sample_size=2000)
+        from_file = estimate_file(str(path), sample_count=5, sample_size=2000)
+
+        assert from_file.analysis == from_text.analysis
+        assert from_file.total_size == len(DOCUMENT)
+
+    def test_empty(self, tmp_path):
+        path = tmp_path / "empty.md"
+        path.write_text("", encoding="utf-8")
+
+        assert estimate_file(str(path)).analysis.total_chars == 0
+        assert estimate_bytes(b"").coverage == 1.0
+
+
+class TestSampledStreaming:
+    """Tests for StreamingConfig.sampled_strategy."""
+
+    def _chunker(self, **kwargs) -> StreamingChunker:
+        streaming_config = StreamingConfig(
+            buffer_size=3000, sample_count=5, sample_size=2000, **kwargs
+        )
+        return StreamingChunker(ChunkConfig(max_chunk_size=500), streaming_config)
+
+    @pytest.mark.parametrize("method", ["chunk_file", "chunk_file_mmap"])
+    def test_one_strategy_for_all_windows(self, tmp_path, method):
+        path = tmp_path / "doc.md"
+        path.write_text(DOCUMENT + "- only a list\n- at the end\n", encoding="utf-8")
+        chunker = self._chunker(sampled_strategy=True)
+
+        chunks = list(getattr(chunker, method)(str(path)))
+
+        assert chunker.last_estimate is not None
+        assert {chunk.strategy for chunk in chunks} == {"code_aware"}
+        assert "".join(chunk.content for chunk in chunks).count("def handler_") == 200
+
+    def test_disabled_by_default(self, tmp_path):
+        path = tmp_path / "doc.md"
+        path.write_text(DOCUMENT, encoding="utf-8")
+        chunker = self._chunker()
+
+        list(chunker.chunk_file(str(path)))
+
+        assert chunker.last_estimate is None
+
+    def test_invalid_config(self):
+        with pytest.raises(ValueError):
+            StreamingConfig(sample_count=0)
+        with pytest.raises(ValueError):
+            StreamingConfig(sample_size=-1)
@@ -265,3 +265,50 @@ class TestEdgeCases:
 
         assert len(result) == 1
         assert result[0] == chunk  # Original chunk returned unchanged
+
+
+class TestSegmentSpans:
+    """Tests for offset-based segment spans."""
+
+    @pytest.fixture
+    def splitter(self):
+        config = ChunkConfig(max_chunk_size=1000)
+        return SectionSplitter(config)
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            "- first item\n  more\n\n- second item\n* third",
+            "Para one.\n\n\n  Para two  \n\nPara three",
+            "One sentence. Two sentences!  Three?\nFour.",
+        ],
+    )
+    def test_spans_are_stripped_segments(self, splitter, body):
+        """Each span slices a stripped, non-empty segment in order."""
+        spans = splitter._find_segment_spans(body)
+
+        assert len(spans) > 1
+        for start, end in spans:
+            assert body[start:end] == body[start:end].strip() != ""
+        assert [start for start, _ in spans] == sorted(start for start, _ in spans)
+
+    def test_list_item_repeated_in_preamble(self, splitter):
+        """A list item whose text also occurs earlier gets its own lines."""
+        body = "Intro mentions - a b here.\n\n- a b\n- c d"
+        original = Chunk(content="## Header\n\n" + body, start_line=1, end_line=6, metadata={})
+
+        result = splitter._find_segments_with_positions(body, original)
+
+        assert [s.content for s in result] == ["- a b", "- c d"]
+        assert [s.start_line_offset for s in result] == [4, 5]
+
+    def test_large_section_line_offsets(self, splitter):
+        """Line offsets stay exact for a body with many segments."""
+        body = "\n\n".join(f"Paragraph {i}\nsecond line" for i in range(2000))
+        original = Chunk(content="## Header\n\n" + body, start_line=1, end_line=6000, metadata={})
+
+        result = splitter._find_segments_with_positions(body, original)
+
+        assert len(result) == 2000
+        assert all(s.start_line_offset == 2 + 3 * i for i, s in enumerate(result))
+        assert all(s.end_line_offset == s.start_line_offset + 1 for s in result)
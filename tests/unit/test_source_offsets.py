@@ -0,0 +1,220 @@
+"""
+Tests for chunk source offsets (start_offset/end_offset, start_byte/end_byte).
+"""
+
+import pytest
+
+from chunkana import Chunk, ChunkConfig, MarkdownChunker, chunk_markdown
+from chunkana.streaming import StreamingChunker, StreamingConfig
+
+DOCUMENT = """# Руководство
+
+Введение: naïve café, 你好世界 🎉.
+
+## Installation
+
+Install the package with pip.
+
+```python
+import chunkana
+chunks = chunkana.chunk_markdown(text)
+```
+
+## Configuration
+
+| Option | Default |
+|--------|---------|
+| max_chunk_size | 4096 |
+
+- first item
+- second item with ünïcödé
+
+## Résumé
+
+Final paragraph of the guide.
+"""
+
+CONFIG = ChunkConfig(max_chunk_size=200, min_chunk_size=20, overlap_size=0)
+
+
+def _assert_spans(chunks, text):
+    data = text.encode("utf-8")
+    for chunk in chunks:
+        span = text[chunk.start_offset : chunk.end_offset]
+        assert data[chunk.start_byte : chunk.end_byte].decode("utf-8") == span
+        for line in chunk.content.split("\n"):
+            assert line.strip() in span
+
+
+class TestChunkOffsets:
+    """Offsets set by MarkdownChunker."""
+
+    @pytest.mark.parametrize("strategy", ["code_aware", "list_aware", "structural", "fallback"])
+    def test_offsets_slice_source(self, strategy):
+        """Every chunk's span contains its content, in characters and bytes."""
+        config = ChunkConfig(
+            max_chunk_size=200, min_chunk_size=20, overlap_size=0, strategy_override=strategy
+        )
+        chunks = chunk_markdown(DOCUMENT, config)
+
+        assert chunks
+        _assert_spans(chunks, DOCUMENT)
+
+    def test_verbatim_content_is_exact_slice(self):
+        """Content copied from the source is exactly the sliced span."""
+        chunks = chunk_markdown(DOCUMENT, CONFIG)
+
+        for chunk in chunks:
+            if not chunk.metadata.get("continued_from_header"):
+                assert DOCUMENT[chunk.start_offset : chunk.end_offset] == chunk.content.strip()
+
+    def test_repeated_first_line(self):
+        """A first line repeated just above the chunk does not shift its span."""
+        text = "\n$$\n- item\n> quote\n\n$$\n\n$$\n$$\nText para.\n### H3"
+        config = ChunkConfig(
+            max_chunk_size=60, min_chunk_size=10, overlap_size=0, strategy_override="list_aware"
+        )
+
+        chunks = MarkdownChunker(config).chunk(text)
+
+        for chunk in chunks:
+            stripped = chunk.content.strip()
+            if text.count(stripped) == 1:
+                assert text[chunk.start_offset : chunk.end_offset] == stripped
+
+    @pytest.mark.parametrize(
+        "block",
+        [
+            "```\ncode\n```\n\nSome explanation text that is long.\n",
+            "## Step\n\nRepeat the same paragraph here.\n\n- item\n- item\n",
+            "| a | b |\n|---|---|\n| 1 | 2 |\n\nSame note after the table.\n",
+        ],
+    )
+    def test_repeated_content(self, block):
+        """Repeated paragraphs and code blocks are located at their own lines."""
+        text = "# Guide\n\n" + "\n".join([block] * 20)
+        config = ChunkConfig(max_chunk_size=60, min_chunk_size=5, overlap_size=0)
+
+        chunks = MarkdownChunker(config).chunk(text)
+
+        assert len(chunks) > 10
+        for previous, chunk in zip(chunks, chunks[1:], strict=False):
+            assert previous.start_offset <= chunk.start_offset
+            assert previous.end_offset <= chunk.end_offset
+        _assert_spans(chunks, text)
+        for chunk in chunks:
+            line = text.count("\n", 0, chunk.start_offset) + 1
+            assert chunk.start_line <= line <= chunk.end_line
+            stripped = chunk.content.strip()
+            if stripped in text and not chunk.metadata.get("continued_from_header"):
+                assert text[chunk.start_offset : chunk.end_offset] == stripped
+
+    def test_offsets_are_ordered(self):
+        """Spans follow document order."""
+        chunks = chunk_markdown(DOCUMENT, CONFIG)
+
+        for previous, chunk in zip(chunks, chunks[1:], strict=False):
+            assert previous.end_offset <= chunk.start_offset
+            assert previous.end_byte <= chunk.start_byte
+
+    def test_crlf_offsets_refer_to_normalized_text(self):
+        """Offsets index the text with LF line endings."""
+        chunks = chunk_markdown(DOCUMENT.replace("\n", "\r\n"), CONFIG)
+
+        _assert_spans(chunks, DOCUMENT)
+
+    def test_iter_chunks_matches_chunk(self):
+        """The lazy pipeline sets the same offsets."""
+        chunker = MarkdownChunker(CONFIG)
+
+        lazy = [
+            (c.start_offset, c.end_offset, c.start_byte, c.end_byte)
+            for c in chunker.iter_chunks(DOCUMENT)
+        ]
+        eager = [
+            (c.start_offset, c.end_offset, c.start_byte, c.end_byte)
+            for c in chunker.chunk(DOCUMENT)
+        ]
+
+        assert lazy == eager
+
+    def test_rechunk_shifts_offsets(self):
+        """Chunks reused after an edit get the offsets of a fresh chunk()."""
+        text = "".join(
+            f"## Раздел {i}\n\nПервый абзац раздела {i}, naïve café.\n\n"
+            f"Second paragraph of section {i} with a few more words.\n\n"
+            for i in range(8)
+        )
+        chunker = MarkdownChunker(CONFIG)
+        previous = chunker.rechunk(None, text)
+
+        new_text = text.replace("раздела 3,", "раздела 3 (изменён),")
+        result = chunker.rechunk(previous, new_text)
+
+        assert not result.full_rechunk
+        assert [c.to_dict() for c in result.chunks] == [
+            c.to_dict() for c in MarkdownChunker(CONFIG).chunk(new_text)
+        ]
+        _assert_spans(result.chunks, new_text)
+
+
+class TestChunkOffsetFields:
+    """Offset fields of Chunk."""
+
+    def test_defaults_to_none(self):
+        """Chunks built by hand have no offsets."""
+        chunk = Chunk(content="text", start_line=1, end_line=1)
+
+        assert chunk.start_offset is None
+        assert chunk.end_byte is None
+
+    def test_end_before_start_rejected(self):
+        """end_offset must not precede start_offset."""
+        with pytest.raises(ValueError, match="end_offset"):
+            Chunk(content="text", start_line=1, end_line=1, start_offset=10, end_offset=5)
+
+    def test_serialization_roundtrip(self):
+        """Offsets survive to_dict()/from_dict() and JSON."""
+        chunk = Chunk(
+            content="café",
+            start_line=3,
+            end_line=3,
+            start_offset=20,
+            end_offset=24,
+            start_byte=22,
+            end_byte=27,
+        )
+
+        assert Chunk.from_dict(chunk.to_dict()) == chunk
+        assert Chunk.from_json(chunk.to_json()) == chunk
+
+    def test_to_dict_without_offsets(self):
+        """Chunks without offsets serialize without the offset keys."""
+        data = Chunk(content="text", start_line=1, end_line=1).to_dict()
+
+        assert list(data) == ["content", "start_line", "end_line", "size", "line_count", "metadata"]
+
+    def test_from_dict_without_offsets(self):
+        """Dicts serialized before offsets existed still load."""
+        chunk = Chunk.from_dict({"content": "text", "start_line": 1, "end_line": 1})
+
+        assert chunk.start_offset is None
+
+
+class TestStreamingOffsets:
+    """Offsets of streamed chunks refer to the whole file."""
+
+    @pytest.mark.parametrize("use_mmap", [False, True])
+    def test_offsets_slice_file(self, tmp_path, use_mmap):
+        """Offsets are global across windows."""
+        text = DOCUMENT * 20
+        path = tmp_path / "doc.md"
+        path.write_text(text, encoding="utf-8")
+        chunker = StreamingChunker(CONFIG, StreamingConfig(buffer_size=500))
+
+        chunks = list(
+            chunker.chunk_file_mmap(str(path)) if use_mmap else chunker.chunk_file(str(path))
+        )
+
+        assert chunker.stats.windows > 1
+        _assert_spans(chunks, text)
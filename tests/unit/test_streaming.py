@@ -358,5 +358,173 @@ console.log("hello");
             assert "bytes_processed" in chunk.metadata
 
 
+class TestSafeWindows:
+    """Tests for window boundaries and document-global metadata."""
+
+    DOCUMENT = (
+        "# Guide\n\nIntro text here.\n\n## Install\n\n"
+        + "Install step paragraph with some words.\n\n" * 12
+        + "```python\n"
+        + "x = 1\n" * 40
+        + "```\n\n"
+        + "| a | b |\n|---|---|\n"
+        + "| 1 | 2 |\n" * 30
+        + "\n$$\n"
+        + "a + b\n" * 20
+        + "$$\n\n## Usage\n\n"
+        + "Usage paragraph with more words.\n\n" * 12
+    )
+
+    def _chunker(self, buffer_size=300):
+        return StreamingChunker(
+            ChunkConfig(max_chunk_size=400, min_chunk_size=50, overlap_size=40),
+            StreamingConfig(buffer_size=buffer_size),
+        )
+
+    def test_windows_cover_every_line_once(self):
+        """Windows are contiguous and never cut through a block."""
+        from chunkana.streaming.buffer_manager import BufferManager
+
+        chunker = self._chunker()
+        manager = BufferManager(chunker.streaming_config)
+
+        windows = list(
+            manager.read_safe_windows(io.StringIO(self.DOCUMENT), chunker.split_detector)
+        )
+
+        assert len(windows) > 3
+        assert "".join(w.text for w in windows) == self.DOCUMENT
+        next_line = 1
+        for previous, window in zip([None, *windows], windows, strict=False):
+            assert window.start_line == next_line
+            assert window.line_count == window.text.count("\n")
+            next_line += window.line_count
+            assert window.text.count("```") % 2 == 0
+            assert window.text.count("$$") % 2 == 0
+            if previous is not None:
+                last_line = previous.text.splitlines()[-1]
+                assert not ("|" in last_line and "|" in window.text.splitlines()[0])
+        assert windows[-1].chars_processed == len(self.DOCUMENT)
+
+    def test_content_emitted_once_with_global_lines(self):
+        """No line is repeated and line numbers refer to the whole document."""
+        chunks = list(self._chunker().chunk_stream(io.StringIO(self.DOCUMENT)))
+        lines = self.DOCUMENT.split("\n")
+
+        words = sum(len(c.content.split()) for c in chunks)
+        assert words == len(self.DOCUMENT.split())
+        assert [c.metadata["chunk_index"] for c in chunks] == list(range(len(chunks)))
+        assert len({c.metadata["stream_window_index"] for c in chunks}) > 1
+        for chunk in chunks:
+            first = chunk.content.strip().split("\n")[0]
+            assert first in lines[chunk.start_line - 1 : chunk.end_line]
+        starts = [c.start_line for c in chunks]
+        assert starts == sorted(starts)
+
+    def test_header_path_carried_across_windows(self):
+        """Chunks of later windows keep the headers of earlier windows."""
+        text = "# Guide\n\n## Install\n\n" + "Install step paragraph with words.\n\n" * 20
+        chunks = list(self._chunker(buffer_size=200).chunk_stream(io.StringIO(text)))
+
+        later = [c for c in chunks if c.metadata["stream_window_index"] > 0]
+        assert later
+        for chunk in later:
+            assert chunk.metadata["header_path"] == "/Guide/Install"
+
+    def test_overlap_across_windows(self):
+        """Overlap metadata links the last chunk of a window to the next window."""
+        chunks = list(self._chunker().chunk_stream(io.StringIO(self.DOCUMENT)))
+
+        for previous, chunk in zip(chunks, chunks[1:], strict=False):
+            assert chunk.metadata.get("previous_content")
+            assert previous.metadata.get("next_content")
+        assert "previous_content" not in chunks[0].metadata
+        assert "next_content" not in chunks[-1].metadata
+
+
+class TestFenceTracker:
+    """Tests for FenceTracker."""
+
+    def test_fences_do_not_nest(self):
+        """An opening fence inside a code block is content, not a new fence."""
+        from chunkana.streaming.fence_tracker import FenceTracker
+
+        tracker = FenceTracker()
+        for line in ["````markdown\n", "```python\n", "x = 1\n", "```\n"]:
+            tracker.track_line(line)
+        assert tracker.is_inside_fence()
+
+        tracker.track_line("````\n")
+        assert not tracker.is_inside_fence()
+
+    def test_latex_blocks(self):
+        """Display math and LaTeX environments are blocks, except inside code."""
+        from chunkana.streaming.fence_tracker import FenceTracker
+
+        tracker = FenceTracker()
+        tracker.track_line("$$\n")
+        assert tracker.is_inside_block()
+        tracker.track_line("$$\n")
+        tracker.track_line("\\begin{align}\n")
+        assert tracker.is_inside_block()
+        tracker.track_line("\\end{align}\n")
+        assert not tracker.is_inside_block()
+
+        tracker.track_line("```\n")
+        tracker.track_line("$$\n")
+        tracker.track_line("```\n")
+        assert not tracker.is_inside_block()
+
+
+class TestMemoryBudget:
+    """Tests for max_memory_mb enforcement."""
+
+    def test_invalid_memory_limit(self):
+        """The memory ceiling must be positive."""
+        with pytest.raises(ValueError, match="max_memory_mb"):
+            StreamingConfig(max_memory_mb=0)
+
+    def test_default_budget_keeps_buffer_size(self):
+        """Small documents never shrink the window."""
+        chunker = StreamingChunker(ChunkConfig())
+
+        list(chunker.chunk_stream(io.StringIO("# Title\n\nSome text.\n")))
+
+        assert chunker.stats.windows == 1
+        assert chunker.stats.window_size == chunker.streaming_config.buffer_size
+        assert 0 < chunker.stats.peak_memory_bytes < chunker.stats.memory_limit_bytes
+
+    def test_windows_shrink_under_memory_ceiling(self):
+        """Dense content gets smaller windows; the estimate stays under the ceiling."""
+        text = "".join(f"Line {i} of a paragraph.\n" + "\n" * (i % 5 == 0) for i in range(8000))
+        chunker = StreamingChunker(
+            ChunkConfig(),
+            StreamingConfig(buffer_size=10_000_000, max_memory_mb=1),
+        )
+
+        chunks = list(chunker.chunk_stream(io.StringIO(text)))
+
+        stats = chunker.stats
+        assert stats.windows > 1
+        assert stats.min_window_size < 10_000_000
+        assert stats.peak_memory_bytes <= stats.memory_limit_bytes
+        assert stats.forced_splits == 0
+        assert sum(len(c.content.split()) for c in chunks) == len(text.split())
+
+    def test_oversized_block_is_cut_and_reopened(self):
+        """A code block larger than the ceiling is cut and re-entered."""
+        text = "Intro.\n\n```python\n" + "x = 1\n" * 4000 + "```\n\nOutro.\n"
+        chunker = StreamingChunker(ChunkConfig(), StreamingConfig(max_memory_mb=1))
+
+        chunks = list(chunker.chunk_stream(io.StringIO(text)))
+
+        stats = chunker.stats
+        assert stats.forced_splits > 0
+        assert stats.peak_memory_bytes <= stats.memory_limit_bytes
+        assert sum(c.content.count("x = 1") for c in chunks) == 4000
+        assert chunks[-1].content.strip().endswith("Outro.")
+        assert all(c.metadata["content_type"] == "code" for c in chunks[1:-1])
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
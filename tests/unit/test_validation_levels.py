@@ -0,0 +1,110 @@
+"""
+Tests for tiered output validation (ChunkConfig.validation_level).
+"""
+
+import random
+
+import pytest
+
+from chunkana import Chunk, ChunkConfig, MarkdownChunker
+from chunkana.validator import TieredValidator, ValidationReport
+
+DOCUMENT = "".join(
+    f"## Section {i}\n\nParagraph {i} of the document, long enough to be a significant line.\n\n"
+    for i in range(10)
+)
+
+
+def _validate(level: str, **kwargs) -> ValidationReport:
+    chunker = MarkdownChunker(
+        ChunkConfig(max_chunk_size=300, min_chunk_size=50, validation_level=level, **kwargs)
+    )
+    _, report = chunker.chunk_with_validation(DOCUMENT)
+    return report
+
+
+class TestValidationLevels:
+    """Tests for the checks run by each level."""
+
+    def test_off(self):
+        """No checks run and nothing is timed."""
+        report = _validate("off")
+
+        assert report.timings == {}
+        assert report.is_valid
+
+    def test_cheap(self):
+        """Only the linear checks run by default."""
+        chunker = MarkdownChunker(ChunkConfig(max_chunk_size=300, min_chunk_size=50))
+        _, report = chunker.chunk_with_validation(DOCUMENT)
+
+        assert report.level == "cheap"
+        assert set(report.timings) == {"cheap"}
+        assert report.coverage is None
+
+    def test_full(self):
+        """Full validation also reports line recall."""
+        report = _validate("full")
+
+        assert set(report.timings) == {"cheap", "full"}
+        assert report.full
+        assert report.coverage == 1.0
+        assert report.elapsed == sum(report.timings.values())
+
+    @pytest.mark.parametrize(("rate", "full"), [(0.0, False), (1.0, True)])
+    def test_sampled(self, rate, full):
+        """Sampled validation runs the full checks at the sample rate."""
+        report = _validate("sampled", validation_sample_rate=rate)
+
+        assert report.full is full
+
+    def test_same_chunks_as_chunk(self):
+        """chunk_with_validation() returns the chunks of chunk()."""
+        chunker = MarkdownChunker(ChunkConfig(max_chunk_size=300, min_chunk_size=50))
+
+        chunks, report = chunker.chunk_with_validation(DOCUMENT)
+
+        assert [c.to_dict() for c in chunks] == [c.to_dict() for c in chunker.chunk(DOCUMENT)]
+        assert report.is_valid
+
+    def test_sample_fraction(self):
+        """About validation_sample_rate of documents get the full checks."""
+        config = ChunkConfig(validation_level="sampled", validation_sample_rate=0.25)
+        validator = TieredValidator(config, rng=random.Random(7))
+        chunks = [Chunk(content="Text", start_line=1, end_line=1)]
+
+        full = sum(validator.validate(chunks, "Text").full for _ in range(400))
+
+        assert 70 <= full <= 130
+
+    def test_findings(self):
+        """Hard violations are errors, quality issues are warnings."""
+        config = ChunkConfig(
+            max_chunk_size=100, min_chunk_size=10, overlap_size=0, validation_level="full"
+        )
+        chunks = [
+            Chunk(content="Intro text\n\n## Dangling", start_line=3, end_line=5),
+            Chunk(content="Body text", start_line=1, end_line=9),
+        ]
+
+        report = TieredValidator(config).validate(chunks, "short\n" * 5)
+
+        assert not report.is_valid
+        assert any("PROP-3" in error for error in report.errors)
+        assert any("PROP-5" in error for error in report.errors)
+        assert any("dangling" in warning for warning in report.warnings)
+
+    def test_off_skips_tree_invariants(self):
+        """Hierarchical tree invariants are not checked when validation is off."""
+        chunker = MarkdownChunker(ChunkConfig(validation_level="off"))
+
+        assert not chunker._hierarchy_builder.validate_invariants
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"validation_level": "sometimes"}, {"validation_sample_rate": 1.5}],
+    )
+    def test_invalid_config(self, kwargs):
+        """Unknown levels and rates outside [0, 1] are rejected."""
+        with pytest.raises(ValueError, match="validation_"):
+            ChunkConfig(**kwargs)